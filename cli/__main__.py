@@ -7,6 +7,7 @@ Usage:
     mind status
     mind upgrade
     mind fix-embeddings [--dry-run]
+    mind audit-queries [--graph NAME] [--verbose]
     mind swarm --agents N
 """
 
@@ -14,7 +15,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from .commands import init, status, upgrade, fix_embeddings, swarm
+from .commands import init, status, upgrade, fix_embeddings, swarm, audit_queries
 from .helpers.show_upgrade_notice_if_available import show_upgrade_notice
 
 
@@ -36,6 +37,11 @@ def main():
     p.add_argument("--dir", "-d", type=Path, default=Path.cwd())
     p.add_argument("--dry-run", action="store_true", help="Show what would be fixed")
 
+    p = subs.add_parser("audit-queries", help="Flag node scans in hot query plans")
+    p.add_argument("--dir", "-d", type=Path, default=Path.cwd())
+    p.add_argument("--graph", "-g", type=str, default=None, help="Graph name (default from config)")
+    p.add_argument("--verbose", "-v", action="store_true", help="Print every plan")
+
     p = subs.add_parser("swarm", help="Run multiple agents in parallel")
     p.add_argument("--agents", "-n", type=int, default=0, help="Number of agents to spawn")
     p.add_argument("--status", action="store_true", help="Show swarm status")
@@ -65,6 +71,10 @@ def main():
         ok = fix_embeddings.run(args.dir, dry_run=args.dry_run)
         sys.exit(0 if ok else 1)
 
+    elif args.command == "audit-queries":
+        ok = audit_queries.run(args.dir, graph_name=args.graph, verbose=args.verbose)
+        sys.exit(0 if ok else 1)
+
     elif args.command == "swarm":
         swarm.run(
             agents=args.agents,
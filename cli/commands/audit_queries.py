@@ -0,0 +1,53 @@
+"""mind audit-queries - Flag node scans in the plans of hot queries."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def run(target_dir: Path, graph_name: Optional[str] = None, verbose: bool = False) -> bool:
+    """
+    EXPLAIN every registered hot query and report full / label scans.
+
+    Connecting ensures the id indexes first, so a scan reported here is one
+    an index cannot fix (usually an unlabeled `{id: ...}` lookup).
+
+    Args:
+        target_dir: Project directory (its .mind/database_config.yaml is used)
+        graph_name: Graph to audit (default from config)
+        verbose: Print every plan
+
+    Returns:
+        True if no hot query scans
+    """
+    original_cwd = os.getcwd()
+    os.chdir(target_dir)
+    try:
+        from runtime.infrastructure.database import get_database_adapter
+        from runtime.infrastructure.database.hot_queries import project_hot_queries
+        from runtime.infrastructure.database.schema import audit_queries
+
+        try:
+            adapter = get_database_adapter(graph_name=graph_name)
+        except Exception as e:
+            print(f"Cannot connect to database: {e}")
+            return False
+
+        audits = audit_queries(adapter, project_hot_queries())
+    finally:
+        os.chdir(original_cwd)
+
+    for audit in audits:
+        if audit.error:
+            print(f"  ! {audit.name}: {audit.error}")
+        elif not audit.scans:
+            print(f"  ✓ {audit.name}")
+        else:
+            mark = "~" if audit.allow_scan else "✗"
+            print(f"  {mark} {audit.name}: {'; '.join(audit.scans)}")
+        if verbose and audit.plan:
+            print("\n".join(f"      {line}" for line in audit.plan))
+
+    failing = [a for a in audits if not a.ok]
+    print(f"\n{len(audits) - len(failing)}/{len(audits)} hot queries without unexpected scans")
+    return not failing
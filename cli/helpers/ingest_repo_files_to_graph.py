@@ -4,15 +4,17 @@ from pathlib import Path
 
 
 def ingest_repo_files(target_dir: Path, graph_name: str) -> None:
-    """Ingest repository files as Thing nodes."""
+    """Ingest repository files as Thing nodes (only files changed since the last run)."""
     try:
         from runtime.ingest import scan_and_ingest_files
 
-        stats = scan_and_ingest_files(target_dir, graph_name=graph_name)
+        stats = scan_and_ingest_files(target_dir, graph_name=graph_name, incremental=True)
 
         print(f"✓ Files: {stats['files_scanned']} scanned, "
               f"{stats['things_created']} created, "
-              f"{stats['things_updated']} updated")
+              f"{stats['things_updated']} updated, "
+              f"{stats['files_unchanged']} unchanged, "
+              f"{stats['things_deleted']} deleted")
 
         if stats.get('errors'):
             print(f"  Warnings: {len(stats['errors'])}")
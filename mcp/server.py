@@ -17,7 +17,18 @@ Tools:
 
 Usage:
   Run as MCP server (stdio):
-    python tools/mcp/mind_server.py
+    python tools/mcp/mind_server.py [--workers N] [--serial]
+
+  Requests are handled concurrently by default: each line is dispatched to
+  a pool of N worker threads (MIND_MCP_WORKERS, default 8) and responses
+  are written as they complete, matched by id. --serial handles one
+  request at a time.
+
+  Startup is lazy by default: initialize and tools/list are answered at
+  once while the graph, agents, capabilities etc. come up in background
+  threads; a tool call waits only for the subsystems it uses. A startup
+  time breakdown is logged when everything is up. --eager-startup brings
+  everything up before serving.
 
   Configure in Claude Code settings:
     {
@@ -31,13 +42,19 @@ Usage:
     }
 """
 
+import argparse
 import asyncio
+import os
 import sys
 import json
 import logging
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, TypeVar
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -80,6 +97,137 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mind")
 
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 8
+# In-flight requests per worker before the reader stops taking new lines
+MAX_PENDING_PER_WORKER = 4
+
+# =============================================================================
+# STARTUP
+# =============================================================================
+
+# Seconds a tool call waits for its subsystems during lazy startup
+STARTUP_WAIT_S = float(os.environ.get("MIND_MCP_STARTUP_WAIT", "60"))
+
+# Tool -> startup subsystems it needs (tools not listed wait for all)
+TOOL_SUBSYSTEMS: Dict[str, Tuple[str, ...]] = {
+    "procedure_start": ("runner",),
+    "procedure_continue": ("runner",),
+    "procedure_abort": ("runner",),
+    "procedure_list": ("runner",),
+    "ACTOR_list": ("agents",),
+    "agent_status": ("agents",),
+    "AGENT_run": ("graph", "agents"),
+    "task_list": ("graph",),
+    "graph_query": ("graph",),
+    "node_create": ("graph",),
+    "capability_status": ("capabilities",),
+    "capability_trigger": ("capabilities",),
+    "capability_list": ("capabilities",),
+    "file_watcher": ("capabilities",),
+    "git_trigger": ("capabilities",),
+    "task_claim": ("graph", "capabilities"),
+    "task_complete": ("graph", "capabilities"),
+    "task_fail": ("graph", "capabilities"),
+    "agent_heartbeat": ("graph", "capabilities"),
+}
+
+
+@dataclass
+class SubsystemStatus:
+    """Startup state of one subsystem."""
+    name: str
+    depends_on: Tuple[str, ...] = ()
+    state: str = "pending"  # pending | running | ready | degraded | failed
+    duration_s: Optional[float] = None
+    note: Optional[str] = None
+
+
+class StartupTracker:
+    """
+    Named startup steps with dependencies and readiness tracking.
+
+    A step returns None when its subsystem is up, or a reason string when it
+    fell back to a degraded mode; an exception marks it failed. Either way
+    it counts as finished, so dependents and waiting tools proceed (tools
+    already handle missing subsystems).
+    """
+
+    def __init__(self):
+        self._steps: Dict[str, Callable[[], Optional[str]]] = {}
+        self._status: Dict[str, SubsystemStatus] = {}
+        self._done: Dict[str, threading.Event] = {}
+        self._started_at = time.perf_counter()
+        self._finished_s: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, name: str, step: Callable[[], Optional[str]], depends_on: Tuple[str, ...] = ()) -> None:
+        self._steps[name] = step
+        self._status[name] = SubsystemStatus(name, tuple(depends_on))
+        self._done[name] = threading.Event()
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._steps)
+
+    def run_all(self) -> None:
+        """Run every step now, in registration order."""
+        self._started_at = time.perf_counter()
+        for name in self._steps:
+            self._run(name)
+
+    def start(self) -> None:
+        """Run every step on its own thread as soon as its dependencies finish."""
+        self._started_at = time.perf_counter()
+        for name in self._steps:
+            threading.Thread(target=self._run, args=(name,), name=f"startup-{name}", daemon=True).start()
+
+    def wait(self, names: Iterable[str], timeout: float) -> List[str]:
+        """Wait for steps to finish. Returns the names still unfinished at timeout."""
+        deadline = time.monotonic() + timeout
+        for name in names:
+            event = self._done.get(name)
+            if event is not None:
+                event.wait(max(0.0, deadline - time.monotonic()))
+        return [name for name in names if name in self._done and not self._done[name].is_set()]
+
+    def report(self) -> str:
+        """Startup-time breakdown, one line per subsystem."""
+        total = self._finished_s if self._finished_s is not None else time.perf_counter() - self._started_at
+        lines = [f"Startup: {total * 1000:.0f}ms{'' if self._finished_s is not None else ' (in progress)'}"]
+        for status in self._status.values():
+            took = f"{status.duration_s * 1000:.0f}ms" if status.duration_s is not None else "-"
+            line = f"  {status.name:<16} {status.state:<9} {took:>8}"
+            if status.note:
+                line += f"  {status.note}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def _run(self, name: str) -> None:
+        status = self._status[name]
+        for dependency in status.depends_on:
+            self._done[dependency].wait()
+
+        status.state = "running"
+        began = time.perf_counter()
+        try:
+            note = self._steps[name]()
+            status.state = "degraded" if note else "ready"
+            status.note = note
+        except Exception as e:
+            logger.exception(f"Startup step {name} failed")
+            status.state = "failed"
+            status.note = str(e)
+        finally:
+            status.duration_s = time.perf_counter() - began
+            self._done[name].set()
+
+        with self._lock:
+            if self._finished_s is None and all(event.is_set() for event in self._done.values()):
+                self._finished_s = time.perf_counter() - self._started_at
+                logger.info(self.report())
+
+
 # =============================================================================
 # MCP PROTOCOL IMPLEMENTATION
 # =============================================================================
@@ -87,20 +235,68 @@ logger = logging.getLogger("mind")
 class MindServer:
     """MCP Server for mind graph tools."""
 
-    def __init__(self, connectomes_dir: Optional[Path] = None):
-        """Initialize server with optional connectomes directory."""
+    def __init__(self, connectomes_dir: Optional[Path] = None, lazy: bool = False):
+        """
+        Initialize server with optional connectomes directory.
+
+        Args:
+            connectomes_dir: Procedures directory (default: <project>/procedures)
+            lazy: Return immediately and bring subsystems up in background
+                threads (each as soon as its dependencies are up). Tool calls
+                wait only for the subsystems they use; initialize and
+                tools/list never wait.
+        """
         self.connectomes_dir = connectomes_dir or (project_root / "procedures")
         self.target_dir = project_root
 
-        # Auto-upgrade check on startup
+        # Subsystem handles; filled in by the startup steps below
+        self.graph_ops = None
+        self.graph_queries = None
+        self.membrane_queries = None
+        self.agent_graph = AgentGraph()  # Fallback mode until "agents" is up
+        self.capability_manager: Optional[CapabilityManager] = None
+        self.runner: Optional[ConnectomeRunner] = None
+
+        # Long-lived event loop for async tool work (started on first use)
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_loop_lock = threading.Lock()
+
+        # The upgrade check may rewrite runtime files, so everything else waits for it
+        self._startup = StartupTracker()
+        self._startup.add("upgrade", self._init_upgrade)
+        self._startup.add("graph", self._init_graph, depends_on=("upgrade",))
+        self._startup.add("membrane", self._init_membrane, depends_on=("upgrade",))
+        self._startup.add("agents", self._init_agents, depends_on=("upgrade",))
+        self._startup.add("capabilities", self._init_capabilities, depends_on=("graph",))
+        self._startup.add("task_assignment", self._init_task_assignment, depends_on=("capabilities",))
+        self._startup.add("runner", self._init_runner, depends_on=("graph",))
+
+        if lazy:
+            self._startup.start()
+        else:
+            self._startup.run_all()
+
+    def startup_report(self) -> str:
+        """Per-subsystem startup state and timing."""
+        return self._startup.report()
+
+    # =========================================================================
+    # STARTUP STEPS (return a reason string when running degraded)
+    # =========================================================================
+
+    def _init_upgrade(self) -> Optional[str]:
+        """Auto-upgrade check on startup."""
         try:
             from runtime.upgrade import check_and_upgrade
             if check_and_upgrade(self.target_dir):
                 logger.info("Runtime upgraded, restart may be needed for full effect")
         except Exception as e:
             logger.debug(f"Upgrade check skipped: {e}")
+            return f"Upgrade check skipped: {e}"
+        return None
 
-        # Try to get graph connections if available
+    def _init_graph(self) -> Optional[str]:
+        """Try to get graph connections if available."""
         try:
             from runtime.physics.graph import GraphOps, GraphQueries
             # Don't pass graph_name - let the adapter use config
@@ -111,8 +307,11 @@ class MindServer:
             logger.warning(f"No graph connection: {e}")
             self.graph_ops = None
             self.graph_queries = None
+            return f"No graph connection: {e}"
+        return None
 
-        # Try to connect to membrane graph
+    def _init_membrane(self) -> Optional[str]:
+        """Try to connect to membrane graph."""
         try:
             from runtime.membrane import get_membrane_queries
             self.membrane_queries = get_membrane_queries()
@@ -121,40 +320,54 @@ class MindServer:
         except Exception as e:
             logger.warning(f"No membrane connection: {e}")
             self.membrane_queries = None
+            return f"No membrane connection: {e}"
+        return None
 
-        # Initialize agent graph for work agent management
+    def _init_agents(self) -> Optional[str]:
+        """Initialize agent graph for work agent management."""
         try:
-            self.agent_graph = AgentGraph()
-            self.agent_graph.ensure_agents_exist()
+            agent_graph = AgentGraph()
+            provisioned = agent_graph.ensure_agents_exist()
+            self.agent_graph = agent_graph
+            if not provisioned:
+                logger.warning("Agent graph not provisioned, using fallback mode")
+                return "Agents not provisioned in the graph (fallback mode)"
             logger.info("Agent graph initialized")
         except Exception as e:
             logger.warning(f"No agent graph: {e}")
             self.agent_graph = AgentGraph()  # Fallback mode
+            return f"No agent graph: {e}"
+        return None
 
-        # Initialize capability manager
-        self.capability_manager: Optional[CapabilityManager] = None
-        if CAPABILITY_RUNTIME_AVAILABLE:
-            try:
-                self.capability_manager = init_capability_manager(
-                    target_dir=self.target_dir,
-                    graph=self.graph_ops,
-                )
-                cap_summary = self.capability_manager.initialize()
-                logger.info(f"Capabilities: {cap_summary}")
+    def _init_capabilities(self) -> Optional[str]:
+        """Initialize capability manager, cron scheduler and startup trigger."""
+        if not CAPABILITY_RUNTIME_AVAILABLE:
+            return "Capability runtime not available"
+        try:
+            capability_manager = init_capability_manager(
+                target_dir=self.target_dir,
+                graph=self.graph_ops,
+            )
+            cap_summary = capability_manager.initialize()
+            logger.info(f"Capabilities: {cap_summary}")
 
-                # Start cron scheduler
-                self.capability_manager.start_cron_scheduler()
+            # Start cron scheduler
+            capability_manager.start_cron_scheduler()
 
-                # Fire startup trigger
-                startup_result = self.capability_manager.fire_trigger(
-                    "init.startup", {}, create_tasks=True
-                )
-                logger.info(f"Startup trigger: {startup_result}")
-            except Exception as e:
-                logger.warning(f"Capability system failed: {e}")
-                self.capability_manager = None
+            # Fire startup trigger
+            startup_result = capability_manager.fire_trigger(
+                "init.startup", {}, create_tasks=True
+            )
+            logger.info(f"Startup trigger: {startup_result}")
+            self.capability_manager = capability_manager
+        except Exception as e:
+            logger.warning(f"Capability system failed: {e}")
+            self.capability_manager = None
+            return f"Capability system failed: {e}"
+        return None
 
-        # Auto-assign pending tasks on startup
+    def _init_task_assignment(self) -> Optional[str]:
+        """Auto-assign pending tasks on startup."""
         try:
             from runtime.task_assignment import startup_assign
             assigned, skipped = startup_assign(self.target_dir)
@@ -162,12 +375,38 @@ class MindServer:
                 logger.info(f"Task assignment: {assigned} assigned, {skipped} skipped")
         except Exception as e:
             logger.debug(f"Task assignment skipped: {e}")
+            return f"Task assignment skipped: {e}"
+        return None
 
+    def _init_runner(self) -> Optional[str]:
+        """Procedure runner over the graph connection."""
         self.runner = ConnectomeRunner(
             graph_ops=self.graph_ops,
             graph_queries=self.graph_queries,
             connectomes_dir=self.connectomes_dir
         )
+        return None
+
+    def _run_async(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the server's long-lived event loop and wait for it.
+
+        Called from request handlers (main or worker threads). One loop for
+        the server's lifetime means async adapters and their connection
+        pools are reused instead of rebuilt per request.
+        """
+        with self._async_loop_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="mind-async", daemon=True).start()
+                self._async_loop = loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._async_loop:
+            raise RuntimeError("_run_async() called from the async loop itself; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, self._async_loop).result()
 
     def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a JSON-RPC request."""
@@ -572,6 +811,15 @@ class MindServer:
         tool_name = params.get("name", "")
         arguments = params.get("arguments", {})
 
+        # Wait for the subsystems this tool uses (lazy startup)
+        needs = TOOL_SUBSYSTEMS.get(tool_name, self._startup.names())
+        starting = self._startup.wait(needs, timeout=STARTUP_WAIT_S)
+        if starting:
+            return {"content": [{"type": "text", "text": (
+                f"Error: still starting up ({', '.join(starting)}); retry shortly.\n\n"
+                f"{self.startup_report()}"
+            )}]}
+
         if tool_name == "procedure_start":
             return self._tool_start(arguments)
         elif tool_name == "procedure_continue":
@@ -939,15 +1187,7 @@ Please investigate and fix this problem. Follow the project's coding standards a
                 task_id=assignment_task_id,
                 problem_ids=problem_ids,
             )
-            # Handle both sync and async contexts
-            try:
-                loop = asyncio.get_running_loop()
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    run_result = pool.submit(asyncio.run, coro).result()
-            except RuntimeError:
-                # No running loop, use asyncio.run directly
-                run_result = asyncio.run(coro)
+            run_result = self._run_async(coro)
 
             # Build response with node details
             lines = [
@@ -1104,7 +1344,7 @@ Please investigate and fix this problem. Follow the project's coding standards a
 
         try:
             # Run queries
-            results = asyncio.run(
+            results = self._run_async(
                 self._ask_async(queries, actor_id, intent, timeout, debug, debug_lines)
             )
 
@@ -1198,7 +1438,8 @@ Please investigate and fix this problem. Follow the project's coding standards a
     async def _ask_single(self, query: str, actor_id: str, intent: Optional[str], timeout: float, debug: bool, debug_lines: List[str]) -> str:
         """Async SubEntity exploration to answer a single query."""
         import time
-        from runtime.infrastructure.embeddings.service import get_embedding_service
+        from runtime.infrastructure.embeddings.scheduler import get_embedding_scheduler
+        from runtime.infrastructure.database import get_async_database_adapter
         start = time.time()
 
         try:
@@ -1209,14 +1450,20 @@ Please investigate and fix this problem. Follow the project's coding standards a
                 debug_lines.append(f"Actor: {actor_id}, Timeout: {timeout}s")
 
             # Create query moment and link to actor
-            embed_service = get_embedding_service()
-            moment_id = self.graph_queries._create_query_moment(
-                query=query,
-                embed_fn=embed_service.embed,
-                initial_energy=1.0
+            # Concurrent queries' embeddings are encoded as one batch
+            query_embedding = await get_embedding_scheduler().embed(query)
+            # Sync graph call: run it off the shared loop so other requests proceed
+            moment_id = await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: self.graph_queries._create_query_moment(
+                    query=query,
+                    embed_fn=lambda _text: query_embedding,
+                    initial_energy=1.0,
+                ),
             )
-            # Link actor to moment
-            self.graph_queries._query("""
+            # Link actor to moment (pooled async queries: don't block the loop)
+            db = get_async_database_adapter(graph_name=self.graph_queries.graph_name)
+            await db.execute("""
                 MATCH (a {id: $actor_id})
                 MATCH (m {id: $moment_id})
                 MERGE (a)-[r:link]->(m)
@@ -1224,7 +1471,7 @@ Please investigate and fix this problem. Follow the project's coding standards a
             """, {'actor_id': actor_id, 'moment_id': moment_id})
 
             # Link to previous actor moment
-            prev_moment = self.graph_queries._query("""
+            prev_moment = await db.query("""
                 MATCH (a {id: $actor_id})-[:link]->(m:Moment)
                 WHERE m.id <> $moment_id
                 RETURN m.id
@@ -1234,7 +1481,7 @@ Please investigate and fix this problem. Follow the project's coding standards a
             if prev_moment:
                 prev_id = prev_moment[0][0] if prev_moment[0] else None
                 if prev_id:
-                    self.graph_queries._query("""
+                    await db.execute("""
                         MATCH (prev {id: $prev_id})
                         MATCH (curr {id: $curr_id})
                         MERGE (prev)-[r:link]->(curr)
@@ -1292,23 +1539,25 @@ Please investigate and fix this problem. Follow the project's coding standards a
                 elif "retriev" in intent_lower or "get" in intent_lower:
                     intent_type = IntentionType.RETRIEVE
 
-            # Fetch actual content for each found narrative
+            # Fetch actual content for every found narrative in one query
             nodes = []
-            query_embedding = embed_service.embed(query)
+            narr_rows = await db.query("""
+                UNWIND $narr_ids AS narr_id
+                MATCH (n {id: narr_id})
+                RETURN n.id, n.name, n.content, n.synthesis, n.node_type, n.energy, n.weight
+            """, {'narr_ids': list(result.found_narratives)})
+            narr_by_id = {row[0]: row[1:] for row in narr_rows if row}
 
             for narr_id, alignment in result.found_narratives.items():
-                narr_data = self.graph_queries._query("""
-                    MATCH (n {id: $narr_id})
-                    RETURN n.name, n.content, n.synthesis, n.node_type, n.energy, n.weight
-                """, {'narr_id': narr_id})
-
-                if narr_data and narr_data[0]:
-                    name = narr_data[0][0] or narr_id
-                    content = narr_data[0][1] or ""
-                    synthesis = narr_data[0][2] or name
-                    node_type = narr_data[0][3] or "narrative"
-                    energy = narr_data[0][4] or 1.0
-                    weight = narr_data[0][5] or alignment
+                narr_data = narr_by_id.get(narr_id)
+
+                if narr_data:
+                    name = narr_data[0] or narr_id
+                    content = narr_data[1] or ""
+                    synthesis = narr_data[2] or name
+                    node_type = narr_data[3] or "narrative"
+                    energy = narr_data[4] or 1.0
+                    weight = narr_data[5] or alignment
 
                     # Use content or synthesis for display
                     display_text = synthesis if synthesis else (content[:200] if content else name)
@@ -1919,31 +2168,165 @@ Please investigate and fix this problem. Follow the project's coding standards a
         }
 
 
-def main():
-    """Run the MCP server on stdio."""
-    server = MindServer()
-    logger.info("Mind MCP server started")
+def _parse_error_response(error: json.JSONDecodeError) -> Dict[str, Any]:
+    """JSON-RPC parse error (no request id available)."""
+    return {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {
+            "code": -32700,
+            "message": f"Parse error: {error}"
+        }
+    }
+
+
+def _invalid_request_response() -> Dict[str, Any]:
+    """JSON-RPC invalid request (valid JSON, but not a request object)."""
+    return {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {
+            "code": -32600,
+            "message": "Invalid Request: expected a JSON object"
+        }
+    }
+
+
+def _internal_error_response(request: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    """JSON-RPC internal error for a request handle_request failed on."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request.get("id"),
+        "error": {
+            "code": -32603,
+            "message": f"Internal error: {error}"
+        }
+    }
+
+
+def _respond(server: MindServer, request: Any) -> Dict[str, Any]:
+    """Response for one decoded line; never raises."""
+    if not isinstance(request, dict):
+        return _invalid_request_response()
+    try:
+        return server.handle_request(request)
+    except Exception as e:
+        logger.exception("Unhandled error handling request")
+        return _internal_error_response(request, e)
+
+
+def serve_serial(server: MindServer, stdin: TextIO = None, stdout: TextIO = None) -> None:
+    """Handle stdio JSON-RPC one request at a time."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
 
     # Read JSON-RPC messages from stdin
-    for line in sys.stdin:
+    for line in stdin:
         line = line.strip()
         if not line:
             continue
 
         try:
-            request = json.loads(line)
-            response = server.handle_request(request)
-            print(json.dumps(response), flush=True)
+            response = _respond(server, json.loads(line))
         except json.JSONDecodeError as e:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {
-                    "code": -32700,
-                    "message": f"Parse error: {e}"
-                }
-            }
-            print(json.dumps(error_response), flush=True)
+            response = _parse_error_response(e)
+        print(json.dumps(response), file=stdout, flush=True)
+
+
+async def serve_stdio(
+    server: MindServer,
+    workers: int = DEFAULT_WORKERS,
+    stdin: TextIO = None,
+    stdout: TextIO = None,
+) -> None:
+    """
+    Handle stdio JSON-RPC concurrently.
+
+    Lines are read as they arrive (on a reader thread) and each request is
+    handled on a pool of `workers` threads. Responses are written as soon
+    as they are ready, so a slow graph_query or AGENT_run no longer holds
+    up other calls; clients match responses by id. At most
+    workers * MAX_PENDING_PER_WORKER requests are in flight, after which
+    reading pauses. Every request line gets a response, an error one if its
+    handler raised. Returns once stdin closes and in-flight requests finish.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-worker")
+    reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-stdin")
+    slots = asyncio.Semaphore(workers * MAX_PENDING_PER_WORKER)
+    in_flight = set()
+
+    def write(response: Dict[str, Any]) -> None:
+        # Only called on the loop thread, so lines never interleave
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+    async def dispatch(request: Dict[str, Any]) -> None:
+        try:
+            try:
+                response = await loop.run_in_executor(pool, _respond, server, request)
+            except Exception as e:
+                logger.exception("Unhandled error dispatching request")
+                response = _internal_error_response(request, e)
+            write(response)
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            line = await loop.run_in_executor(reader, stdin.readline)
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                write(_parse_error_response(e))
+                continue
+            if not isinstance(request, dict):
+                write(_invalid_request_response())
+                continue
+
+            await slots.acquire()
+            task = loop.create_task(dispatch(request))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+    finally:
+        pool.shutdown(wait=False)
+        reader.shutdown(wait=False)
+
+
+def main():
+    """Run the MCP server on stdio."""
+    parser = argparse.ArgumentParser(description="Mind MCP server (JSON-RPC over stdio)")
+    parser.add_argument(
+        "--workers", type=int,
+        default=int(os.environ.get("MIND_MCP_WORKERS", DEFAULT_WORKERS)),
+        help="Requests handled concurrently (default: MIND_MCP_WORKERS or 8)",
+    )
+    parser.add_argument("--serial", action="store_true", help="Handle one request at a time")
+    parser.add_argument(
+        "--eager-startup", action="store_true",
+        help="Bring every subsystem up before answering (default: in the background)",
+    )
+    args = parser.parse_args()
+
+    server = MindServer(lazy=not args.eager_startup)
+
+    if args.serial:
+        logger.info("Mind MCP server started (serial)")
+        serve_serial(server)
+    else:
+        logger.info(f"Mind MCP server started ({args.workers} workers)")
+        asyncio.run(serve_stdio(server, workers=max(1, args.workers)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+"""
+Agent Embedding Cache
+
+Cached embedding matrices for agent selection and salient-term extraction.
+
+Both used to score candidates one at a time: select_agent_for_task looped
+over agent rows, and _extract_salient_terms issued one unlabeled
+`MATCH (n {name: $name})` query per vocabulary name. Each now loads its
+candidates once into a row-normalized float32 matrix, and a query is one
+matrix-vector product plus a top-k.
+
+Freshness:
+    - Mutation events (node_created / node_updated) mark a matrix stale;
+      it reloads, with one query, on next use.
+    - A matrix older than max_age_s reloads anyway, for writers that bypass
+      the event hook (ensure_agents_exist, embed_pending, inject).
+
+Usage:
+    from runtime.agents.embedding_cache import get_vocabulary_matrix
+
+    hits = get_vocabulary_matrix(graph_name).top_k(embedding, 3)  # [(name, cosine)]
+
+DOCS: docs/agents/PATTERNS_Agent_System.md
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from runtime.physics.graph.graph_ops_events import add_mutation_listener
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_S = 60.0
+VOCABULARY_LIMIT = 500  # Named nodes considered as salient-term candidates
+
+VOCABULARY_QUERY = """
+    MATCH (n)
+    WHERE n.embedding IS NOT NULL
+    AND n.name IS NOT NULL
+    AND n.name <> ''
+    RETURN n.name, n.embedding
+    LIMIT $limit
+"""
+
+AGENT_QUERY = """
+    MATCH (a:Actor)
+    WHERE a.type = 'agent' AND a.embedding IS NOT NULL
+    RETURN a.id, a.embedding
+"""
+
+
+class EmbeddingMatrix:
+    """
+    Keys plus a row-normalized embedding matrix, loaded by one query.
+
+    load() returns rows of (key, embedding). Duplicate keys keep their first
+    row; embeddings whose dimension differs from the first are skipped.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], List[Sequence[Any]]],
+        node_types: Optional[Collection[str]] = None,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+    ):
+        self._load = load
+        self.node_types = set(node_types) if node_types else None
+        self.max_age_s = max_age_s
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Reload on next use."""
+        self._loaded_at = None
+
+    def on_mutation(self, event: Dict[str, Any]) -> None:
+        """Mutation listener: node writes (of node_types, if set) mark the matrix stale."""
+        if event.get('type') not in ('node_created', 'node_updated'):
+            return
+        node_type = str((event.get('data') or {}).get('type', '')).lower()
+        if self.node_types is None or node_type in self.node_types:
+            self.invalidate()
+
+    def similarities(
+        self,
+        embedding: Sequence[float],
+        keys: Optional[Collection[str]] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Cosine of embedding against every cached row (or only `keys`).
+
+        Returns:
+            (keys, scores) aligned; empty when nothing is cached or dims differ
+        """
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.max_age_s:
+                self._refresh()
+            all_keys, matrix, rows = self._keys, self._matrix, self._rows
+
+        query = np.asarray(embedding, dtype=np.float32)
+        if matrix is None or query.shape != (matrix.shape[1],):
+            return [], np.zeros(0, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        if keys is None:
+            return list(all_keys), matrix @ query
+        picked = [k for k in keys if k in rows]
+        return picked, matrix[[rows[k] for k in picked]] @ query
+
+    def top_k(self, embedding: Sequence[float], k: int) -> List[Tuple[str, float]]:
+        """Top-k (key, cosine), best first."""
+        keys, scores = self.similarities(embedding)
+        if k <= 0 or not keys:
+            return []
+        if k < len(keys):
+            idx = np.argpartition(-scores, k - 1)[:k]
+        else:
+            idx = np.arange(len(keys))
+        idx = idx[np.argsort(-scores[idx], kind='stable')]
+        return [(keys[i], float(scores[i])) for i in idx]
+
+    def _refresh(self) -> None:
+        keys: List[str] = []
+        rows: Dict[str, int] = {}
+        vectors: List[List[float]] = []
+        for row in self._load() or []:
+            key, value = row[0], row[1]
+            if not key or key in rows or not value:
+                continue
+            try:
+                vector = json.loads(value) if isinstance(value, str) else value
+            except ValueError:
+                continue
+            if vectors and len(vector) != len(vectors[0]):
+                continue
+            rows[key] = len(keys)
+            keys.append(key)
+            vectors.append(vector)
+
+        matrix = None
+        if vectors:
+            matrix = np.asarray(vectors, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+
+        self._keys, self._rows, self._matrix = keys, rows, matrix
+        self._loaded_at = time.monotonic()
+        logger.debug(f"[AgentEmbeddingCache] Loaded {len(keys)} embeddings")
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_matrices: Dict[Tuple[str, Optional[str]], EmbeddingMatrix] = {}
+_matrices_lock = threading.Lock()
+
+
+def _get_matrix(
+    kind: str,
+    graph_name: Optional[str],
+    cypher: str,
+    params: Dict[str, Any],
+    node_types: Optional[Collection[str]] = None,
+) -> EmbeddingMatrix:
+    with _matrices_lock:
+        matrix = _matrices.get((kind, graph_name))
+        if matrix is None:
+            def load() -> List[Sequence[Any]]:
+                from runtime.infrastructure.database import get_database_adapter
+                return get_database_adapter(graph_name=graph_name).query(cypher, params)
+
+            matrix = EmbeddingMatrix(load, node_types=node_types)
+            add_mutation_listener(matrix.on_mutation)
+            _matrices[(kind, graph_name)] = matrix
+        return matrix
+
+
+def get_vocabulary_matrix(graph_name: Optional[str] = None) -> EmbeddingMatrix:
+    """Shared name -> embedding matrix of named graph nodes (salient-term vocabulary)."""
+    return _get_matrix('vocabulary', graph_name, VOCABULARY_QUERY, {'limit': VOCABULARY_LIMIT})
+
+
+def get_agent_matrix(graph_name: Optional[str] = None) -> EmbeddingMatrix:
+    """Shared actor id -> embedding matrix of agent Actors."""
+    return _get_matrix('agents', graph_name, AGENT_QUERY, {}, node_types=('actor', 'character', 'agent'))
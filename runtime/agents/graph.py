@@ -29,7 +29,9 @@ import time
 import hashlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any
+
+import numpy as np
 
 from .mapping import NAME_TO_AGENT_ID, DEFAULT_NAME
 
@@ -57,57 +59,15 @@ def _extract_salient_terms(
 
     try:
         from runtime.infrastructure.embeddings import get_embedding
-        from runtime.infrastructure.database import get_database_adapter
+        from .embedding_cache import get_vocabulary_matrix
 
         # Embed the content
         embedding = get_embedding(content[:2000])  # Truncate for embedding
         if not embedding:
             return []
 
-        adapter = get_database_adapter(graph_name=graph_name)
-
-        # Vector search against all nodes with embeddings
-        # Look for Space, Narrative, Thing nodes that have names
-        results = adapter.query("""
-            MATCH (n)
-            WHERE n.embedding IS NOT NULL
-            AND n.name IS NOT NULL
-            AND n.name <> ''
-            RETURN n.name, n.type, n.id
-            LIMIT 500
-        """)
-
-        if not results:
-            return []
-
-        # Compute similarities
-        from runtime.infrastructure.embeddings import cosine_similarity
-
-        scored: List[Tuple[float, str]] = []
-        seen_names = set()
-
-        for row in results:
-            name = row[0]
-            if not name or name in seen_names:
-                continue
-            seen_names.add(name)
-
-            # Get node embedding for comparison
-            node_result = adapter.query(f"""
-                MATCH (n {{name: $name}})
-                WHERE n.embedding IS NOT NULL
-                RETURN n.embedding
-                LIMIT 1
-            """, {"name": name})
-
-            if node_result and node_result[0][0]:
-                node_embedding = node_result[0][0]
-                sim = cosine_similarity(embedding, node_embedding)
-                scored.append((sim, name))
-
-        # Sort by similarity, take top_k
-        scored.sort(reverse=True, key=lambda x: x[0])
-        top_terms = [name for _, name in scored[:top_k]]
+        # One matrix-vector product against the cached graph vocabulary
+        top_terms = [name for name, _ in get_vocabulary_matrix(graph_name).top_k(embedding, top_k)]
 
         # Clean terms: split on separators, capitalize each part
         clean_terms = []
@@ -264,6 +224,7 @@ class AgentGraph:
 
         try:
             timestamp = int(time.time())
+            created = False
 
             for name, actor_id in NAME_TO_AGENT_ID.items():
                 cypher = f"""
@@ -292,7 +253,11 @@ class AgentGraph:
                     """
                     self._graph_ops._query(create_cypher, {"id": actor_id, "props": props})
                     logger.info(f"[AgentGraph] Created agent: {actor_id}")
+                    created = True
 
+            if created:
+                from .embedding_cache import get_agent_matrix
+                get_agent_matrix(self.graph_name).invalidate()
             return True
         except Exception as e:
             logger.error(f"[AgentGraph] Failed to ensure agents exist: {e}")
@@ -374,39 +339,29 @@ class AgentGraph:
             return available[0].id
 
         try:
-            from runtime.infrastructure.embeddings import get_embedding, cosine_similarity
+            from runtime.infrastructure.embeddings import get_embedding
+            from .embedding_cache import get_agent_matrix
 
             task_embedding = get_embedding(task_synthesis)
             if not task_embedding:
                 available.sort(key=lambda a: a.energy, reverse=True)
                 return available[0].id
 
-            # Get agent embeddings and compute scores
-            available_ids = [a.id for a in available]
-            cypher = """
-            MATCH (a:Actor)
-            WHERE a.id IN $ids AND a.embedding IS NOT NULL
-            RETURN a.id, a.embedding, a.weight, a.energy
-            """
-            rows = self._graph_ops._query(cypher, {"ids": available_ids})
+            # Similarity of every available agent from the cached agent matrix
+            by_id = {a.id: a for a in available}
+            agent_ids, similarity = get_agent_matrix(self.graph_name).similarities(task_embedding, by_id)
 
             best_agent = None
             best_score = -1.0
-
-            for row in rows:
-                agent_id = row[0]
-                agent_embedding = row[1]
-                agent_weight = row[2] or 1.0
-                agent_energy = row[3] or 0.0
-
-                if agent_embedding:
-                    similarity = cosine_similarity(task_embedding, agent_embedding)
-                    # Score = similarity * weight * energy
-                    score = similarity * agent_weight * max(agent_energy, 0.1)
-
-                    if score > best_score:
-                        best_score = score
-                        best_agent = agent_id
+            if agent_ids:
+                # Score = similarity * weight * energy
+                weight = np.array([by_id[i].weight or 1.0 for i in agent_ids], dtype=np.float32)
+                energy = np.array([by_id[i].energy or 0.0 for i in agent_ids], dtype=np.float32)
+                scores = similarity * weight * np.maximum(energy, 0.1)
+                best = int(np.argmax(scores))
+                if scores[best] > best_score:
+                    best_score = float(scores[best])
+                    best_agent = agent_ids[best]
 
             if best_agent:
                 logger.info(f"[AgentGraph] Selected {best_agent} (score={best_score:.3f})")
@@ -430,6 +430,17 @@ def main():
         action="store_true",
         help="Extract without upserting to graph"
     )
+    symbols_parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Parsing processes (default: CPU count, 1 = in-process)"
+    )
+    symbols_parser.add_argument(
+        "--incremental", "-i",
+        action="store_true",
+        help="Only re-parse files changed since the last run"
+    )
     symbols_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -930,11 +941,16 @@ def main():
             result = extract_symbols_command(
                 directory=args.folder,
                 graph_name=args.graph,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                workers=args.workers,
+                incremental=args.incremental
             )
 
             print(f"\nSymbol Extraction Complete:")
             print(f"  Files scanned: {result.files}")
+            if args.incremental:
+                print(f"  Files unchanged: {result.files_unchanged}")
+                print(f"  Symbols deleted: {result.symbols_deleted}")
             print(f"  Symbols extracted: {result.symbols}")
             print(f"  Links created: {result.links}")
 
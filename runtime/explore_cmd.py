@@ -36,305 +36,22 @@ from runtime.physics.traversal_logger import (
 )
 
 
-def get_graph_interface(graph_name: Optional[str] = None) -> GraphInterface:
+async def get_graph_interface(graph_name: Optional[str] = None) -> GraphInterface:
     """
-    Get a GraphInterface implementation connected to FalkorDB.
-    Uses raw Cypher queries for low-level graph access.
+    Get a GraphInterface for one exploration, over the pooled async adapter.
+
+    Concurrent SubEntity branches query concurrently; nodes and links are
+    cached for the exploration (see runtime/physics/exploration_graph.py).
     """
-    from runtime.physics.graph.graph_queries import GraphQueries
+    from runtime.infrastructure.database import get_async_database_adapter
+    from runtime.physics.exploration_graph import ExplorationGraph
 
     try:
-        gq = GraphQueries(graph_name=graph_name)
-        graph = gq.graph  # Raw FalkorDB graph
-        print(f"Connected to graph: {gq.graph_name}")
-
-        # Embedding service not used during exploration (causes feedback loop)
-        # Query embedding done separately in get_embedding()
-        _embed_svc = None
-
-        def _query(cypher: str) -> List[Dict]:
-            """Run Cypher query and return results as dicts."""
-            result = graph.query(cypher)
-            return [dict(zip(result.header, row)) for row in result.result_set]
-
-        def _parse_embedding(value) -> Optional[List[float]]:
-            """Parse embedding from database - handles string-serialized embeddings."""
-            if value is None:
-                return None
-            if isinstance(value, list):
-                # Already a list, ensure floats
-                return [float(x) for x in value]
-            if isinstance(value, str):
-                # JSON-serialized string like "[0.1, 0.2, ...]"
-                import json
-                try:
-                    parsed = json.loads(value)
-                    if isinstance(parsed, list):
-                        return [float(x) for x in parsed]
-                except (json.JSONDecodeError, ValueError):
-                    pass
-            return None
-
-        def _node_to_dict(node) -> Dict[str, Any]:
-            """Convert FalkorDB node to dict."""
-            if node is None:
-                return None
-            props = dict(node.properties) if hasattr(node, 'properties') else {}
-            props['id'] = props.get('id', '')
-            # Parse embedding if stored as string
-            if 'embedding' in props:
-                props['embedding'] = _parse_embedding(props['embedding'])
-            return props
-
-        def _rel_to_dict(rel, from_id: str, to_id: str) -> Dict[str, Any]:
-            """Convert FalkorDB relationship to dict."""
-            if rel is None:
-                return None
-            props = dict(rel.properties) if hasattr(rel, 'properties') else {}
-            props['from_id'] = from_id
-            props['to_id'] = to_id
-            props['node_a'] = from_id  # for link_scoring compatibility
-            props['node_b'] = to_id    # for link_scoring compatibility
-            props['type'] = rel.relation if hasattr(rel, 'relation') else ''
-
-            # Normalize polarity: convert list format [a→b, b→a] to polarity_ab/polarity_ba
-            # This handles both new schema (polarity as list) and legacy (polarity_ab/polarity_ba)
-            polarity = props.get('polarity')
-            if polarity is not None:
-                if isinstance(polarity, (list, tuple)) and len(polarity) >= 2:
-                    props['polarity_ab'] = float(polarity[0])
-                    props['polarity_ba'] = float(polarity[1])
-                elif isinstance(polarity, (int, float)):
-                    # Single value - use for both directions
-                    props['polarity_ab'] = float(polarity)
-                    props['polarity_ba'] = float(polarity)
-            # Ensure defaults if not set
-            if 'polarity_ab' not in props:
-                props['polarity_ab'] = 0.5
-            if 'polarity_ba' not in props:
-                props['polarity_ba'] = 0.5
-
-            # Parse embedding if stored as string
-            if 'embedding' in props:
-                props['embedding'] = _parse_embedding(props['embedding'])
-
-            return props
-
-        async def get_node(node_id: str) -> Optional[Dict[str, Any]]:
-            try:
-                result = graph.query(f"MATCH (n {{id: '{node_id}'}}) RETURN n")
-                if result.result_set:
-                    return _node_to_dict(result.result_set[0][0])
-            except:
-                pass
-            return None
-
-        async def get_node_embedding(node_id: str) -> Optional[List[float]]:
-            node = await get_node(node_id)
-            return node.get('embedding') if node else None
-
-        async def get_outgoing_links(node_id: str) -> List[Dict[str, Any]]:
-            """Get all traversable links from a node (both directions)."""
-            try:
-                links = []
-                # Outgoing links (node → target)
-                result = graph.query(f"""
-                    MATCH (n {{id: '{node_id}'}})-[r]->(m)
-                    RETURN r, n.id as from_id, m.id as to_id, m.node_type as to_type
-                """)
-                for row in result.result_set:
-                    rel, from_id, to_id, to_type = row
-                    link = _rel_to_dict(rel, from_id, to_id)
-                    link['to_type'] = to_type
-                    links.append(link)
-
-                # Incoming links (source → node) - traverse in reverse
-                result = graph.query(f"""
-                    MATCH (m)-[r]->(n {{id: '{node_id}'}})
-                    RETURN r, m.id as source_id, n.id as target_id, m.node_type as source_type
-                """)
-                for row in result.result_set:
-                    rel, source_id, target_id, source_type = row
-                    # Swap: we traverse FROM node_id TO source_id
-                    link = _rel_to_dict(rel, target_id, source_id)
-                    link['node_a'] = target_id  # current node
-                    link['node_b'] = source_id  # where we're going
-                    link['to_id'] = source_id
-                    link['from_id'] = target_id
-                    link['to_type'] = source_type
-                    # Swap polarity for reverse traversal
-                    pab = link.get('polarity_ab', 0.5)
-                    pba = link.get('polarity_ba', 0.5)
-                    link['polarity_ab'] = pba
-                    link['polarity_ba'] = pab
-                    links.append(link)
-
-                return links
-            except Exception as e:
-                print(f"get_outgoing_links error: {e}")
-                return []
-
-        async def get_incoming_links(node_id: str) -> List[Dict[str, Any]]:
-            try:
-                result = graph.query(f"""
-                    MATCH (m)-[r]->(n {{id: '{node_id}'}})
-                    RETURN r, m.id as from_id, n.id as to_id, m.node_type as from_type
-                """)
-                links = []
-                for row in result.result_set:
-                    rel, from_id, to_id, from_type = row
-                    link = _rel_to_dict(rel, from_id, to_id)
-                    link['from_type'] = from_type
-                    links.append(link)
-                return links
-            except:
-                return []
-
-        async def get_link(link_id: str) -> Optional[Dict[str, Any]]:
-            """Get link by ID."""
-            try:
-                result = graph.query(f"""
-                    MATCH (a)-[r:link {{id: '{link_id}'}}]->(b)
-                    RETURN r, a.id as from_id, b.id as to_id
-                """)
-                if result.result_set:
-                    rel, from_id, to_id = result.result_set[0]
-                    return _rel_to_dict(rel, from_id, to_id)
-            except:
-                pass
-            return None
-
-        async def get_link_embedding(link_id: str) -> Optional[List[float]]:
-            link = await get_link(link_id)
-            return link.get('embedding') if link else None
-
-        async def get_all_narratives() -> List[tuple]:
-            try:
-                result = graph.query("MATCH (n {node_type: 'narrative'}) RETURN n.id, n.embedding")
-                return [(row[0], row[1]) for row in result.result_set]
-            except:
-                return []
-
-        async def is_narrative(node_id: str) -> bool:
-            node = await get_node(node_id)
-            return node.get('node_type') == 'narrative' if node else False
-
-        async def is_moment(node_id: str) -> bool:
-            node = await get_node(node_id)
-            return node.get('node_type') == 'moment' if node else False
-
-        async def update_node(node_id: str, updates: Dict[str, Any]) -> None:
-            """Update node properties by ID."""
-            if not updates:
-                return
-            set_parts = []
-            for key, value in updates.items():
-                if isinstance(value, str):
-                    set_parts.append(f"n.{key} = '{value}'")
-                elif isinstance(value, (int, float)):
-                    set_parts.append(f"n.{key} = {value}")
-            if set_parts:
-                set_clause = ", ".join(set_parts)
-                try:
-                    graph.query(f"MATCH (n {{id: '{node_id}'}}) SET {set_clause}")
-                except Exception as e:
-                    print(f"update_node failed: {e}")
-
-        async def update_link(link_id: str, updates: Dict[str, Any]) -> None:
-            pass  # Not implemented for now
-
-        async def create_narrative(data: Dict[str, Any]) -> str:
-            """Persist narrative from crystallization."""
-            import uuid
-            narr_id = f"narrative_cryst_{uuid.uuid4().hex[:8]}"
-            try:
-                graph.query("""
-                    CREATE (n:Narrative {
-                        id: $id, name: $name, node_type: 'narrative',
-                        weight: $weight, energy: $energy,
-                        content: $content, synthesis: $synthesis
-                    })
-                """, {
-                    'id': narr_id,
-                    'name': data.get('name', ''),
-                    'weight': data.get('weight', 1.0),
-                    'energy': data.get('energy', 1.0),
-                    'content': data.get('content', ''),
-                    'synthesis': data.get('synthesis', ''),
-                })
-            except Exception as e:
-                print(f"create_narrative failed: {e}")
-            return narr_id
-
-        async def create_link(data: Dict[str, Any]) -> str:
-            """Persist link from crystallization (no embedding - causes feedback loop)."""
-            import uuid
-            link_id = f"link_{uuid.uuid4().hex[:8]}"
-            node_a, node_b = data.get('node_a'), data.get('node_b')
-            if not node_a or not node_b:
-                return link_id
-            polarity = data.get('polarity', [0.5, 0.5])
-
-            # Don't embed during exploration - causes crystallization feedback loop
-            # Crystallized links use default sem=0.5 until embedded by helper
-            embedding = None
-
-            try:
-                params = {
-                    'a': node_a, 'b': node_b, 'id': link_id,
-                    'w': data.get('weight', 1.0),
-                    'e': data.get('energy', 0.0),
-                    'h': data.get('hierarchy', 0.0),
-                    'p': data.get('permanence', 0.5),
-                    'pab': polarity[0], 'pba': polarity[1] if len(polarity) > 1 else polarity[0],
-                    'js': data.get('joy_sadness', 0.0),
-                    'td': data.get('trust_disgust', 0.0),
-                    'fa': data.get('fear_anger', 0.0),
-                    'sa': data.get('surprise_anticipation', 0.0),
-                }
-                if embedding:
-                    params['emb'] = embedding
-                    graph.query("""
-                        MATCH (a {id: $a}), (b {id: $b})
-                        CREATE (a)-[r:link {
-                            id: $id, weight: $w, energy: $e,
-                            hierarchy: $h, permanence: $p,
-                            polarity_ab: $pab, polarity_ba: $pba,
-                            joy_sadness: $js, trust_disgust: $td,
-                            fear_anger: $fa, surprise_anticipation: $sa,
-                            embedding: $emb
-                        }]->(b)
-                    """, params)
-                else:
-                    graph.query("""
-                        MATCH (a {id: $a}), (b {id: $b})
-                        CREATE (a)-[r:link {
-                            id: $id, weight: $w, energy: $e,
-                            hierarchy: $h, permanence: $p,
-                            polarity_ab: $pab, polarity_ba: $pba,
-                            joy_sadness: $js, trust_disgust: $td,
-                            fear_anger: $fa, surprise_anticipation: $sa
-                        }]->(b)
-                    """, params)
-            except Exception as e:
-                print(f"create_link failed: {e}")
-            return link_id
-
-        return GraphInterface(
-            get_node=get_node,
-            get_node_embedding=get_node_embedding,
-            get_outgoing_links=get_outgoing_links,
-            get_incoming_links=get_incoming_links,
-            get_link=get_link,
-            get_link_embedding=get_link_embedding,
-            get_all_narratives=get_all_narratives,
-            is_narrative=is_narrative,
-            is_moment=is_moment,
-            update_node=update_node,
-            update_link=update_link,
-            create_narrative=create_narrative,
-            create_link=create_link,
-        )
+        adapter = get_async_database_adapter(graph_name=graph_name)
+        if not await adapter.health_check():
+            raise ConnectionError(f"graph {adapter.graph_name} is not reachable")
+        print(f"Connected to graph: {adapter.graph_name}")
+        return ExplorationGraph(adapter).interface()
     except Exception as e:
         print(f"Warning: Could not connect to graph: {e}")
         print("Using mock graph interface for testing.")
@@ -408,6 +125,15 @@ def get_embedding(text: str) -> List[float]:
     return svc.embed(text)
 
 
+async def get_embedding_async(text: str) -> List[float]:
+    """
+    Async get_embedding: concurrent callers share batched encodes
+    (see embeddings/scheduler.py) and the event loop isn't blocked.
+    """
+    from runtime.infrastructure.embeddings.scheduler import get_embedding_scheduler
+    return await get_embedding_scheduler().embed(text)
+
+
 def format_result(
     result: ExplorationResult,
     debug: bool = False,
@@ -520,13 +246,18 @@ async def run_exploration(
             enable_jsonl=True,
         )
 
-    # Get embeddings
-    query_embedding = get_embedding(query)
+    # Get embeddings (batched with any concurrent explorations)
     intention_text = intention or query
-    intention_embedding = get_embedding(intention_text) if intention else query_embedding
+    if intention:
+        query_embedding, intention_embedding = await asyncio.gather(
+            get_embedding_async(query), get_embedding_async(intention)
+        )
+    else:
+        query_embedding = await get_embedding_async(query)
+        intention_embedding = query_embedding
 
     # Get graph interface
-    graph = get_graph_interface(graph_name)
+    graph = await get_graph_interface(graph_name)
 
     # Configure exploration
     config = ExplorationConfig(
@@ -582,6 +313,12 @@ async def run_exploration(
         print(f"ERROR: {e}", file=sys.stderr)
         raise
 
+    finally:
+        # Log files are written in the background; drain them and stop the
+        # writer thread, since every debug exploration gets its own logger
+        if logger:
+            logger.close()
+
 
 def explore_command(
     query: str,
@@ -31,6 +31,7 @@ from pydantic import BaseModel
 from runtime.infrastructure.orchestration import Orchestrator
 from runtime.moment_graph import MomentTraversal, MomentQueries, MomentSurface
 from runtime.physics.graph import GraphQueries, GraphOps, add_mutation_listener
+from runtime.infrastructure.database import get_async_database_adapter
 from runtime.infrastructure.api.moments import create_moments_router
 from runtime.infrastructure.api.playthroughs import create_playthroughs_router
 from runtime.infrastructure.api.tempo import create_tempo_router
@@ -257,8 +258,9 @@ def create_app(
         errors: Dict[str, str] = {}
 
         try:
-            read = get_graph_queries()
-            read.query("RETURN 1 AS ok")
+            db = get_async_database_adapter(graph_name=graph_name, host=host, port=port)
+            await db.query("RETURN 1 AS ok", timeout=5.0)
+            details["pool"] = db.stats().to_dict()
         except Exception as exc:
             details["graph_read"] = "error"
             errors["graph_read"] = str(exc)
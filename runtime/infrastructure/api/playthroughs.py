@@ -309,7 +309,7 @@ def create_playthroughs_router(
                     node["gender"] = request.player_gender
 
             if inject_data["nodes"] or inject_data["links"]:
-                result = graph.apply(data=inject_data, playthrough=playthrough_id)
+                result = graph.apply(data=inject_data, playthrough=playthrough_id, bulk=True)
                 logger.info(f"Scenario injected: {len(result.persisted)} items, {len(result.errors)} errors")
                 if result.errors:
                     for err in result.errors[:5]:
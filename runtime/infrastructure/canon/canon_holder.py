@@ -47,6 +47,102 @@ class ValidationResult:
             self.broken_chain = []
 
 
+# =============================================================================
+# BATCH QUERIES
+# =============================================================================
+
+# One row per moment with everything the four validation rules look at.
+# Contradiction candidates include the other batch moments (whatever their
+# status) so sequential activation can be evaluated in memory.
+BATCH_NEIGHBOURHOOD_QUERY = """
+UNWIND $ids AS mid
+MATCH (m:Moment {id: mid})
+RETURN m.id AS id,
+       [(a:Actor)-[r]->(m) WHERE type(r) IN ['EXPRESSES', 'CAN_SPEAK'] |
+           {id: a.id, alive: a.alive, rel: type(r)}] AS speakers,
+       [(m)-[:ABOUT]->(a:Actor) | a.id] AS about_actors,
+       [(m)-[:ABOUT]->(:Narrative)-[rel:RELATES]->(:Narrative)<-[:ABOUT]-(m2:Moment)
+           WHERE m2.id <> m.id AND (m2.status = 'active' OR m2.id IN $ids)
+           AND (rel.contradicts > 0.5 OR rel.polarity < -0.5) |
+           {id: m2.id, status: m2.status}] AS contradicting,
+       [(prev:Moment)-[r:CAN_BECOME]->(m) |
+           {id: prev.id, status: prev.status, required: r.required}] AS can_become,
+       [(prev:Moment)-[:SEQUENCE]->(m) | {id: prev.id, status: prev.status}] AS sequence
+"""
+
+# Applies activations and rejections together; rejected energy is summed
+# and returned to one actor in the same statement.
+BATCH_TRANSITION_QUERY = """
+UNWIND $rows AS row
+MATCH (m:Moment {id: row.id})
+WHERE m.status = 'possible'
+WITH m, row, coalesce(m.energy, 0.0) AS energy
+SET m.status = row.status,
+    m.tick_activated = CASE WHEN row.status = 'active' THEN $tick ELSE m.tick_activated END,
+    m.tick_resolved = CASE WHEN row.status = 'active' THEN m.tick_resolved ELSE $tick END,
+    m.energy = CASE WHEN row.status = 'active' THEN m.energy ELSE 0 END
+WITH collect({id: m.id, status: row.status}) AS moved,
+     sum(CASE WHEN row.status = 'active' THEN 0.0 ELSE energy END) * $return_rate AS returned
+OPTIONAL MATCH (a:Actor {id: $return_to})
+FOREACH (_ IN CASE WHEN a IS NOT NULL AND returned > 0 THEN [1] ELSE [] END |
+    SET a.energy = coalesce(a.energy, 0.0) + returned)
+RETURN moved, returned
+"""
+
+
+def _evaluate_neighbourhood(row: Dict[str, Any], activated: set) -> ValidationResult:
+    """
+    Apply the four activation rules to one BATCH_NEIGHBOURHOOD_QUERY row.
+
+    `activated` holds batch moments already accepted ahead of this one;
+    they count as active for contradiction and causal-chain checks.
+    """
+    def status_of(entry: Dict[str, Any]) -> Optional[str]:
+        return "active" if entry.get("id") in activated else entry.get("status")
+
+    speakers = [s for s in row.get("speakers") or [] if s and s.get("id")]
+    result = ValidationResult(valid=True)
+
+    # 1. Actors exist: EXPRESSES / ABOUT endpoints are matched as Actor
+    #    nodes, so every referenced actor in the row exists (as in actors_exist)
+
+    # 2. Actors available
+    unavailable = list(dict.fromkeys(s["id"] for s in speakers if s.get("alive") is False))
+    if unavailable:
+        result.valid = False
+        result.unavailable_actors = unavailable
+        result.reason += f"Unavailable actors: {unavailable}. "
+
+    # 3. No contradiction with an active moment
+    contradicting = list(dict.fromkeys(
+        c["id"] for c in row.get("contradicting") or []
+        if c and c.get("id") and status_of(c) == "active"
+    ))
+    if contradicting:
+        result.valid = False
+        result.contradicting_moments = contradicting
+        result.reason += f"Contradicts moments: {contradicting}. "
+
+    # 4. Causal chain
+    broken = []
+    for prev in row.get("can_become") or []:
+        if prev and prev.get("id") and prev.get("required"):
+            prev_status = status_of(prev)
+            if prev_status not in ["completed", "active"]:
+                broken.append(f"{prev['id']}: status={prev_status}, required=true")
+    for prev in row.get("sequence") or []:
+        if prev and prev.get("id") and prev.get("status") != "completed":
+            broken.append(f"{prev['id']}: sequence predecessor not completed (status={prev.get('status')})")
+    if broken:
+        result.valid = False
+        result.broken_chain = broken
+        result.reason += f"Broken causal chain: {broken}. "
+
+    if result.valid:
+        result.reason = "All validations passed"
+    return result
+
+
 # =============================================================================
 # CANON HOLDER
 # =============================================================================
@@ -276,44 +372,110 @@ class CanonHolder:
         3. no_contradiction
         4. causal_chain_valid
 
+        The four rules are evaluated together from one neighbourhood query
+        (see validate_batch).
+
         Returns:
             ValidationResult with all issues collected
         """
-        result = ValidationResult(valid=True)
-
-        # 1. Check actors exist
-        exists, missing = self.actors_exist(moment_id)
-        if not exists:
-            result.valid = False
-            result.missing_actors = missing
-            result.reason += f"Missing actors: {missing}. "
-
-        # 2. Check actors available
-        available, unavailable = self.actors_available(moment_id)
-        if not available:
-            result.valid = False
-            result.unavailable_actors = unavailable
-            result.reason += f"Unavailable actors: {unavailable}. "
-
-        # 3. Check no contradiction
-        no_contra, contradicting = self.no_contradiction(moment_id)
-        if not no_contra:
-            result.valid = False
-            result.contradicting_moments = contradicting
-            result.reason += f"Contradicts moments: {contradicting}. "
-
-        # 4. Check causal chain
-        chain_valid, broken = self.causal_chain_valid(moment_id)
-        if not chain_valid:
-            result.valid = False
-            result.broken_chain = broken
-            result.reason += f"Broken causal chain: {broken}. "
-
-        if result.valid:
-            result.reason = "All validations passed"
-
+        result = self.validate_batch([moment_id]).get(moment_id)
+        if result is None:
+            # Unknown moment: nothing references it, so no rule can fail
+            result = ValidationResult(valid=True, reason="All validations passed")
         return result
 
+    # =========================================================================
+    # BATCH VALIDATION
+    # =========================================================================
+
+    def validate_batch(
+        self,
+        moment_ids: List[str],
+        sequential: bool = True,
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validate many moments with one neighbourhood query.
+
+        Fetches every moment's actors, narrative contradictions and causal
+        predecessors in a single round-trip, then evaluates the same four
+        rules as validate_for_activation() in memory.
+
+        Args:
+            moment_ids: Moments to validate, in activation order
+            sequential: Treat each valid moment as active for the ones after
+                it, as if they were activated one by one (a later moment may
+                then contradict it, or have it as a satisfied predecessor)
+
+        Returns:
+            {moment_id: ValidationResult}; ids not in the graph are omitted
+        """
+        ids = list(dict.fromkeys(m for m in moment_ids if m))
+        if not ids:
+            return {}
+
+        rows = self.graph_queries.query(BATCH_NEIGHBOURHOOD_QUERY, params={"ids": ids})
+        neighbourhoods = {row["id"]: row for row in rows if row.get("id")}
+
+        activated = set()
+        results = {}
+        for moment_id in ids:
+            row = neighbourhoods.get(moment_id)
+            if row is None:
+                continue
+            result = _evaluate_neighbourhood(row, activated)
+            results[moment_id] = result
+            if sequential and result.valid:
+                activated.add(moment_id)
+        return results
+
+    def resolve_batch(
+        self,
+        moment_ids: List[str],
+        current_tick: int,
+        return_energy_to: str = None,
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validate possible moments and apply every transition in one write.
+
+        Valid moments go possible → active, invalid ones possible → failed
+        with REJECTION_RETURN_RATE of their energy summed back to the player
+        (or return_energy_to), like activate_moment() / reject_moment().
+        Moments no longer 'possible' when the write lands are left alone.
+
+        Returns:
+            {moment_id: ValidationResult} for every moment that transitioned
+        """
+        from runtime.physics.constants import REJECTION_RETURN_RATE
+
+        results = self.validate_batch(moment_ids)
+        if not results:
+            return {}
+
+        rows = [{"id": mid, "status": "active" if r.valid else "failed"} for mid, r in results.items()]
+        target_id = return_energy_to or "char_player"
+        written = self.graph_queries.query(
+            BATCH_TRANSITION_QUERY,
+            params={
+                "rows": rows,
+                "tick": current_tick,
+                "return_rate": REJECTION_RETURN_RATE,
+                "return_to": target_id,
+            },
+        )
+
+        summary = written[0] if written else {}
+        returned = summary.get("returned") or 0.0
+        transitioned = {m.get("id") for m in summary.get("moved") or []}
+        resolved = {mid: r for mid, r in results.items() if mid in transitioned}
+
+        activated = sum(1 for r in resolved.values() if r.valid)
+        logger.info(
+            f"[CanonHolder] Resolved {len(resolved)} moments at tick {current_tick}: "
+            f"{activated} activated, {len(resolved) - activated} rejected "
+            f"(returned {returned:.2f} energy to {target_id})"
+        )
+        return resolved
+
     # =========================================================================
     # STATE TRANSITIONS
     # =========================================================================
@@ -715,18 +877,21 @@ class CanonHolder:
 
         # Link actors to recall moment (CAN_SPEAK, not EXPRESSES yet)
         recaller_id = actor_id or "char_player"
-        for aid in actor_ids:
-            # Primary recaller gets CAN_SPEAK link
-            link_type = "CAN_SPEAK" if aid == recaller_id else "WITNESSES"
-            actor_link = f"""
-            MATCH (a:Actor {{id: '{aid}'}})
-            MATCH (m:Moment {{id: '{recall_id}'}})
-            CREATE (a)-[:{link_type} {{
-                weight: 0.5,
-                energy: 0.0
-            }}]->(m)
+        if actor_ids:
+            # Primary recaller gets CAN_SPEAK link, the others witness
+            actor_links = """
+            MATCH (m:Moment {id: $recall_id})
+            UNWIND $actor_ids AS aid
+            MATCH (a:Actor {id: aid})
+            FOREACH (_ IN CASE WHEN aid = $recaller_id THEN [1] ELSE [] END |
+                CREATE (a)-[:CAN_SPEAK {weight: 0.5, energy: 0.0}]->(m))
+            FOREACH (_ IN CASE WHEN aid <> $recaller_id THEN [1] ELSE [] END |
+                CREATE (a)-[:WITNESSES {weight: 0.5, energy: 0.0}]->(m))
             """
-            self.graph_queries.query(actor_link)
+            self.graph_queries.query(
+                actor_links,
+                params={"recall_id": recall_id, "actor_ids": actor_ids, "recaller_id": recaller_id}
+            )
 
         # Copy narrative links from original to recall
         narrative_copy = """
@@ -25,13 +25,22 @@ from .adapter import (
     DatabaseError,
     ConnectionError,
     QueryError,
+    coalesce_statements,
+)
+from .async_adapter import (
+    AsyncDatabaseAdapter,
+    AsyncFalkorDBAdapter,
+    PoolStats,
+    QueryTimeoutError,
 )
 from .factory import (
     get_database_adapter,
+    get_async_database_adapter,
     load_database_config,
     clear_adapter_cache,
 )
 from .falkordb_adapter import FalkorDBAdapter
+from .schema import ensure_id_indexes, audit_queries
 
 # Neo4j adapter is lazy-loaded to avoid requiring the neo4j package
 
@@ -39,14 +48,24 @@ __all__ = [
     # Abstract classes
     "DatabaseAdapter",
     "TransactionAdapter",
+    "AsyncDatabaseAdapter",
+    "PoolStats",
     # Exceptions
     "DatabaseError",
     "ConnectionError",
     "QueryError",
+    "QueryTimeoutError",
+    # Bulk writes
+    "coalesce_statements",
     # Factory
     "get_database_adapter",
+    "get_async_database_adapter",
     "load_database_config",
     "clear_adapter_cache",
+    # Schema
+    "ensure_id_indexes",
+    "audit_queries",
     # Implementations
     "FalkorDBAdapter",
+    "AsyncFalkorDBAdapter",
 ]
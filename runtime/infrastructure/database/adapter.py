@@ -13,8 +13,15 @@ Usage:
 DOCS: docs/infrastructure/database-adapter/PATTERNS_DatabaseAdapter.md
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, ContextManager
+from typing import List, Dict, Any, Iterable, Optional, ContextManager, Set, Tuple
+
+# Rows per UNWIND statement in bulk writes
+DEFAULT_BULK_BATCH_SIZE = 1000
+
+# (cypher, params) pair as accepted by execute()
+Statement = Tuple[str, Optional[Dict[str, Any]]]
 
 
 class DatabaseAdapter(ABC):
@@ -56,6 +63,46 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    def execute_many(
+        self,
+        cypher: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> None:
+        """
+        Execute a per-row mutation for many rows as bulk UNWIND statements.
+
+        The statement refers to the current row as `row`:
+
+            adapter.execute_many(
+                "MATCH (n {id: row.id}) SET n.energy = row.energy",
+                [{"id": "a", "energy": 0.5}, {"id": "b", "energy": 0.2}],
+            )
+
+        Args:
+            cypher: Mutation using `row.<field>` instead of parameters
+            rows: One parameter dict per row
+            batch_size: Rows per UNWIND statement
+        """
+        self.execute_batch([
+            (f"UNWIND $rows AS row\n{cypher}", {"rows": rows[i:i + batch_size]})
+            for i in range(0, len(rows), batch_size)
+        ])
+
+    def execute_batch(self, statements: Iterable[Statement]) -> None:
+        """
+        Execute a sequence of mutations in order, with as few round-trips as possible.
+
+        Consecutive statements with the same shape (identical Cypher, same
+        parameter names) are coalesced into one UNWIND statement. Backends
+        override this to also send the coalesced statements together.
+
+        Args:
+            statements: (cypher, params) pairs, as for execute()
+        """
+        for cypher, params in coalesce_statements(statements):
+            self.execute(cypher, params)
+
     @abstractmethod
     def transaction(self) -> ContextManager['TransactionAdapter']:
         """
@@ -80,6 +127,16 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    @abstractmethod
+    def explain(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Return the execution plan of a query without running it.
+
+        Returns:
+            Plan operators, one per line, children indented under parents
+        """
+        pass
+
     @abstractmethod
     def health_check(self) -> bool:
         """
@@ -111,6 +168,68 @@ class TransactionAdapter(ABC):
         pass
 
 
+# Clauses whose meaning changes when the statement runs once per UNWIND row
+_NOT_COALESCIBLE = re.compile(
+    r"\b(UNWIND|WITH|RETURN|CALL|UNION|LIMIT|SKIP|ORDER\s+BY|row)\b", re.IGNORECASE
+)
+# A $parameter, or a quoted string/identifier to copy verbatim (group 1 unset)
+_PARAM = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|\$(\w+)""")
+
+
+def _param_names(cypher: str) -> Set[str]:
+    """Parameters a statement references, ignoring `$` inside string literals."""
+    return {m.group(1) for m in _PARAM.finditer(cypher) if m.group(1)}
+
+
+def coalesce_statements(
+    statements: Iterable[Statement],
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+) -> List[Statement]:
+    """
+    Merge runs of same-shape mutations into parameterized UNWIND statements.
+
+    `MATCH (n {id: $id}) SET n.x = $x` queued for 300 ids becomes
+    `UNWIND $rows AS row MATCH (n {id: row.id}) SET n.x = row.x` with 300
+    rows. Only consecutive statements are merged, so execution order is
+    preserved. Statements that read results, aggregate, or already use
+    UNWIND/`row` are passed through unchanged. `$name` inside a quoted
+    string is text, not a parameter, and is left as written.
+    """
+    out: List[Statement] = []
+    run: List[Dict[str, Any]] = []
+    run_cypher: Optional[str] = None
+
+    def close_run() -> None:
+        if not run:
+            return
+        if len(run) == 1:
+            out.append((run_cypher, run[0]))
+        else:
+            body = _PARAM.sub(lambda m: f"row.{m.group(1)}" if m.group(1) else m.group(0), run_cypher)
+            for i in range(0, len(run), batch_size):
+                out.append((f"UNWIND $rows AS row\n{body}", {"rows": run[i:i + batch_size]}))
+        run.clear()
+
+    for cypher, params in statements:
+        params = params or {}
+        if (
+            not params
+            or _NOT_COALESCIBLE.search(cypher)
+            or _param_names(cypher) != set(params)
+        ):
+            close_run()
+            run_cypher = None
+            out.append((cypher, params))
+            continue
+        if cypher != run_cypher:
+            close_run()
+            run_cypher = cypher
+        run.append(params)
+
+    close_run()
+    return out
+
+
 class DatabaseError(Exception):
     """Base exception for database errors."""
     pass
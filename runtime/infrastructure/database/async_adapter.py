@@ -0,0 +1,349 @@
+"""
+Async Database Adapter
+
+Asyncio counterpart of DatabaseAdapter, backed by a bounded connection pool
+so concurrent coroutines (explorations, HTTP handlers) overlap their I/O
+instead of serializing on one blocking client or blocking the event loop.
+
+- FalkorDB: falkordb.asyncio over a redis.asyncio BlockingConnectionPool
+- Neo4j:    neo4j.AsyncGraphDatabase with max_connection_pool_size
+
+Every call acquires a pool slot (waiting at most `acquire_timeout`), runs
+under a per-query timeout and is counted in PoolStats.
+
+Usage:
+    from runtime.infrastructure.database import get_async_database_adapter
+
+    adapter = get_async_database_adapter()
+    rows = await adapter.query("MATCH (n) RETURN n.id LIMIT 10")
+    print(adapter.stats())
+
+DOCS: docs/infrastructure/database-adapter/PATTERNS_DatabaseAdapter.md
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .adapter import (
+    ConnectionError,
+    QueryError,
+    Statement,
+    coalesce_statements,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_QUERY_TIMEOUT_S = 30.0
+DEFAULT_ACQUIRE_TIMEOUT_S = 10.0
+
+
+class QueryTimeoutError(QueryError):
+    """Raised when a query exceeds its timeout or no pool slot frees up in time."""
+    pass
+
+
+@dataclass
+class PoolStats:
+    """Connection pool metrics."""
+    pool_size: int
+    in_use: int = 0
+    peak_in_use: int = 0
+    waiting: int = 0
+    queries: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_wait_s: float = 0.0
+    total_query_s: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        return 1000 * self.total_wait_s / self.queries if self.queries else 0.0
+
+    @property
+    def avg_query_ms(self) -> float:
+        return 1000 * self.total_query_s / self.queries if self.queries else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["avg_wait_ms"] = round(self.avg_wait_ms, 3)
+        d["avg_query_ms"] = round(self.avg_query_ms, 3)
+        return d
+
+
+class AsyncDatabaseAdapter(ABC):
+    """
+    Abstract async interface for graph database operations.
+
+    Subclasses implement the raw `_run_query` / `_run_batch` / `_close`;
+    this base class applies pooling limits, timeouts and metrics.
+    Results are lists of rows, like DatabaseAdapter.query().
+    """
+
+    def __init__(
+        self,
+        graph_name: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        query_timeout: float = DEFAULT_QUERY_TIMEOUT_S,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT_S,
+    ):
+        self._graph_name = graph_name
+        self.pool_size = pool_size
+        self.query_timeout = query_timeout
+        self.acquire_timeout = acquire_timeout
+        self._stats = PoolStats(pool_size=pool_size)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def graph_name(self) -> str:
+        """Return the current graph name."""
+        return self._graph_name
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop this adapter's connections are bound to (None until first use)."""
+        return self._loop
+
+    def stats(self) -> PoolStats:
+        """Return pool metrics (live object)."""
+        return self._stats
+
+    async def query(
+        self,
+        cypher: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Execute a Cypher query and return result rows.
+
+        Args:
+            cypher: The Cypher query string
+            params: Optional parameters for the query
+            timeout: Seconds before QueryTimeoutError (default: query_timeout)
+        """
+        return await self._pooled(lambda: self._run_query(cypher, params or {}), timeout, cypher)
+
+    async def execute(
+        self,
+        cypher: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Execute a Cypher mutation without returning results."""
+        await self.query(cypher, params, timeout)
+
+    async def execute_batch(
+        self,
+        statements: Iterable[Statement],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Execute mutations in order, coalesced into UNWIND statements (see DatabaseAdapter)."""
+        commands = coalesce_statements(statements)
+        if commands:
+            await self._pooled(lambda: self._run_batch(commands), timeout, "batch")
+
+    async def health_check(self) -> bool:
+        """Check if the database is reachable. Never raises."""
+        try:
+            await self.query("RETURN 1", timeout=min(5.0, self.query_timeout))
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        await self._close()
+        self._loop = None
+        self._slots = None
+
+    async def _pooled(
+        self,
+        run: Callable[[], Awaitable[Any]],
+        timeout: Optional[float],
+        label: str,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.pool_size)
+        elif loop is not self._loop:
+            raise ConnectionError(
+                f"{type(self).__name__} is bound to another event loop; "
+                "use get_async_database_adapter() from the running loop"
+            )
+
+        stats = self._stats
+        waited_from = time.perf_counter()
+        stats.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise QueryTimeoutError(
+                f"No connection free after {self.acquire_timeout}s (pool_size={self.pool_size})"
+            )
+        finally:
+            stats.waiting -= 1
+
+        started = time.perf_counter()
+        stats.total_wait_s += started - waited_from
+        stats.in_use += 1
+        stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+        try:
+            return await asyncio.wait_for(run(), timeout or self.query_timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise QueryTimeoutError(f"Query timed out after {timeout or self.query_timeout}s: {label.strip()[:80]}")
+        except QueryError:
+            stats.errors += 1
+            raise
+        except Exception as e:
+            stats.errors += 1
+            raise QueryError(f"Query failed: {e}")
+        finally:
+            stats.in_use -= 1
+            stats.queries += 1
+            stats.total_query_s += time.perf_counter() - started
+            self._slots.release()
+
+    @abstractmethod
+    async def _run_query(self, cypher: str, params: Dict[str, Any]) -> List[Any]:
+        """Run one query on a pooled connection."""
+        pass
+
+    @abstractmethod
+    async def _run_batch(self, commands: List[Statement]) -> None:
+        """Run coalesced mutations on one pooled connection."""
+        pass
+
+    @abstractmethod
+    async def _close(self) -> None:
+        pass
+
+
+class AsyncFalkorDBAdapter(AsyncDatabaseAdapter):
+    """FalkorDB over redis.asyncio with a BlockingConnectionPool."""
+
+    def __init__(
+        self,
+        graph_name: str = "blood_ledger",
+        host: str = "localhost",
+        port: int = 6379,
+        **pool_kwargs: Any,
+    ):
+        super().__init__(graph_name, **pool_kwargs)
+        self._host = host
+        self._port = port
+        self._db = None
+        self._graph = None
+
+    def _connect(self) -> None:
+        try:
+            import redis.asyncio as aioredis
+            from falkordb.asyncio import FalkorDB
+
+            pool = aioredis.BlockingConnectionPool(
+                host=self._host,
+                port=self._port,
+                max_connections=self.pool_size,
+                timeout=self.acquire_timeout,
+                decode_responses=True,
+            )
+            self._db = FalkorDB(connection_pool=pool)
+            self._graph = self._db.select_graph(self._graph_name)
+            logger.info(
+                f"[AsyncFalkorDBAdapter] Pool of {self.pool_size} for {self._graph_name} "
+                f"at {self._host}:{self._port}"
+            )
+        except Exception as e:
+            raise ConnectionError(f"Cannot connect to FalkorDB at {self._host}:{self._port}: {e}")
+
+    async def _run_query(self, cypher: str, params: Dict[str, Any]) -> List[Any]:
+        if self._graph is None:
+            self._connect()
+        result = await self._graph.query(cypher, params)
+        return result.result_set if result.result_set else []
+
+    async def _run_batch(self, commands: List[Statement]) -> None:
+        from .falkordb_adapter import params_header  # Same encoder as the sync pipeline
+
+        if self._graph is None:
+            self._connect()
+        pipe = self._db.connection.pipeline(transaction=False)
+        for cypher, params in commands:
+            query = params_header(params) + cypher
+            pipe.execute_command("GRAPH.QUERY", self._graph_name, query, "--compact")
+        responses = await pipe.execute(raise_on_error=False)
+        for (cypher, _), response in zip(commands, responses):
+            if isinstance(response, Exception):
+                raise QueryError(f"Batch statement failed: {response} ({cypher.strip()[:80]})")
+
+    async def _close(self) -> None:
+        if self._db is not None:
+            await self._db.connection.aclose()
+        self._db = None
+        self._graph = None
+        logger.info("[AsyncFalkorDBAdapter] Pool closed")
+
+
+class AsyncNeo4jAdapter(AsyncDatabaseAdapter):
+    """Neo4j over the async driver (requires the neo4j package)."""
+
+    def __init__(
+        self,
+        uri: str = "bolt://localhost:7687",
+        user: str = "neo4j",
+        password: str = "",
+        database: str = "neo4j",
+        **pool_kwargs: Any,
+    ):
+        super().__init__(database, **pool_kwargs)
+        self._uri = uri
+        self._user = user
+        self._password = password
+        self._driver = None
+
+    def _connect(self) -> None:
+        try:
+            from neo4j import AsyncGraphDatabase
+        except ImportError:
+            raise ConnectionError("neo4j package not installed. Run: pip install neo4j")
+        self._driver = AsyncGraphDatabase.driver(
+            self._uri,
+            auth=(self._user, self._password),
+            max_connection_pool_size=self.pool_size,
+            connection_acquisition_timeout=self.acquire_timeout,
+        )
+        logger.info(f"[AsyncNeo4jAdapter] Pool of {self.pool_size} for {self._graph_name} at {self._uri}")
+
+    async def _run_query(self, cypher: str, params: Dict[str, Any]) -> List[Any]:
+        if self._driver is None:
+            self._connect()
+        async with self._driver.session(database=self._graph_name) as session:
+            result = await session.run(cypher, params)
+            return [list(record.values()) async for record in result]
+
+    async def _run_batch(self, commands: List[Statement]) -> None:
+        if self._driver is None:
+            self._connect()
+        async with self._driver.session(database=self._graph_name) as session:
+            tx = await session.begin_transaction()
+            try:
+                for cypher, params in commands:
+                    await tx.run(cypher, params or {})
+                await tx.commit()
+            except Exception:
+                await tx.rollback()
+                raise
+
+    async def _close(self) -> None:
+        if self._driver is not None:
+            await self._driver.close()
+        self._driver = None
+        logger.info("[AsyncNeo4jAdapter] Pool closed")
@@ -15,21 +15,28 @@ Usage:
 DOCS: docs/infrastructure/database-adapter/PATTERNS_DatabaseAdapter.md
 """
 
+import asyncio
 import os
 import logging
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 import yaml
 
 from .adapter import DatabaseAdapter, ConnectionError
 
+if TYPE_CHECKING:
+    from .async_adapter import AsyncDatabaseAdapter
+
 logger = logging.getLogger(__name__)
 
 # Singleton instances per graph name
 _instances: Dict[str, DatabaseAdapter] = {}
 
+# Async adapters per graph name (re-created when used from a new event loop)
+_async_instances: Dict[str, "AsyncDatabaseAdapter"] = {}
+
 
 def _get_repo_name() -> str:
     """Get repository name from git or directory name, normalized for database use."""
@@ -77,6 +84,8 @@ def load_database_config() -> Dict[str, Any]:
 
     Environment variables can override:
     - DATABASE_BACKEND: "falkordb" or "neo4j"
+    - DATABASE_POOL_SIZE, DATABASE_QUERY_TIMEOUT (async adapter pool)
+    - DATABASE_ENSURE_INDEXES: "0" skips id index provisioning at startup
     - FALKORDB_HOST, FALKORDB_PORT, FALKORDB_GRAPH
     - NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD, NEO4J_DATABASE
     """
@@ -101,6 +110,13 @@ def load_database_config() -> Dict[str, Any]:
             logger.warning(f"Failed to load database config: {e}")
 
     # Override with environment variables
+    if os.environ.get("DATABASE_POOL_SIZE"):
+        config["database"]["pool_size"] = int(os.environ["DATABASE_POOL_SIZE"])
+    if os.environ.get("DATABASE_QUERY_TIMEOUT"):
+        config["database"]["query_timeout"] = float(os.environ["DATABASE_QUERY_TIMEOUT"])
+    if os.environ.get("DATABASE_ENSURE_INDEXES"):
+        config["database"]["ensure_indexes"] = os.environ["DATABASE_ENSURE_INDEXES"].lower() not in ("0", "false", "no")
+
     if os.environ.get("DATABASE_BACKEND"):
         config["database"]["backend"] = os.environ["DATABASE_BACKEND"]
 
@@ -132,6 +148,10 @@ def get_database_adapter(
     """
     Get or create a database adapter.
 
+    The adapter ensures `id` indexes on every node label first (see
+    schema.ensure_id_indexes; disable with `ensure_indexes: false`). If the
+    database was unreachable, later calls for the graph retry until it is.
+
     Args:
         graph_name: Optional graph name override. If not provided,
                    uses the default from configuration.
@@ -157,7 +177,9 @@ def get_database_adapter(
     # Check for existing instance
     cache_key = f"{backend}:{graph_name}"
     if not force_new and cache_key in _instances:
-        return _instances[cache_key]
+        adapter = _instances[cache_key]
+        _ensure_indexes(adapter, config)
+        return adapter
 
     # Create new adapter
     if backend == "falkordb":
@@ -182,11 +204,125 @@ def get_database_adapter(
     else:
         raise ValueError(f"Unknown database backend: {backend}")
 
+    _ensure_indexes(adapter, config)
+
     # Cache the instance
     _instances[cache_key] = adapter
     return adapter
 
 
+def _ensure_indexes(adapter: DatabaseAdapter, config: Dict[str, Any]) -> None:
+    """Index-backed id lookups (once per graph and process; never raises)."""
+    if config["database"].get("ensure_indexes", True):
+        from .schema import ensure_id_indexes
+        ensure_id_indexes(adapter)
+
+
+def get_async_database_adapter(
+    graph_name: Optional[str] = None,
+    force_new: bool = False,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> "AsyncDatabaseAdapter":
+    """
+    Get or create a pooled async database adapter.
+
+    Pool size and per-query timeout come from `pool_size` / `query_timeout`
+    in the database config (or DATABASE_POOL_SIZE / DATABASE_QUERY_TIMEOUT).
+    Connections are bound to an event loop, so an adapter first used under
+    another loop is replaced (and closed on its own loop if that still runs).
+
+    Args:
+        graph_name: Optional graph name override (default from configuration)
+        force_new: If True, create a new instance even if one exists.
+        host: FalkorDB host override (default from configuration)
+        port: FalkorDB port override (default from configuration)
+
+    Returns:
+        AsyncDatabaseAdapter instance
+    """
+    from .async_adapter import (
+        AsyncFalkorDBAdapter,
+        AsyncNeo4jAdapter,
+        DEFAULT_POOL_SIZE,
+        DEFAULT_QUERY_TIMEOUT_S,
+    )
+
+    config = load_database_config()
+    backend = config["database"]["backend"]
+
+    if graph_name is None:
+        if backend == "falkordb":
+            graph_name = config["database"]["falkordb"].get("graph_name") or _get_repo_name()
+        else:
+            graph_name = config["database"]["neo4j"].get("database") or _get_repo_name()
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    cache_key = f"{backend}:{graph_name}"
+    if backend == "falkordb" and (host or port):
+        cache_key += f"@{host or ''}:{port or ''}"
+    existing = _async_instances.get(cache_key)
+    if not force_new and existing is not None and existing.loop in (None, loop):
+        return existing
+    if existing is not None:
+        _close_async_adapter(existing)
+
+    pool_kwargs = {
+        "pool_size": config["database"].get("pool_size", DEFAULT_POOL_SIZE),
+        "query_timeout": config["database"].get("query_timeout", DEFAULT_QUERY_TIMEOUT_S),
+    }
+    if backend == "falkordb":
+        falkor_config = config["database"]["falkordb"]
+        adapter = AsyncFalkorDBAdapter(
+            graph_name=graph_name,
+            host=host or falkor_config.get("host", "localhost"),
+            port=port or falkor_config.get("port", 6379),
+            **pool_kwargs,
+        )
+    elif backend == "neo4j":
+        neo4j_config = config["database"]["neo4j"]
+        adapter = AsyncNeo4jAdapter(
+            uri=neo4j_config.get("uri", "bolt://localhost:7687"),
+            user=neo4j_config.get("user", "neo4j"),
+            password=neo4j_config.get("password", ""),
+            database=graph_name,
+            **pool_kwargs,
+        )
+    else:
+        raise ValueError(f"Unknown database backend: {backend}")
+
+    _async_instances[cache_key] = adapter
+    return adapter
+
+
+def _close_async_adapter(adapter: "AsyncDatabaseAdapter") -> None:
+    """
+    Close a dropped async adapter on the event loop its connections belong to.
+
+    Pools of a loop that is closed or no longer running went down with it;
+    there is nothing left to close.
+    """
+    loop = adapter.loop
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+    if loop.is_closed() or not loop.is_running():
+        return
+    future = asyncio.run_coroutine_threadsafe(adapter.close(), loop)
+
+    def _report(done) -> None:
+        if not done.cancelled() and done.exception():
+            logger.debug(f"Closing async adapter failed: {done.exception()}")
+
+    future.add_done_callback(_report)
+
+
 def clear_adapter_cache() -> None:
     """Clear all cached adapter instances."""
     global _instances
@@ -196,3 +332,6 @@ def clear_adapter_cache() -> None:
         except Exception:
             pass
     _instances = {}
+    for async_adapter in _async_instances.values():
+        _close_async_adapter(async_adapter)
+    _async_instances.clear()
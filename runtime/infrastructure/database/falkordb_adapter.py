@@ -7,10 +7,12 @@ DOCS: docs/infrastructure/database-adapter/ALGORITHM_DatabaseAdapter.md
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import math
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional
 from contextlib import contextmanager
 
 from falkordb import FalkorDB
+from redis.exceptions import ResponseError
 
 from .adapter import (
     DatabaseAdapter,
@@ -18,10 +20,49 @@ from .adapter import (
     DatabaseError,
     ConnectionError,
     QueryError,
+    Statement,
+    coalesce_statements,
 )
 
 logger = logging.getLogger(__name__)
 
+# Commands per pipelined round-trip
+PIPELINE_CHUNK_SIZE = 200
+
+
+def cypher_literal(value: Any) -> str:
+    """
+    A parameter value as a Cypher literal for the CYPHER params header.
+
+    NumPy scalars and arrays become their Python equivalents. Raises
+    ValueError for NaN/infinity, which have no Cypher literal.
+    """
+    if hasattr(value, "tolist"):  # NumPy scalar or array
+        value = value.tolist()
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Cannot encode non-finite float {value!r} as a Cypher parameter")
+    if isinstance(value, bytes):
+        value = value.decode()
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(cypher_literal(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ",".join(f"`{k}`:{cypher_literal(v)}" for k, v in value.items()) + "}"
+    return str(value)
+
+
+def params_header(params: Optional[Dict[str, Any]]) -> str:
+    """The `CYPHER name=value ...` prefix FalkorDB reads query parameters from."""
+    if not params:
+        return ""
+    return "CYPHER " + "".join(f"{name}={cypher_literal(value)} " for name, value in params.items())
+
 
 class FalkorDBAdapter(DatabaseAdapter):
     """
@@ -118,15 +159,98 @@ class FalkorDBAdapter(DatabaseAdapter):
                     raise QueryError(f"Execute failed after reconnect: {retry_error}")
             raise QueryError(f"Execute failed: {e}")
 
+    def execute_batch(self, statements: Iterable[Statement]) -> None:
+        """
+        Execute mutations in order, coalesced and pipelined.
+
+        Same-shape runs become UNWIND statements; the resulting statements go
+        out over one pipelined round-trip per PIPELINE_CHUNK_SIZE commands
+        instead of one round-trip each.
+
+        A chunk reaches the server whole, so a failing statement does not
+        stop the ones after it in the same chunk; its error is raised once
+        the chunk's responses are read and later chunks are not sent. After
+        a connection error the batch reconnects once and resumes at the
+        first statement that got no response.
+        """
+        commands = coalesce_statements(statements)
+        done = 0
+        retried_at = None
+        while done < len(commands):
+            chunk = commands[done:done + PIPELINE_CHUNK_SIZE]
+            try:
+                for _ in self._pipeline(chunk):
+                    done += 1
+            except QueryError:
+                raise
+            except Exception as e:
+                if not self._is_connection_error(e) or retried_at == done:
+                    prefix = "Batch failed after reconnect" if retried_at == done else "Batch failed"
+                    raise QueryError(f"{prefix}: {e}")
+                retried_at = done
+                try:
+                    self._connect()
+                except ConnectionError as connect_error:
+                    raise QueryError(f"Batch failed after reconnect: {connect_error}")
+
+    def _pipeline(self, commands: List[Statement]) -> Iterator[None]:
+        """
+        Send GRAPH.QUERY commands in one round-trip, yielding per response.
+
+        Raises QueryError for the first failed statement after every
+        response of the chunk has been read.
+        """
+        if len(commands) == 1:
+            cypher, params = commands[0]
+            try:
+                self._graph.query(cypher, params or {})
+            except Exception as e:
+                if self._is_connection_error(e):
+                    raise
+                raise QueryError(f"Batch statement failed: {e} ({cypher.strip()[:80]})")
+            yield
+            return
+
+        try:
+            queries = [
+                ("GRAPH.QUERY", self._graph_name, params_header(params) + cypher, "--compact")
+                for cypher, params in commands
+            ]
+        except ValueError as e:
+            raise QueryError(f"Batch parameters cannot be encoded: {e}")
+
+        pool = self._db.connection.connection_pool
+        try:
+            conn = pool.get_connection()
+        except TypeError:  # redis-py < 5.3 requires a command name
+            conn = pool.get_connection("GRAPH.QUERY")
+        failed = None
+        try:
+            conn.send_packed_command(conn.pack_commands(queries))
+            for cypher, _ in commands:
+                try:
+                    conn.read_response()
+                except ResponseError as e:
+                    failed = failed or QueryError(f"Batch statement failed: {e} ({cypher.strip()[:80]})")
+                yield
+        except Exception:
+            conn.disconnect()
+            raise
+        finally:
+            pool.release(conn)
+        if failed:
+            raise failed
+
     @contextmanager
     def transaction(self):
         """
         Return a context manager for transactional operations.
 
         Note: FalkorDB transactions are per-query atomic.
-        This provides a batch execution pattern.
+        Mutations are queued and sent on exit through execute_batch()
+        (coalesced into UNWIND statements, pipelined).
         """
-        tx = FalkorDBTransaction(self._graph)
+        tx = FalkorDBTransaction(self._graph, self.execute_batch)
         try:
             yield tx
             tx._commit()
@@ -149,6 +273,16 @@ class FalkorDBAdapter(DatabaseAdapter):
             if "already indexed" not in str(e).lower():
                 logger.warning(f"[FalkorDBAdapter] Index creation warning: {e}")
 
+    def explain(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Return the execution plan of a query without running it (GRAPH.EXPLAIN).
+        """
+        try:
+            plan = self._graph.explain(cypher, params or {})
+            return [line.rstrip() for line in plan.plan]
+        except Exception as e:
+            raise QueryError(f"Explain failed: {e}")
+
     def health_check(self) -> bool:
         """
         Check if FalkorDB is reachable.
@@ -184,9 +318,10 @@ class FalkorDBTransaction(TransactionAdapter):
     Batches commands and executes them on commit.
     """
 
-    def __init__(self, graph):
+    def __init__(self, graph, execute_batch: Optional[Callable[[List[Statement]], None]] = None):
         self._graph = graph
-        self._commands: List[tuple] = []
+        self._execute_batch = execute_batch
+        self._commands: List[Statement] = []
 
     def query(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Any]:
         """
@@ -203,6 +338,9 @@ class FalkorDBTransaction(TransactionAdapter):
 
     def _commit(self) -> None:
         """Execute all queued commands."""
-        for cypher, params in self._commands:
+        commands, self._commands = self._commands, []
+        if self._execute_batch is not None:
+            self._execute_batch(commands)
+            return
+        for cypher, params in commands:
             self._graph.query(cypher, params or {})
-        self._commands = []
@@ -0,0 +1,65 @@
+"""
+Hot Query Registry
+
+The project's most frequently run queries, with representative parameters,
+for the query-plan audit (schema.audit_queries, `mind audit-queries`).
+
+Queries are imported from their owning modules, so the audit always checks
+the Cypher that actually runs. Add a query here when it runs per request,
+per step or per ingested item; batch jobs that read every node on purpose
+are registered with allow_scan=True.
+
+DOCS: docs/infrastructure/database-adapter/PATTERNS_DatabaseAdapter.md
+"""
+
+from typing import List
+
+from .schema import HotQuery
+
+
+def project_hot_queries() -> List[HotQuery]:
+    """Registered hot queries (imported lazily: the owners import this package)."""
+    from runtime.agents.embedding_cache import AGENT_QUERY, VOCABULARY_QUERY
+    from runtime.infrastructure.canon import canon_holder
+    from runtime.infrastructure.embeddings import embed_pending
+    from runtime.ingest import files
+    from runtime import inject, symbol_extractor
+    from runtime.physics import exploration_graph
+
+    node_id = {"id": "probe"}
+    link_labels = {"from_label": ":Actor", "to_label": ":Thing"}
+    link_row = {"rows": [{"from_id": "a", "to_id": "b", "now": 0, "props": {}, "verb": "relates"}]}
+
+    return [
+        # Canonical inject (link statements are formatted per endpoint labels)
+        HotQuery("inject.link_upsert_many", inject.LINK_UPSERT_MANY.format(**link_labels), link_row),
+        HotQuery("inject.link_raw_many", inject.LINK_RAW_MANY.format(**link_labels), link_row),
+        HotQuery("inject.node_labels_by_id", inject.NODE_LABELS_BY_ID, {"ids": ["probe"]}),
+
+        # Canon holder, per tick
+        HotQuery("canon.batch_neighbourhood", canon_holder.BATCH_NEIGHBOURHOOD_QUERY, {"ids": ["probe"]}),
+        HotQuery("canon.batch_transition", canon_holder.BATCH_TRANSITION_QUERY, {
+            "rows": [{"id": "probe", "status": "active"}],
+            "tick": 0, "return_rate": 0.0, "return_to": "probe",
+        }),
+
+        # Exploration, per SubEntity step
+        HotQuery("exploration.node", exploration_graph.NODE_QUERY, node_id),
+        HotQuery("exploration.neighbourhood", exploration_graph.NEIGHBOURHOOD_QUERY, node_id),
+        HotQuery("exploration.incoming", exploration_graph.INCOMING_QUERY, node_id),
+        HotQuery("exploration.link", exploration_graph.LINK_QUERY, node_id),
+
+        # File ingest and symbol extraction, per file
+        HotQuery("ingest.thing_upsert", files.THING_UPSERT, {"rows": [{"id": "probe", "props": {}}]}),
+        HotQuery("ingest.contains_link", files.CONTAINS_LINK, {"rows": [{"space_id": "a", "thing_id": "b"}]}),
+        HotQuery("ingest.imports_link", files.IMPORTS_LINK, {"rows": [{"src_id": "a", "tgt_id": "b", "tgt_name": "b"}]}),
+        HotQuery("ingest.thing_delete", files.THING_DELETE, {"rows": [node_id]}),
+        HotQuery("ingest.embedding_set", files.EMBEDDING_SET.format(label="Thing"), {"rows": [{"id": "probe", "embedding": [0.0]}]}),
+        HotQuery("symbols.delete", symbol_extractor.SYMBOL_DELETE, {"rows": [node_id]}),
+        HotQuery("symbols.links_prune", symbol_extractor.SYMBOL_LINKS_PRUNE, {"rows": [{"id": "probe", "keep": []}]}),
+
+        # Whole-graph batch reads
+        HotQuery("embeddings.node_page", embed_pending.NODE_PAGE_QUERY, {"after": -1, "limit": 1}, allow_scan=True),
+        HotQuery("agents.vocabulary", VOCABULARY_QUERY, {"limit": 1}, allow_scan=True),
+        HotQuery("agents.agent_matrix", AGENT_QUERY, {}, allow_scan=True),
+    ]
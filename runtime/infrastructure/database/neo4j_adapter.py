@@ -9,7 +9,7 @@ DOCS: docs/infrastructure/database-adapter/ALGORITHM_DatabaseAdapter.md
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from contextlib import contextmanager
 
 from .adapter import (
@@ -18,6 +18,8 @@ from .adapter import (
     DatabaseError,
     ConnectionError,
     QueryError,
+    Statement,
+    coalesce_statements,
 )
 
 logger = logging.getLogger(__name__)
@@ -117,6 +119,25 @@ class Neo4jAdapter(DatabaseAdapter):
         except Exception as e:
             raise QueryError(f"Execute failed: {e}")
 
+    def execute_batch(self, statements: Iterable[Statement]) -> None:
+        """
+        Execute mutations in order, coalesced, inside one transaction.
+
+        Same-shape runs become UNWIND statements; everything runs in a single
+        session transaction (one commit) instead of one session per statement.
+        """
+        commands = coalesce_statements(statements)
+        if not commands:
+            return
+        try:
+            with self._driver.session(database=self._database) as session:
+                with session.begin_transaction() as tx:
+                    for cypher, params in commands:
+                        tx.run(cypher, params or {})
+                    tx.commit()
+        except Exception as e:
+            raise QueryError(f"Batch failed: {e}")
+
     @contextmanager
     def transaction(self):
         """
@@ -149,6 +170,26 @@ class Neo4jAdapter(DatabaseAdapter):
         except Exception as e:
             logger.warning(f"[Neo4jAdapter] Index creation warning: {e}")
 
+    def explain(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Return the execution plan of a query without running it (EXPLAIN).
+        """
+        try:
+            with self._driver.session(database=self._database) as session:
+                summary = session.run(f"EXPLAIN {cypher}", params or {}).consume()
+        except Exception as e:
+            raise QueryError(f"Explain failed: {e}")
+
+        lines: List[str] = []
+
+        def walk(operator: Dict[str, Any], depth: int) -> None:
+            lines.append("    " * depth + operator.get("operatorType", ""))
+            for child in operator.get("children", []):
+                walk(child, depth + 1)
+
+        walk(summary.plan or {}, 0)
+        return lines
+
     def health_check(self) -> bool:
         """
         Check if Neo4j is reachable.
@@ -0,0 +1,156 @@
+"""
+Graph Schema Manager
+
+Keeps the id lookups behind almost every hot query index-backed, and audits
+query plans for scans.
+
+- ensure_id_indexes(): an `id` index on every node label (the project's
+  labels plus any label found in the graph). Called once per adapter by
+  get_database_adapter(); idempotent.
+- audit_queries(): EXPLAIN (FalkorDB: GRAPH.EXPLAIN) each query and report
+  the scan operators in its plan. `mind audit-queries` runs it over the
+  project's registry of hot queries (hot_queries.py).
+
+Neither FalkorDB nor Neo4j can index a property across all labels, so an
+unlabeled `MATCH (n {id: $id})` stays a full node scan whatever is indexed;
+the audit flags those so they can be given a label.
+
+Usage:
+    from runtime.infrastructure.database.schema import ensure_id_indexes, audit_queries
+
+    ensure_id_indexes(adapter)
+    for audit in audit_queries(adapter, project_hot_queries()):
+        print(audit.name, audit.scans)
+
+DOCS: docs/infrastructure/database-adapter/PATTERNS_DatabaseAdapter.md
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Every label the project writes nodes with
+NODE_LABELS = ('Actor', 'Moment', 'Narrative', 'Space', 'Thing')
+
+ID_PROPERTY = "id"
+
+# Plan operators (normalized: lowercase letters only) that read nodes without an index
+FULL_SCAN_OPERATORS = {"allnodescan", "allnodesscan"}
+LABEL_SCAN_OPERATORS = {"nodebylabelscan"}
+
+# (graph_name, adapter type) already provisioned in this process
+_ensured: Set[Tuple[str, str]] = set()
+
+
+def graph_labels(adapter) -> List[str]:
+    """Node labels present in the graph (empty if the backend can't list them)."""
+    try:
+        return [row[0] for row in adapter.query("CALL db.labels()") or [] if row and row[0]]
+    except Exception as e:
+        logger.debug(f"[Schema] Could not list labels: {e}")
+        return []
+
+
+def ensure_id_indexes(
+    adapter,
+    labels: Optional[Iterable[str]] = None,
+    force: bool = False,
+) -> List[str]:
+    """
+    Ensure an `id` index on every node label. Never raises.
+
+    Args:
+        adapter: DatabaseAdapter
+        labels: Labels to index (default: NODE_LABELS plus labels in the graph)
+        force: Re-run even if this graph was provisioned in this process
+
+    Returns:
+        Labels an index was requested for
+    """
+    key = (getattr(adapter, "graph_name", ""), type(adapter).__name__)
+    if key in _ensured and not force:
+        return []
+    if not adapter.health_check():
+        logger.debug(f"[Schema] {key[0]} unreachable, skipping id indexes")
+        return []
+
+    if labels is None:
+        labels = list(NODE_LABELS) + [l for l in graph_labels(adapter) if l not in NODE_LABELS]
+
+    indexed = []
+    for label in labels:
+        if not re.fullmatch(r"\w+", label):
+            logger.warning(f"[Schema] Skipping label {label!r}: not an identifier")
+            continue
+        try:
+            adapter.create_index(label, ID_PROPERTY)  # Idempotent on both backends
+            indexed.append(label)
+        except Exception as e:
+            logger.warning(f"[Schema] id index on {label} failed: {e}")
+
+    _ensured.add(key)
+    logger.info(f"[Schema] id indexes ensured on {len(indexed)} labels of {key[0]}")
+    return indexed
+
+
+# =============================================================================
+# QUERY-PLAN AUDIT
+# =============================================================================
+
+@dataclass
+class HotQuery:
+    """A query the project runs often, with representative parameters."""
+    name: str
+    cypher: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    allow_scan: bool = False  # Batch jobs that read every node on purpose
+
+
+@dataclass
+class QueryAudit:
+    """Scan operators found in one query's plan."""
+    name: str
+    scans: List[str] = field(default_factory=list)
+    plan: List[str] = field(default_factory=list)
+    allow_scan: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and (self.allow_scan or not self.scans)
+
+
+def plan_scans(plan: List[str]) -> List[str]:
+    """Plan lines whose operator is a full node scan or an unindexed label scan."""
+    scans = []
+    for line in plan:
+        operator = line.strip().split("|")[0].split("@")[0]
+        normalized = re.sub(r"[^a-z]", "", operator.lower())
+        if normalized in FULL_SCAN_OPERATORS or normalized in LABEL_SCAN_OPERATORS:
+            scans.append(line.strip())
+    return scans
+
+
+def audit_queries(adapter, queries: Iterable[HotQuery]) -> List[QueryAudit]:
+    """
+    EXPLAIN every query (nothing is executed) and collect its scans.
+
+    Statements written for execute_many (using `row.`) are explained as
+    execute_many sends them, under `UNWIND $rows AS row`.
+    """
+    audits = []
+    for hot in queries:
+        cypher = hot.cypher
+        if re.search(r"\brow\.", cypher) and not cypher.lstrip().upper().startswith("UNWIND"):
+            cypher = f"UNWIND $rows AS row\n{cypher}"
+        audit = QueryAudit(name=hot.name, allow_scan=hot.allow_scan)
+        try:
+            audit.plan = adapter.explain(cypher, hot.params)
+            audit.scans = plan_scans(audit.plan)
+        except Exception as e:
+            audit.error = str(e)
+        audits.append(audit)
+    return audits
@@ -0,0 +1,256 @@
+"""
+Embedding Cache
+
+Content-addressed cache for text embeddings, keyed by model name.
+
+Two tiers:
+    - Memory: bounded LRU of recently used vectors.
+    - Disk (optional): one append-only record file per model, memory-mapped.
+      Each record is a 16-byte content hash followed by the float32 vector.
+      The hash → row index is rebuilt from the key column on open and
+      extended when another process appends.
+
+A torn trailing record (crash mid-append) is ignored on read and truncated
+before the next append.
+
+DOCS: docs/infrastructure/embeddings/
+
+Usage:
+    from runtime.infrastructure.embeddings.cache import EmbeddingCache
+
+    cache = EmbeddingCache("all-mpnet-base-v2", cache_dir=".mind/cache/embeddings")
+    vector = cache.get("Aldric swore an oath")
+    if vector is None:
+        vector = model.encode(...)
+        cache.put("Aldric swore an oath", vector)
+
+Environment:
+    MIND_EMBEDDING_CACHE_DIR: Disk tier location (default: .mind/cache/embeddings
+                              when .mind/ exists, otherwise memory only)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer assumption
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "MIND_EMBEDDING_CACHE_DIR"
+DEFAULT_MEMORY_ENTRIES = 10000
+KEY_BYTES = 16
+
+RECORDS_FILE = "vectors.bin"
+META_FILE = "meta.json"
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Disk tier location from env, or .mind/cache/embeddings if .mind/ exists."""
+    configured = os.getenv(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    if Path(".mind").is_dir():
+        return Path(".mind") / "cache" / "embeddings"
+    return None
+
+
+def text_key(model_name: str, text: str) -> bytes:
+    """Content hash for (model, text)."""
+    return hashlib.blake2b(
+        f"{model_name}\0{text}".encode("utf-8"), digest_size=KEY_BYTES
+    ).digest()
+
+
+class _DiskTier:
+    """Append-only, memory-mapped record file for one model and dimension."""
+
+    def __init__(self, directory: Path, model_name: str, dimension: int):
+        self.directory = directory
+        self.dimension = dimension
+        self.dtype = np.dtype([("key", f"V{KEY_BYTES}"), ("vec", "<f4", (dimension,))])
+        self.path = directory / RECORDS_FILE
+        self._rows: Dict[bytes, int] = {}
+        self._indexed = 0
+        self._map: Optional[np.memmap] = None
+
+        directory.mkdir(parents=True, exist_ok=True)
+        meta_path = directory / META_FILE
+        meta = {"model": model_name, "dimension": dimension}
+        if meta_path.exists():
+            try:
+                stored = json.loads(meta_path.read_text())
+            except ValueError:
+                stored = {}
+            if stored != meta:
+                logger.warning(f"[EmbeddingCache] {directory} was built for {stored}, resetting")
+                self.path.unlink(missing_ok=True)
+        meta_path.write_text(json.dumps(meta))
+        self.path.touch(exist_ok=True)
+        self._refresh()
+
+    def __len__(self) -> int:
+        return self._indexed
+
+    def _complete_rows(self) -> int:
+        return os.path.getsize(self.path) // self.dtype.itemsize
+
+    def _refresh(self) -> None:
+        """Map the file and index rows appended since the last refresh."""
+        rows = self._complete_rows()
+        if rows == self._indexed:
+            return
+        self._map = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(rows,))
+        keys = self._map["key"][self._indexed:rows]
+        for offset, key in enumerate(keys):
+            self._rows[bytes(key)] = self._indexed + offset
+        self._indexed = rows
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        row = self._rows.get(key)
+        if row is None:
+            self._refresh()
+            row = self._rows.get(key)
+            if row is None:
+                return None
+        return np.array(self._map["vec"][row])
+
+    def append(self, items: Sequence) -> None:
+        """Append (key, vector) pairs not already on disk."""
+        records = np.zeros(len(items), dtype=self.dtype)
+        for i, (key, vector) in enumerate(items):
+            records[i]["key"] = key
+            records[i]["vec"] = vector
+
+        with open(self.path, "r+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                # Drop a torn tail left by a crashed writer
+                complete = self._complete_rows() * self.dtype.itemsize
+                f.truncate(complete)
+                f.seek(complete)
+                f.write(records.tobytes())
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        self._refresh()
+
+
+class EmbeddingCache:
+    """
+    Memory LRU in front of an optional on-disk tier, both keyed by content hash.
+
+    The disk tier opens lazily once the embedding dimension is known (first put,
+    or `dimension` passed in).
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[os.PathLike] = None,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        dimension: Optional[int] = None,
+    ):
+        self.model_name = model_name
+        self.max_memory_entries = max_memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._disk: Optional[_DiskTier] = None
+        self._disk_dir: Optional[Path] = None
+        if cache_dir is not None:
+            safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+            self._disk_dir = Path(cache_dir) / safe_name
+            dimension = dimension or self._stored_dimension()
+            if dimension:
+                self._open_disk(dimension)
+
+    def _stored_dimension(self) -> Optional[int]:
+        """Dimension recorded by a previous run, so hits don't wait for a first put."""
+        try:
+            return int(json.loads((self._disk_dir / META_FILE).read_text())["dimension"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _open_disk(self, dimension: int) -> None:
+        if self._disk is not None or self._disk_dir is None:
+            return
+        try:
+            self._disk = _DiskTier(self._disk_dir, self.model_name, dimension)
+            logger.info(f"[EmbeddingCache] {len(self._disk)} cached embeddings in {self._disk_dir}")
+        except OSError as e:
+            logger.warning(f"[EmbeddingCache] Disk tier unavailable ({e}), memory only")
+            self._disk_dir = None
+
+    def get(self, text: str) -> Optional[List[float]]:
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Cached vectors for texts, None where missing."""
+        results: List[Optional[List[float]]] = []
+        with self._lock:
+            for text in texts:
+                key = text_key(self.model_name, text)
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                elif self._disk is not None:
+                    stored = self._disk.get(key)
+                    if stored is not None:
+                        vector = stored.tolist()
+                        self._remember(key, vector)
+                if vector is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self.hits += 1
+                    results.append(list(vector))  # callers own their copy
+        return results
+
+    def put(self, text: str, vector: Sequence[float]) -> None:
+        self.put_many([text], [vector])
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        with self._lock:
+            fresh = []
+            for text, vector in zip(texts, vectors):
+                key = text_key(self.model_name, text)
+                vector = [float(x) for x in vector]
+                if key not in self._memory:
+                    fresh.append((key, vector))
+                self._remember(key, vector)
+
+            if not fresh or self._disk_dir is None:
+                return
+            self._open_disk(len(fresh[0][1]))
+            if self._disk is None:
+                return
+            fresh = [
+                (key, vector) for key, vector in fresh
+                if len(vector) == self._disk.dimension and self._disk.get(key) is None
+            ]
+            if fresh:
+                try:
+                    self._disk.append(fresh)
+                except OSError as e:
+                    logger.warning(f"[EmbeddingCache] Disk append failed: {e}")
+
+    def _remember(self, key: bytes, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
@@ -3,72 +3,223 @@ Embed Pending - Batch embed unembedded nodes and links
 
 Call after exploration or doctor to ensure all graph elements have embeddings.
 
+Streaming pipeline, one pass per element kind (nodes, then links):
+    1. READ     keyset pages of unembedded elements (ordered by internal id)
+    2. ENCODE   each page with one embed_batch call, on a worker pool
+    3. WRITE    each encoded page with one UNWIND $rows bulk SET, in page order
+    4. CHECKPOINT  the last written internal id, so a crashed run resumes there
+
+Writes address elements by internal id (nodes directly, links through their
+start node), so no write scans the graph.
+
 Usage:
     from runtime.infrastructure.embeddings.embed_pending import embed_all_pending
     stats = embed_all_pending(graph_name='mind')
 """
 
-from typing import Dict, Any, Optional
+import json
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
 from .service import get_embedding_service
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 512
+DEFAULT_WORKERS = 2
+
+NODE_PAGE_QUERY = """
+    MATCH (n)
+    WHERE n.embedding IS NULL AND n.name IS NOT NULL AND id(n) > $after
+    RETURN id(n), n.name, n.node_type, n.description
+    ORDER BY id(n)
+    LIMIT $limit
+"""
+
+NODE_WRITE_QUERY = """
+    UNWIND $rows AS row
+    MATCH (n)
+    WHERE id(n) = row.nid
+    SET n.embedding = row.emb
+"""
+
+LINK_PAGE_QUERY = """
+    MATCH (a)-[r]->(b)
+    WHERE r.embedding IS NULL AND r.id IS NOT NULL AND id(r) > $after
+    RETURN id(r), id(a), r.name, a.name, a.description, b.name, b.description
+    ORDER BY id(r)
+    LIMIT $limit
+"""
+
+LINK_WRITE_QUERY = """
+    UNWIND $rows AS row
+    MATCH (a)-[r]->()
+    WHERE id(a) = row.aid AND id(r) = row.rid
+    SET r.embedding = row.emb
+"""
+
+
+def default_checkpoint_path(graph_name: str) -> Optional[Path]:
+    """Checkpoint file under .mind/cache/ (None when there is no .mind/)."""
+    if not Path(".mind").is_dir():
+        return None
+    return Path(".mind") / "cache" / f"embed_pending_{graph_name}.json"
+
 
-def embed_all_pending(graph_name: str = 'mind') -> Dict[str, int]:
+def embed_all_pending(
+    graph_name: str = 'mind',
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    checkpoint_path: Optional[Path] = None,
+    resume: bool = True,
+) -> Dict[str, int]:
     """
     Embed all nodes and links that lack embeddings.
 
+    Args:
+        graph_name: Graph to backfill
+        page_size: Elements per read page / encode batch / bulk write
+        workers: Encode worker threads (pages encoded concurrently)
+        checkpoint_path: Progress file (default: .mind/cache/embed_pending_<graph>.json)
+        resume: Continue from the checkpoint if one exists
+
     Returns:
         Dict with counts: {'nodes': N, 'links': M}
     """
     from runtime.physics.graph.graph_queries import GraphQueries
 
     gq = GraphQueries(graph_name=graph_name)
-    graph = gq.graph
     svc = get_embedding_service()
 
     if not svc:
         raise RuntimeError("Embedding service unavailable")
 
-    stats = {'nodes': 0, 'links': 0}
+    if checkpoint_path is None:
+        checkpoint_path = default_checkpoint_path(graph_name)
+    checkpoint = _Checkpoint(checkpoint_path, graph_name, resume)
 
-    # Embed nodes without embeddings
-    result = graph.query("""
-        MATCH (n)
-        WHERE n.embedding IS NULL AND n.name IS NOT NULL
-        RETURN n.id, n.name, n.node_type, n.description
-    """)
-
-    for row in result.result_set:
-        node_id, name, node_type, desc = row
-        text = _node_embed_text(name, node_type, desc)
-        embedding = svc.embed(text)
-        if embedding:
-            graph.query("""
-                MATCH (n {id: $id})
-                SET n.embedding = $emb
-            """, {'id': node_id, 'emb': embedding})
-            stats['nodes'] += 1
-
-    # Embed links without embeddings
-    result = graph.query("""
-        MATCH (a)-[r]->(b)
-        WHERE r.embedding IS NULL AND r.id IS NOT NULL
-        RETURN r.id, r.name, a.name, a.description, b.name, b.description
-    """)
-
-    for row in result.result_set:
-        link_id, link_name, from_name, from_desc, to_name, to_desc = row
-        text = _link_embed_text(link_name, from_name, from_desc, to_name, to_desc)
-        embedding = svc.embed(text)
-        if embedding:
-            graph.query("""
-                MATCH ()-[r {id: $id}]->()
-                SET r.embedding = $emb
-            """, {'id': link_id, 'emb': embedding})
-            stats['links'] += 1
+    stats = {'nodes': 0, 'links': 0}
 
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        stats['nodes'] = _run_phase(
+            gq._query, pool, svc, checkpoint, 'nodes',
+            page_query=NODE_PAGE_QUERY,
+            write_query=NODE_WRITE_QUERY,
+            to_text=lambda row: _node_embed_text(row[1], row[2], row[3]),
+            to_write=lambda row, emb: {'nid': row[0], 'emb': emb},
+            page_size=page_size,
+            max_inflight=2 * max(1, workers),
+        )
+        stats['links'] = _run_phase(
+            gq._query, pool, svc, checkpoint, 'links',
+            page_query=LINK_PAGE_QUERY,
+            write_query=LINK_WRITE_QUERY,
+            to_text=lambda row: _link_embed_text(*row[2:7]),
+            to_write=lambda row, emb: {'rid': row[0], 'aid': row[1], 'emb': emb},
+            page_size=page_size,
+            max_inflight=2 * max(1, workers),
+        )
+
+    checkpoint.clear()
     return stats
 
 
+def _run_phase(
+    query: Callable[[str, Dict[str, Any]], List],
+    pool: ThreadPoolExecutor,
+    svc: Any,
+    checkpoint: '_Checkpoint',
+    phase: str,
+    page_query: str,
+    write_query: str,
+    to_text: Callable[[List], str],
+    to_write: Callable[[List, List[float]], Dict[str, Any]],
+    page_size: int,
+    max_inflight: int,
+) -> int:
+    """Read → encode (pool) → write pipeline for one element kind. Returns count written."""
+    if checkpoint.done(phase):
+        return 0
+
+    after = checkpoint.after(phase)
+    inflight: deque = deque()
+    written = 0
+
+    def write_oldest() -> None:
+        nonlocal written
+        rows, future = inflight.popleft()
+        embeddings = future.result()
+        payload = [to_write(row, emb) for row, emb in zip(rows, embeddings) if emb]
+        if payload:
+            query(write_query, {'rows': payload})
+        written += len(payload)
+        checkpoint.save(phase, rows[-1][0])
+
+    while True:
+        rows = query(page_query, {'after': after, 'limit': page_size}) or []
+        if not rows:
+            break
+        after = rows[-1][0]
+        texts = [to_text(row) for row in rows]
+        inflight.append((rows, pool.submit(svc.embed_batch, texts)))
+        if len(inflight) >= max_inflight:
+            write_oldest()
+        if len(rows) < page_size:
+            break
+
+    while inflight:
+        write_oldest()
+
+    checkpoint.finish(phase)
+    logger.info(f"[EmbedPending] Embedded {written} {phase}")
+    return written
+
+
+class _Checkpoint:
+    """Last written internal id per phase, persisted as JSON after every page."""
+
+    def __init__(self, path: Optional[Path], graph_name: str, resume: bool):
+        self.path = path
+        self.state: Dict[str, Any] = {'graph': graph_name}
+        if path is not None and resume and path.exists():
+            try:
+                stored = json.loads(path.read_text())
+                if stored.get('graph') == graph_name:
+                    self.state = stored
+                    logger.info(f"[EmbedPending] Resuming from {path}: {stored}")
+            except ValueError:
+                pass
+
+    def after(self, phase: str) -> int:
+        return self.state.get(phase, {}).get('after', -1)
+
+    def done(self, phase: str) -> bool:
+        return self.state.get(phase, {}).get('done', False)
+
+    def save(self, phase: str, after: int) -> None:
+        self.state[phase] = {'after': after, 'done': False}
+        self._write()
+
+    def finish(self, phase: str) -> None:
+        self.state[phase] = {'after': self.after(phase), 'done': True}
+        self._write()
+
+    def clear(self) -> None:
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _write(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.state))
+        tmp.replace(self.path)
+
+
 def _node_embed_text(name: str, node_type: Optional[str], desc: Optional[str]) -> str:
     """Build embedding text for a node."""
     parts = [name or '']
@@ -110,7 +110,8 @@ def get_embedding_service(provider: str = None, check_config: bool = True) -> Em
 
     elif provider == "local":
         from .service import EmbeddingService
-        instance = EmbeddingService()
+        from .cache import default_cache_dir
+        instance = EmbeddingService(cache_dir=default_cache_dir())
         logger.info(f"[EmbeddingFactory] Using local sentence-transformers ({instance.dimension}d)")
 
     else:
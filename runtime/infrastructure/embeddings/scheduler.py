@@ -0,0 +1,144 @@
+"""
+Embedding Scheduler
+
+Coalesces concurrent single-text embed requests into batched encodes.
+
+Callers `await scheduler.embed(text)`. Requests arriving within
+`max_delay_s` of each other (or until `max_batch_size` is reached) are
+encoded with one `embed_batch` call, run in a worker thread so the event
+loop keeps serving other coroutines. While a batch is encoding, new
+requests queue up and go out together as the next batch.
+
+DOCS: docs/infrastructure/embeddings/
+
+Usage:
+    from runtime.infrastructure.embeddings.scheduler import get_embedding_scheduler
+
+    scheduler = get_embedding_scheduler()
+    vectors = await asyncio.gather(*(scheduler.embed(q) for q in queries))
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_DELAY_S = 0.005
+
+# Singleton instance
+_scheduler: Optional['EmbeddingScheduler'] = None
+_scheduler_lock = threading.Lock()
+
+
+class EmbeddingScheduler:
+    """
+    Micro-batching front for an embedding service (anything with embed/embed_batch).
+
+    State is per event loop: a scheduler reused under a new loop (each
+    asyncio.run call) starts with an empty queue.
+    """
+
+    def __init__(
+        self,
+        service: Any = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_s: float = DEFAULT_MAX_DELAY_S,
+    ):
+        self._service = service
+        self.max_batch_size = max_batch_size
+        self.max_delay_s = max_delay_s
+        self.batches = 0  # encode calls issued (for diagnostics)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight = False
+
+    @property
+    def service(self) -> Any:
+        if self._service is None:
+            from runtime.infrastructure.embeddings.service import get_embedding_service
+            self._service = get_embedding_service()
+        return self._service
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed one text; batched with other concurrent callers."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._reset(loop)
+
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None and not self._inflight:
+            self._timer = loop.call_later(self.max_delay_s, self._flush)
+        return await future
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts (joins whatever batch is forming)."""
+        return list(await asyncio.gather(*(self.embed(t) for t in texts)))
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._pending = []
+        self._timer = None
+        self._inflight = False
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._inflight or not self._pending:
+            return
+
+        batch = self._pending[:self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size:]
+        self._inflight = True
+        self.batches += 1
+        self._loop.create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            vectors = await self._loop.run_in_executor(None, self._encode, texts)
+        except Exception as e:
+            logger.warning(f"[EmbeddingScheduler] Batch of {len(texts)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+        finally:
+            self._inflight = False
+            # Whatever queued up while encoding goes out now
+            if self._pending:
+                self._flush()
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Worker-thread encode. Blank texts keep embed()'s zero-vector result."""
+        service = self.service
+        real = [i for i, t in enumerate(texts) if t and t.strip()]
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        if real:
+            for i, vector in zip(real, service.embed_batch([texts[i] for i in real])):
+                vectors[i] = vector
+        if len(real) < len(texts):
+            zero = service.embed("")
+            vectors = [v if v is not None else list(zero) for v in vectors]
+        return vectors
+
+
+def get_embedding_scheduler() -> EmbeddingScheduler:
+    """Get singleton scheduler over the configured embedding service."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = EmbeddingScheduler()
+        return _scheduler
@@ -4,13 +4,24 @@ Embedding Service
 Generates embeddings for semantic search using sentence-transformers.
 Based on Mind Protocol's embedding_service.py pattern.
 
+Embeddings are cached by content hash (see embeddings/cache.py), so
+repeated text is only encoded once per model, across restarts when the
+disk tier is enabled.
+
 DOCS: docs/infrastructure/embeddings/
 """
 
 import logging
+import os
 from typing import List, Dict, Any, Optional
 import numpy as np
 
+from runtime.infrastructure.embeddings.cache import (
+    DEFAULT_MEMORY_ENTRIES,
+    EmbeddingCache,
+    default_cache_dir,
+)
+
 logger = logging.getLogger(__name__)
 
 # Singleton instance
@@ -24,16 +35,24 @@ class EmbeddingService:
     Uses all-mpnet-base-v2 (768 dimensions) for high-quality embeddings.
     """
 
-    def __init__(self, model_name: str = "sentence-transformers/all-mpnet-base-v2"):
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-mpnet-base-v2",
+        cache_dir: Optional[os.PathLike] = None,
+        cache_size: int = DEFAULT_MEMORY_ENTRIES,
+    ):
         """
         Initialize embedding service.
 
         Args:
             model_name: HuggingFace model name
+            cache_dir: Directory for the on-disk embedding cache (None: memory only)
+            cache_size: Entries kept in the in-memory LRU
         """
         self.model_name = model_name
         self.model = None
         self.dimension = 768  # all-mpnet-base-v2 dimension
+        self.cache = EmbeddingCache(model_name, cache_dir=cache_dir, max_memory_entries=cache_size)
 
         logger.info(f"[EmbeddingService] Initializing with {model_name}")
 
@@ -61,13 +80,19 @@ class EmbeddingService:
         Returns:
             List of floats (768 dimensions)
         """
+        if text and text.strip():
+            cached = self.cache.get(text)
+            if cached is not None:
+                return cached
+
         self._load_model()
 
         if not text or not text.strip():
             return [0.0] * self.dimension
 
-        embedding = self.model.encode(text, normalize_embeddings=True)
-        return embedding.tolist()
+        embedding = self.model.encode(text, normalize_embeddings=True).tolist()
+        self.cache.put(text, embedding)
+        return embedding
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
@@ -79,16 +104,23 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        self._load_model()
-
         if not texts:
+            self._load_model()
             return []
 
         # Filter empty texts
         valid_texts = [t if t and t.strip() else " " for t in texts]
 
-        embeddings = self.model.encode(valid_texts, normalize_embeddings=True)
-        return embeddings.tolist()
+        # Encode each distinct uncached text once
+        results = self.cache.get_many(valid_texts)
+        missing = list(dict.fromkeys(t for t, r in zip(valid_texts, results) if r is None))
+        if missing:
+            self._load_model()
+            encoded = self.model.encode(missing, normalize_embeddings=True).tolist()
+            self.cache.put_many(missing, encoded)
+            by_text = dict(zip(missing, encoded))
+            results = [r if r is not None else list(by_text[t]) for t, r in zip(valid_texts, results)]
+        return results
 
     def embed_node(self, node: Dict[str, Any]) -> List[float]:
         """
@@ -219,5 +251,5 @@ def get_embedding_service() -> EmbeddingService:
     """Get singleton embedding service instance."""
     global _embedding_service
     if _embedding_service is None:
-        _embedding_service = EmbeddingService()
+        _embedding_service = EmbeddingService(cache_dir=default_cache_dir())
     return _embedding_service
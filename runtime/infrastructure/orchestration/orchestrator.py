@@ -352,7 +352,7 @@ class Orchestrator:
                 })
 
         if any(data.values()):
-            self.write.apply(data=data)
+            self.write.apply(data=data, bulk=True)
 
     def _parse_time(self, time_str: str) -> float:
         """Parse time string to minutes."""
@@ -496,7 +496,7 @@ class Orchestrator:
             data['movements'].append(move)
 
         if any(data.values()):
-            self.write.apply(data=data)
+            self.write.apply(data=data, bulk=True)
 
     def new_game(self, initial_state_path: str = None):
         """Start a new game."""
@@ -508,7 +508,7 @@ class Orchestrator:
 
         # Load initial state if provided
         if initial_state_path:
-            self.write.apply(path=initial_state_path)
+            self.write.apply(path=initial_state_path, bulk=True)
 
         logger.info("[Orchestrator] New game started")
 
@@ -121,7 +121,7 @@ class WorldRunnerService:
 
             try:
 
-                self.graph_ops.apply(data=result["graph_mutations"])
+                self.graph_ops.apply(data=result["graph_mutations"], bulk=True)
 
                 logger.info(f"[WorldRunnerService] Applied {len(result['graph_mutations'].get('new_narratives', []))} new narratives and other mutations.")
 
@@ -362,53 +362,56 @@ class WorldRunnerService:
         final_result = None
         stopped_reason = "max_ticks_reached"
 
-        for tick_num in range(max_ticks):
-            # Run one tick
-            result = tick_runner.run()
-            ticks_run += 1
-            final_result = result
-
-            # Check for completions
-            if result.completions:
-                # Filter by location if specified
-                if location_id:
-                    # Check if any completion is at the player's location
-                    visible_completions = []
-                    for completion in result.completions:
-                        moment_id = completion.get("moment_id")
-                        if moment_id:
-                            # Check if moment is at player location
-                            location_query = """
-                            MATCH (m:Moment {id: $moment_id})-[:AT]->(s:Space {id: $location_id})
-                            RETURN m.id
-                            """
-                            at_location = self.graph_queries.query(
-                                location_query,
-                                params={"moment_id": moment_id, "location_id": location_id}
-                            )
-                            if at_location:
-                                visible_completions.append(completion)
-
-                    if visible_completions:
-                        completed_moments.extend(visible_completions)
-                        stopped_reason = "moment_completed_at_location"
+        try:
+            for tick_num in range(max_ticks):
+                # Run one tick
+                result = tick_runner.run()
+                ticks_run += 1
+                final_result = result
+
+                # Check for completions
+                if result.completions:
+                    # Filter by location if specified
+                    if location_id:
+                        # Check if any completion is at the player's location
+                        visible_completions = []
+                        for completion in result.completions:
+                            moment_id = completion.get("moment_id")
+                            if moment_id:
+                                # Check if moment is at player location
+                                location_query = """
+                                MATCH (m:Moment {id: $moment_id})-[:AT]->(s:Space {id: $location_id})
+                                RETURN m.id
+                                """
+                                at_location = self.graph_queries.query(
+                                    location_query,
+                                    params={"moment_id": moment_id, "location_id": location_id}
+                                )
+                                if at_location:
+                                    visible_completions.append(completion)
+
+                        if visible_completions:
+                            completed_moments.extend(visible_completions)
+                            stopped_reason = "moment_completed_at_location"
+                            break
+                    else:
+                        # No location filter, any completion counts
+                        completed_moments.extend(result.completions)
+                        stopped_reason = "moment_completed"
                         break
-                else:
-                    # No location filter, any completion counts
-                    completed_moments.extend(result.completions)
-                    stopped_reason = "moment_completed"
-                    break
 
-            # Early exit if no energy in system (nothing will happen)
-            total_energy = (
-                result.energy_generated +
-                result.energy_drawn +
-                result.energy_flowed +
-                result.energy_backflowed
-            )
-            if total_energy == 0 and ticks_run > 5:
-                stopped_reason = "no_energy_in_system"
-                break
+                # Early exit if no energy in system (nothing will happen)
+                total_energy = (
+                    result.energy_generated +
+                    result.energy_drawn +
+                    result.energy_flowed +
+                    result.energy_backflowed
+                )
+                if total_energy == 0 and ticks_run > 5:
+                    stopped_reason = "no_energy_in_system"
+                    break
+        finally:
+            tick_runner.close()
 
         logger.info(f"[WorldRunner] run_until_visible: {ticks_run} ticks, {len(completed_moments)} completions, reason={stopped_reason}")
 
@@ -477,57 +480,60 @@ class WorldRunnerService:
         final_result = None
         stopped_reason = "max_ticks_reached"
 
-        for tick_num in range(max_ticks):
-            # Run one tick
-            result = tick_runner.run()
-            ticks_run += 1
-            final_result = result
-
-            # Check for moment-based disruptions
-            if result.completions:
-                for completion in result.completions:
-                    disruptions.append({
-                        "type": "moment_completed",
-                        "tick": ticks_run,
-                        "moment_id": completion.get("moment_id"),
-                        "energy_released": completion.get("energy_released", 0.0)
-                    })
-
-            if result.rejections:
-                for rejection in result.rejections:
-                    disruptions.append({
-                        "type": "moment_rejected",
-                        "tick": ticks_run,
-                        "moment_id": rejection.get("moment_id"),
-                        "reason": rejection.get("reason", "unknown")
-                    })
-
-            # Check narrative energy shifts every 5 ticks
-            if ticks_run % 5 == 0:
-                for nid, initial_energy in initial_narratives.items():
-                    narrative = self.graph_queries.get_narrative(nid)
-                    if narrative:
-                        current_energy = narrative.get("energy", 0.0)
-                        change = abs(current_energy - initial_energy)
-                        if change > disruption_threshold:
-                            disruptions.append({
-                                "type": "narrative_shift",
-                                "tick": ticks_run,
-                                "narrative_id": nid,
-                                "initial_energy": initial_energy,
-                                "current_energy": current_energy,
-                                "change": change
-                            })
-
-            # Stop if we have disruptions
-            if disruptions:
-                stopped_reason = "disruption_detected"
-                break
-
-            # Early exit if no activity
-            if result.hot_links == 0 and ticks_run > 10:
-                stopped_reason = "no_hot_links"
-                break
+        try:
+            for tick_num in range(max_ticks):
+                # Run one tick
+                result = tick_runner.run()
+                ticks_run += 1
+                final_result = result
+
+                # Check for moment-based disruptions
+                if result.completions:
+                    for completion in result.completions:
+                        disruptions.append({
+                            "type": "moment_completed",
+                            "tick": ticks_run,
+                            "moment_id": completion.get("moment_id"),
+                            "energy_released": completion.get("energy_released", 0.0)
+                        })
+
+                if result.rejections:
+                    for rejection in result.rejections:
+                        disruptions.append({
+                            "type": "moment_rejected",
+                            "tick": ticks_run,
+                            "moment_id": rejection.get("moment_id"),
+                            "reason": rejection.get("reason", "unknown")
+                        })
+
+                # Check narrative energy shifts every 5 ticks
+                if ticks_run % 5 == 0:
+                    for nid, initial_energy in initial_narratives.items():
+                        narrative = self.graph_queries.get_narrative(nid)
+                        if narrative:
+                            current_energy = narrative.get("energy", 0.0)
+                            change = abs(current_energy - initial_energy)
+                            if change > disruption_threshold:
+                                disruptions.append({
+                                    "type": "narrative_shift",
+                                    "tick": ticks_run,
+                                    "narrative_id": nid,
+                                    "initial_energy": initial_energy,
+                                    "current_energy": current_energy,
+                                    "change": change
+                                })
+
+                # Stop if we have disruptions
+                if disruptions:
+                    stopped_reason = "disruption_detected"
+                    break
+
+                # Early exit if no activity
+                if result.hot_links == 0 and ticks_run > 10:
+                    stopped_reason = "no_hot_links"
+                    break
+        finally:
+            tick_runner.close()
 
         logger.info(f"[WorldRunner] run_until_disrupted: {ticks_run} ticks, {len(disruptions)} disruptions, reason={stopped_reason}")
 
@@ -1,3 +1,3 @@
-from .tempo_controller import TempoController, TempoState
+from .tempo_controller import OVERRUN_POLICIES, TempoController, TempoMetrics, TempoState
 
-__all__ = ["TempoController", "TempoState"]
+__all__ = ["OVERRUN_POLICIES", "TempoController", "TempoMetrics", "TempoState"]
@@ -9,13 +9,24 @@ FREEZE BEHAVIOR (decided 2025-12-23):
     Pause = 0 ticks. No graph time passes, queue frozen as-is,
     resumes exactly where left off.
 
+TICK EXECUTION:
+    Physics and canon recording run on a dedicated worker thread, one
+    tick at a time, so the event loop (API, SSE) keeps serving during a
+    tick. Deadlines are drift-compensated (next = previous + interval).
+    Deadlines missed while a tick ran are handled by the overrun policy:
+        skip      drop the missed ticks (default)
+        coalesce  run one tick that advances tick_count for all of them
+        catch_up  run up to max_catch_up of them back to back, drop the rest
+
 SEE: docs/infrastructure/tempo/PATTERNS_Tempo.md
 """
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Optional, Tuple
 
 from runtime.physics import GraphTick
 
@@ -31,6 +42,33 @@ class TempoState:
     tick_at_pause: Optional[int] = field(default=None)
 
 
+OVERRUN_POLICIES = ("skip", "coalesce", "catch_up")
+
+
+@dataclass
+class TempoMetrics:
+    """Tick timing and overrun counters."""
+    ticks_run: int = 0
+    # Deadlines found missed by at least one full interval
+    overruns: int = 0
+    ticks_skipped: int = 0
+    ticks_coalesced: int = 0
+    ticks_caught_up: int = 0
+    last_tick_s: float = 0.0
+    max_tick_s: float = 0.0
+    total_tick_s: float = 0.0
+    max_lag_s: float = 0.0
+
+    @property
+    def avg_tick_ms(self) -> float:
+        return 1000 * self.total_tick_s / self.ticks_run if self.ticks_run else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["avg_tick_ms"] = round(self.avg_tick_ms, 3)
+        return d
+
+
 class TempoController:
     """
     Async tick loop coordinating physics and canon surfacing.
@@ -40,6 +78,9 @@ class TempoController:
         - No physics runs, no canon recording, tick_count frozen
         - resume() continues exactly where left off
         - Queue state preserved across pause/resume
+
+    Ticks run off the event loop on one worker thread; see module docstring
+    for scheduling and overrun policies.
     """
 
     # Speed mode to tick interval (seconds)
@@ -49,10 +90,21 @@ class TempoController:
         "3x": 0.01,
     }
 
-    def __init__(self, graph_tick: GraphTick, canon_holder: Optional[object] = None) -> None:
+    def __init__(
+        self,
+        graph_tick: GraphTick,
+        canon_holder: Optional[object] = None,
+        overrun_policy: str = "skip",
+        max_catch_up: int = 3,
+    ) -> None:
+        if overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Invalid overrun policy: {overrun_policy}. Valid: {list(OVERRUN_POLICIES)}")
         self.graph_tick = graph_tick
         self.canon_holder = canon_holder
+        self.overrun_policy = overrun_policy
+        self.max_catch_up = max_catch_up
         self.state = TempoState()
+        self._metrics = TempoMetrics()
         self._pause_event = asyncio.Event()
         self._pause_event.set()  # Start unpaused
 
@@ -72,6 +124,10 @@ class TempoController:
     def tick_count(self) -> int:
         return self.state.tick_count
 
+    def metrics(self) -> TempoMetrics:
+        """Return tick metrics (live object)."""
+        return self._metrics
+
     def set_speed(self, speed: str) -> None:
         """Set tick speed. Valid: 1x, 2x, 3x."""
         if speed not in self.SPEED_INTERVALS:
@@ -109,31 +165,92 @@ class TempoController:
         """
         Main tempo loop. Ticks physics and records canon.
 
+        Each tick runs on the worker thread while the loop awaits it.
+        Deadlines advance from the previous deadline, not from when the
+        tick finished, so the cadence does not drift by the tick duration.
+
         Respects pause: blocks on _pause_event when frozen.
         No busy-wait during pause.
         """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tempo-tick")
         self.state.running = True
-        while self.state.running:
-            # Block if paused — no CPU burn
-            await self._pause_event.wait()
+        deadline = loop.time() + self._tick_interval()
+        try:
+            while self.state.running:
+                if not self._pause_event.is_set():
+                    # Block if paused — no CPU burn
+                    await self._pause_event.wait()
+                    # Frozen time owes no ticks: restart the cadence
+                    deadline = loop.time() + self._tick_interval()
+
+                if not self.state.running:
+                    break
+
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # Double-check pause (could have paused during sleep)
+                if self.state.paused:
+                    continue
 
-            if not self.state.running:
-                break
+                interval = self._tick_interval()
+                lag = max(0.0, loop.time() - deadline)
+                missed = int(lag // interval)
+                deadline += (missed + 1) * interval
+                runs, advance = self._plan_overrun(missed, lag)
+
+                for _ in range(runs):
+                    if self.state.paused or not self.state.running:
+                        break
+                    self.state.tick_count += advance
+                    started = time.perf_counter()
+                    await loop.run_in_executor(executor, self._tick)
+                    self._record_tick(time.perf_counter() - started)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _plan_overrun(self, missed: int, lag: float) -> Tuple[int, int]:
+        """
+        Apply the overrun policy to `missed` deadlines.
+
+        Returns:
+            (ticks to run now, tick_count advance per tick run)
+        """
+        metrics = self._metrics
+        metrics.max_lag_s = max(metrics.max_lag_s, lag)
+        if missed <= 0:
+            return 1, 1
 
-            interval = self._tick_interval()
-            await asyncio.sleep(interval)
+        metrics.overruns += 1
+        if self.overrun_policy == "coalesce":
+            metrics.ticks_coalesced += missed
+            return 1, missed + 1
+        if self.overrun_policy == "catch_up":
+            extra = min(missed, self.max_catch_up)
+            metrics.ticks_caught_up += extra
+            metrics.ticks_skipped += missed - extra
+            return extra + 1, 1
+        metrics.ticks_skipped += missed
+        return 1, 1
 
-            # Double-check pause (could have paused during sleep)
-            if self.state.paused:
-                continue
+    def _record_tick(self, duration: float) -> None:
+        metrics = self._metrics
+        metrics.ticks_run += 1
+        metrics.last_tick_s = duration
+        metrics.max_tick_s = max(metrics.max_tick_s, duration)
+        metrics.total_tick_s += duration
 
-            self.state.tick_count += 1
-            tick_result = self.graph_tick.run()
+    def _tick(self) -> object:
+        """One physics tick plus canon recording. Runs on the worker thread."""
+        tick_result = self.graph_tick.run()
 
-            if self.canon_holder is not None:
-                record = getattr(self.canon_holder, "record_to_canon", None)
-                if callable(record):
-                    record(tick_result)
+        if self.canon_holder is not None:
+            record = getattr(self.canon_holder, "record_to_canon", None)
+            if callable(record):
+                record(tick_result)
+        return tick_result
 
     def stop(self) -> None:
         """Stop the tempo loop entirely."""
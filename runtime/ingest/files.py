@@ -3,12 +3,16 @@ File ingestion for the mind graph.
 
 Scans repository files and creates Thing nodes in the graph.
 Computes physics properties during ingestion (line_count, size_class, has_stub, has_secret).
+A manifest of file hashes lets re-runs ingest only the files that changed.
 
 DOCS: docs/ingest/PATTERNS_File_Ingestion.md
 SYSTEM: templates/SYSTEM.md (Physics layer)
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -100,9 +104,58 @@ def _parse_code_imports(content: str, file_ext: str) -> List[str]:
     return local_imports
 
 
+def default_manifest_path(target_dir: Path, graph_name: Optional[str] = None) -> Path:
+    """Manifest file under <target_dir>/.mind/cache/."""
+    return Path(target_dir) / ".mind" / "cache" / f"ingest_files_{graph_name or 'default'}.json"
+
+
+class FileManifest:
+    """
+    Last ingested state of every file: {rel_path: {mtime_ns, size, sha256}}.
+
+    A file whose mtime and size match its entry is unchanged without being
+    read; otherwise its content hash decides. Persisted as JSON after a
+    successful ingest, so an interrupted run re-ingests its files next time.
+    """
+
+    def __init__(self, path: Optional[Path], graph_name: Optional[str]):
+        self.path = path
+        self.graph_name = graph_name
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> "FileManifest":
+        if self.path is not None and self.path.exists():
+            try:
+                stored = json.loads(self.path.read_text())
+                if stored.get("graph") == self.graph_name:
+                    self.files = stored.get("files", {})
+            except ValueError:
+                logger.warning(f"[FileIngest] Ignoring unreadable manifest {self.path}")
+        return self
+
+    def stat_matches(self, rel_path: str, stat: os.stat_result) -> bool:
+        entry = self.files.get(rel_path)
+        return bool(entry) and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size
+
+    def hash_matches(self, rel_path: str, digest: str) -> bool:
+        entry = self.files.get(rel_path)
+        return bool(entry) and entry.get("sha256") == digest
+
+    def save(self, files: Dict[str, Dict[str, Any]]) -> None:
+        self.files = files
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"graph": self.graph_name, "files": files}))
+        tmp.replace(self.path)
+
+
 def scan_and_ingest_files(
     target_dir: Path,
     graph_name: Optional[str] = None,
+    incremental: bool = False,
+    manifest_path: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
     Scan repository and ingest files as Thing nodes.
@@ -111,18 +164,29 @@ def scan_and_ingest_files(
     - Space nodes for directories (AREA, MODULE)
     - Thing nodes for files
     - LINK edges: Space --contains--> Thing
-    - Embeddings for all nodes with synthesis
+    - LINK edges: Thing --imports--> Thing
+
+    Graph writes are sent as bulk UNWIND statements. A Thing whose synthesis
+    changes has its embedding cleared, so the embedding step re-embeds it.
+
+    Every run records a manifest (path, mtime, size, content hash). With
+    incremental=True only files that changed since the manifest are read and
+    written, and Things of files that disappeared are deleted.
 
     Args:
         target_dir: Repository root
         graph_name: Graph to ingest into (default: from config)
+        incremental: Skip files unchanged since the last run
+        manifest_path: Manifest file (default: .mind/cache/ingest_files_<graph>.json)
 
     Returns:
-        Stats dict: {files_scanned, things_created, spaces_created, ...}
+        Stats dict: {files_scanned, files_unchanged, things_created, things_deleted, ...}
     """
     from ..infrastructure.database import get_database_adapter
     from ..file_utils import should_ignore_path, is_binary_file, load_ignore_patterns
 
+    target_dir = Path(target_dir)
+
     # Load ignore patterns
     ignore_patterns = load_ignore_patterns(target_dir)
 
@@ -131,8 +195,10 @@ def scan_and_ingest_files(
 
     stats = {
         "files_scanned": 0,
+        "files_unchanged": 0,
         "things_created": 0,
         "things_updated": 0,
+        "things_deleted": 0,
         "spaces_created": 0,
         "links_created": 0,
         "areas": set(),
@@ -144,11 +210,24 @@ def scan_and_ingest_files(
         "secrets": 0,
     }
 
-    # Track created spaces to avoid duplicates
-    created_spaces: Set[str] = set()
-
-    def _ensure_space(space_id: str, name: str, space_type: str, location: str = None) -> None:
-        """Create Space node if not exists.
+    manifest = FileManifest(manifest_path or default_manifest_path(target_dir, graph_name), graph_name)
+    if incremental:
+        manifest.load()
+        if manifest.files and not _count_file_things(adapter):
+            # Graph was reset since the manifest was written
+            logger.info("[FileIngest] Graph has no file Things, ignoring manifest")
+            manifest.files = {}
+
+    # Pending writes, keyed so shared directories are written once
+    spaces: Dict[str, Dict[str, Any]] = {}
+    area_modules: Dict[str, Dict[str, Any]] = {}
+    things: List[Dict[str, Any]] = []
+    contains: List[Dict[str, Any]] = []
+    imports: List[Dict[str, Any]] = []
+    seen: Dict[str, Dict[str, Any]] = {}
+
+    def _ensure_space(space_id: str, name: str, space_type: str, location: str) -> None:
+        """Queue a Space node for creation if not exists.
 
         Space types (uppercase):
         - ROOT: Repository root
@@ -161,69 +240,42 @@ def scan_and_ingest_files(
             space_type: Type (ROOT, AREA, MODULE)
             location: Physical path for folder containers (relative to repo root)
         """
-        if space_id in created_spaces:
-            return
-
-        # Check if exists in DB
-        result = adapter.query(
-            "MATCH (s:Space {id: $id}) RETURN s.id",
-            {"id": space_id}
-        )
-        if result:
-            created_spaces.add(space_id)
+        if space_id in spaces:
             return
-
-        # Normalize type to uppercase
         type_upper = space_type.upper()
-
-        # Build properties
-        props = {
+        spaces[space_id] = {
             "id": space_id,
             "name": name,
             "type": type_upper,
             "synthesis": f"{type_upper}: {name}",
+            "location": location,
         }
-        if location:
-            props["location"] = location
-
-        # Create Space node
-        if location:
-            adapter.execute(
-                """
-                CREATE (s:Space {
-                    id: $id,
-                    name: $name,
-                    node_type: 'space',
-                    type: $type,
-                    synthesis: $synthesis,
-                    location: $location
-                })
-                """,
-                props
-            )
-        else:
-            adapter.execute(
-                """
-                CREATE (s:Space {
-                    id: $id,
-                    name: $name,
-                    node_type: 'space',
-                    type: $type,
-                    synthesis: $synthesis
-                })
-                """,
-                props
-            )
-        created_spaces.add(space_id)
-        stats["spaces_created"] += 1
-        if type_upper == "AREA":
-            stats["areas"].add(name)
-        else:
-            stats["modules"].add(name)
 
-    def _create_thing(rel_path: str, parent_space_id: str) -> None:
+    def _parent_space(rel_path: Path) -> str:
+        """Queue the Space hierarchy of a file and return its parent Space id."""
+        parts = rel_path.parts[:-1]
+
+        if not parts:
+            # Root level file
+            _ensure_space("space:root", "root", "ROOT", location=".")
+            return "space:root"
+
+        # Area level (e.g., engine/file.py)
+        area_id = f"space:area:{parts[0]}"
+        _ensure_space(area_id, parts[0], "AREA", location=parts[0])
+        if len(parts) == 1:
+            return area_id
+
+        # Module level (e.g., engine/physics/file.py)
+        module_name = f"{parts[0]}/{parts[1]}"
+        module_id = f"space:module:{module_name}"
+        _ensure_space(module_id, module_name, "MODULE", location=module_name)
+        area_modules[module_id] = {"area_id": area_id, "module_id": module_id}
+        return module_id
+
+    def _create_thing(rel_path: str, parent_space_id: str, content: str) -> None:
         """
-        Create Thing node and link to parent Space.
+        Queue the Thing node of a file, its contains link and its imports.
 
         Computes and stores physics properties:
         - line_count, size_class, has_stub, has_secret, updated_at
@@ -243,12 +295,6 @@ def scan_and_ingest_files(
         else:
             file_type = "file"
 
-        # Read full content for physics computation
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-        except Exception:
-            content = ""
-
         # Compute physics properties
         physics = _compute_physics_properties(file_path, content)
 
@@ -260,85 +306,24 @@ def scan_and_ingest_files(
         if physics["has_secret"]:
             stats["secrets"] += 1
 
-        # Generate synthesis from file content
-        synthesis = _generate_synthesis(file_path, filename)
-
-        # Upsert Thing node
-        result = adapter.query(
-            "MATCH (t:Thing {id: $id}) RETURN t.id",
-            {"id": thing_id}
-        )
-
-        if result:
-            # Update existing with physics properties (refresh energy on update)
-            adapter.execute(
-                """
-                MATCH (t:Thing {id: $id})
-                SET t.synthesis = $synthesis,
-                    t.file_type = $file_type,
-                    t.line_count = $line_count,
-                    t.size_class = $size_class,
-                    t.has_stub = $has_stub,
-                    t.has_secret = $has_secret,
-                    t.updated_at = $updated_at,
-                    t.energy = $energy
-                """,
-                {
-                    "id": thing_id,
-                    "synthesis": synthesis,
-                    "file_type": file_type,
-                    **physics,
-                }
-            )
-            stats["things_updated"] += 1
-        else:
-            # Create new with physics properties
-            adapter.execute(
-                """
-                CREATE (t:Thing {
-                    id: $id,
-                    name: $name,
-                    node_type: 'thing',
-                    path: $path,
-                    file_type: $file_type,
-                    synthesis: $synthesis,
-                    line_count: $line_count,
-                    size_class: $size_class,
-                    has_stub: $has_stub,
-                    has_secret: $has_secret,
-                    updated_at: $updated_at,
-                    energy: $energy
-                })
-                """,
-                {
-                    "id": thing_id,
-                    "name": filename,
-                    "path": rel_path,
-                    "file_type": file_type,
-                    "synthesis": synthesis,
-                    **physics,
-                }
-            )
-            stats["things_created"] += 1
-
-        # Create contains link
-        adapter.execute(
-            """
-            MATCH (s:Space {id: $space_id})
-            MATCH (t:Thing {id: $thing_id})
-            MERGE (s)-[r:LINK {type: 'contains'}]->(t)
-            ON CREATE SET r.hierarchy = -0.7, r.synthesis = 'contains'
-            """,
-            {"space_id": parent_space_id, "thing_id": thing_id}
-        )
-        stats["links_created"] += 1
+        things.append({
+            "id": thing_id,
+            "props": {
+                "name": filename,
+                "node_type": "thing",
+                "path": rel_path,
+                "file_type": file_type,
+                "synthesis": _generate_synthesis(file_path, filename, content),
+                **physics,
+            },
+        })
+        contains.append({"space_id": parent_space_id, "thing_id": thing_id})
 
         # Create import links for code files
         if file_type == "code" and content:
-            imports = _parse_code_imports(content, file_ext)
             file_dir = file_path.parent
 
-            for imp in imports:
+            for imp in _parse_code_imports(content, file_ext):
                 # Resolve relative import to file path
                 if imp.startswith('.'):
                     # Python relative import: .foo -> ./foo.py, ..bar -> ../bar.py
@@ -350,26 +335,14 @@ def scan_and_ingest_files(
 
                 try:
                     target_path = str(resolved.relative_to(target_dir))
-                    target_id = f"thing:{target_path}"
-
-                    # Create imports link (target may not exist yet)
-                    adapter.execute(
-                        """
-                        MATCH (src:Thing {id: $src_id})
-                        MERGE (tgt:Thing {id: $tgt_id})
-                        ON CREATE SET tgt.node_type = 'thing', tgt.name = $tgt_name
-                        MERGE (src)-[r:LINK]->(tgt)
-                        ON CREATE SET r.verb = 'imports', r.hierarchy = 0.3, r.polarity = [0.8, 0.2], r.permanence = 0.9
-                        """,
-                        {
-                            "src_id": thing_id,
-                            "tgt_id": target_id,
-                            "tgt_name": resolved.name,
-                        }
-                    )
-                    stats["links_created"] += 1
                 except ValueError:
-                    pass  # Outside project directory
+                    continue  # Outside project directory
+                # Target may not exist yet
+                imports.append({
+                    "src_id": thing_id,
+                    "tgt_id": f"thing:{target_path}",
+                    "tgt_name": resolved.name,
+                })
 
     def _compute_physics_properties(file_path: Path, content: str) -> Dict[str, Any]:
         """
@@ -426,10 +399,10 @@ def scan_and_ingest_files(
 
         return props
 
-    def _generate_synthesis(file_path: Path, filename: str) -> str:
+    def _generate_synthesis(file_path: Path, filename: str, content: str) -> str:
         """Generate synthesis text from file content."""
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')[:2000]
+            content = content[:2000]
 
             # Extract docstring/first comment
             if file_path.suffix == '.py':
@@ -460,6 +433,32 @@ def scan_and_ingest_files(
         except Exception:
             return filename
 
+    def _ingest_file(item: Path) -> None:
+        """Queue one file, unless the manifest says it is unchanged."""
+        rel_path = item.relative_to(target_dir)
+        rel_path_str = str(rel_path)
+        stat = item.stat()
+
+        if incremental and manifest.stat_matches(rel_path_str, stat):
+            seen[rel_path_str] = manifest.files[rel_path_str]
+            stats["files_unchanged"] += 1
+            return
+
+        data = item.read_bytes()
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        seen[rel_path_str] = entry
+        if incremental and manifest.hash_matches(rel_path_str, entry["sha256"]):
+            # Touched but identical
+            stats["files_unchanged"] += 1
+            return
+
+        content = data.decode('utf-8', errors='ignore')
+        _create_thing(rel_path_str, _parent_space(rel_path), content)
+
     def _scan_dir(directory: Path, depth: int = 0) -> None:
         """Recursively scan directory."""
         if depth > 10:
@@ -498,52 +497,25 @@ def scan_and_ingest_files(
                 stats["files_scanned"] += 1
 
                 try:
-                    rel_path = item.relative_to(target_dir)
-                    rel_path_str = str(rel_path)
-
-                    # Determine space hierarchy
-                    parts = rel_path.parts[:-1]
-
-                    if not parts:
-                        # Root level file
-                        parent_id = "space:root"
-                        _ensure_space(parent_id, "root", "ROOT", location=".")
-                    elif len(parts) == 1:
-                        # Area level (e.g., engine/file.py)
-                        area_id = f"space:area:{parts[0]}"
-                        _ensure_space(area_id, parts[0], "AREA", location=parts[0])
-                        parent_id = area_id
-                    else:
-                        # Module level (e.g., engine/physics/file.py)
-                        area_id = f"space:area:{parts[0]}"
-                        module_name = f"{parts[0]}/{parts[1]}"
-                        module_id = f"space:module:{module_name}"
-
-                        _ensure_space(area_id, parts[0], "AREA", location=parts[0])
-                        _ensure_space(module_id, module_name, "MODULE", location=module_name)
-
-                        # Link area -> module
-                        adapter.execute(
-                            """
-                            MATCH (a:Space {id: $area_id})
-                            MATCH (m:Space {id: $module_id})
-                            MERGE (a)-[r:LINK {type: 'contains'}]->(m)
-                            ON CREATE SET r.hierarchy = -0.7
-                            """,
-                            {"area_id": area_id, "module_id": module_id}
-                        )
-
-                        parent_id = module_id
-
-                    _create_thing(rel_path_str, parent_id)
-
+                    _ingest_file(item)
                 except Exception as e:
                     stats["errors"].append(f"{item}: {e}")
                     logger.warning(f"Error ingesting {item}: {e}")
+                    # Unreadable is not deleted: keep the file's last good entry
+                    # (or none), so its Thing survives and it is retried next run
+                    rel_path_str = str(item.relative_to(target_dir))
+                    if rel_path_str in manifest.files:
+                        seen[rel_path_str] = manifest.files[rel_path_str]
+                    else:
+                        seen.pop(rel_path_str, None)
 
     # Run scan
     _scan_dir(target_dir)
 
+    deleted = [f"thing:{p}" for p in manifest.files if p not in seen] if incremental else []
+    _write_ingest(adapter, stats, spaces, area_modules, things, contains, imports, deleted)
+    manifest.save(seen)
+
     # Convert sets to counts
     stats["areas_count"] = len(stats["areas"])
     stats["modules_count"] = len(stats["modules"])
@@ -553,40 +525,163 @@ def scan_and_ingest_files(
     return stats
 
 
-def _embed_all_nodes(adapter) -> int:
-    """Embed all nodes that have synthesis but no embedding."""
+# =============================================================================
+# BULK WRITES (statements refer to the current row as `row`, see execute_many)
+# =============================================================================
+
+SPACE_CREATE = """
+    CREATE (s:Space {
+        id: row.id,
+        name: row.name,
+        node_type: 'space',
+        type: row.type,
+        synthesis: row.synthesis,
+        location: row.location
+    })
+"""
+
+AREA_MODULE_LINK = """
+    MATCH (a:Space {id: row.area_id})
+    MATCH (m:Space {id: row.module_id})
+    MERGE (a)-[r:LINK {type: 'contains'}]->(m)
+    ON CREATE SET r.hierarchy = -0.7
+"""
+
+# Upsert (refreshes energy on update); a changed synthesis clears the
+# embedding so the embedding step picks the node up again
+THING_UPSERT = """
+    MERGE (t:Thing {id: row.id})
+    SET t.embedding = CASE WHEN t.synthesis = row.props.synthesis THEN t.embedding ELSE null END
+    SET t += row.props
+"""
+
+CONTAINS_LINK = """
+    MATCH (s:Space {id: row.space_id})
+    MATCH (t:Thing {id: row.thing_id})
+    MERGE (s)-[r:LINK {type: 'contains'}]->(t)
+    ON CREATE SET r.hierarchy = -0.7, r.synthesis = 'contains'
+"""
+
+# Imports of a re-ingested file are rebuilt from its current content
+IMPORTS_CLEAR = """
+    MATCH (src:Thing {id: row.id})-[r:LINK {verb: 'imports'}]->()
+    DELETE r
+"""
+
+IMPORTS_LINK = """
+    MATCH (src:Thing {id: row.src_id})
+    MERGE (tgt:Thing {id: row.tgt_id})
+    ON CREATE SET tgt.node_type = 'thing', tgt.name = row.tgt_name
+    MERGE (src)-[r:LINK]->(tgt)
+    ON CREATE SET r.verb = 'imports', r.hierarchy = 0.3, r.polarity = [0.8, 0.2], r.permanence = 0.9
+"""
+
+THING_DELETE = """
+    MATCH (t:Thing {id: row.id})
+    DETACH DELETE t
+"""
+
+# Formatted with the node's label (one statement per label in a batch)
+EMBEDDING_SET = """
+    MATCH (n:{label} {{id: row.id}})
+    SET n.embedding = row.embedding
+"""
+
+
+def _cypher_label(label: str) -> str:
+    """A label from the graph, backtick-quoted unless it is a plain identifier."""
+    return label if re.fullmatch(r"\w+", label) else "`" + label.replace("`", "``") + "`"
+
+
+def _count_file_things(adapter) -> int:
+    """Number of Thing nodes created from files (import placeholders have no path)."""
+    result = adapter.query("MATCH (t:Thing) WHERE t.path IS NOT NULL RETURN count(t)")
+    return result[0][0] if result else 0
+
+
+def _existing_ids(adapter, label: str, ids: List[str]) -> Set[str]:
+    """Which of ids already exist as label nodes, in one query."""
+    if not ids:
+        return set()
+    result = adapter.query(
+        f"UNWIND $ids AS id MATCH (n:{label} {{id: id}}) RETURN n.id",
+        {"ids": ids},
+    )
+    return {row[0] for row in result or []}
+
+
+def _write_ingest(
+    adapter,
+    stats: Dict[str, Any],
+    spaces: Dict[str, Dict[str, Any]],
+    area_modules: Dict[str, Dict[str, Any]],
+    things: List[Dict[str, Any]],
+    contains: List[Dict[str, Any]],
+    imports: List[Dict[str, Any]],
+    deleted: List[str],
+) -> None:
+    """Send queued scan results as bulk writes, in dependency order."""
+    existing_spaces = _existing_ids(adapter, "Space", list(spaces))
+    new_spaces = [s for sid, s in spaces.items() if sid not in existing_spaces]
+    existing_things = _existing_ids(adapter, "Thing", [t["id"] for t in things])
+
+    if new_spaces:
+        adapter.execute_many(SPACE_CREATE, new_spaces)
+    if area_modules:
+        adapter.execute_many(AREA_MODULE_LINK, list(area_modules.values()))
+    if things:
+        adapter.execute_many(THING_UPSERT, things)
+    if contains:
+        adapter.execute_many(CONTAINS_LINK, contains)
+    if existing_things:
+        adapter.execute_many(IMPORTS_CLEAR, [{"id": i} for i in sorted(existing_things)])
+    if imports:
+        adapter.execute_many(IMPORTS_LINK, imports)
+    if deleted:
+        adapter.execute_many(THING_DELETE, [{"id": i} for i in deleted])
+
+    for space in new_spaces:
+        stats["spaces_created"] += 1
+        if space["type"] == "AREA":
+            stats["areas"].add(space["name"])
+        else:
+            stats["modules"].add(space["name"])
+    stats["things_updated"] += len(existing_things)
+    stats["things_created"] += len(things) - len(existing_things)
+    stats["things_deleted"] += len(deleted)
+    stats["links_created"] += len(contains) + len(imports)
+
+
+def _embed_all_nodes(adapter, batch_size: int = 64) -> int:
+    """Embed all nodes that have synthesis but no embedding, in batches."""
     try:
-        from ..infrastructure.embeddings.service import EmbeddingService
+        from ..infrastructure.embeddings import get_embedding_service
 
-        embed_service = EmbeddingService()
+        embed_service = get_embedding_service()
 
         # Find all nodes without embeddings (Things, Spaces, Actors, etc.)
         result = adapter.query(
             """
             MATCH (n)
             WHERE n.embedding IS NULL AND (n.synthesis IS NOT NULL OR n.description IS NOT NULL)
-            RETURN n.id, COALESCE(n.synthesis, n.description) as text
+            RETURN n.id, COALESCE(n.synthesis, n.description) as text, labels(n)[0] AS label
             """
         )
-
-        if not result:
-            return 0
+        rows = [(row[0], row[1], row[2]) for row in result or [] if row[0] and row[1] and row[2]]
 
         count = 0
-        for row in result:
-            node_id = row[0]
-            text = row[1]
-
-            if not text:
-                continue
-
-            embedding = embed_service.embed(text)
-            if embedding:
-                adapter.execute(
-                    "MATCH (n {id: $id}) SET n.embedding = $embedding",
-                    {"id": node_id, "embedding": embedding}
-                )
-                count += 1
+        for i in range(0, len(rows), batch_size):
+            chunk = rows[i:i + batch_size]
+            embeddings = embed_service.embed_batch([text for _, text, _ in chunk])
+
+            # Labeled matches, so each row is an id index seek
+            by_label: Dict[str, List[Dict[str, Any]]] = {}
+            for (node_id, _, label), embedding in zip(chunk, embeddings):
+                if embedding:
+                    by_label.setdefault(label, []).append({"id": node_id, "embedding": embedding})
+            for label, updates in by_label.items():
+                adapter.execute_many(EMBEDDING_SET.format(label=_cypher_label(label)), updates)
+                count += len(updates)
 
         return count
 
@@ -24,6 +24,9 @@ Space Resolution:
 1. Detect active task → follow implements chain → find space
 2. Fallback: actor's linked spaces, pick by weight × energy (logs warning)
 
+Bulk writes (symbol extraction, ingest) go through inject_many(), which
+diffs, embeds and writes a whole batch with a handful of round-trips.
+
 Usage:
     from runtime.inject import inject, set_actor
 
@@ -43,6 +46,8 @@ import logging
 import time
 from typing import Any, Dict, List, Literal, Optional
 
+from runtime.infrastructure.database.schema import NODE_LABELS
+
 logger = logging.getLogger(__name__)
 
 
@@ -588,6 +593,18 @@ def _generate_embedding(text: str) -> Optional[List[float]]:
     return None
 
 
+def _generate_embeddings(texts: List[str]) -> List[Optional[List[float]]]:
+    """Generate embeddings for many texts with one batch call (None where it fails)."""
+    service = _get_embedding_service()
+    if not service or not texts:
+        return [None] * len(texts)
+    try:
+        return list(service.embed_batch(texts))
+    except Exception as e:
+        logger.warning(f"Batch embedding generation failed: {e}")
+        return [None] * len(texts)
+
+
 # =============================================================================
 # NATURE TO PHYSICS
 # =============================================================================
@@ -720,22 +737,7 @@ def _inject_node(
     """
     node = dict(node)  # Copy to avoid mutating original
     node_id = node["id"]
-
-    # Determine label
-    label = node.get("label")
-    if not label:
-        node_type = node.get("node_type")
-        if node_type:
-            label = LABEL_MAP.get(node_type, "Thing")
-        else:
-            # Infer from id prefix: "actor:foo" or "AGENT_Foo" -> "Actor"
-            if ":" in node_id:
-                prefix = node_id.split(":")[0]
-            elif "_" in node_id:
-                prefix = node_id.split("_")[0].lower()
-            else:
-                prefix = "thing"
-            label = LABEL_MAP.get(prefix, "Thing")
+    label = _node_label(node)
 
     # Generate synthesis if missing
     if not node.get("synthesis"):
@@ -771,12 +773,49 @@ def _inject_node(
         if embedding:
             node["embedding"] = embedding
 
+    props = _node_props(node, exists)
+    props_str = ", ".join(f"{k}: ${k}" for k in props.keys())
+    query = f"MERGE (n:{label} {{id: $id}}) SET n += {{{props_str}}} RETURN n.id"
+    adapter.execute(query, props)
+
+    result = "updated" if exists else "created"
+
+    # Auto-assign task_run nodes to best agent on creation
+    if result == "created" and node.get("type") == "task_run":
+        _auto_assign_task(adapter, node_id, node.get("synthesis", ""))
+
+    return result
+
+
+def _node_label(node: Dict[str, Any]) -> str:
+    """Graph label of a node: explicit label, node_type, or id prefix."""
+    label = node.get("label")
+    if label:
+        return label
+
+    node_type = node.get("node_type")
+    if node_type:
+        return LABEL_MAP.get(node_type, "Thing")
+
+    # Infer from id prefix: "actor:foo" or "AGENT_Foo" -> "Actor"
+    node_id = node["id"]
+    if ":" in node_id:
+        prefix = node_id.split(":")[0]
+    elif "_" in node_id:
+        prefix = node_id.split("_")[0].lower()
+    else:
+        prefix = "thing"
+    return LABEL_MAP.get(prefix, "Thing")
+
+
+def _node_props(node: Dict[str, Any], exists: bool, now: int = None) -> Dict[str, Any]:
+    """Properties to SET on a node: no label/node_type/None, timestamps, single-line text."""
     # Build properties (exclude label, node_type from props)
     exclude = {"label", "node_type"}
     props = {k: v for k, v in node.items() if k not in exclude and v is not None}
 
     # Add timestamps
-    now = int(time.time())
+    now = now if now is not None else int(time.time())
     props["updated_at_s"] = now
     if not exists:
         props["created_at_s"] = now
@@ -786,17 +825,7 @@ def _inject_node(
         if key in props and isinstance(props[key], str):
             props[key] = props[key].replace("\n", " ")
 
-    props_str = ", ".join(f"{k}: ${k}" for k in props.keys())
-    query = f"MERGE (n:{label} {{id: $id}}) SET n += {{{props_str}}} RETURN n.id"
-    adapter.execute(query, props)
-
-    result = "updated" if exists else "created"
-
-    # Auto-assign task_run nodes to best agent on creation
-    if result == "created" and node.get("type") == "task_run":
-        _auto_assign_task(adapter, node_id, node.get("synthesis", ""))
-
-    return result
+    return props
 
 
 def _auto_assign_task(adapter, task_id: str, synthesis: str) -> None:
@@ -826,10 +855,44 @@ def _inject_link(
     - Auto-generates synthesis if missing
     - Generates embedding from synthesis
     """
-    link = dict(link)  # Copy to avoid mutating original
+    link = _prepare_link(link)
     from_id = link["from"]
     to_id = link["to"]
 
+    # Generate embedding
+    if generate_embedding and link.get("synthesis"):
+        embedding = _generate_embedding(link["synthesis"])
+        if embedding:
+            link["embedding"] = embedding
+
+    now = int(time.time())
+    props = _link_props(link, now)
+    # created_at_s set via coalesce in query (only on first creation)
+
+    # Build SET clause for properties
+    if props:
+        set_parts = [f"r.{k} = ${k}" for k in props.keys()]
+        set_clause = "SET r.created_at_s = coalesce(r.created_at_s, $now), " + ", ".join(set_parts)
+    else:
+        set_clause = "SET r.created_at_s = coalesce(r.created_at_s, $now)"
+
+    query = f"""
+    MATCH (a {{id: $from_id}})
+    MATCH (b {{id: $to_id}})
+    MERGE (a)-[r:LINK]->(b)
+    {set_clause}
+    RETURN type(r)
+    """
+
+    params = {"from_id": from_id, "to_id": to_id, "now": now, **props}
+    adapter.execute(query, params)
+    return "created"  # MERGE doesn't distinguish create/update
+
+
+def _prepare_link(link: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of link with nature parsed to physics floats, verb and synthesis filled in."""
+    link = dict(link)  # Copy to avoid mutating original
+
     # Parse nature to physics floats
     nature = link.get("nature")
     if nature:
@@ -849,54 +912,282 @@ def _inject_link(
             except Exception:
                 pass
 
-    # Default verb
-    verb = link.get("verb", "linked")
-
     # Generate synthesis if missing
     if not link.get("synthesis"):
         link["synthesis"] = _generate_link_synthesis(link)
 
-    # Generate embedding
-    if generate_embedding and link.get("synthesis"):
-        embedding = _generate_embedding(link["synthesis"])
-        if embedding:
-            link["embedding"] = embedding
+    # Default verb
+    link["verb"] = link.get("verb", "linked")
+    return link
+
 
-    # Build properties (exclude structural fields)
+def _link_props(link: Dict[str, Any], now: int) -> Dict[str, Any]:
+    """Properties to SET on a prepared link (structural fields and None excluded)."""
     exclude = {"from", "to", "nature"}
     props = {k: v for k, v in link.items() if k not in exclude and v is not None}
+    props["updated_at_s"] = now
+    return props
 
-    # Ensure verb is set
-    props["verb"] = verb
 
-    # Add timestamps
-    now = int(time.time())
-    props["updated_at_s"] = now
-    # created_at_s set via coalesce in query (only on first creation)
+# =============================================================================
+# BATCH INJECTION
+# =============================================================================
 
-    # Build SET clause for properties
-    if props:
-        set_parts = [f"r.{k} = ${k}" for k in props.keys()]
-        set_clause = "SET r.created_at_s = coalesce(r.created_at_s, $now), " + ", ".join(set_parts)
-    else:
-        set_clause = "SET r.created_at_s = coalesce(r.created_at_s, $now)"
+NODE_UPSERT_MANY = "MERGE (n:{label} {{id: row.id}}) SET n += row.props"
 
-    query = f"""
-    MATCH (a {{id: $from_id}})
-    MATCH (b {{id: $to_id}})
+# Link statements are formatted per (from_label, to_label) group, so both
+# endpoint lookups are id index seeks (`:Label`, or "" for an unlabeled MATCH)
+LINK_UPSERT_MANY = """
+    MATCH (a{from_label} {{id: row.from_id}})
+    MATCH (b{to_label} {{id: row.to_id}})
     MERGE (a)-[r:LINK]->(b)
-    {set_clause}
-    RETURN type(r)
+    SET r.created_at_s = coalesce(r.created_at_s, row.now)
+    SET r += row.props
+"""
+
+LINK_RAW_MANY = """
+    MATCH (a{from_label} {{id: row.from_id}})
+    MATCH (b{to_label} {{id: row.to_id}})
+    MERGE (a)-[r:LINK]->(b)
+    SET r.verb = row.verb
+"""
+
+# Label of existing nodes by id, one index seek per label
+NODE_LABELS_BY_ID = "\nUNION ALL\n".join(
+    f"UNWIND $ids AS id MATCH (n:{label} {{id: id}}) RETURN n.id AS id, '{label}' AS label"
+    for label in NODE_LABELS
+)
+
+
+def inject_many(
+    adapter,
+    items: List[Dict[str, Any]],
+    generate_embedding: bool = True,
+    with_context: bool = False,
+) -> List[Literal["created", "updated", "unchanged"]]:
     """
+    Inject many nodes and links with bulk reads and writes.
 
-    params = {"from_id": from_id, "to_id": to_id, "now": now, **props}
-    adapter.execute(query, params)
-    return "created"  # MERGE doesn't distinguish create/update
+    Same per-item semantics as inject(), with round-trips per batch instead
+    of per item:
+    - One synthesis read per label diffs every node against the graph
+    - Only new or changed nodes (and all links) are embedded, in one batch
+    - Nodes, then links, are written as grouped UNWIND statements
 
+    Items are applied in order: a node repeated in items sees the earlier
+    occurrence, and with_context creates and chains moments exactly as
+    calling inject() for each item would.
+
+    Args:
+        adapter: Database adapter with query() and execute_many()
+        items: Node and link dicts, as for inject()
+        generate_embedding: If True, generate embeddings (default: True)
+        with_context: If True, create moments and context links (default: False)
+
+    Returns:
+        One "created" | "updated" | "unchanged" per item, in order.
+        Raises exception on failure (fail loud).
+    """
+    nodes: List[tuple] = []  # (index, label, node)
+    links: List[tuple] = []  # (index, prepared link)
+    for index, data in enumerate(items):
+        if "from" in data and "to" in data:
+            links.append((index, _prepare_link(data)))
+        elif "id" in data:
+            node = dict(data)
+            if not node.get("synthesis"):
+                node["synthesis"] = _generate_node_synthesis(node)
+            nodes.append((index, _node_label(node), node))
+        else:
+            raise ValueError(f"inject: data must have 'id' (node) or 'from'/'to' (link), got: {list(data.keys())}")
+
+    results: List[Optional[str]] = [None] * len(items)
+    written = _inject_nodes_many(adapter, nodes, links, generate_embedding, results)
+
+    now = int(time.time())
+    if links:
+        _write_links_many(adapter, LINK_UPSERT_MANY, [
+            {"from_id": link["from"], "to_id": link["to"], "now": now, "props": _link_props(link, now)}
+            for _, link in links
+        ], known={node["id"]: label for _, label, node in nodes})
+        for index, _ in links:
+            results[index] = "created"  # MERGE doesn't distinguish create/update
+
+    if with_context and written:
+        _apply_context_many(adapter, written, generate_embedding)
+
+    return results
+
+
+def _inject_nodes_many(
+    adapter,
+    nodes: List[tuple],
+    links: List[tuple],
+    generate_embedding: bool,
+    results: List[Optional[str]],
+) -> List[Dict[str, Any]]:
+    """
+    Diff, embed and write nodes; embeds link synthesis in the same batch.
+
+    Fills results for the nodes and returns the created/updated nodes in
+    order (the ones inject() would apply context to).
+    """
+    # Current synthesis per (label, id), read once per label
+    current: Dict[tuple, Optional[str]] = {}
+    ids_by_label: Dict[str, List[str]] = {}
+    for _, label, node in nodes:
+        ids_by_label.setdefault(label, []).append(node["id"])
+    for label, ids in ids_by_label.items():
+        rows = adapter.query(
+            f"UNWIND $ids AS id MATCH (n:{label} {{id: id}}) RETURN n.id, n.synthesis",
+            {"ids": list(dict.fromkeys(ids))}
+        )
+        for row in rows or []:
+            current[(label, row[0])] = row[1]
+
+    # Diff in order, so repeated ids compare against the earlier occurrence
+    changed: List[tuple] = []  # (index, label, node, exists)
+    for index, label, node in nodes:
+        key = (label, node["id"])
+        exists = key in current
+        if exists and current[key] == node.get("synthesis"):
+            results[index] = "unchanged"
+            continue
+        current[key] = node.get("synthesis")
+        results[index] = "updated" if exists else "created"
+        changed.append((index, label, node, exists))
+
+    # One embedding batch for changed nodes and all links
+    if generate_embedding:
+        targets = [node for _, _, node, _ in changed if node.get("synthesis")]
+        targets += [link for _, link in links if link.get("synthesis")]
+        texts = list(dict.fromkeys(t["synthesis"] for t in targets))
+        embeddings = dict(zip(texts, _generate_embeddings(texts)))
+        for target in targets:
+            if embeddings.get(target["synthesis"]):
+                target["embedding"] = embeddings[target["synthesis"]]
+
+    now = int(time.time())
+    rows_by_label: Dict[str, List[Dict[str, Any]]] = {}
+    for _, label, node, exists in changed:
+        rows_by_label.setdefault(label, []).append({"id": node["id"], "props": _node_props(node, exists, now)})
+    for label, rows in rows_by_label.items():
+        adapter.execute_many(NODE_UPSERT_MANY.format(label=label), rows)
+
+    # Auto-assign task_run nodes to best agent on creation
+    for index, _, node, _ in changed:
+        if results[index] == "created" and node.get("type") == "task_run":
+            _auto_assign_task(adapter, node["id"], node.get("synthesis", ""))
+
+    return [node for _, _, node, _ in changed]
+
+
+def _write_links_many(
+    adapter,
+    template: str,
+    rows: List[Dict[str, Any]],
+    known: Dict[str, str],
+) -> None:
+    """
+    Write link rows grouped by endpoint labels.
+
+    Labels come from `known` (nodes of this batch), else from one
+    index-backed lookup over NODE_LABELS. Ids are not reliable label hints
+    (AGENT_* ids are Actors), so they are not guessed from. An endpoint with
+    none of those labels is matched unlabeled, so links to nodes of other
+    labels are still written; rows whose endpoint does not exist match
+    nothing, as with the unlabeled MATCH.
+    """
+    labels = dict(known)
+    missing = list(dict.fromkeys(
+        node_id for row in rows for node_id in (row["from_id"], row["to_id"]) if node_id not in labels
+    ))
+    if missing:
+        for node_id, label in adapter.query(NODE_LABELS_BY_ID, {"ids": missing}) or []:
+            labels.setdefault(node_id, label)
+
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        key = (labels.get(row["from_id"]), labels.get(row["to_id"]))
+        groups.setdefault(key, []).append(row)
+    for (from_label, to_label), group in groups.items():
+        if None in (from_label, to_label):
+            logger.debug(f"Matching {len(group)} link endpoints outside NODE_LABELS unlabeled")
+        adapter.execute_many(template.format(
+            from_label=f":{from_label}" if from_label else "",
+            to_label=f":{to_label}" if to_label else "",
+        ), group)
+
+
+def _apply_context_many(adapter, nodes: List[Dict[str, Any]], generate_embedding: bool) -> None:
+    """
+    Context for many injected nodes, as inject() applies it one by one.
+
+    Moment nodes are linked to the actor and chained; every other node gets
+    a new chained moment plus actor/space/moment links. The active space is
+    resolved once for the batch.
+    """
+    actor_id = get_actor()
+    space_id = None
+    if any(not _is_moment(node) for node in nodes):
+        space_id = _resolve_active_space(adapter)
+
+    base = int(time.time() * 1000)
+    prev_moment_id = _context["last_moment_id"].get(actor_id)
+    moments: List[Dict[str, Any]] = []
+    raw_links: List[Dict[str, Any]] = []
+
+    def chain(moment_id: str) -> None:
+        nonlocal prev_moment_id
+        raw_links.append({"from_id": actor_id, "to_id": moment_id, "verb": "creates"})
+        if prev_moment_id:
+            raw_links.append({"from_id": moment_id, "to_id": prev_moment_id, "verb": "follows"})
+        prev_moment_id = moment_id
+
+    for node in nodes:
+        node_id = node["id"]
+        if _is_moment(node):
+            chain(node_id)
+            continue
+
+        # Distinct ids for moments created within the same millisecond
+        moment_id = f"moment:{base}" if not moments else f"moment:{base}_{len(moments)}"
+        synthesis = node.get("synthesis", node.get("name", node_id))
+        moments.append({
+            "id": moment_id,
+            "label": "Moment",
+            "name": f"inject:{node_id.split(':')[-1]}",
+            "synthesis": f"Injected {synthesis}",
+            "actor_id": actor_id,
+            "timestamp": int(time.time()),
+            "weight": 1.0,
+            "energy": 1.0,
+        })
+        chain(moment_id)
+        raw_links.append({"from_id": actor_id, "to_id": node_id, "verb": "touches"})
+        if space_id:
+            raw_links.append({"from_id": space_id, "to_id": node_id, "verb": "contains"})
+        raw_links.append({"from_id": moment_id, "to_id": node_id, "verb": "captures"})
+
+    if moments:
+        _inject_nodes_many(
+            adapter, [(i, "Moment", m) for i, m in enumerate(moments)], [],
+            generate_embedding, [None] * len(moments),
+        )
+    known = {node["id"]: _node_label(node) for node in nodes}
+    known.update((moment["id"], "Moment") for moment in moments)
+    if space_id:
+        known[space_id] = "Space"
+    if _context["last_moment_id"].get(actor_id):
+        known[_context["last_moment_id"][actor_id]] = "Moment"
+    _write_links_many(adapter, LINK_RAW_MANY, raw_links, known)
+    _context["last_moment_id"][actor_id] = prev_moment_id
+
+
+def _is_moment(node: Dict[str, Any]) -> bool:
+    """Injected node IS a moment (gets chained instead of a new moment)."""
+    return node.get("label") == "Moment" or node["id"].startswith("moment:")
 
-# =============================================================================
-# BATCH INJECTION
-# =============================================================================
 
 def inject_batch(
     adapter,
@@ -905,7 +1196,7 @@ def inject_batch(
     with_context: bool = False,
 ) -> Dict[str, int]:
     """
-    Inject multiple nodes/links.
+    Inject multiple nodes/links (bulk, see inject_many).
 
     Args:
         adapter: Database adapter
@@ -919,8 +1210,7 @@ def inject_batch(
     """
     stats = {"created": 0, "updated": 0, "unchanged": 0}
 
-    for item in items:
-        result = inject(adapter, item, generate_embedding=generate_embedding, with_context=with_context)
+    for result in inject_many(adapter, items, generate_embedding=generate_embedding, with_context=with_context):
         stats[result] += 1
 
     return stats
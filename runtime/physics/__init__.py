@@ -38,6 +38,7 @@ from .link_scoring import (
     calculate_permanence,
     get_polarity,
     calculate_link_score,
+    score_links_batch,
     score_outgoing_links,
     get_target_node_id,
     should_branch,
@@ -165,6 +166,7 @@ __all__ = [
     'calculate_permanence',
     'get_polarity',
     'calculate_link_score',
+    'score_links_batch',
     'score_outgoing_links',
     'get_target_node_id',
     'should_branch',
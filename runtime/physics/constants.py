@@ -199,6 +199,10 @@ CRYSTALLIZATION_WEIGHT = 0.2
 # Maximum hops for path finding (Dijkstra)
 MAX_PATH_HOPS = 5
 
+# Full proximity rebuild every N ticks (60 ticks = 5 minutes of world time),
+# catching link writes that don't emit mutation events (inject, ingest, canon)
+PROXIMITY_RESYNC_TICKS = 60
+
 # Default resistance for blocked paths
 BLOCKED_PATH_RESISTANCE = 100.0
 
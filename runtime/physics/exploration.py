@@ -24,10 +24,17 @@ ASYNC PATTERN:
     - Parent awaits all children before proceeding
     - Timeout safety prevents runaway exploration (D4: crash loud on timeout)
 
+EMBEDDING CACHE:
+    - One bounded EmbeddingCache per runner, shared by the root and all children
+    - Outgoing link fetches seed it with the links' embeddings (prefetch)
+    - Path embeddings are read from it; misses go out in one bulk call
+      (GraphInterface.get_link_embeddings) when the graph provides it
+
 DOCS: docs/physics/ALGORITHM_Physics.md (v1.8 SubEntity section)
 """
 
 import asyncio
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
 from dataclasses import dataclass, field
 import time
@@ -62,6 +69,8 @@ class GraphInterface:
     get_incoming_links: Callable[[str], Awaitable[List[Dict[str, Any]]]] = None
     get_link: Callable[[str], Awaitable[Optional[Dict[str, Any]]]] = None
     get_link_embedding: Callable[[str], Awaitable[Optional[List[float]]]] = None
+    # Optional bulk variant: {link_id: embedding or None} in one call
+    get_link_embeddings: Callable[[List[str]], Awaitable[Dict[str, Optional[List[float]]]]] = None
 
     # Narrative queries
     get_all_narratives: Callable[[], Awaitable[List[Tuple[str, List[float]]]]] = None
@@ -75,6 +84,49 @@ class GraphInterface:
     create_link: Callable[[Dict[str, Any]], Awaitable[str]] = None
 
 
+# =============================================================================
+# EMBEDDING CACHE
+# =============================================================================
+
+_MISSING = object()
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU of node and link embeddings for one exploration.
+
+    Misses are cached too (None), so a link without an embedding is asked
+    for once, not once per step.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Optional[List[float]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, key: str, default: Any = _MISSING) -> Any:
+        entry = self._entries.get((kind, key), _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end((kind, key))
+        return entry
+
+    def put(self, kind: str, key: str, embedding: Optional[List[float]]) -> None:
+        self._entries[(kind, key)] = embedding or None
+        self._entries.move_to_end((kind, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, kind: str, key: str) -> None:
+        self._entries.pop((kind, key), None)
+
+
 # =============================================================================
 # EXPLORATION RESULT
 # =============================================================================
@@ -125,6 +177,7 @@ class ExplorationConfig:
     satisfaction_threshold: float = 0.8
     novelty_threshold: float = 0.85
     min_link_score: float = 0.1
+    embedding_cache_size: int = 4096  # Node + link embeddings kept per exploration
 
 
 class ExplorationTimeoutError(Exception):
@@ -154,6 +207,7 @@ class ExplorationRunner:
         self._exploration_id = exploration_id or ""
         self._step_counter: Dict[str, int] = {}  # subentity_id -> step count
         self._tick = 0
+        self._embeddings = EmbeddingCache(self.config.embedding_cache_size)
 
     def _log_step(
         self,
@@ -389,12 +443,13 @@ class ExplorationRunner:
             get_target_node_id,
             should_branch,
         )
+        from runtime.physics.flow import inject_node_energy, regenerate_node_synthesis_if_drifted
         # v2.1: Removed forward_color_link - coloring now happens in backprop
 
         state_before = se.state.value
 
-        # Get outgoing links
-        links = await self.graph.get_outgoing_links(se.position)
+        # Get outgoing links (embeddings included, seeds the cache)
+        links = await self._get_outgoing_links(se.position)
         if not links:
             se.transition_to(SubEntityState.REFLECTING)
             self._log_step(
@@ -405,11 +460,7 @@ class ExplorationRunner:
             return
 
         # Get path embeddings for self-novelty
-        path_embeddings = []
-        for link_id, _ in se.path:
-            emb = await self.graph.get_link_embedding(link_id)
-            if emb:
-                path_embeddings.append(emb)
+        path_embeddings = await self._path_embeddings(se)
 
         # Get sibling crystallization embeddings (v1.7.2: lazy resolution via property)
         sibling_embeddings = [
@@ -475,7 +526,9 @@ class ExplorationRunner:
 
         # v1.9: Inject energy into target node
         # injection = criticality × state_mult × node.weight
-        if self.graph.get_node and target_node:
+        state_mult = STATE_MULTIPLIER.get(se.state, 1.0)
+        target_node = await self.graph.get_node(target_id) if self.graph.get_node else None
+        if target_node:
             inject_node_energy(target_node, se.criticality, state_mult)
 
             # Determine node type from labels or properties
@@ -502,7 +555,7 @@ class ExplorationRunner:
         # v1.7.2 D5: Check if at branch point with simple count
         is_moment = await self.graph.is_moment(target_id)
         if is_moment:
-            outgoing = await self.graph.get_outgoing_links(target_id)
+            outgoing = await self._get_outgoing_links(target_id)
             if len(outgoing) >= self.config.min_branch_links:
                 se.transition_to(SubEntityState.BRANCHING)
                 return
@@ -514,14 +567,10 @@ class ExplorationRunner:
         from runtime.physics.link_scoring import select_branch_candidates, get_target_node_id
 
         # Get outgoing links
-        links = await self.graph.get_outgoing_links(se.position)
+        links = await self._get_outgoing_links(se.position)
 
         # Get path embeddings
-        path_embeddings = []
-        for link_id, _ in se.path:
-            emb = await self.graph.get_link_embedding(link_id)
-            if emb:
-                path_embeddings.append(emb)
+        path_embeddings = await self._path_embeddings(se)
 
         # Get sibling embeddings (v1.7.2: lazy resolution via property)
         sibling_embeddings = [
@@ -604,7 +653,7 @@ class ExplorationRunner:
         from runtime.physics.flow import inject_node_energy
 
         # Get current node embedding
-        node_embedding = await self.graph.get_node_embedding(se.position) if self.graph.get_node_embedding else None
+        node_embedding = await self._get_node_embedding(se.position)
 
         # Compute alignment with intention
         alignment = 0.0
@@ -614,11 +663,7 @@ class ExplorationRunner:
         # Compute novelty against path
         novelty = 1.0
         if node_embedding and se.path:
-            path_embeddings = []
-            for link_id, _ in se.path:
-                emb = await self.graph.get_link_embedding(link_id) if self.graph.get_link_embedding else None
-                if emb:
-                    path_embeddings.append(emb)
+            path_embeddings = await self._path_embeddings(se)
             if path_embeddings:
                 novelty = 1.0 - max_cosine_against_set(node_embedding, path_embeddings)
 
@@ -643,7 +688,7 @@ class ExplorationRunner:
         from runtime.physics.flow import add_node_weight_on_resonating
 
         # Get narrative embedding
-        narrative_embedding = await self.graph.get_node_embedding(se.position)
+        narrative_embedding = await self._get_node_embedding(se.position)
 
         if narrative_embedding and se.intention_embedding:
             align = cosine_similarity(se.intention_embedding, narrative_embedding)
@@ -705,7 +750,7 @@ class ExplorationRunner:
                 # Save colored links back to graph
                 if self.graph.update_link:
                     for link in colored_links:
-                        await self.graph.update_link(link.get('id', ''), link)
+                        await self._update_link(link)
 
         if se.satisfaction > 0.5:
             se.transition_to(SubEntityState.MERGING)
@@ -888,7 +933,7 @@ class ExplorationRunner:
 
                 if self.graph.update_link:
                     for link in colored_links:
-                        await self.graph.update_link(link.get('id', ''), link)
+                        await self._update_link(link)
 
         # 5. After crystallizing, go to MERGING
         # v2.0.1: Changed from conditional SEEKING to always MERGING
@@ -910,26 +955,78 @@ class ExplorationRunner:
         se.state = SubEntityState.MERGING
         se.completed_at = time.time()
 
+    # =========================================================================
+    # CACHED GRAPH READS
+    # =========================================================================
+
+    async def _get_outgoing_links(self, node_id: str) -> List[Dict[str, Any]]:
+        """Outgoing links; their embeddings seed the cache (prefetch)."""
+        links = await self.graph.get_outgoing_links(node_id)
+        for link in links or []:
+            link_id = link.get('id')
+            if link_id and 'embedding' in link:
+                self._embeddings.put('link', link_id, link['embedding'])
+        return links
+
+    async def _get_link_embeddings(self, link_ids: List[str]) -> List[List[float]]:
+        """Non-empty embeddings for link_ids, in order. Only cache misses are fetched."""
+        found: Dict[str, Optional[List[float]]] = {}
+        missing = []
+        for link_id in dict.fromkeys(link_ids):
+            emb = self._embeddings.get('link', link_id)
+            if emb is _MISSING:
+                missing.append(link_id)
+            else:
+                found[link_id] = emb
+
+        if missing:
+            if self.graph.get_link_embeddings:
+                fetched = await self.graph.get_link_embeddings(missing) or {}
+            elif self.graph.get_link_embedding:
+                fetched = {link_id: await self.graph.get_link_embedding(link_id) for link_id in missing}
+            else:
+                fetched = {}
+            for link_id in missing:
+                found[link_id] = fetched.get(link_id)
+                self._embeddings.put('link', link_id, found[link_id])
+
+        return [found[link_id] for link_id in link_ids if found.get(link_id)]
+
+    async def _path_embeddings(self, se: SubEntity) -> List[List[float]]:
+        """Embeddings of the links already traversed by se."""
+        return await self._get_link_embeddings([link_id for link_id, _ in se.path])
+
+    async def _get_node_embedding(self, node_id: str) -> Optional[List[float]]:
+        if not self.graph.get_node_embedding:
+            return None
+        emb = self._embeddings.get('node', node_id)
+        if emb is _MISSING:
+            emb = await self.graph.get_node_embedding(node_id)
+            self._embeddings.put('node', node_id, emb)
+        return emb
+
+    async def _update_link(self, link: Dict[str, Any]) -> None:
+        """Write a link back and drop its (now stale) cached embedding."""
+        link_id = link.get('id', '')
+        await self.graph.update_link(link_id, link)
+        self._embeddings.discard('link', link_id)
+
     async def _update_crystallization_embedding(self, se: SubEntity) -> None:
         """Update crystallization embedding based on current state (v1.7.2)."""
         from runtime.physics.crystallization import compute_crystallization_embedding
 
         # Get position embedding
-        position_emb = await self.graph.get_node_embedding(se.position) if self.graph.get_node_embedding else None
+        position_emb = await self._get_node_embedding(se.position)
 
         # Get found narrative embeddings - v1.7.2: iterate dict keys
         found_embs = []
         for narr_id in se.found_narratives.keys():
-            emb = await self.graph.get_node_embedding(narr_id) if self.graph.get_node_embedding else None
+            emb = await self._get_node_embedding(narr_id)
             if emb:
                 found_embs.append(emb)
 
         # Get path link embeddings
-        path_embs = []
-        for link_id, _ in se.path:
-            emb = await self.graph.get_link_embedding(link_id) if self.graph.get_link_embedding else None
-            if emb:
-                path_embs.append(emb)
+        path_embs = await self._path_embeddings(se)
 
         se.crystallization_embedding = compute_crystallization_embedding(
             intention_embedding=se.intention_embedding,
@@ -0,0 +1,407 @@
+"""
+Exploration Graph — async, pooled GraphInterface for ExplorationRunner
+
+Backs GraphInterface with AsyncDatabaseAdapter, so SubEntity branches that
+run concurrently also query concurrently instead of serializing on one
+blocking client.
+
+QUERIES:
+    - Parameterized; node lookups go through (n:Label {id: $id}) for each
+      node label (UNION ALL), so every branch is an id index seek instead
+      of an unlabeled scan
+    - One neighbourhood query per step returns in and out links together
+      with the neighbour nodes
+
+CACHE (per exploration):
+    - Bounded LRU of node and link dicts, seeded by neighbourhood fetches
+    - get_node_embedding / is_moment / is_narrative / get_link read from it
+    - Callers get copies: the runner mutates node dicts in place without
+      always writing back, and those edits must not leak into later steps
+    - Concurrent lookups of the same key share one query
+
+Usage:
+    graph = ExplorationGraph(get_async_database_adapter(graph_name)).interface()
+    runner = ExplorationRunner(graph, config)
+
+DOCS: docs/physics/ALGORITHM_Physics.md (v1.8 SubEntity section)
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from runtime.infrastructure.database.schema import NODE_LABELS
+from runtime.physics.exploration import EmbeddingCache, GraphInterface
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _per_label(template: str) -> str:
+    """One index-backed branch per node label, combined with UNION ALL."""
+    return "\nUNION ALL\n".join(template.format(label=label) for label in NODE_LABELS)
+
+
+NODE_QUERY = _per_label("""
+    MATCH (n:{label} {{id: $id}})
+    RETURN properties(n) AS props, '{label}' AS label
+""")
+
+NEIGHBOURHOOD_QUERY = _per_label("""
+    MATCH (n:{label} {{id: $id}})-[r]-(m)
+    RETURN properties(r) AS rel, type(r) AS rel_type,
+           startNode(r).id = n.id AS outgoing,
+           properties(m) AS other, labels(m)[0] AS other_label
+""")
+
+INCOMING_QUERY = _per_label("""
+    MATCH (m)-[r]->(n:{label} {{id: $id}})
+    RETURN properties(r) AS rel, type(r) AS rel_type,
+           m.id AS from_id, m.node_type AS from_type
+""")
+
+LINK_QUERY = """
+    MATCH (a)-[r:link {id: $id}]->(b)
+    RETURN properties(r) AS rel, type(r) AS rel_type, a.id AS from_id, b.id AS to_id
+"""
+
+LINK_EMBEDDINGS_QUERY = """
+    MATCH ()-[r:link]->()
+    WHERE r.id IN $ids
+    RETURN r.id, r.embedding
+"""
+
+NARRATIVES_QUERY = """
+    MATCH (n:Narrative)
+    RETURN n.id, n.embedding
+"""
+
+NARRATIVE_CREATE = """
+    CREATE (n:Narrative {
+        id: $id, name: $name, node_type: 'narrative',
+        weight: $weight, energy: $energy,
+        content: $content, synthesis: $synthesis
+    })
+"""
+
+LINK_CREATE = """
+    MATCH (a:{label_a} {{id: $a}}), (b:{label_b} {{id: $b}})
+    CREATE (a)-[r:link]->(b)
+    SET r += $props
+"""
+
+NODE_UPDATE = """
+    MATCH (n:{label} {{id: $id}})
+    SET n += $props
+"""
+
+
+def parse_embedding(value: Any) -> Optional[List[float]]:
+    """Parse embedding from database - handles string-serialized embeddings."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    if isinstance(value, (list, tuple)):
+        return [float(x) for x in value]
+    return None
+
+
+def node_dict(props: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Node properties as an exploration node dict."""
+    node = dict(props or {})
+    node['id'] = node.get('id', '')
+    if 'embedding' in node:
+        node['embedding'] = parse_embedding(node['embedding'])
+    return node
+
+
+def link_dict(
+    props: Optional[Dict[str, Any]],
+    rel_type: str,
+    from_id: str,
+    to_id: str,
+) -> Dict[str, Any]:
+    """Relationship properties as an exploration link dict."""
+    link = dict(props or {})
+    link['from_id'] = from_id
+    link['to_id'] = to_id
+    link['node_a'] = from_id  # for link_scoring compatibility
+    link['node_b'] = to_id    # for link_scoring compatibility
+    link['type'] = rel_type or ''
+
+    # Normalize polarity: list [a→b, b→a] or single value → polarity_ab/polarity_ba
+    polarity = link.get('polarity')
+    if isinstance(polarity, (list, tuple)) and len(polarity) >= 2:
+        link['polarity_ab'] = float(polarity[0])
+        link['polarity_ba'] = float(polarity[1])
+    elif isinstance(polarity, (int, float)):
+        link['polarity_ab'] = link['polarity_ba'] = float(polarity)
+    link.setdefault('polarity_ab', 0.5)
+    link.setdefault('polarity_ba', 0.5)
+
+    if 'embedding' in link:
+        link['embedding'] = parse_embedding(link['embedding'])
+    return link
+
+
+def reversed_link(link: Dict[str, Any]) -> Dict[str, Any]:
+    """Link traversed against its direction: endpoints and polarity swapped."""
+    flipped = dict(link)
+    flipped['from_id'] = flipped['node_a'] = link['to_id']
+    flipped['to_id'] = flipped['node_b'] = link['from_id']
+    flipped['polarity_ab'], flipped['polarity_ba'] = link['polarity_ba'], link['polarity_ab']
+    return flipped
+
+
+_MISSING = object()
+
+
+class ExplorationGraph:
+    """
+    GraphInterface over a pooled AsyncDatabaseAdapter, for one exploration.
+
+    Read failures are logged and read as "not found", like the blocking
+    interface this replaces; nothing is cached for them.
+    """
+
+    def __init__(self, adapter, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.adapter = adapter
+        self.cache = EmbeddingCache(cache_size)  # ('node'|'link', id) -> dict or None
+        self._labels: Dict[str, str] = {}
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future"] = {}
+
+    def interface(self) -> GraphInterface:
+        return GraphInterface(
+            get_node=self.get_node,
+            get_node_embedding=self.get_node_embedding,
+            get_outgoing_links=self.get_outgoing_links,
+            get_incoming_links=self.get_incoming_links,
+            get_link=self.get_link,
+            get_link_embedding=self.get_link_embedding,
+            get_link_embeddings=self.get_link_embeddings,
+            get_all_narratives=self.get_all_narratives,
+            is_narrative=self.is_narrative,
+            is_moment=self.is_moment,
+            update_node=self.update_node,
+            update_link=self.update_link,
+            create_narrative=self.create_narrative,
+            create_link=self.create_link,
+        )
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    async def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        node = await self._cached('node', node_id, lambda: self._fetch_node(node_id))
+        return dict(node) if node else None
+
+    async def get_node_embedding(self, node_id: str) -> Optional[List[float]]:
+        node = await self.get_node(node_id)
+        return node.get('embedding') if node else None
+
+    async def is_narrative(self, node_id: str) -> bool:
+        node = await self.get_node(node_id)
+        return node.get('node_type') == 'narrative' if node else False
+
+    async def is_moment(self, node_id: str) -> bool:
+        node = await self.get_node(node_id)
+        return node.get('node_type') == 'moment' if node else False
+
+    async def get_outgoing_links(self, node_id: str) -> List[Dict[str, Any]]:
+        """All traversable links from a node (both directions), embeddings included."""
+        rows = await self._query(NEIGHBOURHOOD_QUERY, {'id': node_id})
+        if rows is None:
+            return []
+
+        outgoing, incoming = [], []
+        for rel, rel_type, is_outgoing, other, other_label in rows:
+            other = node_dict(other)
+            other_id = other['id']
+            self._remember_node(other, other_label)
+
+            if is_outgoing:
+                stored = link_dict(rel, rel_type, node_id, other_id)
+                traversed = stored
+            else:
+                # Incoming link (source → node): traverse it in reverse
+                stored = link_dict(rel, rel_type, other_id, node_id)
+                traversed = reversed_link(stored)
+            traversed['to_type'] = other.get('node_type')
+            if stored.get('id'):
+                self.cache.put('link', stored['id'], dict(stored))
+            (outgoing if is_outgoing else incoming).append(traversed)
+
+        return outgoing + incoming
+
+    async def get_incoming_links(self, node_id: str) -> List[Dict[str, Any]]:
+        rows = await self._query(INCOMING_QUERY, {'id': node_id})
+        links = []
+        for rel, rel_type, from_id, from_type in rows or []:
+            link = link_dict(rel, rel_type, from_id, node_id)
+            link['from_type'] = from_type
+            links.append(link)
+        return links
+
+    async def get_link(self, link_id: str) -> Optional[Dict[str, Any]]:
+        """Get link by ID (stored direction)."""
+        link = await self._cached('link', link_id, lambda: self._fetch_link(link_id))
+        return dict(link) if link else None
+
+    async def get_link_embedding(self, link_id: str) -> Optional[List[float]]:
+        link = await self.get_link(link_id)
+        return link.get('embedding') if link else None
+
+    async def get_link_embeddings(self, link_ids: List[str]) -> Dict[str, Optional[List[float]]]:
+        """Embeddings for many links; cached links answer, the rest in one query."""
+        found: Dict[str, Optional[List[float]]] = {}
+        missing = []
+        for link_id in link_ids:
+            link = self.cache.get('link', link_id, _MISSING)
+            if link is _MISSING:
+                missing.append(link_id)
+            else:
+                found[link_id] = link.get('embedding') if link else None
+        if missing:
+            rows = await self._query(LINK_EMBEDDINGS_QUERY, {'ids': missing})
+            found.update({row[0]: parse_embedding(row[1]) for row in rows or []})
+        return found
+
+    async def get_all_narratives(self) -> List[Tuple[str, Optional[List[float]]]]:
+        rows = await self._query(NARRATIVES_QUERY, {})
+        return [(row[0], parse_embedding(row[1])) for row in rows or []]
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    async def update_node(self, node_id: str, updates: Dict[str, Any]) -> None:
+        """Update scalar node properties by ID (cached copy too)."""
+        props = {k: v for k, v in (updates or {}).items() if isinstance(v, (str, int, float))}
+        label = await self._label(node_id)
+        if not props or label is None:
+            return
+        try:
+            await self.adapter.execute(NODE_UPDATE.format(label=label), {'id': node_id, 'props': props})
+        except Exception as e:
+            logger.warning(f"[ExplorationGraph] update_node failed: {e}")
+            return
+        node = self.cache.get('node', node_id, None)
+        if node:
+            node.update(props)
+
+    async def update_link(self, link_id: str, updates: Dict[str, Any]) -> None:
+        pass  # Not implemented for now
+
+    async def create_narrative(self, data: Dict[str, Any]) -> str:
+        """Persist narrative from crystallization."""
+        narr_id = f"narrative_cryst_{uuid.uuid4().hex[:8]}"
+        try:
+            await self.adapter.execute(NARRATIVE_CREATE, {
+                'id': narr_id,
+                'name': data.get('name', ''),
+                'weight': data.get('weight', 1.0),
+                'energy': data.get('energy', 1.0),
+                'content': data.get('content', ''),
+                'synthesis': data.get('synthesis', ''),
+            })
+            self._labels[narr_id] = 'Narrative'
+        except Exception as e:
+            logger.warning(f"[ExplorationGraph] create_narrative failed: {e}")
+        return narr_id
+
+    async def create_link(self, data: Dict[str, Any]) -> str:
+        """Persist link from crystallization (no embedding - causes feedback loop)."""
+        link_id = f"link_{uuid.uuid4().hex[:8]}"
+        node_a, node_b = data.get('node_a'), data.get('node_b')
+        if not node_a or not node_b:
+            return link_id
+        label_a, label_b = await asyncio.gather(self._label(node_a), self._label(node_b))
+        if label_a is None or label_b is None:
+            return link_id
+
+        # Crystallized links use default sem=0.5 until embedded by helper
+        polarity = data.get('polarity', [0.5, 0.5])
+        props = {
+            'id': link_id,
+            'weight': data.get('weight', 1.0),
+            'energy': data.get('energy', 0.0),
+            'hierarchy': data.get('hierarchy', 0.0),
+            'permanence': data.get('permanence', 0.5),
+            'polarity_ab': polarity[0],
+            'polarity_ba': polarity[1] if len(polarity) > 1 else polarity[0],
+            'joy_sadness': data.get('joy_sadness', 0.0),
+            'trust_disgust': data.get('trust_disgust', 0.0),
+            'fear_anger': data.get('fear_anger', 0.0),
+            'surprise_anticipation': data.get('surprise_anticipation', 0.0),
+        }
+        try:
+            await self.adapter.execute(
+                LINK_CREATE.format(label_a=label_a, label_b=label_b),
+                {'a': node_a, 'b': node_b, 'props': props},
+            )
+        except Exception as e:
+            logger.warning(f"[ExplorationGraph] create_link failed: {e}")
+        return link_id
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    async def _cached(self, kind: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Cached value, else one shared fetch per key however many callers wait."""
+        value = self.cache.get(kind, key, _MISSING)
+        if value is not _MISSING:
+            return value
+        task = self._inflight.get((kind, key))
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[(kind, key)] = task
+            task.add_done_callback(lambda _: self._inflight.pop((kind, key), None))
+        # A cancelled waiter must not cancel the fetch others wait on
+        return await asyncio.shield(task)
+
+    async def _fetch_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        rows = await self._query(NODE_QUERY, {'id': node_id})
+        if rows is None:
+            return None
+        if not rows:
+            self.cache.put('node', node_id, None)
+            return None
+        props, label = rows[0]
+        node = node_dict(props)
+        self._remember_node(node, label)
+        return node
+
+    async def _fetch_link(self, link_id: str) -> Optional[Dict[str, Any]]:
+        rows = await self._query(LINK_QUERY, {'id': link_id})
+        if rows is None:
+            return None
+        link = link_dict(*rows[0]) if rows else None
+        self.cache.put('link', link_id, link)
+        return link
+
+    async def _label(self, node_id: str) -> Optional[str]:
+        if node_id not in self._labels:
+            await self.get_node(node_id)
+        return self._labels.get(node_id)
+
+    def _remember_node(self, node: Dict[str, Any], label: Optional[str]) -> None:
+        self.cache.put('node', node['id'], dict(node))
+        if label in NODE_LABELS:
+            self._labels[node['id']] = label
+
+    async def _query(self, cypher: str, params: Dict[str, Any]) -> Optional[List[Any]]:
+        """Rows, or None when the query failed."""
+        try:
+            return await self.adapter.query(cypher, params)
+        except Exception as e:
+            logger.warning(f"[ExplorationGraph] query failed: {e}")
+            return None
@@ -27,8 +27,10 @@ DOCS: docs/physics/graph/PATTERNS_Graph.md
 
 import json
 import logging
+import threading
 import numpy as np
-from typing import Dict, Any, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 from runtime.infrastructure.database import get_database_adapter
 from runtime.physics.graph.graph_ops_moments import MomentOperationsMixin
@@ -44,8 +46,10 @@ from runtime.physics.graph.graph_ops_types import (
     WriteError,
     SimilarNode,
     ApplyResult,
-    SIMILARITY_THRESHOLD
+    SIMILARITY_THRESHOLD,
+    DUPLICATE_INDEX_ENGINE
 )
+from runtime.physics.graph.graph_vector_index import GraphVectorIndex, database_address, get_vector_index
 from runtime.physics.graph.graph_ops_read_only_interface import (
     GraphReadOps,
     get_graph_reader,
@@ -53,6 +57,11 @@ from runtime.physics.graph.graph_ops_read_only_interface import (
 
 logger = logging.getLogger(__name__)
 
+# apply(bulk=True) buffers, per thread and keyed by GraphOps instance: one
+# GraphOps is shared across threads, and only the applying thread's writes
+# may be collected
+_write_buffers = threading.local()
+
 
 class GraphOps(MomentOperationsMixin, ApplyOperationsMixin, LinkCreationMixin):
     """
@@ -114,6 +123,10 @@ Error: {e}"""
 
     def _query(self, cypher: str, params: Dict[str, Any] = None) -> List:
         """Execute a Cypher query via the database adapter."""
+        buffer = self._write_buffer()
+        if buffer is not None:
+            buffer.append((cypher, params))
+            return []
         try:
             return self._adapter.query(cypher, params)
         except Exception as e:
@@ -141,10 +154,73 @@ Error: {e}"""
                     f"Query: {cypher}\nParams: {params}"
                 )
 
+    def _write_buffer(self) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """The calling thread's apply(bulk=True) buffer, if it is collecting writes."""
+        return getattr(_write_buffers, 'by_ops', {}).get(id(self))
+
+    @contextmanager
+    def _buffered_writes(self) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Collect the (cypher, params) of every _query() call instead of running it.
+
+        Only for write-only code paths (add_* methods): buffered calls
+        return no rows. The caller sends the buffer with execute_batch().
+        Only calls from this thread are collected; other threads sharing
+        this GraphOps keep querying the graph.
+        """
+        buffer: List[Tuple[str, Dict[str, Any]]] = []
+        by_ops = _write_buffers.__dict__.setdefault('by_ops', {})
+        by_ops[id(self)] = buffer
+        try:
+            yield buffer
+        finally:
+            by_ops.pop(id(self), None)
+
     # =========================================================================
     # DUPLICATE DETECTION
     # =========================================================================
 
+    def _duplicate_index(self) -> GraphVectorIndex:
+        """Shared int8 vector index for duplicate detection (see graph_vector_index.py)."""
+        index = getattr(self, '_dup_index', None)
+        if index is None:
+            # Raw adapter queries: the index must load even while writes are buffered
+            host, port = database_address(self._adapter)
+            index = get_vector_index(
+                self.graph_name, self._adapter.query, engine=DUPLICATE_INDEX_ENGINE, host=host, port=port
+            )
+            self._dup_index = index
+        return index
+
+    def _find_similar_nodes_batch(
+        self,
+        label: str,
+        embeddings: List[Optional[List[float]]],
+        threshold: float = SIMILARITY_THRESHOLD
+    ) -> List[List[SimilarNode]]:
+        """
+        _find_similar_nodes() for many embeddings with one threshold query.
+
+        Returns:
+            One list per embedding of SimilarNode above threshold, most similar first
+        """
+        hits = self._duplicate_index().within(label, embeddings, threshold)
+
+        hit_ids = sorted({node_id for row in hits for node_id, _ in row})
+        names: Dict[str, str] = {}
+        if hit_ids:
+            rows = self._adapter.query(
+                f"MATCH (n:{label}) WHERE n.id IN $ids RETURN n.id, n.name",
+                {"ids": hit_ids}
+            )
+            names = {row[0]: row[1] for row in rows or []}
+
+        return [
+            [SimilarNode(id=node_id, name=names.get(node_id), node_type=label.lower(), similarity=sim)
+             for node_id, sim in row]
+            for row in hits
+        ]
+
     def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
         a = np.array(a)
@@ -173,38 +249,8 @@ Error: {e}"""
         if not embedding:
             return []
 
-        # Get all nodes of this type with embeddings
-        cypher = f"""
-        MATCH (n:{label})
-        WHERE n.embedding IS NOT NULL
-        RETURN n.id, n.name, n.embedding
-        """
-
         try:
-            rows = self._query(cypher)
-            if not rows:
-                return []
-
-            similar = []
-            for row in rows:
-                if len(row) >= 3 and row[2]:
-                    node_id = row[0]
-                    node_name = row[1]
-                    node_embedding = json.loads(row[2]) if isinstance(row[2], str) else row[2]
-
-                    sim = self._cosine_similarity(embedding, node_embedding)
-                    if sim >= threshold:
-                        similar.append(SimilarNode(
-                            id=node_id,
-                            name=node_name,
-                            node_type=label.lower(),
-                            similarity=sim
-                        ))
-
-            # Sort by similarity descending
-            similar.sort(key=lambda x: x.similarity, reverse=True)
-            return similar
-
+            return self._find_similar_nodes_batch(label, [embedding], threshold)[0]
         except Exception as e:
             logger.warning(f"Error finding similar nodes: {e}")
             return []
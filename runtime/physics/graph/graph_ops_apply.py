@@ -14,15 +14,51 @@ Docs:
 """
 
 import json
+import re
 import yaml
 import logging
+import numpy as np
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from runtime.infrastructure.embeddings.service import get_embedding_service
+from runtime.physics.graph.graph_ops_types import SimilarNode, SIMILARITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# Node type -> label its add_* method writes
+NODE_LABELS = {
+    'character': 'Actor',
+    'place': 'Space',
+    'thing': 'Thing',
+    'narrative': 'Narrative',
+    'moment': 'Moment',
+}
+
+# Link type -> (source key(s), target key(s), relationship for the link embedding)
+LINK_ENDPOINTS = {
+    'belief': (('character',), ('narrative',), 'BELIEVES'),
+    'present': (('from',), ('to',), 'AT'),
+    'carries': (('from',), ('to',), 'CARRIES'),
+    'carries_hidden': (('from',), ('to',), 'CARRIES'),
+    'located': (('from',), ('to',), 'LOCATED_AT'),
+    'geography': (('from',), ('to',), 'CONNECTS'),
+    'narrative_link': (('from',), ('to',), 'RELATES_TO'),
+    'said': (('character',), ('moment',), 'SAID'),
+    'moment_at': (('moment',), ('place',), 'AT'),
+    'moment_then': (('from',), ('to',), 'THEN'),
+    'narrative_from': (('narrative',), ('moment',), 'FROM'),
+    'can_speak': (('character',), ('moment',), 'CAN_SPEAK'),
+    'attached_to': (('moment',), ('target',), 'ATTACHED_TO'),
+    'can_lead_to': (('from',), ('to',), 'CAN_LEAD_TO'),
+    'contains': (('from', 'parent'), ('to', 'child'), 'CONTAINS'),
+    'about': (('from', 'moment'), ('to', 'target'), 'ABOUT'),
+}
+
+# Buffered node upserts (MERGE (n:Label {id: $id}) ...) run before everything else
+_NODE_UPSERT = re.compile(r"^\s*MERGE \(n:\w+ \{id: \$id\}\)")
+
 
 class ApplyOperationsMixin:
     """
@@ -45,6 +81,15 @@ class ApplyOperationsMixin:
         """
         Generate embedding for a node from name + description.
         """
+        text = self._node_embedding_text(node)
+        if not text:
+            return None
+
+        embed_service = get_embedding_service()
+        return embed_service.embed(text)
+
+    def _node_embedding_text(self, node: Dict) -> str:
+        """Embedding text for a node: name (or id) + first description field."""
         parts = []
 
         # Name/title
@@ -58,12 +103,7 @@ class ApplyOperationsMixin:
                 parts.append(node[field])
                 break
 
-        text = '. '.join(p for p in parts if p)
-        if not text:
-            return None
-
-        embed_service = get_embedding_service()
-        return embed_service.embed(text)
+        return '. '.join(p for p in parts if p)
 
     def _get_node_name(self, node_id: str) -> str:
         """Get node name from graph, fallback to id."""
@@ -83,13 +123,15 @@ class ApplyOperationsMixin:
         from_name = self._get_node_name(from_id)
         to_name = self._get_node_name(to_id)
 
+        embed_service = get_embedding_service()
+        return embed_service.embed(self._link_embedding_text(from_name, link_type, to_name, notes))
+
+    def _link_embedding_text(self, from_name: str, link_type: str, to_name: str, notes: str = None) -> str:
+        """Embedding text for a link: source_name + LINK_TYPE + target_name + notes."""
         parts = [from_name, link_type.upper(), to_name]
         if notes:
             parts.append(notes)
-
-        text = ' '.join(parts)
-        embed_service = get_embedding_service()
-        return embed_service.embed(text)
+        return ' '.join(parts)
 
     def _set_link_embedding(self, from_id: str, to_id: str, rel_type: str, embedding: List[float]):
         """Store embedding on a relationship."""
@@ -109,7 +151,13 @@ class ApplyOperationsMixin:
     # APPLY METHOD (Main API)
     # =========================================================================
 
-    def apply(self, path: str = None, data: Dict = None, playthrough: str = "default"):
+    def apply(
+        self,
+        path: str = None,
+        data: Dict = None,
+        playthrough: str = "default",
+        bulk: bool = False,
+    ):
         """
         Apply mutations from a YAML/JSON file or dict.
 
@@ -117,6 +165,9 @@ class ApplyOperationsMixin:
             path: Path to mutation file (YAML or JSON)
             data: Dict with mutations (alternative to file)
             playthrough: Playthrough folder name (for image generation)
+            bulk: Batch nodes and links: one embed_batch call each, one
+                vectorized duplicate check per label, and grouped UNWIND
+                writes instead of per-item queries. Same ApplyResult.
 
         Returns:
             ApplyResult with persisted, rejected, and errors
@@ -203,8 +254,15 @@ class ApplyOperationsMixin:
         new_node_ids: Set[str] = set()
         linked_ids: Set[str] = set()
 
+        if bulk:
+            # 1-2. Nodes and links in batched embed / dedup / write passes
+            self._apply_nodes_bulk(data.get('nodes', []), result, new_node_ids)
+            self._apply_links_bulk(data.get('links', []), result, existing_ids, new_node_ids, linked_ids)
+        nodes = [] if bulk else data.get('nodes', [])
+        links = [] if bulk else data.get('links', [])
+
         # 1. Process nodes
-        for node in data.get('nodes', []):
+        for node in nodes:
             node_type = node.get('type')
             node_id = node.get('id')
 
@@ -283,193 +341,28 @@ class ApplyOperationsMixin:
                 })
 
         # 2. Process links
-        for link in data.get('links', []):
+        for link in links:
             link_type = link.get('type')
             link_id = self._link_id(link)
 
-            try:
-                if link_type == 'belief':
-                    char_id = link.get('character')
-                    narr_id = link.get('narrative')
-                    self._validate_link_targets(char_id, narr_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(narr_id)
-                    self.add_belief(**self._extract_belief_args(link))
-                    # Embed link
-                    emb = self._generate_link_embedding(char_id, 'BELIEVES', narr_id, link.get('notes'))
-                    self._set_link_embedding(char_id, narr_id, 'BELIEVES', emb)
-
-                elif link_type == 'present':
-                    char_id = link.get('from')
-                    place_id = link.get('to')
-                    self._validate_link_targets(char_id, place_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(place_id)
-                    self.add_presence(**self._extract_presence_args(link))
-                    emb = self._generate_link_embedding(char_id, 'AT', place_id, link.get('notes'))
-                    self._set_link_embedding(char_id, place_id, 'AT', emb)
-
-                elif link_type in ('carries', 'carries_hidden'):
-                    char_id = link.get('from')
-                    thing_id = link.get('to')
-                    self._validate_link_targets(char_id, thing_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(thing_id)
-                    self.add_possession(**self._extract_possession_args(link))
-                    emb = self._generate_link_embedding(char_id, 'CARRIES', thing_id, link.get('notes'))
-                    self._set_link_embedding(char_id, thing_id, 'CARRIES', emb)
-
-                elif link_type == 'geography':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_geography(**self._extract_geography_args(link))
-                    emb = self._generate_link_embedding(from_id, 'CONNECTS', to_id, link.get('notes'))
-                    self._set_link_embedding(from_id, to_id, 'CONNECTS', emb)
-
-                elif link_type == 'narrative_link':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_narrative_link(**self._extract_narrative_link_args(link))
-                    emb = self._generate_link_embedding(from_id, 'RELATES_TO', to_id, link.get('notes'))
-                    self._set_link_embedding(from_id, to_id, 'RELATES_TO', emb)
-
-                elif link_type == 'located':
-                    thing_id = link.get('from')
-                    place_id = link.get('to')
-                    self._validate_link_targets(thing_id, place_id, existing_ids, new_node_ids)
-                    linked_ids.add(thing_id)
-                    linked_ids.add(place_id)
-                    self.add_thing_location(**self._extract_thing_location_args(link))
-                    emb = self._generate_link_embedding(thing_id, 'LOCATED_AT', place_id, link.get('notes'))
-                    self._set_link_embedding(thing_id, place_id, 'LOCATED_AT', emb)
-
-                elif link_type == 'said':
-                    char_id = link.get('character')
-                    moment_id = link.get('moment')
-                    self._validate_link_targets(char_id, moment_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(moment_id)
-                    self.add_said(char_id, moment_id)
-                    emb = self._generate_link_embedding(char_id, 'SAID', moment_id, link.get('notes'))
-                    self._set_link_embedding(char_id, moment_id, 'SAID', emb)
-
-                elif link_type == 'moment_at':
-                    moment_id = link.get('moment')
-                    place_id = link.get('place')
-                    self._validate_link_targets(moment_id, place_id, existing_ids, new_node_ids)
-                    linked_ids.add(moment_id)
-                    linked_ids.add(place_id)
-                    self.add_moment_at(moment_id, place_id)
-                    emb = self._generate_link_embedding(moment_id, 'AT', place_id, link.get('notes'))
-                    self._set_link_embedding(moment_id, place_id, 'AT', emb)
-
-                elif link_type == 'moment_then':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_moment_then(from_id, to_id)
-                    emb = self._generate_link_embedding(from_id, 'THEN', to_id, link.get('notes'))
-                    self._set_link_embedding(from_id, to_id, 'THEN', emb)
-
-                elif link_type == 'narrative_from':
-                    narr_id = link.get('narrative')
-                    moment_id = link.get('moment')
-                    self._validate_link_targets(narr_id, moment_id, existing_ids, new_node_ids)
-                    linked_ids.add(narr_id)
-                    linked_ids.add(moment_id)
-                    self.add_narrative_from_moment(narr_id, moment_id)
-                    emb = self._generate_link_embedding(narr_id, 'FROM', moment_id, link.get('notes'))
-                    self._set_link_embedding(narr_id, moment_id, 'FROM', emb)
-
-                elif link_type == 'can_speak':
-                    char_id = link.get('character')
-                    moment_id = link.get('moment')
-                    self._validate_link_targets(char_id, moment_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(moment_id)
-                    self.add_can_speak(
-                        char_id,
-                        moment_id,
-                        weight=link.get('weight', 1.0)
-                    )
-                    emb = self._generate_link_embedding(char_id, 'CAN_SPEAK', moment_id, link.get('notes'))
-                    self._set_link_embedding(char_id, moment_id, 'CAN_SPEAK', emb)
-
-                elif link_type == 'attached_to':
-                    moment_id = link.get('moment')
-                    target_id = link.get('target')
-                    self._validate_link_targets(moment_id, target_id, existing_ids, new_node_ids)
-                    linked_ids.add(moment_id)
-                    linked_ids.add(target_id)
-                    self.add_attached_to(
-                        moment_id,
-                        target_id,
-                        presence_required=link.get('presence_required', False),
-                        persistent=link.get('persistent', True),
-                        dies_with_target=link.get('dies_with_target', False)
-                    )
-                    emb = self._generate_link_embedding(moment_id, 'ATTACHED_TO', target_id, link.get('notes'))
-                    self._set_link_embedding(moment_id, target_id, 'ATTACHED_TO', emb)
-
-                elif link_type == 'can_lead_to':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_can_lead_to(
-                        from_id,
-                        to_id,
-                        trigger=link.get('trigger', 'player'),
-                        weight_transfer=link.get('weight_transfer', 0.3),
-                        require_words=link.get('require_words'),
-                        bidirectional=link.get('bidirectional', False),
-                        wait_ticks=link.get('wait_ticks'),
-                        consumes_origin=link.get('consumes_origin', True)
-                    )
-                    emb = self._generate_link_embedding(from_id, 'CAN_LEAD_TO', to_id, link.get('notes'))
-                    self._set_link_embedding(from_id, to_id, 'CAN_LEAD_TO', emb)
-
-                elif link_type == 'contains':
-                    parent_id = link.get('from') or link.get('parent')
-                    child_id = link.get('to') or link.get('child')
-                    self._validate_link_targets(parent_id, child_id, existing_ids, new_node_ids)
-                    linked_ids.add(parent_id)
-                    linked_ids.add(child_id)
-                    self.add_contains(parent_id, child_id)
-                    emb = self._generate_link_embedding(parent_id, 'CONTAINS', child_id, link.get('notes'))
-                    self._set_link_embedding(parent_id, child_id, 'CONTAINS', emb)
-
-                elif link_type == 'about':
-                    moment_id = link.get('from') or link.get('moment')
-                    target_id = link.get('to') or link.get('target')
-                    self._validate_link_targets(moment_id, target_id, existing_ids, new_node_ids)
-                    linked_ids.add(moment_id)
-                    linked_ids.add(target_id)
-                    self.add_about(
-                        moment_id,
-                        target_id,
-                        weight=link.get('weight', 0.5)
-                    )
-                    emb = self._generate_link_embedding(moment_id, 'ABOUT', target_id, link.get('notes'))
-                    self._set_link_embedding(moment_id, target_id, 'ABOUT', emb)
+            if link_type not in LINK_ENDPOINTS:
+                result.errors.append({
+                    'item': link_id,
+                    'message': f'Invalid link type: {link_type}',
+                    'fix': f"Valid types: {', '.join(LINK_ENDPOINTS)}"
+                })
+                result.rejected.append(link_id)
+                continue
 
-                else:
-                    result.errors.append({
-                        'item': link_id,
-                        'message': f'Invalid link type: {link_type}',
-                        'fix': 'Valid types: belief, present, carries, carries_hidden, located, geography, narrative_link, said, moment_at, moment_then, narrative_from, can_speak, attached_to, can_lead_to, contains, about'
-                    })
-                    result.rejected.append(link_id)
-                    continue
+            from_id, to_id, rel_type = self._link_endpoints(link)
+            try:
+                self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
+                linked_ids.add(from_id)
+                linked_ids.add(to_id)
+                self._write_link(link)
+                # Embed link
+                emb = self._generate_link_embedding(from_id, rel_type, to_id, link.get('notes'))
+                self._set_link_embedding(from_id, to_id, rel_type, emb)
 
                 result.persisted.append(link_id)
 
@@ -547,10 +440,368 @@ class ApplyOperationsMixin:
         logger.info(f"[GraphOps] Applied: {len(result.persisted)} persisted, {len(result.rejected)} rejected")
         return result
 
+    # =========================================================================
+    # BULK APPLY
+    # =========================================================================
+
+    def _apply_nodes_bulk(self, nodes: List[Dict], result, new_node_ids: Set[str]) -> None:
+        """Node pass of apply(bulk=True): batch embed, batch dedup, one grouped write."""
+        from runtime.physics.graph.graph_ops_types import WriteError
+        from runtime.physics.graph.graph_ops_events import emit_event as _emit_event
+
+        valid = [n for n in nodes if n.get('type') and n.get('id')]
+        embeddings = self._embed_texts([self._node_embedding_text(n) for n in valid])
+        duplicates = self._find_payload_duplicates(valid, embeddings)
+
+        # Payload order: ('write', node, statements) or ('reject', error/duplicate entry, rejected id)
+        plan: List[Tuple[str, Any, Any]] = []
+        valid_index = 0
+        with self._buffered_writes() as buffer:
+            for node in nodes:
+                node_type = node.get('type')
+                node_id = node.get('id')
+
+                if not node_type or not node_id:
+                    plan.append(('reject', {
+                        'item': str(node),
+                        'message': 'Node missing type or id',
+                        'fix': 'Every node needs: type (character/place/thing/narrative/moment) and id'
+                    }, str(node)))
+                    continue
+
+                embedding = embeddings[valid_index]
+                similar = duplicates.get(valid_index)
+                valid_index += 1
+                if similar:
+                    plan.append(('duplicate', {
+                        'new_node': node_id,
+                        'new_name': node.get('name', node_id),
+                        'similar_to': similar.id,
+                        'similar_name': similar.name,
+                        'similarity': similar.similarity,
+                        'action': 'skipped',
+                        'fix': f"Update existing node '{similar.id}' or use force=True to create anyway"
+                    }, node_id))
+                    continue
+
+                node['_embedding'] = embedding
+                new_node_ids.add(node_id)
+
+                start = len(buffer)
+                if not self._write_node(node):
+                    plan.append(('reject', {
+                        'item': node_id,
+                        'message': f'Invalid node type: {node_type}',
+                        'fix': 'Valid types: character, place, thing, narrative, moment'
+                    }, node_id))
+                    continue
+                plan.append(('write', node, buffer[start:]))
+
+        failures = self._flush_buffered([stmts for kind, _, stmts in plan if kind == 'write'])
+
+        write_index = 0
+        for kind, item, extra in plan:
+            if kind == 'reject':
+                result.errors.append(item)
+                result.rejected.append(extra)
+            elif kind == 'duplicate':
+                result.duplicates.append(item)
+                result.rejected.append(extra)
+            else:
+                error: Optional[WriteError] = failures.get(write_index)
+                write_index += 1
+                if error is None:
+                    result.persisted.append(item['id'])
+                    _emit_event("node_created", item)
+                else:
+                    result.errors.append({'item': item['id'], 'message': error.message, 'fix': error.fix})
+                    result.rejected.append(item['id'])
+                    _emit_event("node_error", {"id": item['id'], "type": item['type'], "error": error.message})
+
+    def _apply_links_bulk(
+        self,
+        links: List[Dict],
+        result,
+        existing_ids: Set[str],
+        new_node_ids: Set[str],
+        linked_ids: Set[str],
+    ) -> None:
+        """Link pass of apply(bulk=True): one grouped write, then batched link embeddings."""
+        from runtime.physics.graph.graph_ops_types import WriteError
+        from runtime.physics.graph.graph_ops_events import emit_event as _emit_event
+
+        # Payload order: (kind, link, link_id, statements | error entry | WriteError)
+        plan: List[Tuple[str, Dict, str, Any]] = []
+        with self._buffered_writes() as buffer:
+            for link in links:
+                link_type = link.get('type')
+                link_id = self._link_id(link)
+
+                if link_type not in LINK_ENDPOINTS:
+                    plan.append(('reject', link, link_id, {
+                        'item': link_id,
+                        'message': f'Invalid link type: {link_type}',
+                        'fix': f"Valid types: {', '.join(LINK_ENDPOINTS)}"
+                    }))
+                    continue
+
+                from_id, to_id, _ = self._link_endpoints(link)
+                try:
+                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
+                except WriteError as e:
+                    plan.append(('error', link, link_id, e))
+                    continue
+                linked_ids.add(from_id)
+                linked_ids.add(to_id)
+
+                start = len(buffer)
+                self._write_link(link)
+                plan.append(('write', link, link_id, buffer[start:]))
+
+        failures = self._flush_buffered([stmts for kind, _, _, stmts in plan if kind == 'write'])
+
+        # Resolve write outcomes, then embed the persisted links before announcing them
+        outcomes = []
+        write_index = 0
+        for kind, link, link_id, extra in plan:
+            if kind == 'write':
+                extra = failures.get(write_index)
+                write_index += 1
+                kind = 'error' if extra else 'persisted'
+            outcomes.append((kind, link, link_id, extra))
+
+        self._set_link_embeddings_bulk([
+            self._link_endpoints(link) + (link.get('notes'),)
+            for kind, link, _, _ in outcomes if kind == 'persisted'
+        ])
+
+        for kind, link, link_id, extra in outcomes:
+            if kind == 'persisted':
+                result.persisted.append(link_id)
+                _emit_event("link_created", {**link, "_link_id": link_id})
+            elif kind == 'reject':
+                result.errors.append(extra)
+                result.rejected.append(link_id)
+            else:
+                result.errors.append({'item': link_id, 'message': extra.message, 'fix': extra.fix})
+                result.rejected.append(link_id)
+                _emit_event("link_error", {"id": link_id, "type": link.get('type'), "error": extra.message})
+
+    def _embed_texts(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed texts with one embed_batch call; empty texts get None."""
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        todo = [i for i, text in enumerate(texts) if text]
+        if todo:
+            vectors = get_embedding_service().embed_batch([texts[i] for i in todo])
+            for i, vector in zip(todo, vectors):
+                embeddings[i] = vector
+        return embeddings
+
+    def _find_payload_duplicates(
+        self,
+        nodes: List[Dict],
+        embeddings: List[Optional[List[float]]],
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> Dict[int, SimilarNode]:
+        """
+        Duplicate check for a whole payload, one threshold query per label.
+
+        Matches what serial apply() reports: each node is compared with the
+        label's existing nodes (duplicate index) and with earlier payload
+        nodes already accepted under that label (serial apply would have
+        written those first).
+
+        Returns:
+            {index into nodes: most similar node} for nodes to skip
+        """
+        by_label: Dict[str, List[int]] = defaultdict(list)
+        for i, (node, embedding) in enumerate(zip(nodes, embeddings)):
+            if embedding:
+                by_label[node['type'].capitalize()].append(i)
+
+        duplicates: Dict[int, SimilarNode] = {}
+        for label, indices in by_label.items():
+            dim = len(embeddings[indices[0]])
+            indices = [i for i in indices if len(embeddings[i]) == dim]
+            new = np.asarray([embeddings[i] for i in indices], dtype=np.float32)
+            norms = np.linalg.norm(new, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            new /= norms
+
+            try:
+                existing = self._find_similar_nodes_batch(label, [embeddings[i] for i in indices], threshold)
+            except Exception as e:
+                logger.warning(f"Error finding similar nodes: {e}")
+                existing = [[] for _ in indices]
+            against_payload = new @ new.T
+
+            accepted: List[int] = []
+            for row, i in enumerate(indices):
+                best: Optional[SimilarNode] = existing[row][0] if existing[row] else None
+                if accepted:
+                    sims = against_payload[row, accepted]
+                    k = int(np.argmax(sims))
+                    if sims[k] >= threshold and (best is None or sims[k] > best.similarity):
+                        other = nodes[indices[accepted[k]]]
+                        best = SimilarNode(other['id'], other.get('name', other['id']), label.lower(), float(sims[k]))
+
+                if best is not None:
+                    duplicates[i] = best
+                elif NODE_LABELS.get(nodes[i]['type']) == label:
+                    accepted.append(row)
+        return duplicates
+
+    def _flush_buffered(self, groups: List[List[Tuple[str, Dict]]]) -> Dict[int, Any]:
+        """
+        Send buffered per-item statements as one batch (grouped, coalesced, pipelined).
+
+        If the batch fails, items are replayed one by one so errors land on
+        the right item, as in serial apply.
+
+        Returns:
+            {group index: WriteError} for items that failed
+        """
+        from runtime.physics.graph.graph_ops_types import WriteError
+
+        statements = [stmt for group in groups for stmt in group]
+        if not statements:
+            return {}
+
+        # Node upserts first so every link/attachment MATCH finds its nodes,
+        # then statements grouped by shape so runs coalesce into UNWINDs
+        first_seen: Dict[str, int] = {}
+        for i, (cypher, _) in enumerate(statements):
+            first_seen.setdefault(cypher, i)
+        statements.sort(key=lambda st: (0 if _NODE_UPSERT.match(st[0]) else 1, first_seen[st[0]]))
+
+        try:
+            self._adapter.execute_batch(statements)
+            return {}
+        except Exception as e:
+            logger.warning(f"[GraphOps] Bulk write failed ({e}), retrying item by item")
+
+        failures: Dict[int, WriteError] = {}
+        for index, group in enumerate(groups):
+            try:
+                for cypher, params in group:
+                    self._query(cypher, params)
+            except WriteError as e:
+                failures[index] = e
+        return failures
+
+    def _set_link_embeddings_bulk(self, links: List[Tuple[str, str, str, Optional[str]]]) -> None:
+        """Embed (from_id, to_id, rel_type, notes) links in one batch and store per relationship type."""
+        if not links:
+            return
+
+        ids = sorted({node_id for link in links for node_id in link[:2] if node_id})
+        names: Dict[str, str] = {}
+        try:
+            rows = self._query("MATCH (n) WHERE n.id IN $ids RETURN n.id, n.name", {"ids": ids})
+            names = {row[0]: row[1] for row in rows if row and row[1]}
+        except Exception:
+            pass
+
+        texts = [
+            self._link_embedding_text(names.get(from_id, from_id), rel_type, names.get(to_id, to_id), notes)
+            for from_id, to_id, rel_type, notes in links
+        ]
+        vectors = get_embedding_service().embed_batch(texts)
+
+        rows_by_type: Dict[str, List[Dict]] = defaultdict(list)
+        for (from_id, to_id, rel_type, _), vector in zip(links, vectors):
+            if vector:
+                rows_by_type[rel_type].append({'from_id': from_id, 'to_id': to_id, 'emb': json.dumps(vector)})
+
+        for rel_type, rows in rows_by_type.items():
+            try:
+                self._adapter.execute_many(
+                    f"MATCH (a {{id: row.from_id}})-[r:{rel_type}]->(b {{id: row.to_id}}) "
+                    f"SET r.embedding = row.emb",
+                    rows,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to set link embeddings: {e}")
+
     # =========================================================================
     # APPLY HELPERS
     # =========================================================================
 
+    def _write_node(self, node: Dict) -> bool:
+        """Write a node with its add_* method. False for an unknown node type."""
+        node_type = node.get('type')
+        if node_type == 'character':
+            self.add_character(**self._extract_character_args(node))
+        elif node_type == 'place':
+            self.add_place(**self._extract_place_args(node))
+        elif node_type == 'thing':
+            self.add_thing(**self._extract_thing_args(node))
+        elif node_type == 'narrative':
+            self.add_narrative(**self._extract_narrative_args(node))
+        elif node_type == 'moment':
+            self.add_moment(**self._extract_moment_args(node))
+        else:
+            return False
+        return True
+
+    def _link_endpoints(self, link: Dict) -> Tuple[str, str, str]:
+        """(source id, target id, relationship type) of a link, per LINK_ENDPOINTS."""
+        from_keys, to_keys, rel_type = LINK_ENDPOINTS[link.get('type')]
+        from_id = next((link.get(k) for k in from_keys if link.get(k)), None)
+        to_id = next((link.get(k) for k in to_keys if link.get(k)), None)
+        return from_id, to_id, rel_type
+
+    def _write_link(self, link: Dict) -> None:
+        """Write a link with its add_* method (type must be in LINK_ENDPOINTS)."""
+        link_type = link.get('type')
+        from_id, to_id, _ = self._link_endpoints(link)
+
+        if link_type == 'belief':
+            self.add_belief(**self._extract_belief_args(link))
+        elif link_type == 'present':
+            self.add_presence(**self._extract_presence_args(link))
+        elif link_type in ('carries', 'carries_hidden'):
+            self.add_possession(**self._extract_possession_args(link))
+        elif link_type == 'geography':
+            self.add_geography(**self._extract_geography_args(link))
+        elif link_type == 'narrative_link':
+            self.add_narrative_link(**self._extract_narrative_link_args(link))
+        elif link_type == 'located':
+            self.add_thing_location(**self._extract_thing_location_args(link))
+        elif link_type == 'said':
+            self.add_said(from_id, to_id)
+        elif link_type == 'moment_at':
+            self.add_moment_at(from_id, to_id)
+        elif link_type == 'moment_then':
+            self.add_moment_then(from_id, to_id)
+        elif link_type == 'narrative_from':
+            self.add_narrative_from_moment(from_id, to_id)
+        elif link_type == 'can_speak':
+            self.add_can_speak(from_id, to_id, weight=link.get('weight', 1.0))
+        elif link_type == 'attached_to':
+            self.add_attached_to(
+                from_id,
+                to_id,
+                presence_required=link.get('presence_required', False),
+                persistent=link.get('persistent', True),
+                dies_with_target=link.get('dies_with_target', False)
+            )
+        elif link_type == 'can_lead_to':
+            self.add_can_lead_to(
+                from_id,
+                to_id,
+                trigger=link.get('trigger', 'player'),
+                weight_transfer=link.get('weight_transfer', 0.3),
+                require_words=link.get('require_words'),
+                bidirectional=link.get('bidirectional', False),
+                wait_ticks=link.get('wait_ticks'),
+                consumes_origin=link.get('consumes_origin', True)
+            )
+        elif link_type == 'contains':
+            self.add_contains(from_id, to_id)
+        elif link_type == 'about':
+            self.add_about(from_id, to_id, weight=link.get('weight', 0.5))
+
     def _get_existing_node_ids(self) -> Set[str]:
         """Get all existing node IDs in the graph."""
         try:
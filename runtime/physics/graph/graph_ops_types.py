@@ -20,6 +20,9 @@ from typing import Dict, Any, List
 # Similarity threshold for duplicate detection
 SIMILARITY_THRESHOLD = 0.85
 
+# Vector index engine behind duplicate detection (quantized, exact after rescoring)
+DUPLICATE_INDEX_ENGINE = "int8"
+
 
 class WriteError(Exception):
     """Error with helpful fix instructions."""
@@ -75,6 +75,7 @@ from runtime.physics.graph.graph_query_utils import (
     extract_node_props,
     extract_link_props,
 )
+from runtime.physics.graph.graph_vector_index import GraphVectorIndex, database_address, get_vector_index
 
 logger = logging.getLogger(__name__)
 
@@ -260,6 +261,11 @@ class SearchQueryMixin:
             'timestamp': timestamp
         })
 
+        try:
+            self._get_vector_index().upsert('Moment', moment_id, embedding)
+        except Exception as e:
+            logger.debug(f"[Search] Vector index upsert skipped: {e}")
+
         logger.info(f"[Search] Created query moment: {moment_id}")
         return moment_id
 
@@ -311,7 +317,60 @@ class SearchQueryMixin:
         embedding: List[float],
         top_k: int
     ) -> List[Dict[str, Any]]:
-        """Find nodes similar to the given embedding."""
+        """
+        Find nodes similar to the given embedding.
+
+        Top-k ids come from the in-process vector index; only those nodes'
+        properties are fetched. Falls back to a full label scan if the index
+        can't be used.
+        """
+        try:
+            hits = self._get_vector_index().search(label, embedding, top_k)
+        except Exception as e:
+            logger.warning(f"[Search] Vector index unavailable for {label}, scanning: {e}")
+            return self._scan_similar_nodes(label, embedding, top_k)
+
+        if not hits:
+            return []
+
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE n.id IN $ids
+        RETURN n.id, n.name, n.energy, n.weight, n.status
+        """
+
+        try:
+            rows = self._query(cypher, {'ids': [node_id for node_id, _ in hits]})
+            props_by_id = {row[0]: row for row in rows or []}
+
+            results = []
+            for node_id, sim in hits:
+                row = props_by_id.get(node_id)
+                if row is None:
+                    continue  # Deleted since indexed; next sync drops it
+                _, name, energy, weight, status = row
+                results.append({
+                    'id': node_id,
+                    'name': name if name is not None else node_id,
+                    'type': label.lower(),
+                    'similarity': sim,
+                    'energy': energy if energy is not None else 0,
+                    'weight': weight if weight is not None else 1.0,
+                    'status': status,
+                })
+            return results
+
+        except Exception as e:
+            logger.warning(f"[Search] Error finding similar {label}: {e}")
+            return []
+
+    def _scan_similar_nodes(
+        self,
+        label: str,
+        embedding: List[float],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Find similar nodes by scoring every embedded node of label."""
         cypher = f"""
         MATCH (n:{label})
         WHERE n.embedding IS NOT NULL
@@ -877,6 +936,15 @@ class SearchQueryMixin:
     # UTILITIES
     # =========================================================================
 
+    def _get_vector_index(self) -> GraphVectorIndex:
+        """Shared vector index for this graph (see graph_vector_index.py)."""
+        index = getattr(self, '_vector_index', None)
+        if index is None:
+            host, port = database_address(getattr(self, '_adapter', None))
+            index = get_vector_index(self.graph_name, self._query, host=host, port=port)
+            self._vector_index = index
+        return index
+
     def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
         a = np.array(a)
@@ -0,0 +1,634 @@
+"""
+Graph Vector Index — In-process nearest-neighbour index over node embeddings.
+
+Semantic search used to pull every embedded node of a label (with its full
+embedding) over the wire and score it in Python. This module keeps the
+embeddings in a normalized float32 matrix per (graph, label) and answers
+top-k queries locally; only the k winning ids are fetched back from the graph.
+
+Engines:
+    - BruteForceEngine: exact, one matrix-vector product per query.
+    - IVFEngine: inverted-file index (spherical k-means coarse quantizer).
+      Only the `nprobe` nearest lists are scored. Below `min_train` vectors it
+      scans everything, so small graphs get exact results.
+    - Int8Engine: scalar-quantized rows (int8 codes + per-row scale), 4x
+      smaller than float32. Scores are approximate with a per-row error
+      bound; within() rescores the candidates it cannot rule out against
+      their stored embeddings, so threshold results are exact.
+
+Threshold queries:
+    within(label, embeddings, threshold) answers "which nodes are at least
+    this similar" for a batch of embeddings with one matrix product per
+    label (duplicate detection in GraphOps).
+
+Sync with graph writes:
+    - First search of a label loads `n.id, n.embedding` in keyset pages.
+    - Mutation events (node_created / node_updated) mark ids dirty; their
+      embeddings are fetched in one `IN $ids` query on the next search.
+    - Every `refresh_interval` seconds a count check catches writers that
+      bypass the event hook (inject, embed_pending); on mismatch only the
+      missing ids' embeddings are fetched.
+
+Environment:
+    MIND_VECTOR_INDEX: "ivf" (default), "brute" or "int8". int8 scores are
+        within scale / 2 * |query|_1 of the exact cosine per row (scale =
+        max |component| / 127); search() ranks by them, within() rescores
+        every candidate inside that bound against its stored embedding.
+
+Indexes are shared per (host, port, graph_name, engine), so graphs of the
+same name on different databases never share one.
+
+Usage:
+    from runtime.physics.graph.graph_vector_index import database_address, get_vector_index
+
+    host, port = database_address(adapter)
+    index = get_vector_index(graph_name, adapter.query, host=host, port=port)
+    hits = index.search('Narrative', query_embedding, top_k=10)  # [(id, score)]
+
+    dup_index = get_vector_index(graph_name, adapter.query, engine='int8', host=host, port=port)
+    [hits] = dup_index.within('Narrative', [query_embedding], 0.85)  # [(id, score)]
+
+DOCS: docs/physics/IMPLEMENTATION_Physics.md
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from runtime.physics.graph.graph_ops_events import add_mutation_listener
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+INDEX_ENGINE_ENV = "MIND_VECTOR_INDEX"
+DEFAULT_ENGINE = "ivf"
+
+LOAD_PAGE_SIZE = 2000          # Embeddings per keyset page on initial load
+DEFAULT_REFRESH_INTERVAL = 30.0  # Seconds between count reconciliations
+
+IVF_MIN_TRAIN = 2048           # Below this, IVF scans exactly
+IVF_NPROBE = 8                 # Lists scored per query
+IVF_KMEANS_ITERATIONS = 10
+IVF_TRAIN_SAMPLE = 20000       # Max vectors used to fit centroids
+
+WITHIN_CHUNK = 256             # Queries per matrix product in within()
+INT8_BOUND_EPS = 1e-4          # Float32 rounding slack on the int8 error bound
+
+# apply() node types → graph labels
+NODE_TYPE_LABELS = {
+    'character': 'Actor',
+    'actor': 'Actor',
+    'place': 'Space',
+    'space': 'Space',
+    'thing': 'Thing',
+    'narrative': 'Narrative',
+    'moment': 'Moment',
+}
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Row-normalize; zero rows stay zero (cosine 0 against anything)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest scores, best first."""
+    if k <= 0 or scores.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < scores.size:
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(scores.size)
+    return idx[np.argsort(-scores[idx], kind='stable')]
+
+
+# =============================================================================
+# ENGINES
+# =============================================================================
+
+class BruteForceEngine:
+    """
+    Exact engine: growable normalized matrix with swap-remove.
+
+    Also the storage layer the IVF engine builds on.
+    """
+
+    name = "brute"
+    exact = True  # scores are exact cosines
+    _dtype = np.float32
+
+    def __init__(self):
+        self.dim: Optional[int] = None
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.zeros((0, 0), dtype=self._dtype)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._rows
+
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    def upsert(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """Insert or replace vectors (raw, un-normalized) for ids."""
+        if not len(ids):
+            return
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self._matrix = np.zeros((0, self.dim), dtype=self._dtype)
+            self._ensure_capacity(max(16, len(ids)))
+
+        for node_id, vector in zip(ids, vectors):
+            row = self._rows.get(node_id)
+            if row is None:
+                row = len(self._ids)
+                self._ensure_capacity(row + 1)
+                self._ids.append(node_id)
+                self._rows[node_id] = row
+            self._store(row, vector)
+            self._on_row_written(row)
+
+    def remove(self, ids: Iterable[str]) -> None:
+        for node_id in ids:
+            row = self._rows.pop(node_id, None)
+            if row is None:
+                continue
+            last = len(self._ids) - 1
+            if row != last:
+                moved = self._ids[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                self._matrix[row] = self._matrix[last]
+                self._on_row_moved(last, row)
+            self._ids.pop()
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if not self._ids:
+            return []
+        scores = self._score_rows(query[None, :])[:, 0]
+        return [(self._ids[i], float(scores[i])) for i in _top_k(scores, k)]
+
+    def within(self, queries: np.ndarray, threshold: float) -> List[List[Tuple[str, float]]]:
+        """
+        Per normalized query row, every (id, score) that may reach threshold.
+
+        Exact engines return exactly the rows >= threshold; approximate ones
+        a superset (score + error bound >= threshold) with approximate scores.
+        """
+        results: List[List[Tuple[str, float]]] = []
+        for start in range(0, len(queries), WITHIN_CHUNK):
+            chunk = queries[start:start + WITHIN_CHUNK]
+            if not self._ids:
+                results.extend([] for _ in chunk)
+                continue
+            scores = self._score_rows(chunk)
+            rows, cols = np.nonzero(scores + self._error_bound(chunk) >= threshold)
+            hits: List[List[Tuple[str, float]]] = [[] for _ in chunk]
+            for row, col in zip(rows, cols):
+                hits[col].append((self._ids[row], float(scores[row, col])))
+            results.extend(hits)
+        return results
+
+    def _score_rows(self, queries: np.ndarray) -> np.ndarray:
+        """(rows, queries) score matrix over every stored row."""
+        return self._matrix[:len(self._ids)] @ queries.T
+
+    def _error_bound(self, queries: np.ndarray) -> Any:
+        """Max |approximate - exact| score, broadcastable to _score_rows()."""
+        return 0.0
+
+    def _store(self, row: int, vector: np.ndarray) -> None:
+        self._matrix[row] = vector
+
+    def _ensure_capacity(self, size: int) -> None:
+        if size > self._matrix.shape[0]:
+            grown = np.zeros((max(size, 2 * self._matrix.shape[0]), self.dim), dtype=self._dtype)
+            grown[:self._matrix.shape[0]] = self._matrix
+            self._matrix = grown
+
+    # Hooks for subclasses that keep per-row state
+    def _on_row_written(self, row: int) -> None:
+        pass
+
+    def _on_row_moved(self, src: int, dst: int) -> None:
+        pass
+
+
+class IVFEngine(BruteForceEngine):
+    """
+    Inverted-file engine on top of the brute-force storage.
+
+    Centroids are fit with spherical k-means (dot product on unit vectors),
+    every row carries its list assignment, and a query scores only rows whose
+    list is among the `nprobe` closest centroids. Centroids are refit when
+    the index has doubled since the last fit.
+    """
+
+    name = "ivf"
+
+    def __init__(self, nprobe: int = IVF_NPROBE, min_train: int = IVF_MIN_TRAIN, seed: int = 0):
+        super().__init__()
+        self.nprobe = nprobe
+        self.min_train = min_train
+        self._rng = np.random.default_rng(seed)
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def upsert(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        super().upsert(ids, vectors)
+        if len(self) >= self.min_train and len(self) >= 2 * self._trained_size:
+            self.train()
+
+    def train(self) -> None:
+        """Fit centroids on (a sample of) the current rows and reassign."""
+        n = len(self)
+        if n == 0:
+            return
+        data = self._matrix[:n]
+        nlist = max(1, int(np.sqrt(n)))
+        sample = data
+        if n > IVF_TRAIN_SAMPLE:
+            sample = data[self._rng.choice(n, IVF_TRAIN_SAMPLE, replace=False)]
+
+        centroids = sample[self._rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(IVF_KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]  # keep empty lists where they were
+            centroids = _normalize(sums)
+
+        self._centroids = centroids
+        self._assign = np.argmax(data @ centroids.T, axis=1).astype(np.int32)
+        self._trained_size = n
+        logger.debug(f"[VectorIndex] IVF trained: {n} vectors, {nlist} lists")
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        n = len(self)
+        if n == 0:
+            return []
+        if not self.trained:
+            return super().search(query, k)
+
+        probes = _top_k(self._centroids @ query, self.nprobe)
+        rows = np.flatnonzero(np.isin(self._assign[:n], probes))
+        if rows.size < k:
+            return super().search(query, k)
+        scores = self._matrix[rows] @ query
+        return [(self._ids[rows[i]], float(scores[i])) for i in _top_k(scores, k)]
+
+    def _ensure_capacity(self, size: int) -> None:
+        super()._ensure_capacity(size)
+        if self._assign.shape[0] < self._matrix.shape[0]:
+            grown = np.zeros(self._matrix.shape[0], dtype=np.int32)
+            grown[:self._assign.shape[0]] = self._assign
+            self._assign = grown
+
+    def _on_row_written(self, row: int) -> None:
+        if self._centroids is not None:
+            self._assign[row] = int(np.argmax(self._centroids @ self._matrix[row]))
+
+    def _on_row_moved(self, src: int, dst: int) -> None:
+        self._assign[dst] = self._assign[src]
+
+
+class Int8Engine(BruteForceEngine):
+    """
+    Scalar-quantized engine on top of the brute-force storage.
+
+    Each normalized row is stored as int8 codes with its own scale
+    (max |component| / 127), so code * scale is within scale / 2 of every
+    component and a score is within scale / 2 * |query|_1 of the exact
+    cosine. search() ranks by approximate score; within() uses the bound
+    to return every row that might reach the threshold.
+    """
+
+    name = "int8"
+    exact = False
+    _dtype = np.int8
+
+    def __init__(self):
+        super().__init__()
+        self._scales = np.zeros(0, dtype=np.float32)
+
+    def _store(self, row: int, vector: np.ndarray) -> None:
+        peak = float(np.abs(vector).max())
+        scale = peak / 127.0 if peak else 1.0
+        self._matrix[row] = np.rint(vector / scale).astype(np.int8)
+        self._scales[row] = scale
+
+    def _score_rows(self, queries: np.ndarray) -> np.ndarray:
+        n = len(self._ids)
+        return (self._matrix[:n].astype(np.float32) @ queries.T) * self._scales[:n, None]
+
+    def _error_bound(self, queries: np.ndarray) -> np.ndarray:
+        n = len(self._ids)
+        return self._scales[:n, None] * (0.5 * np.abs(queries).sum(axis=1))[None, :] + INT8_BOUND_EPS
+
+    def _ensure_capacity(self, size: int) -> None:
+        super()._ensure_capacity(size)
+        if self._scales.shape[0] < self._matrix.shape[0]:
+            grown = np.zeros(self._matrix.shape[0], dtype=np.float32)
+            grown[:self._scales.shape[0]] = self._scales
+            self._scales = grown
+
+    def _on_row_moved(self, src: int, dst: int) -> None:
+        self._scales[dst] = self._scales[src]
+
+
+ENGINES: Dict[str, Callable[[], BruteForceEngine]] = {
+    BruteForceEngine.name: BruteForceEngine,
+    IVFEngine.name: IVFEngine,
+    Int8Engine.name: Int8Engine,
+}
+
+
+# =============================================================================
+# GRAPH-BACKED INDEX
+# =============================================================================
+
+def _parse_embedding(value: Any) -> Optional[List[float]]:
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value if value else None
+
+
+class GraphVectorIndex:
+    """
+    Per-label engines for one graph, kept in sync with graph writes.
+
+    query_fn(cypher, params) must return adapter rows (lists).
+    """
+
+    def __init__(
+        self,
+        query_fn: Callable[[str, Optional[Dict[str, Any]]], List],
+        engine: Optional[str] = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        page_size: int = LOAD_PAGE_SIZE,
+    ):
+        engine = engine or os.environ.get(INDEX_ENGINE_ENV, DEFAULT_ENGINE)
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown vector index engine '{engine}' (expected one of {sorted(ENGINES)})")
+        self.engine = engine
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self._query = query_fn
+        self._engines: Dict[str, BruteForceEngine] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._dirty: Dict[str, set] = {}
+        self._lock = threading.RLock()
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def search(self, label: str, embedding: Sequence[float], k: int) -> List[Tuple[str, float]]:
+        """Top-k (node_id, cosine) for label, best first."""
+        with self._lock:
+            engine = self._sync(label)
+            query = np.asarray(embedding, dtype=np.float32)
+            if engine.dim is None or query.shape != (engine.dim,):
+                return []
+            return engine.search(_normalize(query), k)
+
+    def within(
+        self,
+        label: str,
+        embeddings: Sequence[Sequence[float]],
+        threshold: float,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        For each embedding, every (node_id, cosine) of label with cosine >= threshold, best first.
+
+        One matrix product per WITHIN_CHUNK embeddings. With an approximate
+        engine, the candidates it cannot rule out are rescored against their
+        stored embeddings (one `IN $ids` fetch), so results are exact.
+        Embeddings whose dimension differs from the label's get no hits.
+        """
+        results: List[List[Tuple[str, float]]] = [[] for _ in embeddings]
+        with self._lock:
+            engine = self._sync(label)
+            if engine.dim is None:
+                return results
+            slots = [i for i, e in enumerate(embeddings) if e is not None and len(e) == engine.dim]
+            if not slots:
+                return results
+            raw = np.asarray([embeddings[i] for i in slots], dtype=np.float64)
+            queries = _normalize(raw)
+            candidates = engine.within(queries, threshold)
+
+        if not engine.exact:
+            ids = sorted({node_id for hits in candidates for node_id, _ in hits})
+            exact = self._stored_vectors(label, ids)
+            unit = raw / np.maximum(np.linalg.norm(raw, axis=1, keepdims=True), 1e-300)
+            candidates = [
+                [(node_id, float(exact[node_id] @ unit[j])) for node_id, _ in hits if node_id in exact]
+                for j, hits in enumerate(candidates)
+            ]
+
+        for slot, hits in zip(slots, candidates):
+            results[slot] = sorted((h for h in hits if h[1] >= threshold), key=lambda h: -h[1])
+        return results
+
+    def upsert(self, label: str, node_id: str, embedding: Sequence[float]) -> None:
+        """Record a write made by this process. Unloaded labels pick it up on load."""
+        with self._lock:
+            engine = self._engines.get(label)
+            if engine is not None and embedding:
+                self._add(engine, [node_id], [embedding])
+
+    def remove(self, label: str, node_ids: Iterable[str]) -> None:
+        with self._lock:
+            engine = self._engines.get(label)
+            if engine is not None:
+                engine.remove(node_ids)
+
+    def mark_dirty(self, label: str, node_id: str) -> None:
+        """Refetch node_id's embedding before the next search of label."""
+        with self._lock:
+            if label in self._engines:
+                self._dirty.setdefault(label, set()).add(node_id)
+
+    def invalidate(self, label: Optional[str] = None) -> None:
+        """Drop a label (or everything); it reloads on next search."""
+        with self._lock:
+            for name in ([label] if label else list(self._engines)):
+                self._engines.pop(name, None)
+                self._checked_at.pop(name, None)
+                self._dirty.pop(name, None)
+
+    def on_mutation(self, event: Dict[str, Any]) -> None:
+        """Mutation listener: node writes mark their id dirty."""
+        if event.get('type') not in ('node_created', 'node_updated'):
+            return
+        data = event.get('data') or {}
+        node_id = data.get('id')
+        label = NODE_TYPE_LABELS.get(str(data.get('type', '')).lower())
+        if node_id and label:
+            # Events carry no graph name, so fetch from this graph rather than
+            # trusting the payload's embedding.
+            self.mark_dirty(label, node_id)
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    def _sync(self, label: str) -> BruteForceEngine:
+        engine = self._engines.get(label)
+        if engine is None:
+            engine = self._load(label)
+        elif time.monotonic() - self._checked_at.get(label, 0.0) >= self.refresh_interval:
+            self._reconcile(label, engine)
+
+        dirty = self._dirty.pop(label, None)
+        if dirty:
+            self._fetch(label, engine, sorted(dirty))
+        return engine
+
+    def _load(self, label: str) -> BruteForceEngine:
+        engine = ENGINES[self.engine]()
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE n.embedding IS NOT NULL AND n.id > $after
+        RETURN n.id, n.embedding
+        ORDER BY n.id
+        LIMIT $limit
+        """
+        after = ""
+        while True:
+            rows = self._query(cypher, {'after': after, 'limit': self.page_size}) or []
+            self._add(engine, [r[0] for r in rows], [r[1] for r in rows])
+            if len(rows) < self.page_size:
+                break
+            after = rows[-1][0]
+
+        self._engines[label] = engine
+        self._checked_at[label] = time.monotonic()
+        logger.info(f"[VectorIndex] Loaded {len(engine)} {label} embeddings ({self.engine})")
+        return engine
+
+    def _reconcile(self, label: str, engine: BruteForceEngine) -> None:
+        """Cheap count check; on mismatch diff ids and fetch only what is missing."""
+        self._checked_at[label] = time.monotonic()
+        rows = self._query(f"MATCH (n:{label}) WHERE n.embedding IS NOT NULL RETURN count(n)", {})
+        count = rows[0][0] if rows else 0
+        if count == len(engine):
+            return
+
+        rows = self._query(f"MATCH (n:{label}) WHERE n.embedding IS NOT NULL RETURN n.id", {})
+        graph_ids = {r[0] for r in rows or []}
+        engine.remove([i for i in engine.ids() if i not in graph_ids])
+        missing = [i for i in graph_ids if i not in engine]
+        if missing:
+            self._fetch(label, engine, missing)
+
+    def _fetch(self, label: str, engine: BruteForceEngine, node_ids: List[str]) -> None:
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE n.id IN $ids AND n.embedding IS NOT NULL
+        RETURN n.id, n.embedding
+        """
+        for start in range(0, len(node_ids), self.page_size):
+            chunk = node_ids[start:start + self.page_size]
+            rows = self._query(cypher, {'ids': chunk}) or []
+            found = {r[0] for r in rows}
+            engine.remove([i for i in chunk if i not in found])
+            self._add(engine, [r[0] for r in rows], [r[1] for r in rows])
+
+    def _stored_vectors(self, label: str, node_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Unit-length float64 embeddings of node_ids as stored in the graph."""
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE n.id IN $ids AND n.embedding IS NOT NULL
+        RETURN n.id, n.embedding
+        """
+        vectors: Dict[str, np.ndarray] = {}
+        for start in range(0, len(node_ids), self.page_size):
+            for row in self._query(cypher, {'ids': node_ids[start:start + self.page_size]}) or []:
+                try:
+                    vector = np.asarray(_parse_embedding(row[1]), dtype=np.float64)
+                except (TypeError, ValueError):
+                    continue
+                norm = np.linalg.norm(vector)
+                if norm:
+                    vectors[row[0]] = vector / norm
+        return vectors
+
+    def _add(self, engine: BruteForceEngine, ids: List[str], embeddings: List[Any]) -> None:
+        keep_ids, keep_vectors = [], []
+        for node_id, value in zip(ids, embeddings):
+            try:
+                vector = _parse_embedding(value)
+            except (TypeError, ValueError):
+                vector = None
+            if vector is None:
+                engine.remove([node_id])
+                continue
+            if engine.dim is not None and len(vector) != engine.dim:
+                logger.debug(f"[VectorIndex] Skipping {node_id}: dim {len(vector)} != {engine.dim}")
+                continue
+            if engine.dim is None and keep_vectors and len(vector) != len(keep_vectors[0]):
+                continue
+            keep_ids.append(node_id)
+            keep_vectors.append(vector)
+        if keep_ids:
+            engine.upsert(keep_ids, np.asarray(keep_vectors, dtype=np.float32))
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_indexes: Dict[Tuple[Optional[str], Optional[int], str, str], GraphVectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def database_address(adapter: Any) -> Tuple[Optional[str], Optional[int]]:
+    """(host, port) of a database adapter (Neo4j: (uri, None)) for get_vector_index."""
+    host = getattr(adapter, '_host', None) or getattr(adapter, '_uri', None)
+    return host, getattr(adapter, '_port', None)
+
+
+def get_vector_index(
+    graph_name: str,
+    query_fn: Callable[[str, Optional[Dict[str, Any]]], List],
+    engine: Optional[str] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> GraphVectorIndex:
+    """
+    Shared index for (host, port, graph_name, engine); created (and hooked to
+    mutation events) on first use with that database's query_fn.
+
+    engine defaults to MIND_VECTOR_INDEX.
+    """
+    engine = engine or os.environ.get(INDEX_ENGINE_ENV, DEFAULT_ENGINE)
+    key = (host, port, graph_name, engine)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = GraphVectorIndex(query_fn, engine=engine)
+            add_mutation_listener(index.on_mutation)
+            _indexes[key] = index
+        return index
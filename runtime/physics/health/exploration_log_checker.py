@@ -88,11 +88,22 @@ def parse_log_file(log_path: Path) -> List[StepRecord]:
         logger.warning(f"Log file not found: {log_path}")
         return steps
 
+    # (subentity_id, step_number) -> step, for deferred STEP_ANALYSIS records
+    by_key: Dict[tuple, StepRecord] = {}
+
     with open(log_path, 'r') as f:
         for line_num, line in enumerate(f, 1):
             try:
                 record = json.loads(line.strip())
 
+                # Anomalies derived at exploration end attach to their steps
+                if record.get("event") == "STEP_ANALYSIS":
+                    for entry in record.get("steps", []):
+                        target = by_key.get((entry.get("subentity_id"), entry.get("step_number")))
+                        if target is not None:
+                            target.anomalies.extend(entry.get("anomalies", []))
+                    continue
+
                 # Only process STEP-level records
                 header = record.get("header", {})
                 if header.get("level") != "STEP":
@@ -110,6 +121,7 @@ def parse_log_file(log_path: Path) -> List[StepRecord]:
                     found_narratives=record.get("found_narratives", {}),
                 )
                 steps.append(step)
+                by_key[(header.get("subentity_id"), header.get("step_number"))] = step
 
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse line {line_num}: {e}")
@@ -18,12 +18,20 @@ v1.7.2 CHANGES:
     - D5: Branch threshold is simple count (len >= 2), not ratio
     - Link scoring handles path selection via score ranking
 
+BATCHING:
+    score_outgoing_links() scores through score_links_batch(), which stacks
+    candidate, path and sibling embeddings into unit-row matrices and fills
+    the whole component table with three matrix products. Per-link results
+    equal calculate_link_score().
+
 DOCS: docs/physics/ALGORITHM_Physics.md (v1.7.2 SubEntity section)
 """
 
 from typing import List, Dict, Any, Optional, Tuple
 from math import sqrt
 
+import numpy as np
+
 
 # =============================================================================
 # COSINE SIMILARITY
@@ -75,14 +83,28 @@ def max_cosine_against_set(
     if not embedding or not embedding_set:
         return 0.0
 
-    max_sim = 0.0
-    for other in embedding_set:
-        if other:
-            sim = cosine_similarity(embedding, other)
-            if sim > max_sim:
-                max_sim = sim
+    dim = len(embedding)
+    return float(_max_cosine_rows(_unit_rows([embedding], dim), _unit_rows(embedding_set, dim))[0])
+
 
-    return max_sim
+def _unit_rows(vectors: List[List[float]], dim: int) -> np.ndarray:
+    """
+    Stack the non-empty `dim`-length vectors as unit rows (zero-norm rows stay zero).
+
+    Vectors of another length are dropped: cosine_similarity() scores them 0.0,
+    which never raises a max that starts at 0.0.
+    """
+    rows = [v for v in vectors if v and len(v) == dim]
+    matrix = np.array(rows, dtype=np.float64).reshape(len(rows), dim)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _max_cosine_rows(units: np.ndarray, against: np.ndarray) -> np.ndarray:
+    """Row-wise max_cosine_against_set() for unit rows."""
+    if against.shape[0] == 0:
+        return np.zeros(units.shape[0])
+    return np.maximum((units @ against.T).max(axis=1), 0.0)
 
 
 # =============================================================================
@@ -246,6 +268,88 @@ def calculate_link_score(
     return score, components
 
 
+def score_links_batch(
+    links: List[Dict[str, Any]],
+    from_node_id: str,
+    intention_embedding: List[float],
+    path_embeddings: List[List[float]],
+    sibling_embeddings: List[List[float]],
+) -> List[Tuple[float, Dict[str, float]]]:
+    """
+    Calculate link scores for many links in one vectorized pass.
+
+    Equivalent to calling calculate_link_score() on each link. Links whose
+    embedding length differs from the batch dimension (the intention's, or
+    the first link's when there is no intention) are scored one by one.
+
+    Args:
+        links: List of link dicts
+        from_node_id: ID of the node we're traversing FROM
+        intention_embedding: SubEntity's intention embedding
+        path_embeddings: Embeddings of links already traversed
+        sibling_embeddings: Crystallization embeddings of siblings
+
+    Returns:
+        List of (score, components) tuples, in input order
+    """
+    embeddings = [link.get('embedding') for link in links]
+    if intention_embedding:
+        dim = len(intention_embedding)
+    else:
+        dim = next((len(e) for e in embeddings if e), 0)
+    batched = [i for i, e in enumerate(embeddings) if e and len(e) == dim]
+    row_of = {i: row for row, i in enumerate(batched)}
+
+    if batched:
+        units = _unit_rows([embeddings[i] for i in batched], dim)
+        if intention_embedding:
+            semantic = units @ _unit_rows([intention_embedding], dim)[0]
+        else:
+            semantic = np.full(len(batched), 0.5)
+
+        if path_embeddings:
+            self_novelty = 1.0 - _max_cosine_rows(units, _unit_rows(path_embeddings, dim))
+        else:
+            self_novelty = np.ones(len(batched))
+
+        if sibling_embeddings:
+            sibling_divergence = 1.0 - _max_cosine_rows(units, _unit_rows(sibling_embeddings, dim))
+        else:
+            sibling_divergence = np.ones(len(batched))
+
+    results = []
+    for i, link in enumerate(links):
+        row = row_of.get(i)
+        if row is None:
+            results.append(calculate_link_score(
+                link=link,
+                from_node_id=from_node_id,
+                intention_embedding=intention_embedding,
+                path_embeddings=path_embeddings,
+                sibling_embeddings=sibling_embeddings,
+            ))
+            continue
+
+        polarity = get_polarity(link, from_node_id)
+        permanence = calculate_permanence(link.get('weight', 1.0))
+        permanence_factor = 1.0 - permanence
+        components = {
+            'semantic': float(semantic[row]),
+            'polarity': polarity,
+            'permanence': permanence,
+            'permanence_factor': permanence_factor,
+            'self_novelty': float(self_novelty[row]),
+            'sibling_divergence': float(sibling_divergence[row]),
+        }
+        score = (
+            components['semantic'] * polarity * permanence_factor
+            * components['self_novelty'] * components['sibling_divergence']
+        )
+        results.append((score, components))
+
+    return results
+
+
 def score_outgoing_links(
     links: List[Dict[str, Any]],
     from_node_id: str,
@@ -268,26 +372,25 @@ def score_outgoing_links(
     Returns:
         List of (link, score, components) tuples, sorted by score descending
     """
-    results = []
-
-    for link in links:
-        # Only consider links connected to from_node_id
-        node_a = link.get('node_a', '')
-        node_b = link.get('node_b', '')
-
-        if node_a != from_node_id and node_b != from_node_id:
-            continue
-
-        score, components = calculate_link_score(
-            link=link,
-            from_node_id=from_node_id,
-            intention_embedding=intention_embedding,
-            path_embeddings=path_embeddings,
-            sibling_embeddings=sibling_embeddings,
-        )
-
-        if score >= min_score:
-            results.append((link, score, components))
+    # Only consider links connected to from_node_id
+    connected = [
+        link for link in links
+        if link.get('node_a', '') == from_node_id or link.get('node_b', '') == from_node_id
+    ]
+
+    scores = score_links_batch(
+        links=connected,
+        from_node_id=from_node_id,
+        intention_embedding=intention_embedding,
+        path_embeddings=path_embeddings,
+        sibling_embeddings=sibling_embeddings,
+    )
+
+    results = [
+        (link, score, components)
+        for link, (score, components) in zip(connected, scores)
+        if score >= min_score
+    ]
 
     # Sort by score descending
     results.sort(key=lambda x: x[1], reverse=True)
@@ -1,7 +1,9 @@
 """
 Phase 7: Completion — Complete moments that meet criteria.
 
-Just set status. Links cool naturally.
+Possible moments that reached the threshold are validated by the canon
+holder and activated or rejected together. Active moments that reached it
+complete: just set status. Links cool naturally.
 Crystallize actor↔actor links.
 
 DOCS: docs/physics/IMPLEMENTATION_Physics.md
@@ -9,14 +11,58 @@ DOCS: docs/physics/IMPLEMENTATION_Physics.md
 
 import logging
 from typing import List, Dict, Tuple
-from runtime.physics.graph import GraphQueries, GraphOps
 
 logger = logging.getLogger(__name__)
 
+# Completion criteria (simplified: energy threshold)
+COMPLETION_THRESHOLD = 0.8
+
+
+def phase_activation(
+    queries: any,  # TickQueries
+    possible_moments: List[Dict],
+    current_tick: int,
+    resolve_moments_func: callable
+) -> List[str]:
+    """
+    Run Phase 7 activation: resolve possible moments at the threshold.
+
+    The canon holder validates all of them with one neighbourhood query and
+    writes every possible → active / possible → failed transition at once.
+    Rejected moments are left with zero energy, their share already returned.
+
+    Args:
+        queries: TickQueries instance
+        possible_moments: List of possible moments
+        current_tick: Current tick number
+        resolve_moments_func: (moment_ids, current_tick) -> {moment_id: ValidationResult}
+
+    Returns:
+        IDs of the moments activated
+    """
+    ready = []
+    for moment in possible_moments:
+        moment_id = moment.get('id')
+        m = queries.get_moment_state(moment_id)
+        if m and m.get('status') == 'possible' and (m.get('energy', 0.0) or 0.0) >= COMPLETION_THRESHOLD:
+            ready.append(moment_id)
+
+    if not ready:
+        return []
+
+    try:
+        resolved = resolve_moments_func(ready, current_tick)
+    except Exception as e:
+        logger.warning(f"[Phase 7] Activation error for {len(ready)} moments: {e}")
+        return []
+
+    activated = [moment_id for moment_id, r in resolved.items() if r.valid]
+    logger.info(f"[Phase 7] Activated {len(activated)} of {len(ready)} moments at threshold")
+    return activated
+
 
 def phase_completion(
-    read: GraphQueries,
-    write: GraphOps,
+    queries: any,  # TickQueries
     active_moments: List[Dict],
     current_tick: int,
     crystallize_actor_links_func: callable
@@ -25,8 +71,7 @@ def phase_completion(
     Run Phase 7: Completion.
 
     Args:
-        read: Graph read interface
-        write: Graph write interface
+        queries: TickQueries instance
         active_moments: List of active moments
         current_tick: Current tick number
         crystallize_actor_links_func: Function to create links between sharing actors
@@ -37,30 +82,20 @@ def phase_completion(
     completions = []
     links_crystallized = 0
 
-    # Completion criteria (simplified: energy threshold)
-    COMPLETION_THRESHOLD = 0.8
-
     for moment in active_moments:
         moment_id = moment.get('id')
 
         try:
             # Get current state
-            m = read.query(f"""
-            MATCH (m:Moment {{id: '{moment_id}'}})
-            RETURN m.energy AS energy, m.status AS status
-            """)
+            m = queries.get_moment_state(moment_id)
             if not m:
                 continue
 
-            energy = m[0].get('energy', 0.0) or 0.0
+            energy = m.get('energy', 0.0) or 0.0
 
             if energy >= COMPLETION_THRESHOLD:
                 # Complete the moment
-                write._query(f"""
-                MATCH (m:Moment {{id: '{moment_id}'}})
-                SET m.status = 'completed',
-                    m.tick_resolved = {current_tick}
-                """)
+                queries.complete_moment(moment_id, current_tick)
 
                 # Crystallize links between actors
                 crystallized = crystallize_actor_links_func(moment_id)
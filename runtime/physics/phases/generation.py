@@ -9,15 +9,13 @@ DOCS: docs/physics/IMPLEMENTATION_Physics.md
 
 import logging
 from typing import Tuple
-from runtime.physics.graph import GraphQueries, GraphOps
 from runtime.physics.constants import GENERATION_RATE
 
 logger = logging.getLogger(__name__)
 
 
 def phase_generation(
-    read: GraphQueries,
-    write: GraphOps,
+    queries: any,  # TickQueries
     player_id: str,
     calculate_proximity_func: callable
 ) -> Tuple[float, int]:
@@ -25,8 +23,7 @@ def phase_generation(
     Run Phase 1: Generation.
 
     Args:
-        read: Graph read interface
-        write: Graph write interface
+        queries: TickQueries instance
         player_id: Player actor ID
         calculate_proximity_func: Function to calculate proximity to player
 
@@ -38,12 +35,7 @@ def phase_generation(
 
     try:
         # Get all actors sorted by weight descending
-        actors = read.query("""
-        MATCH (a:Actor)
-        WHERE a.alive = true OR a.alive IS NULL
-        RETURN a.id AS id, a.weight AS weight, a.energy AS energy
-        ORDER BY a.weight DESC
-        """)
+        actors = queries.get_generating_actors()
 
         for actor in actors:
             actor_id = actor.get('id')
@@ -62,10 +54,7 @@ def phase_generation(
             total_generated += generated
 
             # Update actor
-            write._query(f"""
-            MATCH (a:Actor {{id: '{actor_id}'}})
-            SET a.energy = {new_energy}
-            """)
+            queries.set_energy('Actor', actor_id, new_energy)
             actors_updated += 1
 
     except Exception as e:
@@ -10,7 +10,6 @@ DOCS: docs/physics/IMPLEMENTATION_Physics.md
 import logging
 import math
 from typing import List, Dict
-from runtime.physics.graph import GraphOps
 from runtime.physics.constants import DRAW_RATE, TOP_N_LINKS, plutchik_proximity, PLUTCHIK_AXES
 
 logger = logging.getLogger(__name__)
@@ -22,7 +21,6 @@ def _get_link_axes(link: Dict) -> Dict[str, float]:
 
 
 def phase_moment_draw(
-    write: GraphOps,
     moments: List[Dict],
     queries: any,  # TickQueries
     energy_flows_through_func: callable
@@ -31,7 +29,6 @@ def phase_moment_draw(
     Run Phase 2: Moment Draw.
 
     Args:
-        write: Graph write interface
         moments: List of moments to process
         queries: TickQueries instance
         energy_flows_through_func: Function to record energy flow through link
@@ -87,16 +84,10 @@ def phase_moment_draw(
                     )
 
                     # Update actor
-                    write._query(f"""
-                    MATCH (a:Actor {{id: '{actor_id}'}})
-                    SET a.energy = {max(0, actor_energy)}
-                    """)
+                    queries.set_energy('Actor', actor_id, max(0, actor_energy))
 
             # Update moment
-            write._query(f"""
-            MATCH (m:Moment {{id: '{moment_id}'}})
-            SET m.energy = {moment_energy}
-            """)
+            queries.set_energy('Moment', moment_id, moment_energy)
 
         except Exception as e:
             logger.warning(f"[Phase 2] Draw error for {moment_id}: {e}")
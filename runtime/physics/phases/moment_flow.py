@@ -11,7 +11,6 @@ DOCS: docs/physics/IMPLEMENTATION_Physics.md
 import logging
 import math
 from typing import List, Dict
-from runtime.physics.graph import GraphQueries, GraphOps
 from runtime.physics.constants import (
     TICKS_PER_MINUTE, TOP_N_LINKS, plutchik_proximity, PLUTCHIK_AXES
 )
@@ -25,8 +24,6 @@ def _get_link_axes(link: Dict) -> Dict[str, float]:
 
 
 def phase_moment_flow(
-    read: GraphQueries,
-    write: GraphOps,
     active_moments: List[Dict],
     queries: any,  # TickQueries
     energy_flows_through_func: callable
@@ -35,8 +32,6 @@ def phase_moment_flow(
     Run Phase 3: Moment Flow.
 
     Args:
-        read: Graph read interface
-        write: Graph write interface
         active_moments: List of active moments
         queries: TickQueries instance
         energy_flows_through_func: Function to record energy flow through link
@@ -58,16 +53,13 @@ def phase_moment_flow(
 
         try:
             # Get current state
-            m = read.query(f"""
-            MATCH (m:Moment {{id: '{moment_id}'}})
-            RETURN m.energy AS energy, m.duration_minutes AS duration, m.weight AS weight
-            """)
+            m = queries.get_moment_state(moment_id)
             if not m:
                 continue
 
-            moment_energy = m[0].get('energy', 0.0) or 0.0
-            duration = m[0].get('duration', 1.0) or 1.0  # Default 1 minute
-            moment_weight = m[0].get('weight', 1.0) or 1.0
+            moment_energy = m.get('energy', 0.0) or 0.0
+            duration = m.get('duration', 1.0) or 1.0  # Default 1 minute
+            moment_weight = m.get('weight', 1.0) or 1.0
 
             if moment_energy <= 0.01:
                 continue
@@ -118,16 +110,10 @@ def phase_moment_flow(
                     )
 
                     # Update target
-                    write._query(f"""
-                    MATCH (n {{id: '{target_id}'}})
-                    SET n.energy = {target_energy}
-                    """)
+                    queries.set_energy(None, target_id, target_energy)
 
             # Update moment energy
-            write._query(f"""
-            MATCH (m:Moment {{id: '{moment_id}'}})
-            SET m.energy = {max(0, moment_energy)}
-            """)
+            queries.set_energy('Moment', moment_id, max(0, moment_energy))
 
         except Exception as e:
             logger.warning(f"[Phase 3] Flow error for {moment_id}: {e}")
@@ -6,96 +6,126 @@ If proximity < 0.3: contradict (m1 drains m2)
 
 Only between moments sharing narratives.
 
+Batched: the moment→narrative ABOUT incidence and every moment's Plutchik
+axes are fetched in one query each. Shared-narrative pairs come from one
+incidence product, and all pairwise proximities from one vectorized pass
+over the four axes.
+
 DOCS: docs/physics/IMPLEMENTATION_Physics.md
 """
 
 import logging
-import math
-from typing import List, Dict
-from runtime.physics.graph import GraphOps
+from typing import List, Dict, Tuple
+import numpy as np
 from runtime.physics.constants import (
-    SUPPORT_THRESHOLD, CONTRADICT_THRESHOLD, INTERACTION_RATE, plutchik_proximity, PLUTCHIK_AXES
+    SUPPORT_THRESHOLD, CONTRADICT_THRESHOLD, INTERACTION_RATE, PLUTCHIK_AXES
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _shared_narrative_matrix(moment_ids: List[str], incidence: List[Tuple[str, str]]) -> np.ndarray:
+    """
+    Boolean (N, N) matrix: True where two moments are ABOUT a common narrative.
+
+    Incidence columns are restricted to narratives the moments actually
+    reference, so the product stays O(N² × referenced narratives).
+    """
+    rows_by_id: Dict[str, List[int]] = {}
+    for i, mid in enumerate(moment_ids):
+        rows_by_id.setdefault(mid, []).append(i)
+
+    columns: Dict[str, int] = {}
+    entries = []
+    for moment_id, narrative_id in incidence:
+        col = columns.setdefault(narrative_id, len(columns))
+        for row in rows_by_id.get(moment_id, ()):
+            entries.append((row, col))
+
+    a = np.zeros((len(moment_ids), len(columns)), dtype=np.float32)
+    if entries:
+        rows, cols = zip(*entries)
+        a[list(rows), list(cols)] = 1.0
+    return (a @ a.T) > 0
+
+
+def _plutchik_proximity_matrix(axes: np.ndarray) -> np.ndarray:
+    """Pairwise plutchik_proximity for an (N, 4) axes matrix."""
+    diff = axes[:, None, :] - axes[None, :, :]
+    distance = np.sqrt((diff * diff).sum(axis=2)) / 4.0
+    return np.maximum(0.0, 1.0 - distance)
+
+
 def phase_moment_interaction(
-    write: GraphOps,
     active_moments: List[Dict],
     queries: any  # TickQueries
 ) -> float:
     """
     Run Phase 4: Moment Interaction.
 
+    Moments are taken in list order and m1 only acts on later moments.
+    Energies come from the active_moments list, and when several earlier
+    moments act on m2 the last one's result is what gets written, exactly
+    as the pairwise loop this replaces did.
+
     Args:
-        write: Graph write interface
         active_moments: List of active moments
         queries: TickQueries instance
 
     Returns:
         total_interacted
     """
-    total_interacted = 0.0
+    n = len(active_moments)
+    if n < 2:
+        return 0.0
 
-    if len(active_moments) < 2:
+    try:
+        moment_ids = [m.get('id') for m in active_moments]
+        axes_by_id = queries.get_moment_axes_batch(moment_ids)
+        incidence = queries.get_about_incidence(moment_ids)
+    except Exception as e:
+        logger.warning(f"[Phase 4] Interaction fetch error: {e}")
         return 0.0
 
-    # Get Plutchik axes for each moment
-    moment_axes = {}
-    for m in active_moments:
-        mid = m.get('id')
-        moment_axes[mid] = queries.get_moment_axes(mid)
-
-    for i, m1 in enumerate(active_moments):
-        m1_id = m1.get('id')
-        m1_energy = m1.get('energy', 0.0) or 0.0
-
-        if m1_energy <= 0.01:
-            continue
-
-        for m2 in active_moments[i+1:]:
-            m2_id = m2.get('id')
-            m2_energy = m2.get('energy', 0.0) or 0.0
-
-            try:
-                # Check for shared narratives
-                shared = queries.get_shared_narratives(m1_id, m2_id)
-                if not shared:
-                    continue
-
-                # Calculate Plutchik proximity
-                default_axes = {axis: 0.0 for axis in PLUTCHIK_AXES}
-                proximity = plutchik_proximity(
-                    moment_axes.get(m1_id, default_axes),
-                    moment_axes.get(m2_id, default_axes)
-                )
-
-                if proximity > SUPPORT_THRESHOLD:
-                    # Support: m1 feeds m2
-                    support = m1_energy * INTERACTION_RATE * proximity
-                    m2_weight = m2.get('weight', 1.0) or 1.0
-                    received = support * math.sqrt(m2_weight)
-                    m2_energy += received
-                    total_interacted += support
-
-                    write._query(f"""
-                    MATCH (m:Moment {{id: '{m2_id}'}})
-                    SET m.energy = {m2_energy}
-                    """)
-
-                elif proximity < CONTRADICT_THRESHOLD:
-                    # Contradict: m1 drains m2
-                    suppress = m1_energy * INTERACTION_RATE * (1 - proximity)
-                    m2_energy = max(0, m2_energy - suppress)
-                    total_interacted += suppress
-
-                    write._query(f"""
-                    MATCH (m:Moment {{id: '{m2_id}'}})
-                    SET m.energy = {m2_energy}
-                    """)
-
-            except Exception as e:
-                logger.warning(f"[Phase 4] Interaction error {m1_id} <-> {m2_id}: {e}")
+    default_axes = {axis: 0.0 for axis in PLUTCHIK_AXES}
+    axes = np.array([
+        [axes_by_id.get(mid, default_axes).get(axis, 0.0) for axis in PLUTCHIK_AXES]
+        for mid in moment_ids
+    ], dtype=np.float64)
+    energy = np.array([m.get('energy', 0.0) or 0.0 for m in active_moments], dtype=np.float64)
+    weight = np.array([m.get('weight', 1.0) or 1.0 for m in active_moments], dtype=np.float64)
+
+    # Candidate pairs: i < j, shared narrative, m1 has energy to give
+    candidates = (
+        np.triu(np.ones((n, n), dtype=bool), k=1)
+        & _shared_narrative_matrix(moment_ids, incidence)
+        & (energy > 0.01)[:, None]
+    )
+    proximity = _plutchik_proximity_matrix(axes)
+
+    supports = candidates & (proximity > SUPPORT_THRESHOLD)
+    contradicts = candidates & (proximity < CONTRADICT_THRESHOLD)
+
+    support = energy[:, None] * INTERACTION_RATE * proximity
+    suppress = energy[:, None] * INTERACTION_RATE * (1 - proximity)
+    total_interacted = float(support[supports].sum() + suppress[contradicts].sum())
+
+    # Each m2 ends up with the effect of the last m1 that touched it
+    interacting = supports | contradicts
+    touched = np.flatnonzero(interacting.any(axis=0))
+    last_m1 = n - 1 - np.argmax(interacting[::-1, :], axis=0)
+
+    for j in touched:
+        i = last_m1[j]
+        if supports[i, j]:
+            m2_energy = energy[j] + support[i, j] * np.sqrt(weight[j])
+        else:
+            m2_energy = max(0, energy[j] - suppress[i, j])
+
+        m2_id = moment_ids[j]
+        try:
+            queries.set_energy('Moment', m2_id, float(m2_energy))
+        except Exception as e:
+            logger.warning(f"[Phase 4] Interaction error {moment_ids[i]} <-> {m2_id}: {e}")
 
     return total_interacted
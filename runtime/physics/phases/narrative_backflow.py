@@ -9,7 +9,6 @@ DOCS: docs/physics/IMPLEMENTATION_Physics.md
 
 import logging
 import math
-from runtime.physics.graph import GraphQueries, GraphOps
 from runtime.physics.constants import (
     BACKFLOW_RATE, COLD_THRESHOLD, TOP_N_LINKS, plutchik_proximity, PLUTCHIK_AXES
 )
@@ -27,8 +26,6 @@ def _get_link_axes(link: dict) -> dict:
 
 
 def phase_narrative_backflow(
-    read: GraphQueries,
-    write: GraphOps,
     queries: any,  # TickQueries
     energy_flows_through_func: callable
 ) -> float:
@@ -36,8 +33,6 @@ def phase_narrative_backflow(
     Run Phase 5: Narrative Backflow.
 
     Args:
-        read: Graph read interface
-        write: Graph write interface
         queries: TickQueries instance
         energy_flows_through_func: Function to record energy flow through link
 
@@ -49,13 +44,7 @@ def phase_narrative_backflow(
     try:
         # Get TOP N narratives by energy (not all 1600+)
         # This prevents O(N) query explosion while prioritizing hot narratives
-        narratives = read.query(f"""
-        MATCH (n:Narrative)
-        WHERE n.energy > 0.01
-        RETURN n.id AS id, n.energy AS energy
-        ORDER BY n.energy DESC
-        LIMIT {MAX_NARRATIVES_PER_TICK}
-        """)
+        narratives = queries.get_top_narratives(0.01, MAX_NARRATIVES_PER_TICK)
 
         for narr in narratives:
             narr_id = narr.get('id')
@@ -98,16 +87,10 @@ def phase_narrative_backflow(
                     )
 
                     # Update actor
-                    write._query(f"""
-                    MATCH (a:Actor {{id: '{actor_id}'}})
-                    SET a.energy = {actor_energy}
-                    """)
+                    queries.set_energy('Actor', actor_id, actor_energy)
 
             # Update narrative
-            write._query(f"""
-            MATCH (n:Narrative {{id: '{narr_id}'}})
-            SET n.energy = {max(0, narr_energy)}
-            """)
+            queries.set_energy('Narrative', narr_id, max(0, narr_energy))
 
     except Exception as e:
         logger.warning(f"[Phase 5] Backflow error: {e}")
@@ -9,15 +9,13 @@ DOCS: docs/physics/IMPLEMENTATION_Physics.md
 
 import logging
 from typing import List, Dict
-from runtime.physics.graph import GraphQueries, GraphOps
 from runtime.physics.constants import REJECTION_RETURN_RATE
 
 logger = logging.getLogger(__name__)
 
 
 def phase_rejection(
-    read: GraphQueries,
-    write: GraphOps,
+    queries: any,  # TickQueries
     possible_moments: List[Dict],
     player_id: str,
     current_tick: int
@@ -26,8 +24,7 @@ def phase_rejection(
     Run Phase 8: Rejection.
 
     Args:
-        read: Graph read interface
-        write: Graph write interface
+        queries: TickQueries instance
         possible_moments: List of possible moments
         player_id: Player actor ID
         current_tick: Current tick number
@@ -39,11 +36,7 @@ def phase_rejection(
 
     try:
         # Get moments marked for rejection
-        rejected = read.query("""
-        MATCH (m:Moment)
-        WHERE m.status: "failed" AND m.energy > 0
-        RETURN m.id AS id, m.energy AS energy
-        """)
+        rejected = queries.get_failed_moments()
 
         for moment in rejected:
             moment_id = moment.get('id')
@@ -53,25 +46,13 @@ def phase_rejection(
             return_energy = energy * REJECTION_RETURN_RATE
 
             # Get player's current energy
-            player = read.query(f"""
-            MATCH (p:Actor {{id: '{player_id}'}})
-            RETURN p.energy AS energy
-            """)
+            player_energy = queries.get_actor_energy(player_id)
 
-            if player:
-                player_energy = player[0].get('energy', 0.0) or 0.0
-                new_energy = player_energy + return_energy
-
-                write._query(f"""
-                MATCH (p:Actor {{id: '{player_id}'}})
-                SET p.energy = {new_energy}
-                """)
+            if player_energy is not None:
+                queries.set_energy('Actor', player_id, player_energy + return_energy)
 
             # Clear moment energy
-            write._query(f"""
-            MATCH (m:Moment {{id: '{moment_id}'}})
-            SET m.energy = 0, m.tick_resolved = {current_tick}
-            """)
+            queries.clear_moment_energy(moment_id, current_tick)
 
             rejections.append({
                 'moment_id': moment_id,
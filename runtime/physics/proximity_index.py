@@ -0,0 +1,368 @@
+"""
+Proximity Index — persistent player-rooted shortest-resistance tree.
+
+Phase 1 gates generation by proximity = 1 / (1 + resistance(player, actor)).
+Instead of rescanning every edge and rerunning Dijkstra each tick, the
+index keeps the shortest-resistance tree between ticks and repairs it
+incrementally (dynamic SSSP) as links change:
+
+    - resistance decrease / new link: relax from the cheaper endpoint
+    - resistance increase / removed link on a tree edge: invalidate the
+      child's subtree and re-derive it from its intact boundary
+    - changes to non-tree links that only get more expensive are no-ops
+
+Both kinds of change in one batch are repaired with a single heap pass.
+
+Change sources:
+    - the tick reports links it modified (cooling, crystallization)
+    - graph mutation events mark touched nodes; their incident links are
+      refreshed in one query at the next sync
+    - an optional periodic full rebuild (paged, no edge cap) catches
+      writers that bypass mutation events
+
+Hop limit: nodes deeper than max_hops in the tree are treated as blocked.
+
+DOCS: docs/physics/IMPLEMENTATION_Physics.md
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from runtime.physics.constants import (
+    BLOCKED_PATH_RESISTANCE, MAX_PATH_HOPS, PLUTCHIK_AXES, plutchik_intensity
+)
+from runtime.physics.graph.graph_query_utils import calculate_link_resistance
+
+logger = logging.getLogger(__name__)
+
+# Edges fetched per page during a full rebuild
+PROXIMITY_PAGE_SIZE = 10000
+
+# Event data keys that name link endpoints (graph_ops_apply link dicts)
+_ENDPOINT_KEYS = (
+    'from', 'to', 'node_a', 'node_b', 'source', 'target',
+    'character', 'actor', 'narrative', 'moment', 'place', 'thing',
+    'parent', 'child', 'holder', 'location',
+)
+
+_LINK_RETURN = """a.id AS node_a, b.id AS node_b, type(r) AS type,
+               r.weight AS weight,
+               r.joy_sadness AS joy_sadness,
+               r.trust_disgust AS trust_disgust,
+               r.fear_anger AS fear_anger,
+               r.surprise_anticipation AS surprise_anticipation"""
+
+EdgeKey = Tuple[str, str, str]
+
+
+def link_emotion_factor(link: Dict[str, Any]) -> float:
+    """Emotion factor of a link row: Plutchik intensity of its axes, floored at 0.1."""
+    axes = {axis: link[axis] for axis in PLUTCHIK_AXES if link.get(axis) is not None}
+    return max(0.1, plutchik_intensity(axes))
+
+
+def link_resistance(link: Dict[str, Any]) -> float:
+    """Path resistance of a link row (weight + Plutchik axes)."""
+    weight = link.get('weight', 1.0) or 1.0
+    return calculate_link_resistance(weight, link_emotion_factor(link))
+
+
+class ProximityIndex:
+    """
+    Player-rooted shortest-resistance tree, maintained across ticks.
+
+    Links are treated as undirected; parallel links between the same pair
+    use the cheapest one. Link identity is (node_a, node_b, type).
+    """
+
+    def __init__(self, max_hops: int = MAX_PATH_HOPS, resync_every: int = 0):
+        """
+        Args:
+            max_hops: Tree depth beyond which nodes count as blocked
+            resync_every: Full rebuild every N syncs (0 = only when needed)
+        """
+        self.max_hops = max_hops
+        self.resync_every = resync_every
+        self.root: Optional[str] = None
+
+        # Graph: node -> neighbor -> {edge_key: resistance}
+        self._adj: Dict[str, Dict[str, Dict[EdgeKey, float]]] = {}
+        self._edge_count = 0
+
+        # Tree
+        self.dist: Dict[str, float] = {}
+        self.parent: Dict[str, Optional[str]] = {}
+        self.depth: Dict[str, int] = {}
+        self._children: Dict[str, Set[str]] = {}
+
+        self._built = False
+        self._syncs = 0
+        self._dirty_nodes: Set[str] = set()
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    # =========================================================================
+    # LOOKUP
+    # =========================================================================
+
+    def resistance(self, node_id: str) -> float:
+        """Resistance from the root, or BLOCKED_PATH_RESISTANCE if unreachable."""
+        d = self.dist.get(node_id)
+        if d is None or math.isinf(d) or self.depth.get(node_id, 0) > self.max_hops:
+            return BLOCKED_PATH_RESISTANCE
+        return d
+
+    def distances(self) -> Dict[str, float]:
+        """All nodes reachable within max_hops, mapped to their resistance."""
+        return {
+            n: d for n, d in self.dist.items()
+            if self.depth[n] <= self.max_hops and not math.isinf(d)
+        }
+
+    # =========================================================================
+    # SYNC
+    # =========================================================================
+
+    def sync(self, read, root: str) -> None:
+        """
+        Bring the tree up to date before a tick.
+
+        Rebuilds from scratch on first use, when the root changes, or when
+        a periodic resync is due; otherwise refreshes only the links of
+        nodes touched by mutation events since the last sync.
+        """
+        self._syncs += 1
+        resync_due = self.resync_every and self._syncs % self.resync_every == 0
+        if not self._built or root != self.root or resync_due:
+            self.build(read, root)
+            return
+
+        with self._lock:
+            dirty, self._dirty_nodes = self._dirty_nodes, set()
+        if dirty:
+            self.refresh_nodes(read, dirty)
+
+    def build(self, read, root: str) -> None:
+        """Load every link (paged, no cap) and compute the tree from scratch."""
+        with self._lock:
+            self._dirty_nodes.clear()
+        self._adj = {}
+        self._edge_count = 0
+
+        after = -1
+        while True:
+            rows = read.query(f"""
+            MATCH (a)-[r]->(b)
+            WHERE id(r) > $after AND a.id IS NOT NULL AND b.id IS NOT NULL
+            RETURN id(r) AS rid, {_LINK_RETURN}
+            ORDER BY rid
+            LIMIT $limit
+            """, {'after': after, 'limit': PROXIMITY_PAGE_SIZE})
+            for row in rows:
+                self._set_edge(self._key(row), link_resistance(row))
+            if len(rows) < PROXIMITY_PAGE_SIZE:
+                break
+            after = rows[-1]['rid']
+
+        self.set_root(root)
+        self._built = True
+        logger.debug(f"[Proximity] Built index: {self._edge_count} links, {len(self.dist)} reached")
+
+    def set_root(self, root: str) -> None:
+        """Recompute the whole tree from a (new) root."""
+        self.root = root
+        self.dist = {root: 0.0}
+        self.parent = {root: None}
+        self.depth = {root: 0}
+        self._children = {}
+        heap = []
+        self._relax_from(root, heap)
+        self._propagate(heap)
+
+    def refresh_nodes(self, read, node_ids: Iterable[str]) -> int:
+        """Re-read every link incident to node_ids and repair the tree."""
+        ids = [n for n in set(node_ids) if n]
+        if not ids:
+            return 0
+        rows = read.query(f"""
+        MATCH (n)-[r]-()
+        WHERE n.id IN $ids
+        WITH DISTINCT r
+        WITH r, startNode(r) AS a, endNode(r) AS b
+        WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+        RETURN {_LINK_RETURN}
+        """, {'ids': ids})
+
+        fresh = {self._key(row): link_resistance(row) for row in rows}
+        changes = list(fresh.items())
+        for node_id in ids:
+            for neighbor, keys in list(self._adj.get(node_id, {}).items()):
+                changes.extend((key, None) for key in keys if key not in fresh)
+        return self.apply_changes(changes)
+
+    def update_links(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Apply link rows (node_a, node_b, type, weight, axes) reported by the tick."""
+        if not self._built:
+            return 0
+        return self.apply_changes(
+            (self._key(row), link_resistance(row)) for row in rows
+            if row.get('node_a') and row.get('node_b')
+        )
+
+    def on_mutation(self, event: Dict[str, Any]) -> None:
+        """Mutation listener: remember nodes whose links may have changed."""
+        if not str(event.get('type', '')).startswith('link_'):
+            return
+        data = event.get('data') or {}
+        touched = {data[k] for k in _ENDPOINT_KEYS if isinstance(data.get(k), str)}
+        if touched:
+            with self._lock:
+                self._dirty_nodes.update(touched)
+
+    # =========================================================================
+    # DYNAMIC SSSP
+    # =========================================================================
+
+    def apply_changes(self, changes: Iterable[Tuple[EdgeKey, Optional[float]]]) -> int:
+        """
+        Apply link changes and repair the tree.
+
+        Args:
+            changes: (edge_key, resistance) pairs; resistance None removes the link
+
+        Returns:
+            Number of nodes whose resistance changed
+        """
+        decreased: List[Tuple[str, str]] = []
+        invalid_roots: Set[str] = set()
+
+        for key, resistance in changes:
+            a, b = key[0], key[1]
+            if a == b:
+                continue
+            old_w = self._weight(a, b)
+            if resistance is None:
+                self._remove_edge(key)
+            else:
+                self._set_edge(key, resistance)
+            new_w = self._weight(a, b)
+
+            if new_w < old_w:
+                decreased.append((a, b))
+            elif new_w > old_w:
+                if self.parent.get(b) == a:
+                    invalid_roots.add(b)
+                elif self.parent.get(a) == b:
+                    invalid_roots.add(a)
+
+        if not decreased and not invalid_roots:
+            return 0
+
+        before = dict(self.dist)
+        heap: List[tuple] = []
+
+        # Increases: drop affected subtrees, re-seed them from their boundary
+        invalid = self._invalidate(invalid_roots)
+        for v in invalid:
+            for u, keys in self._adj.get(v, {}).items():
+                if u in self.dist:
+                    self._push(heap, self.dist[u] + min(keys.values()), v, u)
+
+        # Decreases: relax across the cheaper link in both directions
+        for a, b in decreased:
+            w = self._weight(a, b)
+            for u, v in ((a, b), (b, a)):
+                if u in self.dist:
+                    self._push(heap, self.dist[u] + w, v, u)
+
+        self._propagate(heap)
+
+        changed = sum(1 for n in invalid if before.get(n) != self.dist.get(n))
+        changed += sum(1 for n, d in self.dist.items() if n not in invalid and before.get(n) != d)
+        return changed
+
+    def _invalidate(self, roots: Set[str]) -> Set[str]:
+        """Remove the subtrees under roots from the tree; return removed nodes."""
+        removed: Set[str] = set()
+        stack = [r for r in roots if r != self.root and r in self.dist]
+        while stack:
+            v = stack.pop()
+            if v in removed:
+                continue
+            removed.add(v)
+            stack.extend(self._children.get(v, ()))
+        for v in removed:
+            p = self.parent.pop(v, None)
+            if p is not None and p not in removed:
+                self._children.get(p, set()).discard(v)
+            self._children.pop(v, None)
+            self.dist.pop(v, None)
+            self.depth.pop(v, None)
+        return removed
+
+    def _propagate(self, heap: List[tuple]) -> None:
+        """Label-correcting Dijkstra from the seeded heap."""
+        while heap:
+            d, _, v, p = heapq.heappop(heap)
+            if d >= self.dist.get(v, math.inf):
+                continue
+            old_parent = self.parent.get(v)
+            if old_parent is not None:
+                self._children.get(old_parent, set()).discard(v)
+            self.parent[v] = p
+            self._children.setdefault(p, set()).add(v)
+            self.dist[v] = d
+            self.depth[v] = self.depth[p] + 1
+            self._relax_from(v, heap)
+
+    def _relax_from(self, u: str, heap: List[tuple]) -> None:
+        d = self.dist[u]
+        for x, keys in self._adj.get(u, {}).items():
+            nd = d + min(keys.values())
+            if nd < self.dist.get(x, math.inf):
+                self._push(heap, nd, x, u)
+
+    def _push(self, heap: List[tuple], d: float, v: str, p: str) -> None:
+        if not math.isinf(d):
+            heapq.heappush(heap, (d, next(self._seq), v, p))
+
+    # =========================================================================
+    # GRAPH STORAGE
+    # =========================================================================
+
+    @staticmethod
+    def _key(row: Dict[str, Any]) -> EdgeKey:
+        return (row.get('node_a'), row.get('node_b'), row.get('type') or '')
+
+    def _weight(self, a: str, b: str) -> float:
+        keys = self._adj.get(a, {}).get(b)
+        return min(keys.values()) if keys else math.inf
+
+    def _set_edge(self, key: EdgeKey, resistance: float) -> None:
+        a, b = key[0], key[1]
+        if not a or not b or a == b:
+            return
+        slot = self._adj.setdefault(a, {}).setdefault(b, {})
+        if key not in slot:
+            self._edge_count += 1
+        slot[key] = resistance
+        self._adj.setdefault(b, {}).setdefault(a, {})[key] = resistance
+
+    def _remove_edge(self, key: EdgeKey) -> None:
+        a, b = key[0], key[1]
+        for u, v in ((a, b), (b, a)):
+            slot = self._adj.get(u, {}).get(v)
+            if slot and key in slot:
+                del slot[key]
+                if u == a:
+                    self._edge_count -= 1
+                if not slot:
+                    del self._adj[u][v]
@@ -82,31 +82,34 @@ def run_until_next_moment(
     stopped_reason = "max_ticks_reached"
     final_result = None
 
-    for tick_num in range(max_ticks):
-        result = tick_runner.run()
-        ticks_run += 1
-        final_result = result
-
-        if verbose:
-            logger.info(f"[tick {ticks_run}] generated={result.energy_generated:.2f} "
-                       f"active={result.moments_active} completed={result.moments_completed}")
-
-        # Check for completions
-        if result.completions:
-            completions.extend(result.completions)
-            stopped_reason = "moment_completed"
-            break
-
-        # Early exit if no energy (nothing will happen)
-        total_energy = (
-            result.energy_generated +
-            result.energy_drawn +
-            result.energy_flowed +
-            result.energy_backflowed
-        )
-        if total_energy == 0 and ticks_run > 5:
-            stopped_reason = "no_energy_in_system"
-            break
+    try:
+        for tick_num in range(max_ticks):
+            result = tick_runner.run()
+            ticks_run += 1
+            final_result = result
+
+            if verbose:
+                logger.info(f"[tick {ticks_run}] generated={result.energy_generated:.2f} "
+                           f"active={result.moments_active} completed={result.moments_completed}")
+
+            # Check for completions
+            if result.completions:
+                completions.extend(result.completions)
+                stopped_reason = "moment_completed"
+                break
+
+            # Early exit if no energy (nothing will happen)
+            total_energy = (
+                result.energy_generated +
+                result.energy_drawn +
+                result.energy_flowed +
+                result.energy_backflowed
+            )
+            if total_energy == 0 and ticks_run > 5:
+                stopped_reason = "no_energy_in_system"
+                break
+    finally:
+        tick_runner.close()
 
     final_stats = {}
     if final_result:
@@ -160,50 +163,53 @@ def run_until_completion_or_interruption(
     stopped_reason = "max_ticks_reached"
     final_result = None
 
-    for tick_num in range(max_ticks):
-        result = tick_runner.run()
-        ticks_run += 1
-        final_result = result
-
-        if verbose:
-            logger.info(f"[tick {ticks_run}] generated={result.energy_generated:.2f} "
-                       f"active={result.moments_active} completed={result.moments_completed} "
-                       f"interrupted={getattr(result, 'moments_interrupted', 0)}")
-
-        # Check for completions
-        if result.completions:
-            completions.extend(result.completions)
-            stopped_reason = "moment_completed"
-            break
-
-        # Check for interruptions (if available in result)
-        if hasattr(result, 'interruptions') and result.interruptions:
-            interruptions.extend(result.interruptions)
-            stopped_reason = "moment_interrupted"
-            break
-
-        # Check for overrides (if available in result)
-        if hasattr(result, 'overrides') and result.overrides:
-            interruptions.extend(result.overrides)
-            stopped_reason = "moment_overridden"
-            break
-
-        # Check rejections as a form of interruption
-        if result.rejections:
-            interruptions.extend(result.rejections)
-            stopped_reason = "moment_rejected"
-            break
-
-        # Early exit if no energy
-        total_energy = (
-            result.energy_generated +
-            result.energy_drawn +
-            result.energy_flowed +
-            result.energy_backflowed
-        )
-        if total_energy == 0 and ticks_run > 5:
-            stopped_reason = "no_energy_in_system"
-            break
+    try:
+        for tick_num in range(max_ticks):
+            result = tick_runner.run()
+            ticks_run += 1
+            final_result = result
+
+            if verbose:
+                logger.info(f"[tick {ticks_run}] generated={result.energy_generated:.2f} "
+                           f"active={result.moments_active} completed={result.moments_completed} "
+                           f"interrupted={getattr(result, 'moments_interrupted', 0)}")
+
+            # Check for completions
+            if result.completions:
+                completions.extend(result.completions)
+                stopped_reason = "moment_completed"
+                break
+
+            # Check for interruptions (if available in result)
+            if hasattr(result, 'interruptions') and result.interruptions:
+                interruptions.extend(result.interruptions)
+                stopped_reason = "moment_interrupted"
+                break
+
+            # Check for overrides (if available in result)
+            if hasattr(result, 'overrides') and result.overrides:
+                interruptions.extend(result.overrides)
+                stopped_reason = "moment_overridden"
+                break
+
+            # Check rejections as a form of interruption
+            if result.rejections:
+                interruptions.extend(result.rejections)
+                stopped_reason = "moment_rejected"
+                break
+
+            # Early exit if no energy
+            total_energy = (
+                result.energy_generated +
+                result.energy_drawn +
+                result.energy_flowed +
+                result.energy_backflowed
+            )
+            if total_energy == 0 and ticks_run > 5:
+                stopped_reason = "no_energy_in_system"
+                break
+    finally:
+        tick_runner.close()
 
     final_stats = {}
     if final_result:
@@ -8,12 +8,15 @@ DOCS: docs/physics/algorithms/ALGORITHM_Physics_Schema_v1.2_Energy_Physics.md
 """
 
 import logging
-from typing import List, Dict, Any, Tuple
-from runtime.physics.graph import GraphQueries, GraphOps
+import os
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
+from runtime.physics.graph import GraphQueries, GraphOps, add_mutation_listener, remove_mutation_listener
 from runtime.physics.tick_v1_2_types import TickResultV1_2
 from runtime.physics.tick_v1_2_queries import TickQueries
-from runtime.physics.graph.graph_query_utils import dijkstra_with_resistance, dijkstra_single_source
-from runtime.physics.constants import BLOCKED_PATH_RESISTANCE, MAX_PATH_HOPS, plutchik_intensity
+from runtime.physics.tick_v1_2_snapshot import SnapshotTickQueries
+from runtime.physics.proximity_index import ProximityIndex
+from runtime.physics.constants import MAX_PATH_HOPS, PROXIMITY_RESYNC_TICKS
 
 # Import phases
 from runtime.physics.phases.generation import phase_generation
@@ -22,17 +25,37 @@ from runtime.physics.phases.moment_flow import phase_moment_flow
 from runtime.physics.phases.moment_interaction import phase_moment_interaction
 from runtime.physics.phases.narrative_backflow import phase_narrative_backflow
 from runtime.physics.phases.link_cooling import phase_link_cooling
-from runtime.physics.phases.completion import phase_completion
+from runtime.physics.phases.completion import phase_activation, phase_completion
 from runtime.physics.phases.rejection import phase_rejection
 
 logger = logging.getLogger(__name__)
 
+# Set to 0 to run every tick on the per-query path
+SNAPSHOT_ENV = "MIND_TICK_SNAPSHOT"
+
+
+def _snapshot_default() -> bool:
+    """Snapshot mode unless MIND_TICK_SNAPSHOT disables it (default: on)."""
+    return os.environ.get(SNAPSHOT_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
 
 class GraphTickV1_2:
     """
     Schema v1.2 Energy Physics Tick Engine.
 
     NO DECAY. Energy flows through links and cools naturally.
+
+    In snapshot mode (the default; snapshot=False or MIND_TICK_SNAPSHOT=0
+    turns it off), each tick loads the tick subgraph into memory once, runs
+    all phases against it and writes back a single diff, instead of issuing
+    per-moment and per-pair queries. A tick whose snapshot fails to load
+    falls back to the per-query path.
+
+    Proximity to the player is kept in a ProximityIndex that persists
+    across ticks and is repaired incrementally from the links each tick
+    changes and from graph mutation events; a full rebuild every
+    proximity_resync_every ticks catches writers that emit none. The index
+    listens for mutation events until close() is called.
     """
 
     def __init__(
@@ -41,14 +64,20 @@ class GraphTickV1_2:
         host: str = "localhost",
         port: int = 6379,
         read: GraphQueries = None,
-        write: GraphOps = None
+        write: GraphOps = None,
+        snapshot: Optional[bool] = None,
+        proximity_resync_every: int = PROXIMITY_RESYNC_TICKS
     ):
         self.read = read or GraphQueries(graph_name=graph_name, host=host, port=port)
         self.write = write or GraphOps(graph_name=graph_name, host=host, port=port)
-        self.queries = TickQueries(self.read)
+        self.queries = TickQueries(self.read, self.write)
+        from runtime.infrastructure.canon import CanonHolder  # Imports runtime.physics
+        self.canon = CanonHolder(self.read, self.write)
         self.graph_name = graph_name
+        self.snapshot = _snapshot_default() if snapshot is None else snapshot
         self._tick_count = 0
-        self._proximity_cache: Dict[str, float] = {}  # node_id -> resistance from player
+        self.proximity = ProximityIndex(MAX_PATH_HOPS, resync_every=proximity_resync_every)
+        add_mutation_listener(self.proximity.on_mutation)
 
         logger.info(f"[GraphTick v1.2] Initialized for {graph_name}")
 
@@ -83,6 +112,7 @@ class GraphTickV1_2:
                 combined_result.actors_updated = max(combined_result.actors_updated, res.actors_updated)
                 combined_result.moments_active = res.moments_active
                 combined_result.moments_possible = res.moments_possible
+                combined_result.moments_activated += res.moments_activated
                 combined_result.moments_completed += res.moments_completed
                 combined_result.moments_rejected += res.moments_rejected
                 combined_result.links_cooled += res.links_cooled
@@ -111,48 +141,55 @@ class GraphTickV1_2:
         # Pre-compute all proximities in ONE Dijkstra pass
         self._compute_all_proximities(player_id)
 
+        queries = self._open_tick_queries()
+
         # Phase 1: Generation (proximity-gated)
         result.energy_generated, result.actors_updated = phase_generation(
-            self.read, self.write, player_id, self._calculate_proximity
+            queries, player_id, self._calculate_proximity
         )
 
         # Phase 2: Moment Draw (possible + active)
-        possible_moments = self.queries.get_moments_by_status('possible')
-        active_moments = self.queries.get_moments_by_status('active')
+        possible_moments = queries.get_moments_by_status('possible')
+        active_moments = queries.get_moments_by_status('active')
         result.moments_possible = len(possible_moments)
         result.moments_active = len(active_moments)
 
         all_draw_moments = possible_moments + active_moments
         result.energy_drawn = phase_moment_draw(
-            self.write, all_draw_moments, self.queries, self._energy_flows_through
+            all_draw_moments, queries, self._energy_flows_through
         )
 
         # Phase 3: Moment Flow (active only, duration-based)
         result.energy_flowed = phase_moment_flow(
-            self.read, self.write, active_moments, self.queries, self._energy_flows_through
+            active_moments, queries, self._energy_flows_through
         )
 
         # Phase 4: Moment Interaction (support/contradict)
         result.energy_interacted = phase_moment_interaction(
-            self.write, active_moments, self.queries
+            active_moments, queries
         )
 
         # Phase 5: Narrative Backflow (link.energy gated)
         result.energy_backflowed = phase_narrative_backflow(
-            self.read, self.write, self.queries, self._energy_flows_through
+            queries, self._energy_flows_through
         )
 
         # Phase 6: Link Cooling (drain)
-        result.energy_cooled, result.links_cooled = phase_link_cooling(
-            self.read, self.write
-        )
+        result.energy_cooled, result.links_cooled = phase_link_cooling(queries)
 
         # Count hot/cold links
-        result.hot_links, result.cold_links = self.queries.count_hot_cold_links()
+        result.hot_links, result.cold_links = queries.count_hot_cold_links()
+
+        # Phase 7: Activation (canon-validated, one batch) and Completion
+        activated = phase_activation(
+            queries, possible_moments, current_tick,
+            partial(queries.resolve_moments, self.canon, return_energy_to=player_id)
+        )
+        result.moments_activated = len(activated)
 
-        # Phase 7: Completion Processing
         completions, crystallized = phase_completion(
-            self.read, self.write, active_moments, current_tick, self._crystallize_actor_links
+            queries, active_moments, current_tick,
+            partial(self._crystallize_actor_links, queries=queries)
         )
         result.completions = completions
         result.moments_completed = len(completions)
@@ -160,11 +197,20 @@ class GraphTickV1_2:
 
         # Phase 8: Rejection Processing
         rejections = phase_rejection(
-            self.read, self.write, possible_moments, player_id, current_tick
+            queries, possible_moments, player_id, current_tick
         )
         result.rejections = rejections
         result.moments_rejected = len(rejections)
 
+        # Persist the snapshot diff (no-op on the per-query path)
+        queries.flush()
+
+        # Repair the proximity tree from links this tick changed
+        try:
+            self.proximity.update_links(queries.drain_link_changes())
+        except Exception as e:
+            logger.warning(f"[Proximity] Incremental update failed: {e}")
+
         # Add legacy fields for single tick too
         setattr(result, 'energy_total', result.energy_generated)
         setattr(result, 'moments_decayed', result.moments_completed)
@@ -173,92 +219,64 @@ class GraphTickV1_2:
 
         return result
 
-    def _compute_all_proximities(self, player_id: str) -> None:
+    def _open_tick_queries(self):
         """
-        Compute resistance from player to ALL nodes in ONE Dijkstra pass.
+        Return the query backend for this tick.
 
-        This replaces 23 separate Dijkstra calls with 1 single-source Dijkstra.
-        Results cached in self._proximity_cache for the tick.
+        Snapshot mode loads the tick subgraph once; if loading fails the
+        tick falls back to the per-query path.
         """
-        self._proximity_cache = {player_id: 0.0}  # Player has 0 resistance to self
-
+        if not self.snapshot:
+            return self.queries
         try:
-            # Fetch ALL edges in the graph (limited to those with valid properties)
-            edges_result = self.read.query("""
-            MATCH (a)-[r]-(b)
-            WHERE a.id IS NOT NULL AND b.id IS NOT NULL
-            RETURN DISTINCT a.id AS node_a, b.id AS node_b,
-                   coalesce(r.weight, 1.0) AS weight,
-                   r.emotions AS emotions
-            LIMIT 5000
-            """)
-
-            if not edges_result:
-                logger.debug("[Proximity] No edges found, using fallback")
-                return
-
-            # Build edge list for Dijkstra (v1.2: no conductivity)
-            edges = []
-            for edge in edges_result:
-                emotions = edge.get('emotions', []) or []
-                emotion_factor = avg_emotion_intensity(emotions)
-
-                edges.append({
-                    'node_a': edge.get('node_a'),
-                    'node_b': edge.get('node_b'),
-                    'weight': edge.get('weight', 1.0) or 1.0,
-                    'emotion_factor': max(0.1, emotion_factor)
-                })
-
-            # Single-source Dijkstra from player
-            self._proximity_cache = dijkstra_single_source(edges, player_id, MAX_PATH_HOPS)
-            logger.debug(f"[Proximity] Computed {len(self._proximity_cache)} reachable nodes")
+            return SnapshotTickQueries.load(self.read, self.write)
+        except Exception as e:
+            logger.warning(f"[GraphTick v1.2] Snapshot load failed, using per-query path: {e}")
+            return self.queries
+
+    def _compute_all_proximities(self, player_id: str) -> None:
+        """
+        Bring the player-rooted proximity index up to date.
 
+        The first tick (or a new player) builds the full tree; later ticks
+        only repair what mutation events touched since the last tick.
+        """
+        try:
+            self.proximity.sync(self.read, player_id)
+            logger.debug(f"[Proximity] {len(self.proximity.dist)} reachable nodes")
         except Exception as e:
             logger.warning(f"[Proximity] Failed to compute: {e}")
-            self._proximity_cache = {player_id: 0.0}
 
     def _calculate_proximity(self, from_id: str, to_id: str) -> float:
-        """Calculate proximity using cached resistance values."""
+        """Calculate proximity using the persistent resistance tree."""
         # from_id is always player, to_id is the target actor
-        resistance = self._proximity_cache.get(to_id, BLOCKED_PATH_RESISTANCE)
+        resistance = self.proximity.resistance(to_id)
         return 1.0 / (1.0 + resistance)
 
-    def _crystallize_actor_links(self, moment_id: str) -> int:
+    def close(self) -> None:
+        """Stop listening to graph mutation events."""
+        remove_mutation_listener(self.proximity.on_mutation)
+
+    def _crystallize_actor_links(self, moment_id: str, queries=None) -> int:
         """Create relates links between actors sharing a completed moment."""
+        queries = queries or self.queries
         crystallized = 0
         try:
-            actors = self.read.query(f"""
-            MATCH (a:Actor)-[]->(m:Moment {{id: '{moment_id}'}})
-            RETURN DISTINCT a.id AS actor_id
-            """)
+            actor_ids = queries.get_moment_actor_ids(moment_id)
 
-            if len(actors) < 2:
+            if len(actor_ids) < 2:
                 return 0
 
-            actor_ids = [a.get('actor_id') for a in actors if a.get('actor_id')]
-            moment_emotions = self.queries.get_moment_emotions(moment_id)
-            emotions_str = str(moment_emotions).replace("'", '"') if moment_emotions else "[]"
+            moment_emotions = queries.get_moment_emotions(moment_id)
 
             from runtime.physics.constants import CRYSTALLIZATION_WEIGHT
 
             for i, actor_a in enumerate(actor_ids):
                 for actor_b in actor_ids[i+1:]:
-                    existing = self.read.query(f"""
-                    MATCH (a:Actor {{id: '{actor_a}'}})-[r:RELATES]-(b:Actor {{id: '{actor_b}'}})
-                    RETURN count(r) AS cnt
-                    """)
-
-                    if existing and existing[0].get('cnt', 0) == 0:
-                        self.write._query(f"""
-                        MATCH (a:Actor {{id: '{actor_a}'}}), (b:Actor {{id: '{actor_b}'}})
-                        CREATE (a)-[:RELATES {{
-                            weight: {CRYSTALLIZATION_WEIGHT},
-                            energy: 0.0,
-                            emotions: {emotions_str},
-                            created_from: '{moment_id}'
-                        }}]->(b)
-                        """)
+                    if not queries.actors_related(actor_a, actor_b):
+                        queries.create_relates_link(
+                            actor_a, actor_b, CRYSTALLIZATION_WEIGHT, moment_emotions, moment_id
+                        )
                         crystallized += 1
         except Exception as e:
             logger.warning(f"[Crystallize] Error for {moment_id}: {e}")
@@ -4,17 +4,28 @@ Helper queries for v1.2 Energy Physics Tick.
 DOCS: docs/physics/IMPLEMENTATION_Physics.md
 """
 
-from typing import List, Dict, Any, Tuple
-from runtime.physics.graph import GraphQueries
+from typing import List, Dict, Any, Optional, Tuple
+from runtime.physics.graph import GraphQueries, GraphOps
 from runtime.physics.flow import get_weighted_average_axes
 from runtime.physics.constants import COLD_THRESHOLD, PLUTCHIK_AXES
 
+# Columns of a link change row (see drain_link_changes)
+LINK_CHANGE_FIELDS = ('node_a', 'node_b', 'type', 'weight', *PLUTCHIK_AXES)
+
 
 class TickQueries:
-    """Helper queries for graph tick."""
+    """
+    Helper queries for graph tick.
+
+    Every read and write issued by the tick phases goes through this class,
+    so an alternative backend (see tick_v1_2_snapshot.SnapshotTickQueries)
+    can replace the whole data path without touching phase logic.
+    """
 
-    def __init__(self, read: GraphQueries):
+    def __init__(self, read: GraphQueries, write: GraphOps = None):
         self.read = read
+        self.write = write
+        self._link_changes: List[Dict] = []
 
     def get_moments_by_status(self, status: str) -> List[Dict]:
         """Get moments with a given status."""
@@ -43,6 +54,50 @@ class TickQueries:
         except:
             return {axis: 0.0 for axis in PLUTCHIK_AXES}
 
+    def get_moment_axes_batch(self, moment_ids: List[str]) -> Dict[str, Dict[str, float]]:
+        """Get weighted average Plutchik axes for many moments in one query."""
+        default = {axis: 0.0 for axis in PLUTCHIK_AXES}
+        try:
+            rows = self.read.query("""
+            MATCH (m:Moment)-[r]->()
+            WHERE m.id IN $ids
+            RETURN m.id AS moment_id,
+                   r.weight AS weight,
+                   r.joy_sadness AS joy_sadness,
+                   r.trust_disgust AS trust_disgust,
+                   r.fear_anger AS fear_anger,
+                   r.surprise_anticipation AS surprise_anticipation
+            """, {'ids': list(moment_ids)})
+        except:
+            return {mid: dict(default) for mid in moment_ids}
+
+        grouped: Dict[str, List[Dict]] = {mid: [] for mid in moment_ids}
+        for row in rows:
+            grouped.setdefault(row.pop('moment_id'), []).append(row)
+
+        axes = {}
+        for mid, links in grouped.items():
+            try:
+                axes[mid] = get_weighted_average_axes(links)
+            except:
+                axes[mid] = dict(default)
+        return axes
+
+    def get_about_incidence(self, moment_ids: List[str]) -> List[Tuple[str, str]]:
+        """Get (moment_id, narrative_id) ABOUT pairs for many moments in one query."""
+        try:
+            rows = self.read.query("""
+            MATCH (m:Moment)-[:ABOUT]->(n:Narrative)
+            WHERE m.id IN $ids
+            RETURN DISTINCT m.id AS moment_id, n.id AS narrative_id
+            """, {'ids': list(moment_ids)})
+            return [
+                (r.get('moment_id'), r.get('narrative_id'))
+                for r in rows if r.get('narrative_id')
+            ]
+        except:
+            return []
+
     def get_narrative_axes(self, narrative_id: str) -> Dict[str, float]:
         """Get Plutchik axes associated with a narrative."""
         try:
@@ -127,3 +182,187 @@ class TickQueries:
             return [r.get('narrative_id') for r in result if r.get('narrative_id')]
         except:
             return []
+
+    def get_moment_emotions(self, moment_id: str) -> List:
+        """Get the emotions list stored on a moment."""
+        try:
+            result = self.read.query(f"""
+            MATCH (m:Moment {{id: '{moment_id}'}})
+            RETURN m.emotions AS emotions
+            """)
+            if result:
+                return result[0].get('emotions') or []
+            return []
+        except:
+            return []
+
+    def get_moment_state(self, moment_id: str) -> Optional[Dict]:
+        """Get the current energy, weight, duration and status of a moment."""
+        result = self.read.query(f"""
+        MATCH (m:Moment {{id: '{moment_id}'}})
+        RETURN m.energy AS energy, m.weight AS weight,
+               m.duration_minutes AS duration, m.status AS status
+        """)
+        return result[0] if result else None
+
+    def get_generating_actors(self) -> List[Dict]:
+        """Get living actors ordered by weight descending."""
+        return self.read.query("""
+        MATCH (a:Actor)
+        WHERE a.alive = true OR a.alive IS NULL
+        RETURN a.id AS id, a.weight AS weight, a.energy AS energy
+        ORDER BY a.weight DESC
+        """)
+
+    def get_actor_energy(self, actor_id: str) -> Optional[float]:
+        """Get an actor's current energy, or None if the actor doesn't exist."""
+        result = self.read.query(f"""
+        MATCH (p:Actor {{id: '{actor_id}'}})
+        RETURN p.energy AS energy
+        """)
+        if not result:
+            return None
+        return result[0].get('energy', 0.0) or 0.0
+
+    def get_top_narratives(self, min_energy: float, limit: int) -> List[Dict]:
+        """Get the hottest narratives above min_energy."""
+        return self.read.query(f"""
+        MATCH (n:Narrative)
+        WHERE n.energy > {min_energy}
+        RETURN n.id AS id, n.energy AS energy
+        ORDER BY n.energy DESC
+        LIMIT {limit}
+        """)
+
+    def get_failed_moments(self) -> List[Dict]:
+        """Get failed moments that still hold energy."""
+        return self.read.query("""
+        MATCH (m:Moment)
+        WHERE m.status = 'failed' AND m.energy > 0
+        RETURN m.id AS id, m.energy AS energy
+        """)
+
+    def get_moment_actor_ids(self, moment_id: str) -> List[str]:
+        """Get IDs of actors linked to a moment."""
+        actors = self.read.query(f"""
+        MATCH (a:Actor)-[]->(m:Moment {{id: '{moment_id}'}})
+        RETURN DISTINCT a.id AS actor_id
+        """)
+        return [a.get('actor_id') for a in actors if a.get('actor_id')]
+
+    def actors_related(self, actor_a: str, actor_b: str) -> bool:
+        """Check whether two actors already share a RELATES link."""
+        existing = self.read.query(f"""
+        MATCH (a:Actor {{id: '{actor_a}'}})-[r:RELATES]-(b:Actor {{id: '{actor_b}'}})
+        RETURN count(r) AS cnt
+        """)
+        return not existing or existing[0].get('cnt', 0) != 0
+
+    # =========================================================================
+    # WRITES
+    # =========================================================================
+
+    def set_energy(self, label: Optional[str], node_id: str, energy: float) -> None:
+        """Set a node's energy. label=None matches any node with that id."""
+        label_part = f":{label}" if label else ""
+        self.write._query(f"""
+        MATCH (n{label_part} {{id: '{node_id}'}})
+        SET n.energy = {energy}
+        """)
+
+    def complete_moment(self, moment_id: str, current_tick: int) -> None:
+        """Mark a moment completed at current_tick."""
+        self.write._query(f"""
+        MATCH (m:Moment {{id: '{moment_id}'}})
+        SET m.status = 'completed',
+            m.tick_resolved = {current_tick}
+        """)
+
+    def clear_moment_energy(self, moment_id: str, current_tick: int) -> None:
+        """Zero a rejected moment's energy and stamp its resolution tick."""
+        self.write._query(f"""
+        MATCH (m:Moment {{id: '{moment_id}'}})
+        SET m.energy = 0, m.tick_resolved = {current_tick}
+        """)
+
+    def resolve_moments(
+        self,
+        canon: Any,  # CanonHolder
+        moment_ids: List[str],
+        current_tick: int,
+        return_energy_to: str,
+    ) -> Dict[str, Any]:
+        """
+        Validate possible moments and activate or reject them in one write
+        (CanonHolder.resolve_batch).
+
+        Returns:
+            {moment_id: ValidationResult} for every moment that transitioned
+        """
+        return canon.resolve_batch(moment_ids, current_tick, return_energy_to=return_energy_to)
+
+    def cool_links(self, min_energy: float, decay_factor: float, weight_rate: float) -> Tuple[int, float]:
+        """
+        Cool every link hotter than min_energy in one batch.
+
+        Energy is multiplied by decay_factor and weight grows by
+        energy × weight_rate (using the pre-cooling energy).
+
+        Returns:
+            (links_cooled, total_energy_before_cooling)
+        """
+        count_result = self.read.query(f"""
+        MATCH ()-[r]->()
+        WHERE r.energy IS NOT NULL AND r.energy > {min_energy}
+        RETURN count(r) AS cnt, sum(r.energy) AS total_energy
+        """)
+
+        if not count_result or count_result[0].get('cnt', 0) == 0:
+            return 0, 0.0
+
+        cooled = self.write._query(f"""
+        MATCH (a)-[r]->(b)
+        WHERE r.energy > {min_energy}
+        SET r.energy = r.energy * {decay_factor},
+            r.weight = coalesce(r.weight, 1.0) + r.energy * {weight_rate}
+        RETURN a.id, b.id, type(r), r.weight,
+               r.joy_sadness, r.trust_disgust, r.fear_anger, r.surprise_anticipation
+        """)
+        self._link_changes.extend(dict(zip(LINK_CHANGE_FIELDS, row)) for row in cooled or [])
+
+        return count_result[0].get('cnt', 0), count_result[0].get('total_energy', 0.0) or 0.0
+
+    def create_relates_link(
+        self, actor_a: str, actor_b: str, weight: float, emotions: List, moment_id: str
+    ) -> None:
+        """Create a RELATES link between two actors, crystallized from a moment."""
+        emotions_str = str(emotions).replace("'", '"') if emotions else "[]"
+        self.write._query(f"""
+        MATCH (a:Actor {{id: '{actor_a}'}}), (b:Actor {{id: '{actor_b}'}})
+        CREATE (a)-[:RELATES {{
+            weight: {weight},
+            energy: 0.0,
+            emotions: {emotions_str},
+            created_from: '{moment_id}'
+        }}]->(b)
+        """)
+        self._link_changes.append({
+            'node_a': actor_a, 'node_b': actor_b, 'type': 'RELATES', 'weight': weight
+        })
+
+    def drain_link_changes(self) -> List[Dict]:
+        """
+        Return (and forget) links whose weight changed or that were created
+        this tick, as rows with LINK_CHANGE_FIELDS.
+        """
+        changes, self._link_changes = self._link_changes, []
+        return changes
+
+    def flush(self) -> int:
+        """
+        Persist pending writes.
+
+        Writes go straight to the graph on this path, so there is nothing
+        to flush. Returns the number of statements issued (always 0).
+        """
+        return 0
@@ -0,0 +1,700 @@
+"""
+In-memory snapshot backend for the v1.2 Energy Physics Tick.
+
+The per-query path (TickQueries) issues one or more Cypher round-trips per
+moment, per moment pair and per actor write. In snapshot mode the tick
+loads the relevant subgraph once into array-backed node and link tables
+keyed by integer index, runs all eight phases against it, and writes back
+a single diff at the end.
+
+Loaded subgraph:
+    - every Actor, Moment and Narrative node
+    - every non-actor target of a Moment link (Phase 3 flow targets)
+    - every link touching a Moment, every BELIEVES/RELATES link, and every
+      link carrying energy (Phase 6 cooling and hot/cold counting)
+
+SnapshotTickQueries implements the same interface as TickQueries and
+returns rows shaped exactly like the Cypher results, so phase code runs
+unchanged and produces the same numbers. The snapshot assumes the tick is
+the only writer to the graph for its duration.
+
+DOCS: docs/physics/IMPLEMENTATION_Physics.md
+"""
+
+import logging
+import math
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from runtime.physics.graph import GraphQueries, GraphOps
+from runtime.physics.constants import REJECTION_RETURN_RATE
+from runtime.physics.flow import get_weighted_average_axes
+from runtime.physics.constants import COLD_THRESHOLD, PLUTCHIK_AXES
+
+logger = logging.getLogger(__name__)
+
+# Rows per UNWIND statement when flushing the diff
+FLUSH_BATCH_SIZE = 1000
+
+# Link types that carry actor -> moment draw (Phase 2)
+_DRAW_LINK_TYPES = ('EXPRESSES', 'CAN_SPEAK', 'SAID')
+
+_AXES_RETURN = ",\n       ".join(f"{{v}}.{axis} AS {axis}" for axis in PLUTCHIK_AXES)
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    """Build a float64 column, storing None (or non-numeric) as NaN."""
+    out = np.full(len(values), np.nan, dtype=np.float64)
+    for i, v in enumerate(values):
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[i] = v
+    return out
+
+
+def _value(column: np.ndarray, i: int) -> Optional[float]:
+    """Read a float column cell back as a Cypher-style value (NaN -> None)."""
+    v = column[i]
+    return None if math.isnan(v) else float(v)
+
+
+def _hotness(energy: Optional[float], weight: Optional[float]) -> float:
+    """coalesce(r.energy, 0) * coalesce(r.weight, 1), the hot-link sort key."""
+    return (0.0 if energy is None else energy) * (1.0 if weight is None else weight)
+
+
+class TickSnapshot:
+    """
+    Array-backed copy of the tick-relevant subgraph.
+
+    Node i:  node_ids[i], node_labels[i], node_energy[i], node_weight[i], ...
+    Link j:  link_src[j] -> link_dst[j] (node indices), link_type[j], ...
+    out_links[i] / in_links[i] hold link indices for node i.
+    """
+
+    def __init__(self):
+        # Node table
+        self.node_ids: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.node_labels: List[Tuple[str, ...]] = []
+        self.node_energy = np.zeros(0)
+        self.node_weight = np.zeros(0)
+        self.node_duration = np.zeros(0)
+        self.node_axes = np.zeros((0, len(PLUTCHIK_AXES)))
+        self.node_status: List[Optional[str]] = []
+        self.node_alive: List[Any] = []
+        self.node_emotions: List[Any] = []
+        self.node_tick_resolved: List[Any] = []
+
+        # Link table
+        self.link_rid: List[Any] = []
+        self.link_src = np.zeros(0, dtype=np.int64)
+        self.link_dst = np.zeros(0, dtype=np.int64)
+        self.link_type: List[str] = []
+        self.link_energy = np.zeros(0)
+        self.link_weight = np.zeros(0)
+        self.link_axes = np.zeros((0, len(PLUTCHIK_AXES)))
+        self.link_emotions: List[Any] = []
+
+        # Adjacency
+        self.out_links: List[List[int]] = []
+        self.in_links: List[List[int]] = []
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def link_count(self) -> int:
+        return len(self.link_type)
+
+    def has_label(self, i: int, label: str) -> bool:
+        return label in self.node_labels[i]
+
+    def find(self, node_id: str, label: Optional[str] = None) -> Optional[int]:
+        """Index of node_id, or None if absent (or lacking label)."""
+        i = self.node_index.get(node_id)
+        if i is None or (label and label not in self.node_labels[i]):
+            return None
+        return i
+
+    @classmethod
+    def load(cls, read: GraphQueries) -> 'TickSnapshot':
+        """Load the tick subgraph in three queries."""
+        node_rows = read.query(f"""
+        MATCH (n)
+        WHERE (n:Actor OR n:Moment OR n:Narrative) AND n.id IS NOT NULL
+        RETURN n.id AS id, labels(n) AS labels,
+               n.energy AS energy, n.weight AS weight,
+               n.duration_minutes AS duration, n.status AS status,
+               n.alive AS alive, n.emotions AS emotions,
+               n.tick_resolved AS tick_resolved,
+               {_AXES_RETURN.format(v='n')}
+        """)
+        target_rows = read.query("""
+        MATCH (:Moment)-[]->(t)
+        WHERE NOT t:Actor AND NOT t:Moment AND NOT t:Narrative AND t.id IS NOT NULL
+        RETURN DISTINCT t.id AS id, labels(t) AS labels,
+               t.energy AS energy, t.weight AS weight
+        """)
+        link_rows = read.query(f"""
+        MATCH (a)-[r]->(b)
+        WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+          AND (a:Moment OR b:Moment OR r.energy IS NOT NULL
+               OR type(r) IN ['BELIEVES', 'RELATES'])
+        RETURN id(r) AS rid, type(r) AS type,
+               a.id AS src, labels(a) AS src_labels,
+               b.id AS dst, labels(b) AS dst_labels,
+               r.weight AS weight, r.energy AS energy, r.emotions AS emotions,
+               {_AXES_RETURN.format(v='r')}
+        """)
+        return cls.from_rows(node_rows, target_rows, link_rows)
+
+    @classmethod
+    def from_rows(
+        cls,
+        node_rows: List[Dict],
+        target_rows: List[Dict],
+        link_rows: List[Dict]
+    ) -> 'TickSnapshot':
+        """Build the tables from query result rows."""
+        snap = cls()
+        nodes: List[Dict] = []
+
+        def add_node(row: Dict) -> int:
+            node_id = row.get('id')
+            i = snap.node_index.get(node_id)
+            if i is None:
+                i = len(nodes)
+                snap.node_index[node_id] = i
+                nodes.append(row)
+            return i
+
+        for row in node_rows:
+            add_node(row)
+        for row in target_rows:
+            add_node(row)
+
+        src, dst = [], []
+        link_props: List[Dict] = []
+        for row in link_rows:
+            # Endpoints outside the loaded node set become stub rows
+            # (id + labels only) so links can still be indexed and written back.
+            s = add_node({'id': row.get('src'), 'labels': row.get('src_labels')})
+            d = add_node({'id': row.get('dst'), 'labels': row.get('dst_labels')})
+            src.append(s)
+            dst.append(d)
+            link_props.append(row)
+
+        snap.node_ids = [n.get('id') for n in nodes]
+        snap.node_labels = [tuple(n.get('labels') or ()) for n in nodes]
+        snap.node_energy = _column([n.get('energy') for n in nodes])
+        snap.node_weight = _column([n.get('weight') for n in nodes])
+        snap.node_duration = _column([n.get('duration') for n in nodes])
+        snap.node_axes = np.stack(
+            [_column([n.get(axis) for n in nodes]) for axis in PLUTCHIK_AXES], axis=1
+        ) if nodes else np.zeros((0, len(PLUTCHIK_AXES)))
+        snap.node_status = [n.get('status') for n in nodes]
+        snap.node_alive = [n.get('alive') for n in nodes]
+        snap.node_emotions = [n.get('emotions') for n in nodes]
+        snap.node_tick_resolved = [n.get('tick_resolved') for n in nodes]
+
+        snap.link_rid = [r.get('rid') for r in link_props]
+        snap.link_src = np.array(src, dtype=np.int64)
+        snap.link_dst = np.array(dst, dtype=np.int64)
+        snap.link_type = [r.get('type') for r in link_props]
+        snap.link_energy = _column([r.get('energy') for r in link_props])
+        snap.link_weight = _column([r.get('weight') for r in link_props])
+        snap.link_axes = np.stack(
+            [_column([r.get(axis) for r in link_props]) for axis in PLUTCHIK_AXES], axis=1
+        ) if link_props else np.zeros((0, len(PLUTCHIK_AXES)))
+        snap.link_emotions = [r.get('emotions') for r in link_props]
+
+        snap.out_links = [[] for _ in nodes]
+        snap.in_links = [[] for _ in nodes]
+        for j, (s, d) in enumerate(zip(src, dst)):
+            snap.out_links[s].append(j)
+            snap.in_links[d].append(j)
+
+        return snap
+
+
+class SnapshotTickQueries:
+    """
+    TickQueries interface backed by a TickSnapshot.
+
+    Reads are answered from the tables; writes update the tables and are
+    recorded as a diff. flush() persists the diff with grouped UNWIND
+    statements.
+    """
+
+    def __init__(self, snapshot: TickSnapshot, write: GraphOps):
+        self.snapshot = snapshot
+        self.write = write
+        self._dirty_energy: set = set()
+        self._dirty_resolution: set = set()
+        self._dirty_links: set = set()
+        self._new_relates: List[Dict[str, Any]] = []
+        self._relates_pairs = set()
+        self._changed_links: List[int] = []
+        self._relates_changes: List[Dict[str, Any]] = []
+
+        snap = snapshot
+        for j, link_type in enumerate(snap.link_type):
+            if link_type == 'RELATES':
+                s, d = int(snap.link_src[j]), int(snap.link_dst[j])
+                if snap.has_label(s, 'Actor') and snap.has_label(d, 'Actor'):
+                    self._relates_pairs.add(frozenset((s, d)))
+
+    @classmethod
+    def load(cls, read: GraphQueries, write: GraphOps) -> 'SnapshotTickQueries':
+        return cls(TickSnapshot.load(read), write)
+
+    # =========================================================================
+    # READS
+    # =========================================================================
+
+    def get_moments_by_status(self, status: str) -> List[Dict]:
+        snap = self.snapshot
+        return [
+            {
+                'id': snap.node_ids[i],
+                'energy': _value(snap.node_energy, i),
+                'weight': _value(snap.node_weight, i),
+                'duration': _value(snap.node_duration, i),
+            }
+            for i in range(snap.node_count)
+            if snap.node_status[i] == status and snap.has_label(i, 'Moment')
+        ]
+
+    def get_moment_axes(self, moment_id: str) -> Dict[str, float]:
+        snap = self.snapshot
+        try:
+            i = snap.find(moment_id, 'Moment')
+            links = []
+            if i is not None:
+                for j in snap.out_links[i]:
+                    link = {'weight': _value(snap.link_weight, j)}
+                    for k, axis in enumerate(PLUTCHIK_AXES):
+                        link[axis] = _value(snap.link_axes[:, k], j)
+                    links.append(link)
+            return get_weighted_average_axes(links)
+        except:
+            return {axis: 0.0 for axis in PLUTCHIK_AXES}
+
+    def get_moment_axes_batch(self, moment_ids: List[str]) -> Dict[str, Dict[str, float]]:
+        return {mid: self.get_moment_axes(mid) for mid in moment_ids}
+
+    def get_about_incidence(self, moment_ids: List[str]) -> List[Tuple[str, str]]:
+        snap = self.snapshot
+        pairs = []
+        for moment_id in dict.fromkeys(moment_ids):
+            i = snap.find(moment_id, 'Moment')
+            if i is None:
+                continue
+            narratives = []
+            for j in snap.out_links[i]:
+                n = int(snap.link_dst[j])
+                if snap.link_type[j] == 'ABOUT' and snap.has_label(n, 'Narrative') \
+                        and n not in narratives:
+                    narratives.append(n)
+            pairs.extend((moment_id, snap.node_ids[n]) for n in narratives)
+        return pairs
+
+    def get_narrative_axes(self, narrative_id: str) -> Dict[str, float]:
+        snap = self.snapshot
+        i = snap.find(narrative_id, 'Narrative')
+        if i is None:
+            return {axis: 0.0 for axis in PLUTCHIK_AXES}
+        return {axis: _value(snap.node_axes[:, k], i) for k, axis in enumerate(PLUTCHIK_AXES)}
+
+    def _top_links(self, rows: List[Tuple[Dict, float]], n: int) -> List[Dict]:
+        rows.sort(key=lambda r: r[1], reverse=True)
+        return [r[0] for r in rows[:n]]
+
+    def get_hot_links_to_moment(self, moment_id: str, n: int = 20) -> List[Dict]:
+        snap = self.snapshot
+        i = snap.find(moment_id, 'Moment')
+        if i is None:
+            return []
+        rows = []
+        for j in snap.in_links[i]:
+            a = int(snap.link_src[j])
+            if snap.link_type[j] not in _DRAW_LINK_TYPES or not snap.has_label(a, 'Actor'):
+                continue
+            weight, energy = _value(snap.link_weight, j), _value(snap.link_energy, j)
+            rows.append(({
+                'actor_id': snap.node_ids[a],
+                'actor_energy': _value(snap.node_energy, a),
+                'actor_weight': _value(snap.node_weight, a),
+                'weight': weight,
+                'link_energy': energy,
+                'emotions': snap.link_emotions[j],
+            }, _hotness(energy, weight)))
+        return self._top_links(rows, n)
+
+    def get_hot_links_from_moment(self, moment_id: str, n: int = 20) -> List[Dict]:
+        snap = self.snapshot
+        i = snap.find(moment_id, 'Moment')
+        if i is None:
+            return []
+        rows = []
+        for j in snap.out_links[i]:
+            t = int(snap.link_dst[j])
+            if snap.has_label(t, 'Actor'):
+                continue
+            labels = snap.node_labels[t]
+            weight, energy = _value(snap.link_weight, j), _value(snap.link_energy, j)
+            rows.append(({
+                'target_id': snap.node_ids[t],
+                'target_type': labels[0] if labels else None,
+                'target_energy': _value(snap.node_energy, t),
+                'target_weight': _value(snap.node_weight, t),
+                'weight': weight,
+                'link_energy': energy,
+                'emotions': snap.link_emotions[j],
+            }, _hotness(energy, weight)))
+        return self._top_links(rows, n)
+
+    def get_hot_links_to_actors(self, narrative_id: str, n: int = 20) -> List[Dict]:
+        snap = self.snapshot
+        i = snap.find(narrative_id, 'Narrative')
+        if i is None:
+            return []
+        rows = []
+        for j in snap.in_links[i]:
+            a = int(snap.link_src[j])
+            if snap.link_type[j] != 'BELIEVES' or not snap.has_label(a, 'Actor'):
+                continue
+            weight, energy = _value(snap.link_weight, j), _value(snap.link_energy, j)
+            rows.append(({
+                'actor_id': snap.node_ids[a],
+                'actor_energy': _value(snap.node_energy, a),
+                'actor_weight': _value(snap.node_weight, a),
+                'weight': weight,
+                'link_energy': energy,
+                'emotions': snap.link_emotions[j],
+            }, _hotness(energy, weight)))
+        return self._top_links(rows, n)
+
+    def count_hot_cold_links(self) -> Tuple[int, int]:
+        snap = self.snapshot
+        has_energy = ~np.isnan(snap.link_energy)
+        weight = np.where(np.isnan(snap.link_weight), 1.0, snap.link_weight)
+        heat = snap.link_energy[has_energy] * weight[has_energy]
+        hot = int(np.count_nonzero(heat > COLD_THRESHOLD))
+        return hot, int(heat.size - hot)
+
+    def get_shared_narratives(self, m1_id: str, m2_id: str) -> List[str]:
+        snap = self.snapshot
+
+        def about(moment_id: str) -> List[int]:
+            i = snap.find(moment_id, 'Moment')
+            if i is None:
+                return []
+            return [
+                int(snap.link_dst[j]) for j in snap.out_links[i]
+                if snap.link_type[j] == 'ABOUT' and snap.has_label(int(snap.link_dst[j]), 'Narrative')
+            ]
+
+        shared = set(about(m2_id))
+        result = []
+        for n in about(m1_id):
+            if n in shared and snap.node_ids[n] not in result:
+                result.append(snap.node_ids[n])
+        return result
+
+    def get_moment_emotions(self, moment_id: str) -> List:
+        i = self.snapshot.find(moment_id, 'Moment')
+        if i is None:
+            return []
+        return self.snapshot.node_emotions[i] or []
+
+    def get_moment_state(self, moment_id: str) -> Optional[Dict]:
+        snap = self.snapshot
+        i = snap.find(moment_id, 'Moment')
+        if i is None:
+            return None
+        return {
+            'energy': _value(snap.node_energy, i),
+            'weight': _value(snap.node_weight, i),
+            'duration': _value(snap.node_duration, i),
+            'status': snap.node_status[i],
+        }
+
+    def get_generating_actors(self) -> List[Dict]:
+        snap = self.snapshot
+        actors = [
+            {
+                'id': snap.node_ids[i],
+                'weight': _value(snap.node_weight, i),
+                'energy': _value(snap.node_energy, i),
+            }
+            for i in range(snap.node_count)
+            if snap.has_label(i, 'Actor') and snap.node_alive[i] in (True, None)
+        ]
+        # Cypher orders NULL above every value, so DESC puts it first
+        actors.sort(
+            key=lambda a: math.inf if a['weight'] is None else a['weight'],
+            reverse=True
+        )
+        return actors
+
+    def get_actor_energy(self, actor_id: str) -> Optional[float]:
+        i = self.snapshot.find(actor_id, 'Actor')
+        if i is None:
+            return None
+        return _value(self.snapshot.node_energy, i) or 0.0
+
+    def get_top_narratives(self, min_energy: float, limit: int) -> List[Dict]:
+        snap = self.snapshot
+        rows = [
+            {'id': snap.node_ids[i], 'energy': float(snap.node_energy[i])}
+            for i in range(snap.node_count)
+            if snap.has_label(i, 'Narrative') and snap.node_energy[i] > min_energy
+        ]
+        rows.sort(key=lambda r: r['energy'], reverse=True)
+        return rows[:limit]
+
+    def get_failed_moments(self) -> List[Dict]:
+        snap = self.snapshot
+        return [
+            {'id': snap.node_ids[i], 'energy': float(snap.node_energy[i])}
+            for i in range(snap.node_count)
+            if snap.has_label(i, 'Moment')
+            and snap.node_status[i] == 'failed'
+            and snap.node_energy[i] > 0
+        ]
+
+    def get_moment_actor_ids(self, moment_id: str) -> List[str]:
+        snap = self.snapshot
+        i = snap.find(moment_id, 'Moment')
+        if i is None:
+            return []
+        actor_ids = []
+        for j in snap.in_links[i]:
+            a = int(snap.link_src[j])
+            if snap.has_label(a, 'Actor') and snap.node_ids[a] not in actor_ids:
+                actor_ids.append(snap.node_ids[a])
+        return actor_ids
+
+    def actors_related(self, actor_a: str, actor_b: str) -> bool:
+        a = self.snapshot.find(actor_a, 'Actor')
+        b = self.snapshot.find(actor_b, 'Actor')
+        if a is None or b is None:
+            return False
+        return frozenset((a, b)) in self._relates_pairs
+
+    # =========================================================================
+    # WRITES (recorded as diff)
+    # =========================================================================
+
+    def set_energy(self, label: Optional[str], node_id: str, energy: float) -> None:
+        i = self.snapshot.find(node_id, label)
+        if i is None:
+            return
+        self.snapshot.node_energy[i] = energy
+        self._dirty_energy.add(i)
+
+    def complete_moment(self, moment_id: str, current_tick: int) -> None:
+        i = self.snapshot.find(moment_id, 'Moment')
+        if i is None:
+            return
+        self.snapshot.node_status[i] = 'completed'
+        self.snapshot.node_tick_resolved[i] = current_tick
+        self._dirty_resolution.add(i)
+
+    def clear_moment_energy(self, moment_id: str, current_tick: int) -> None:
+        i = self.snapshot.find(moment_id, 'Moment')
+        if i is None:
+            return
+        self.snapshot.node_energy[i] = 0
+        self.snapshot.node_tick_resolved[i] = current_tick
+        self._dirty_energy.add(i)
+        self._dirty_resolution.add(i)
+
+    def resolve_moments(
+        self,
+        canon: Any,  # CanonHolder
+        moment_ids: List[str],
+        current_tick: int,
+        return_energy_to: str,
+    ) -> Dict[str, Any]:
+        """
+        Validate possible moments and activate or reject them in one write.
+
+        The canon holder reads and writes the graph itself, so the pending
+        diff is flushed first and its transitions (status, zeroed energy of
+        rejected moments, energy returned to the actor) are then mirrored
+        into the tables.
+        """
+        self.flush()
+        resolved = canon.resolve_batch(moment_ids, current_tick, return_energy_to=return_energy_to)
+
+        snap = self.snapshot
+        returned = 0.0
+        for moment_id, result in resolved.items():
+            i = snap.find(moment_id, 'Moment')
+            if i is None:
+                continue
+            if result.valid:
+                snap.node_status[i] = 'active'
+                continue
+            returned += (_value(snap.node_energy, i) or 0.0) * REJECTION_RETURN_RATE
+            snap.node_status[i] = 'failed'
+            snap.node_energy[i] = 0
+            snap.node_tick_resolved[i] = current_tick
+
+        a = snap.find(return_energy_to, 'Actor')
+        if a is not None and returned > 0:
+            snap.node_energy[a] = (_value(snap.node_energy, a) or 0.0) + returned
+        return resolved
+
+    def cool_links(self, min_energy: float, decay_factor: float, weight_rate: float) -> Tuple[int, float]:
+        snap = self.snapshot
+        # NaN compares False, matching "r.energy IS NOT NULL AND r.energy > min"
+        hot = np.flatnonzero(snap.link_energy > min_energy)
+        if hot.size == 0:
+            return 0, 0.0
+
+        energy = snap.link_energy[hot]
+        total_energy = float(energy.sum())
+        # All SET expressions read pre-update values, as FalkorDB evaluates
+        # the whole SET clause before committing it.
+        weight = np.where(np.isnan(snap.link_weight[hot]), 1.0, snap.link_weight[hot])
+        snap.link_weight[hot] = weight + energy * weight_rate
+        snap.link_energy[hot] = energy * decay_factor
+        self._dirty_links.update(hot.tolist())
+        self._changed_links.extend(hot.tolist())
+
+        return int(hot.size), total_energy
+
+    def create_relates_link(
+        self, actor_a: str, actor_b: str, weight: float, emotions: List, moment_id: str
+    ) -> None:
+        a = self.snapshot.find(actor_a, 'Actor')
+        b = self.snapshot.find(actor_b, 'Actor')
+        if a is None or b is None:
+            return
+        self._relates_pairs.add(frozenset((a, b)))
+        self._new_relates.append({
+            'a': actor_a,
+            'b': actor_b,
+            'weight': weight,
+            'emotions': emotions or [],
+            'moment_id': moment_id,
+        })
+        self._relates_changes.append({
+            'node_a': actor_a, 'node_b': actor_b, 'type': 'RELATES', 'weight': weight
+        })
+
+    def drain_link_changes(self) -> List[Dict]:
+        snap = self.snapshot
+        changes = []
+        for j in dict.fromkeys(self._changed_links):
+            row = {
+                'node_a': snap.node_ids[int(snap.link_src[j])],
+                'node_b': snap.node_ids[int(snap.link_dst[j])],
+                'type': snap.link_type[j],
+                'weight': _value(snap.link_weight, j),
+            }
+            for k, axis in enumerate(PLUTCHIK_AXES):
+                row[axis] = _value(snap.link_axes[:, k], j)
+            changes.append(row)
+        changes.extend(self._relates_changes)
+        self._changed_links = []
+        self._relates_changes = []
+        return changes
+
+    # =========================================================================
+    # FLUSH
+    # =========================================================================
+
+    def _unwind(self, cypher: str, rows: List[Dict]) -> int:
+        statements = 0
+        for start in range(0, len(rows), FLUSH_BATCH_SIZE):
+            self.write._query(cypher, {'rows': rows[start:start + FLUSH_BATCH_SIZE]})
+            statements += 1
+        return statements
+
+    def flush(self) -> int:
+        """
+        Write the accumulated diff back to the graph.
+
+        Returns:
+            Number of statements issued
+        """
+        snap = self.snapshot
+        statements = 0
+
+        # Node energy, grouped by primary label so lookups hit the label index
+        by_label: Dict[str, List[Dict]] = {}
+        for i in sorted(self._dirty_energy):
+            labels = snap.node_labels[i]
+            by_label.setdefault(labels[0] if labels else '', []).append(
+                {'id': snap.node_ids[i], 'energy': _value(snap.node_energy, i)}
+            )
+        for label, rows in by_label.items():
+            label_part = f":{label}" if label else ""
+            statements += self._unwind(f"""
+            UNWIND $rows AS row
+            MATCH (n{label_part} {{id: row.id}})
+            SET n.energy = row.energy
+            """, rows)
+
+        # Moment resolution (completion / rejection)
+        rows = [
+            {
+                'id': snap.node_ids[i],
+                'status': snap.node_status[i],
+                'tick_resolved': snap.node_tick_resolved[i],
+            }
+            for i in sorted(self._dirty_resolution)
+        ]
+        if rows:
+            statements += self._unwind("""
+            UNWIND $rows AS row
+            MATCH (m:Moment {id: row.id})
+            SET m.status = row.status, m.tick_resolved = row.tick_resolved
+            """, rows)
+
+        # Cooled links, anchored on their source node
+        by_label = {}
+        for j in sorted(self._dirty_links):
+            s = int(snap.link_src[j])
+            labels = snap.node_labels[s]
+            by_label.setdefault(labels[0] if labels else '', []).append({
+                'src': snap.node_ids[s],
+                'rid': snap.link_rid[j],
+                'energy': _value(snap.link_energy, j),
+                'weight': _value(snap.link_weight, j),
+            })
+        for label, rows in by_label.items():
+            label_part = f":{label}" if label else ""
+            statements += self._unwind(f"""
+            UNWIND $rows AS row
+            MATCH (a{label_part} {{id: row.src}})-[r]->()
+            WHERE id(r) = row.rid
+            SET r.energy = row.energy, r.weight = row.weight
+            """, rows)
+
+        # Crystallized actor links
+        if self._new_relates:
+            statements += self._unwind("""
+            UNWIND $rows AS row
+            MATCH (a:Actor {id: row.a}), (b:Actor {id: row.b})
+            CREATE (a)-[:RELATES {
+                weight: row.weight,
+                energy: 0.0,
+                emotions: row.emotions,
+                created_from: row.moment_id
+            }]->(b)
+            """, self._new_relates)
+
+        self._dirty_energy.clear()
+        self._dirty_resolution.clear()
+        self._dirty_links.clear()
+        self._new_relates = []
+
+        logger.debug(f"[Snapshot] Flushed diff in {statements} statements")
+        return statements
@@ -23,6 +23,7 @@ class TickResultV1_2:
     actors_updated: int = 0
     moments_active: int = 0
     moments_possible: int = 0
+    moments_activated: int = 0
     moments_completed: int = 0
     moments_rejected: int = 0
     links_cooled: int = 0
@@ -24,25 +24,36 @@ Output:
 - JSONL: machine-readable, one JSON per line
 - TXT: human/agent-readable formatted output
 
+Writes go through a background writer thread (LogWriter): log calls only
+enqueue records, the writer keeps one open handle per log file, drains the
+queue in batches and flushes once per batch. Per-step anomaly detection and
+causal chains are derived at exploration end and written as one
+STEP_ANALYSIS record (defer_analysis=True, the default).
+
 IMPL: engine/physics/subentity.py
 """
 
 from __future__ import annotations
+import atexit
 import json
+import logging
+import queue
 import time
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from threading import Lock
-from typing import List, Dict, Any, Optional, Tuple, Set
+from threading import Event, Lock, Thread
+from typing import Callable, IO, List, Dict, Any, Optional, Tuple, Set, Union
 
 # Avoid circular import
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from runtime.physics.subentity import SubEntity, SubEntityState
 
+log = logging.getLogger(__name__)
+
 
 class LogLevel(Enum):
     """Log verbosity levels."""
@@ -754,6 +765,155 @@ class LearningSignalExtractor:
         return signals
 
 
+# =============================================================================
+# ASYNC WRITER
+# =============================================================================
+
+# A record is either ready text or a callable rendering it on the writer thread
+Payload = Union[str, Callable[[], str]]
+
+_CLOSE = object()
+_FLUSH = object()
+_STOP = object()
+
+
+class LogWriter:
+    """
+    Background writer for traversal log files.
+
+    Log calls enqueue (path, payload) and return. A single daemon thread
+    keeps one open append handle per file, drains up to `batch_size`
+    records per wakeup and flushes each touched handle once per batch.
+
+    The queue is bounded. When it is full:
+        - policy="block": the caller waits for room (backpressure, lossless)
+        - policy="drop":  the record is discarded and counted in `dropped`
+
+    Control messages (close/flush/stop) always block, so they are never dropped.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        policy: str = "block",
+    ):
+        if policy not in ("block", "drop"):
+            raise ValueError(f"Unknown policy: {policy}")
+        self.policy = policy
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.written = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._handles: Dict[Path, IO[str]] = {}
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._closed = False
+
+    def write(self, path: Path, payload: Payload) -> bool:
+        """Enqueue a record. Returns False if it was dropped."""
+        if self._closed:
+            return False
+        self._ensure_started()
+        if self.policy == "drop":
+            try:
+                self._queue.put_nowait((path, payload))
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+                return False
+        else:
+            self._queue.put((path, payload))
+        return True
+
+    def close_file(self, path: Path) -> None:
+        """Close the handle for `path` once every record queued before it is written."""
+        if self._thread is not None and not self._closed:
+            self._queue.put((_CLOSE, path))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is on disk."""
+        if self._thread is None or self._closed:
+            return True
+        done = Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Drain the queue, close all handles and stop the thread."""
+        if self._thread is None or self._closed:
+            self._closed = True
+            return
+        self._queue.put((_STOP, None))
+        self._thread.join()
+        self._closed = True
+        atexit.unregister(self.close)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="traversal-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not self._write_batch(batch):
+                return
+
+    def _write_batch(self, batch: List[Tuple[Any, Any]]) -> bool:
+        """Write one drained batch. Returns False when asked to stop."""
+        touched: Set[Path] = set()
+        keep_running = True
+
+        for target, payload in batch:
+            if target is _CLOSE:
+                handle = self._handles.pop(payload, None)
+                touched.discard(payload)
+                if handle is not None:
+                    handle.close()
+            elif target is _FLUSH:
+                self._flush_handles(touched)
+                touched.clear()
+                payload.set()
+            elif target is _STOP:
+                keep_running = False
+            else:
+                try:
+                    text = payload() if callable(payload) else payload
+                    handle = self._handles.get(target)
+                    if handle is None:
+                        handle = open(target, "a")
+                        self._handles[target] = handle
+                    handle.write(text + "\n")
+                    touched.add(target)
+                    self.written += 1
+                except Exception as e:
+                    log.warning(f"[TraversalLogger] Failed to write {target}: {e}")
+
+        self._flush_handles(touched)
+        if not keep_running:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+        return keep_running
+
+    def _flush_handles(self, paths: Set[Path]) -> None:
+        for path in paths:
+            handle = self._handles.get(path)
+            if handle is not None:
+                handle.flush()
+
+
 # =============================================================================
 # MAIN LOGGER
 # =============================================================================
@@ -788,6 +948,8 @@ class TraversalLogger:
         level: LogLevel = LogLevel.STEP,
         enable_human_readable: bool = True,
         enable_jsonl: bool = True,
+        writer: Optional[LogWriter] = None,
+        defer_analysis: bool = True,
     ):
         self.log_dir = log_dir or Path("engine/data/logs/traversal")
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -795,8 +957,9 @@ class TraversalLogger:
         self.level = level
         self.enable_human_readable = enable_human_readable
         self.enable_jsonl = enable_jsonl
+        self.defer_analysis = defer_analysis
 
-        self._lock = Lock()
+        self._writer = writer or LogWriter()
 
         # Active explorations
         self._explorations: Dict[str, Dict[str, Any]] = {}
@@ -812,23 +975,39 @@ class TraversalLogger:
         """Get ISO timestamp."""
         return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
-    def _write_jsonl(self, exploration_id: str, data: Dict[str, Any]) -> None:
-        """Write a line to JSONL file."""
+    def _jsonl_path(self, exploration_id: str) -> Path:
+        return self.log_dir / f"traversal_{exploration_id}.jsonl"
+
+    def _human_path(self, exploration_id: str) -> Path:
+        return self.log_dir / f"traversal_{exploration_id}.txt"
+
+    def _write_jsonl(
+        self,
+        exploration_id: str,
+        data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+    ) -> None:
+        """Queue a line for the JSONL file (callables are serialized on the writer thread)."""
         if not self.enable_jsonl:
             return
-        path = self.log_dir / f"traversal_{exploration_id}.jsonl"
-        with self._lock:
-            with open(path, "a") as f:
-                f.write(json.dumps(data, separators=(",", ":")) + "\n")
+        if callable(data):
+            payload = lambda: json.dumps(data(), separators=(",", ":"))
+        else:
+            payload = json.dumps(data, separators=(",", ":"))
+        self._writer.write(self._jsonl_path(exploration_id), payload)
 
-    def _write_human(self, exploration_id: str, text: str) -> None:
-        """Write to human-readable file."""
+    def _write_human(self, exploration_id: str, text: Payload) -> None:
+        """Queue text for the human-readable file."""
         if not self.enable_human_readable:
             return
-        path = self.log_dir / f"traversal_{exploration_id}.txt"
-        with self._lock:
-            with open(path, "a") as f:
-                f.write(text + "\n")
+        self._writer.write(self._human_path(exploration_id), text)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued log records are written."""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Flush and stop the background writer."""
+        self._writer.close()
 
     # =========================================================================
     # EXPLORATION LIFECYCLE
@@ -982,6 +1161,9 @@ class TraversalLogger:
             "termination": termination.to_dict(),
         })
 
+        if self.defer_analysis and history:
+            self._write_step_analysis(exploration_id, history)
+
         # Human readable
         reason_emoji = {
             "satisfaction_reached": "✓",
@@ -1011,6 +1193,47 @@ class TraversalLogger:
         # Cleanup
         self._explorations.pop(exploration_id, None)
         self._history.pop(exploration_id, None)
+        self._writer.close_file(self._jsonl_path(exploration_id))
+        self._writer.close_file(self._human_path(exploration_id))
+
+    def _write_step_analysis(self, exploration_id: str, history: List[StepRecord]) -> None:
+        """
+        Derive anomalies and causal chains for every step, off the hot path.
+
+        Each step is analysed against the history that preceded it, so the
+        results match inline analysis (defer_analysis=False).
+        """
+        analyses = []
+        lines = []
+        for i, step in enumerate(history):
+            anomalies = self._anomaly_detector.detect_anomalies(step, history[:i])
+            chain = self._causal_builder.build_chain(step, history[i - 1] if i else None)
+            if not anomalies and not chain:
+                continue
+            entry = {
+                "subentity_id": step.subentity_id,
+                "step_number": step.step_number,
+            }
+            if anomalies:
+                entry["anomalies"] = [a.to_dict() for a in anomalies]
+            if chain:
+                entry["causal_chain"] = [c.to_dict() for c in chain]
+            analyses.append(entry)
+            for anomaly in anomalies:
+                icon = "⚠" if anomaly.severity == AnomalySeverity.WARN else "ℹ"
+                lines.append(
+                    f"    {icon} [{step.subentity_id} #{step.step_number}] "
+                    f"{anomaly.anomaly_type}: {anomaly.detail}"
+                )
+
+        self._write_jsonl(exploration_id, {
+            "event": "STEP_ANALYSIS",
+            "exploration_id": exploration_id,
+            "timestamp": self._timestamp(),
+            "steps": analyses,
+        })
+        if lines:
+            self._write_human(exploration_id, " ANOMALIES\n" + "\n".join(lines))
 
     # =========================================================================
     # STEP LOGGING
@@ -1066,12 +1289,13 @@ class TraversalLogger:
             criticality=criticality,
             decision=decision,
             movement=movement,
-            found_narratives=found_narratives,
+            # Copies: the record is serialized later, on the writer thread
+            found_narratives=dict(found_narratives),
             new_this_step=new_this_step,
             alignment_this_step=alignment_this_step,
             parent_id=parent_id,
-            sibling_ids=sibling_ids,
-            children_ids=children_ids,
+            sibling_ids=list(sibling_ids),
+            children_ids=list(children_ids),
             active_siblings=active_siblings,
             joy_sadness=emotions.get("joy_sadness", 0.0),
             trust_disgust=emotions.get("trust_disgust", 0.0),
@@ -1086,11 +1310,12 @@ class TraversalLogger:
         # Generate progress narrative
         step.progress_narrative = self._generate_progress_narrative(step, history, intention)
 
-        # Detect anomalies
-        step.anomalies = self._anomaly_detector.detect_anomalies(step, history)
+        if not self.defer_analysis:
+            # Detect anomalies
+            step.anomalies = self._anomaly_detector.detect_anomalies(step, history)
 
-        # Build causal chain
-        step.causal_chain = self._causal_builder.build_chain(step, prev_step)
+            # Build causal chain
+            step.causal_chain = self._causal_builder.build_chain(step, prev_step)
 
         # Extract learning signals
         step.learning_signals = self._learning_extractor.extract_signals(step, history)
@@ -1108,11 +1333,9 @@ class TraversalLogger:
         history.append(step)
         self._history[exploration_id] = history
 
-        # Write JSONL
-        self._write_jsonl(exploration_id, step.to_dict())
-
-        # Write human readable
-        self._write_human(exploration_id, self._format_step_human(step))
+        # Serialization and formatting happen on the writer thread
+        self._write_jsonl(exploration_id, step.to_dict)
+        self._write_human(exploration_id, lambda: self._format_step_human(step))
 
         return step
 
@@ -1456,6 +1679,8 @@ def create_traversal_logger(
     level: LogLevel = LogLevel.STEP,
     enable_human_readable: bool = True,
     enable_jsonl: bool = True,
+    queue_policy: str = "block",
+    defer_analysis: bool = True,
 ) -> TraversalLogger:
     """Create a new traversal logger with custom settings."""
     return TraversalLogger(
@@ -1463,4 +1688,6 @@ def create_traversal_logger(
         level=level,
         enable_human_readable=enable_human_readable,
         enable_jsonl=enable_jsonl,
+        writer=LogWriter(policy=queue_policy),
+        defer_analysis=defer_analysis,
     )
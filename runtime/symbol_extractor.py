@@ -22,11 +22,14 @@ Phases:
 """
 
 import ast
+import hashlib
 import os
 import re
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 
@@ -104,6 +107,8 @@ class ExtractionResult:
     links: int = 0
     errors: List[str] = field(default_factory=list)
     extracted_files: List[str] = field(default_factory=list)
+    files_unchanged: int = 0
+    symbols_deleted: int = 0
 
 
 # =============================================================================
@@ -122,29 +127,105 @@ def slugify(text: str) -> str:
     return slug.strip('-').lower()
 
 
+def _links_touching(links: List[ExtractedLink], ids: Optional[Set[str]]) -> List[ExtractedLink]:
+    """Links with an endpoint in ids (all links if ids is None)."""
+    if ids is None:
+        return links
+    return [link for link in links if link.node_a in ids or link.node_b in ids]
+
+
 def calculate_complexity(node: ast.AST) -> int:
     """Calculate cyclomatic complexity of an AST node."""
     complexity = 1  # Base complexity
 
     for child in ast.walk(node):
-        # Decision points
-        if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-            complexity += 1
-        elif isinstance(child, ast.ExceptHandler):
-            complexity += 1
-        elif isinstance(child, (ast.And, ast.Or)):
-            complexity += 1
-        elif isinstance(child, ast.comprehension):
-            complexity += 1
-        elif isinstance(child, ast.Assert):
-            complexity += 1
-        # Match cases (Python 3.10+)
-        elif hasattr(ast, 'match_case') and isinstance(child, ast.match_case):
+        if _is_decision_point(child):
             complexity += 1
 
     return complexity
 
 
+def _is_decision_point(node: ast.AST) -> bool:
+    """Node adds a branch to cyclomatic complexity."""
+    return (
+        isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor))
+        or isinstance(node, ast.ExceptHandler)
+        or isinstance(node, (ast.And, ast.Or))
+        or isinstance(node, ast.comprehension)
+        or isinstance(node, ast.Assert)
+        # Match cases (Python 3.10+)
+        or (hasattr(ast, 'match_case') and isinstance(node, ast.match_case))
+    )
+
+
+@dataclass
+class TreeFacts:
+    """
+    Everything PythonExtractor needs from a module's AST, from one walk.
+
+    Per-function facts are keyed by id(function node) and, like ast.walk()
+    over the function, include nodes of nested functions.
+    """
+    imports_raw: List[str] = field(default_factory=list)
+    import_from_modules: List[str] = field(default_factory=list)
+    functions: List[ast.AST] = field(default_factory=list)  # ast.walk order
+    complexity: Dict[int, int] = field(default_factory=dict)
+    generators: Set[int] = field(default_factory=set)
+    calls: Dict[int, Dict[str, int]] = field(default_factory=dict)  # callee name -> count
+
+
+def scan_tree(tree: ast.Module) -> TreeFacts:
+    """
+    Collect imports and per-function complexity, generator and call facts.
+
+    Walks breadth-first like ast.walk(), so every list and dict comes out
+    in the same order as separate ast.walk() passes would produce.
+    """
+    facts = TreeFacts()
+    queue = deque([(tree, ())])
+
+    while queue:
+        node, enclosing = queue.popleft()
+
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                facts.imports_raw.append(f"import {alias.name}")
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            names = ", ".join(a.name for a in node.names)
+            facts.imports_raw.append(f"from {module} import {names}")
+            if node.module:
+                facts.import_from_modules.append(node.module)
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            facts.functions.append(node)
+            facts.complexity[id(node)] = 1  # Base complexity
+            facts.calls[id(node)] = {}
+            enclosing = enclosing + (id(node),)
+
+        if enclosing:
+            if _is_decision_point(node):
+                for func in enclosing:
+                    facts.complexity[func] += 1
+            elif isinstance(node, (ast.Yield, ast.YieldFrom)):
+                facts.generators.update(enclosing)
+            elif isinstance(node, ast.Call):
+                callee_name = None
+                if isinstance(node.func, ast.Name):
+                    callee_name = node.func.id
+                elif isinstance(node.func, ast.Attribute):
+                    callee_name = node.func.attr
+                if callee_name:
+                    for func in enclosing:
+                        counts = facts.calls[func]
+                        counts[callee_name] = counts.get(callee_name, 0) + 1
+
+        for child in ast.iter_child_nodes(node):
+            queue.append((child, enclosing))
+
+    return facts
+
+
 def get_docstring_first_line(docstring: Optional[str]) -> str:
     """Extract first line of docstring as description."""
     if not docstring:
@@ -241,7 +322,12 @@ class PythonExtractor:
         self.constant_pattern = re.compile(r'^[A-Z][A-Z0-9_]*$')
 
     def extract_file(self, file_path: Path) -> Tuple[List[ExtractedSymbol], List[ExtractedLink]]:
-        """Extract all symbols from a Python file."""
+        """
+        Extract all symbols from a Python file.
+
+        Raises if the file can't be read or parsed: an unparseable file has
+        unknown symbols, not none.
+        """
         symbols: List[ExtractedSymbol] = []
         links: List[ExtractedLink] = []
 
@@ -250,15 +336,18 @@ class PythonExtractor:
             tree = ast.parse(content, filename=str(file_path))
         except SyntaxError as e:
             logger.warning(f"Syntax error in {file_path}: {e}")
-            return symbols, links
+            raise
         except Exception as e:
             logger.warning(f"Failed to parse {file_path}: {e}")
-            return symbols, links
+            raise
 
         rel_path = str(file_path.relative_to(self.base_path))
         file_slug = slugify(rel_path)
         file_id = f"thing_FILE_{file_slug}"
 
+        # One walk for imports, complexity, generators and calls
+        facts = scan_tree(tree)
+
         # Create file node
         stat = file_path.stat()
         lines = content.count('\n') + 1
@@ -278,19 +367,19 @@ class PythonExtractor:
             size_bytes=stat.st_size,
             last_modified_s=int(stat.st_mtime),
             docstring=module_docstring,
-            imports_raw=self._extract_imports_raw(tree),
+            imports_raw=facts.imports_raw,
         )
         symbols.append(file_symbol)
 
         # Extract top-level symbols
         for node in ast.iter_child_nodes(tree):
             if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                func_symbols, func_links = self._extract_function(node, file_id, file_slug, rel_path)
+                func_symbols, func_links = self._extract_function(node, file_id, file_slug, rel_path, facts)
                 symbols.extend(func_symbols)
                 links.extend(func_links)
 
             elif isinstance(node, ast.ClassDef):
-                class_symbols, class_links = self._extract_class(node, file_id, file_slug, rel_path)
+                class_symbols, class_links = self._extract_class(node, file_id, file_slug, rel_path, facts)
                 symbols.extend(class_symbols)
                 links.extend(class_links)
 
@@ -305,34 +394,22 @@ class PythonExtractor:
                 links.extend(const_links)
 
         # Extract call relationships
-        call_links = self._extract_calls(tree, file_slug, rel_path, symbols)
+        call_links = self._extract_calls(facts, file_slug, rel_path, symbols)
         links.extend(call_links)
 
         # Extract import relationships
-        import_links = self._extract_import_links(tree, file_id, rel_path)
+        import_links = self._extract_import_links(facts, file_id, rel_path)
         links.extend(import_links)
 
         return symbols, links
 
-    def _extract_imports_raw(self, tree: ast.Module) -> List[str]:
-        """Extract raw import statements."""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(f"import {alias.name}")
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                names = ", ".join(a.name for a in node.names)
-                imports.append(f"from {module} import {names}")
-        return imports
-
     def _extract_function(
         self,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
         file_id: str,
         file_slug: str,
-        rel_path: str
+        rel_path: str,
+        facts: TreeFacts
     ) -> Tuple[List[ExtractedSymbol], List[ExtractedLink]]:
         """Extract a top-level function."""
         symbols = []
@@ -344,7 +421,7 @@ class PythonExtractor:
 
         docstring = ast.get_docstring(node) or ""
         is_async = isinstance(node, ast.AsyncFunctionDef)
-        is_generator = any(isinstance(n, (ast.Yield, ast.YieldFrom)) for n in ast.walk(node))
+        is_generator = id(node) in facts.generators
 
         # Get parameters (excluding self/cls)
         params = [arg.arg for arg in node.args.args if arg.arg not in ('self', 'cls')]
@@ -361,7 +438,7 @@ class PythonExtractor:
             lines=(node.end_lineno or node.lineno) - node.lineno + 1,
             docstring=docstring,
             signature=get_signature(node),
-            complexity=calculate_complexity(node),
+            complexity=facts.complexity[id(node)],
             parameters=params,
             returns=get_return_annotation(node),
             is_public=not func_name.startswith('_'),
@@ -386,7 +463,8 @@ class PythonExtractor:
         node: ast.ClassDef,
         file_id: str,
         file_slug: str,
-        rel_path: str
+        rel_path: str,
+        facts: TreeFacts
     ) -> Tuple[List[ExtractedSymbol], List[ExtractedLink]]:
         """Extract a class and its methods."""
         symbols = []
@@ -440,7 +518,7 @@ class PythonExtractor:
         # Extract methods
         for method_node in methods:
             method_symbols, method_links = self._extract_method(
-                method_node, class_id, class_slug, file_slug, rel_path, class_name
+                method_node, class_id, class_slug, file_slug, rel_path, class_name, facts
             )
             symbols.extend(method_symbols)
             links.extend(method_links)
@@ -454,7 +532,8 @@ class PythonExtractor:
         class_slug: str,
         file_slug: str,
         rel_path: str,
-        class_name: str
+        class_name: str,
+        facts: TreeFacts
     ) -> Tuple[List[ExtractedSymbol], List[ExtractedLink]]:
         """Extract a method from a class."""
         symbols = []
@@ -482,7 +561,7 @@ class PythonExtractor:
             lines=(node.end_lineno or node.lineno) - node.lineno + 1,
             docstring=docstring,
             signature=get_signature(node),
-            complexity=calculate_complexity(node),
+            complexity=facts.complexity[id(node)],
             parameters=params,
             returns=get_return_annotation(node),
             is_public=not method_name.startswith('_'),
@@ -610,7 +689,7 @@ class PythonExtractor:
 
     def _extract_calls(
         self,
-        tree: ast.Module,
+        facts: TreeFacts,
         file_slug: str,
         rel_path: str,
         symbols: List[ExtractedSymbol]
@@ -619,66 +698,54 @@ class PythonExtractor:
         links = []
         symbol_names = {s.name: s.id for s in symbols if s.type in ('func', 'method')}
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                caller_slug = slugify(node.name)
-                caller_id = f"thing_FUNC_{file_slug}_{caller_slug}"
-
-                # Check if this is a method
-                # (simplified - would need parent tracking for accuracy)
-
-                # Count calls to other symbols in this file
-                call_counts: Dict[str, int] = {}
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call):
-                        callee_name = None
-                        if isinstance(child.func, ast.Name):
-                            callee_name = child.func.id
-                        elif isinstance(child.func, ast.Attribute):
-                            callee_name = child.func.attr
-
-                        if callee_name and callee_name in symbol_names:
-                            call_counts[callee_name] = call_counts.get(callee_name, 0) + 1
-
-                for callee_name, count in call_counts.items():
-                    callee_id = symbol_names[callee_name]
-                    links.append(ExtractedLink(
-                        id=f"rel_{caller_slug}_calls_{slugify(callee_name)}",
-                        node_a=caller_id,
-                        node_b=callee_id,
-                        type="relates",
-                        direction="calls",
-                        call_count=count,
-                    ))
+        for node in facts.functions:
+            caller_slug = slugify(node.name)
+            caller_id = f"thing_FUNC_{file_slug}_{caller_slug}"
+
+            # Check if this is a method
+            # (simplified - would need parent tracking for accuracy)
+
+            # Count calls to other symbols in this file
+            for callee_name, count in facts.calls[id(node)].items():
+                if callee_name not in symbol_names:
+                    continue
+                callee_id = symbol_names[callee_name]
+                links.append(ExtractedLink(
+                    id=f"rel_{caller_slug}_calls_{slugify(callee_name)}",
+                    node_a=caller_id,
+                    node_b=callee_id,
+                    type="relates",
+                    direction="calls",
+                    call_count=count,
+                ))
 
         return links
 
     def _extract_import_links(
         self,
-        tree: ast.Module,
+        facts: TreeFacts,
         file_id: str,
         rel_path: str
     ) -> List[ExtractedLink]:
         """Extract import relationships (file-level only, local imports)."""
         links = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                if node.module and not self._is_external_module(node.module):
-                    # Try to resolve to local file
-                    target_path = self._resolve_import(node.module, rel_path)
-                    if target_path:
-                        target_slug = slugify(target_path)
-                        target_id = f"thing_FILE_{target_slug}"
-
-                        links.append(ExtractedLink(
-                            id=f"rel_{slugify(rel_path)}_imports_{target_slug}",
-                            node_a=file_id,
-                            node_b=target_id,
-                            type="relates",
-                            direction="imports",
-                            import_type="from",
-                        ))
+        for module in facts.import_from_modules:
+            if not self._is_external_module(module):
+                # Try to resolve to local file
+                target_path = self._resolve_import(module, rel_path)
+                if target_path:
+                    target_slug = slugify(target_path)
+                    target_id = f"thing_FILE_{target_slug}"
+
+                    links.append(ExtractedLink(
+                        id=f"rel_{slugify(rel_path)}_imports_{target_slug}",
+                        node_a=file_id,
+                        node_b=target_id,
+                        type="relates",
+                        direction="imports",
+                        import_type="from",
+                    ))
 
         return links
 
@@ -721,7 +788,8 @@ class TestInferrer:
     def infer_test_links(
         self,
         symbols: List[ExtractedSymbol],
-        test_files: List[Path]
+        test_files: List[Path],
+        only: Optional[Set[str]] = None
     ) -> List[ExtractedLink]:
         """
         Infer which test functions test which source symbols.
@@ -731,6 +799,8 @@ class TestInferrer:
         2. file_convention: test_tick.py tests tick.py
         3. call_analysis: Test calls symbol directly
         4. explicit_marker: # TESTS: symbol_name
+
+        If only is given, returns just the links touching those symbol ids.
         """
         links = []
 
@@ -788,7 +858,7 @@ class TestInferrer:
             explicit_links = self._extract_explicit_markers(test_file, symbols)
             links.extend(explicit_links)
 
-        return links
+        return _links_touching(links, only)
 
     def _create_test_link(
         self,
@@ -885,7 +955,8 @@ class DocsLinker:
     def link_docs(
         self,
         symbols: List[ExtractedSymbol],
-        docs_dir: str = "docs"
+        docs_dir: str = "docs",
+        only: Optional[Set[str]] = None
     ) -> List[ExtractedLink]:
         """
         Link symbols to documentation.
@@ -894,6 +965,9 @@ class DocsLinker:
         1. docs_comment: # DOCS: path/to/doc.md in source
         2. implementation_reference: IMPLEMENTATION.md mentions symbol
         3. naming_convention: Module name matches doc folder
+
+        If only is given, returns just the links touching those symbol ids
+        (and reads only those files for markers).
         """
         links = []
         docs_path = self.base_path / docs_dir
@@ -906,7 +980,7 @@ class DocsLinker:
 
         # Strategy 1: Explicit doc markers in source files
         for symbol in symbols:
-            if symbol.type == 'file':
+            if symbol.type == 'file' and (only is None or symbol.id in only):
                 file_path = self.base_path / symbol.uri
                 if file_path.exists():
                     explicit_links = self._extract_docs_markers(file_path, symbol, narratives)
@@ -921,7 +995,7 @@ class DocsLinker:
         module_links = self._link_by_module_convention(symbols, docs_path)
         links.extend(module_links)
 
-        return links
+        return _links_touching(links, only)
 
     def _find_narrative_docs(self, docs_path: Path) -> Dict[str, str]:
         """Find all narrative documentation files."""
@@ -1058,6 +1132,66 @@ class DocsLinker:
         return links
 
 
+# =============================================================================
+# PARALLEL EXTRACTION (process pool workers)
+# =============================================================================
+#
+# Symbols and links cross the process boundary as plain tuples of their
+# dataclass fields, which pickle far smaller than the dataclasses.
+
+_SYMBOL_FIELDS = [f.name for f in fields(ExtractedSymbol)]
+_LINK_FIELDS = [f.name for f in fields(ExtractedLink)]
+
+_worker_extractors: Dict[str, PythonExtractor] = {}
+
+
+def _init_extract_worker(base_path: Path) -> None:
+    """Pool initializer: one extractor per worker process."""
+    _worker_extractors['.py'] = PythonExtractor(base_path)
+
+
+def _extract_file_records(file_path: Path) -> Tuple[List[tuple], List[tuple], Optional[str]]:
+    """Extract one file in a worker; returns (symbol records, link records, error)."""
+    try:
+        symbols, links = _worker_extractors[file_path.suffix].extract_file(file_path)
+    except Exception as e:
+        return [], [], str(e)
+    return (
+        [tuple(getattr(s, name) for name in _SYMBOL_FIELDS) for s in symbols],
+        [tuple(getattr(l, name) for name in _LINK_FIELDS) for l in links],
+        None,
+    )
+
+
+def _symbols_from_records(records: List[tuple]) -> List[ExtractedSymbol]:
+    return [ExtractedSymbol(*record) for record in records]
+
+
+def _links_from_records(records: List[tuple]) -> List[ExtractedLink]:
+    return [ExtractedLink(*record) for record in records]
+
+
+# =============================================================================
+# INCREMENTAL EXTRACTION
+# =============================================================================
+
+SYMBOL_DELETE = """
+    MATCH (n:Thing {id: row.id})
+    DETACH DELETE n
+"""
+
+SYMBOL_LINKS_PRUNE = """
+    MATCH (a:Thing {id: row.id})-[r:LINK]->(b)
+    WHERE NOT b.id IN row.keep
+    DELETE r
+"""
+
+
+def default_manifest_path(base_path: Path, graph_name: Optional[str] = None) -> Path:
+    """Symbol manifest under <base_path>/.mind/cache/."""
+    return Path(base_path) / ".mind" / "cache" / f"symbols_{graph_name or 'default'}.json"
+
+
 # =============================================================================
 # MAIN EXTRACTOR CLASS
 # =============================================================================
@@ -1129,18 +1263,35 @@ class SymbolExtractor:
     def extract_directory(
         self,
         directory: str = None,
-        upsert: bool = True
+        upsert: bool = True,
+        workers: int = 1,
+        incremental: bool = False,
+        manifest_path: Optional[Path] = None
     ) -> ExtractionResult:
         """
         Extract symbols from a directory and optionally upsert to graph.
 
+        Every run records a manifest of each file's fingerprint (mtime, size,
+        content hash) and extracted symbols. With incremental=True, files
+        matching their fingerprint are not parsed: their cached symbols only
+        feed test inference and docs linking, which are written just for links
+        touching re-parsed symbols. Symbols that vanished from changed or
+        deleted files are deleted in bulk, and stale outgoing links of
+        re-parsed symbols are dropped.
+
         Args:
             directory: Directory to scan (relative to base_path)
             upsert: If True, upsert nodes/links to graph
+            workers: Processes parsing files in parallel (1 = in-process).
+                Results are merged in file order, so output is the same.
+            incremental: Only re-parse files changed since the last run
+            manifest_path: Manifest file (default: .mind/cache/symbols_<graph>.json)
 
         Returns:
             ExtractionResult with counts and any errors
         """
+        from runtime.ingest.files import FileManifest
+
         result = ExtractionResult()
 
         if upsert and not self._connect_graph():
@@ -1157,34 +1308,103 @@ class SymbolExtractor:
         all_links: List[ExtractedLink] = []
         test_files: List[Path] = []
 
-        # Phase 1 & 2: Files and Symbols
-        for scan_dir in scan_dirs:
-            if not scan_dir.exists():
-                continue
+        manifest = FileManifest(
+            manifest_path or default_manifest_path(self.base_path, self.graph_name),
+            self.graph_name,
+        )
+        manifest.load()  # Full runs keep entries outside their scope
+        if incremental:
+            if manifest.files and upsert and not self._manifest_in_graph(manifest):
+                # Graph was reset since the manifest was written
+                logger.info("Graph has none of the manifest's symbols, ignoring manifest")
+                manifest.files = {}
 
-            for file_path in self._iter_source_files(scan_dir):
-                ext = file_path.suffix
-                extractor = self.extractors.get(ext)
+        # Phase 1 & 2: Files and Symbols
+        source_files = [
+            file_path
+            for scan_dir in scan_dirs if scan_dir.exists()
+            for file_path in self._iter_source_files(scan_dir)
+            if file_path.suffix in self.extractors
+        ]
 
-                if not extractor:
+        entries = dict(manifest.files)
+        cached_symbols: List[ExtractedSymbol] = []
+        changed: List[Path] = []
+        for file_path in source_files:
+            rel_path = str(file_path.relative_to(self.base_path))
+            try:
+                stat = file_path.stat()
+                if incremental and manifest.stat_matches(rel_path, stat):
+                    cached_symbols.extend(_symbols_from_records(manifest.files[rel_path]["symbols"]))
                     continue
+                digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            except OSError as e:
+                # Keeps its manifest entry and symbols; retried next run
+                result.errors.append(f"{file_path}: {e}")
+                cached_symbols.extend(_symbols_from_records(manifest.files.get(rel_path, {}).get("symbols", [])))
+                continue
+            if incremental and manifest.hash_matches(rel_path, digest):
+                # Touched but not modified
+                entries[rel_path] = {**manifest.files[rel_path], "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+                cached_symbols.extend(_symbols_from_records(manifest.files[rel_path]["symbols"]))
+                continue
+            entries[rel_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+            changed.append(file_path)
+        result.files_unchanged = len(source_files) - len(changed)
+
+        reparsed: List[str] = []
+        for file_path, symbols, links, error in self._extract_files(changed, workers):
+            rel_path = str(file_path.relative_to(self.base_path))
+            if error:
+                # A file that can't be parsed (mid-edit syntax error, unreadable)
+                # keeps its previous entry and symbols, so nothing of it is
+                # deleted; the stale fingerprint makes the next run retry it
+                result.errors.append(f"{file_path}: {error}")
+                previous = manifest.files.get(rel_path)
+                if previous:
+                    entries[rel_path] = previous
+                    cached_symbols.extend(_symbols_from_records(previous.get("symbols", [])))
+                else:
+                    entries.pop(rel_path, None)
+                continue
+            reparsed.append(rel_path)
 
-                try:
-                    symbols, links = extractor.extract_file(file_path)
-                    all_symbols.extend(symbols)
-                    all_links.extend(links)
-                    result.files += 1
-                    result.extracted_files.append(str(file_path.relative_to(self.base_path)))
-
-                    # Track test files for phase 4
-                    if 'test' in str(file_path).lower():
-                        test_files.append(file_path)
-                except Exception as e:
-                    result.errors.append(f"{file_path}: {e}")
+            entries[rel_path]["symbols"] = [
+                [getattr(s, name) for name in _SYMBOL_FIELDS] for s in symbols
+            ]
+            all_symbols.extend(symbols)
+            all_links.extend(links)
+            result.files += 1
+            result.extracted_files.append(rel_path)
+
+            # Track test files for phase 4
+            if 'test' in str(file_path).lower():
+                test_files.append(file_path)
+
+        # Symbols of changed files that are gone, and of files no longer present
+        current = {str(f.relative_to(self.base_path)) for f in source_files}
+        scopes = [str(d.relative_to(self.base_path)).rstrip('/') + '/' for d in scan_dirs]
+        removed = [
+            rel_path for rel_path in manifest.files
+            if rel_path not in current and any(rel_path.startswith(scope) for scope in scopes)
+        ]
+        for rel_path in removed:
+            entries.pop(rel_path)
+        fresh_ids = {s.id for s in all_symbols}
+        vanished = sorted({
+            record[0]
+            for rel_path in reparsed + removed
+            for record in manifest.files.get(rel_path, {}).get("symbols", [])
+        } - fresh_ids)
+
+        # Derived links see every symbol; incremental runs write only those
+        # touching re-parsed symbols
+        only = fresh_ids if incremental else None
+        known_symbols = all_symbols + cached_symbols
 
         # Phase 4: Test inference
         try:
-            test_links = self.test_inferrer.infer_test_links(all_symbols, test_files)
+            test_links = self.test_inferrer.infer_test_links(known_symbols, test_files, only=only)
             all_links.extend(test_links)
             logger.info(f"Inferred {len(test_links)} test links")
         except Exception as e:
@@ -1192,7 +1412,7 @@ class SymbolExtractor:
 
         # Phase 5: Docs linking
         try:
-            docs_links = self.docs_linker.link_docs(all_symbols)
+            docs_links = self.docs_linker.link_docs(known_symbols, only=only)
             all_links.extend(docs_links)
             logger.info(f"Created {len(docs_links)} docs links")
         except Exception as e:
@@ -1204,10 +1424,89 @@ class SymbolExtractor:
         # Upsert to graph
         if upsert and self.graph_ops:
             upsert_errors = self._upsert_to_graph(all_symbols, all_links)
+            if incremental and not upsert_errors:
+                upsert_errors = self._remove_stale(vanished, all_symbols, all_links)
+                result.symbols_deleted = len(vanished)
             result.errors.extend(upsert_errors)
+            if not upsert_errors:
+                manifest.save(entries)
 
         return result
 
+    def _extract_files(self, files: List[Path], workers: int = 1):
+        """
+        Yield (file_path, symbols, links, error) per file, in file order.
+
+        With workers > 1, files are sharded across a process pool that sends
+        back compact tuple records; falls back to in-process parsing if the
+        pool cannot be used.
+        """
+        workers = min(workers or 1, len(files))
+        if workers > 1:
+            try:
+                chunksize = max(1, len(files) // (workers * 4))
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_extract_worker,
+                    initargs=(self.base_path,),
+                ) as pool:
+                    records = list(pool.map(_extract_file_records, files, chunksize=chunksize))
+                for file_path, (symbols, links, error) in zip(files, records):
+                    yield file_path, _symbols_from_records(symbols), _links_from_records(links), error
+                return
+            except (OSError, RuntimeError) as e:
+                # BrokenProcessPool is a RuntimeError
+                logger.warning(f"Parallel extraction unavailable, parsing in-process: {e}")
+
+        for file_path in files:
+            try:
+                symbols, links = self.extractors[file_path.suffix].extract_file(file_path)
+                yield file_path, symbols, links, None
+            except Exception as e:
+                yield file_path, [], [], str(e)
+
+    def _manifest_in_graph(self, manifest) -> bool:
+        """Whether the graph still holds any of the manifest's file symbols."""
+        sample = [
+            entry["symbols"][0][0]
+            for entry in list(manifest.files.values())[:20]
+            if entry.get("symbols")
+        ]
+        if not sample:
+            return True
+        result = self.graph_ops._adapter.query(
+            "UNWIND $ids AS id MATCH (n:Thing {id: id}) RETURN count(n)",
+            {"ids": sample},
+        )
+        return bool(result and result[0][0])
+
+    def _remove_stale(
+        self,
+        vanished: List[str],
+        symbols: List[ExtractedSymbol],
+        links: List[ExtractedLink]
+    ) -> List[str]:
+        """
+        Delete vanished symbols and prune re-parsed symbols' outgoing links
+        that this run no longer produced.
+        """
+        keep: Dict[str, Set[str]] = {s.id: set() for s in symbols}
+        for link in links:
+            if link.node_a in keep:
+                keep[link.node_a].add(link.node_b)
+
+        adapter = self.graph_ops._adapter
+        try:
+            if vanished:
+                adapter.execute_many(SYMBOL_DELETE, [{"id": sid} for sid in vanished])
+            if keep:
+                adapter.execute_many(SYMBOL_LINKS_PRUNE, [
+                    {"id": sid, "keep": sorted(targets)} for sid, targets in keep.items()
+                ])
+        except Exception as e:
+            return [f"Removing stale symbols: {e}"]
+        return []
+
     def _iter_source_files(self, directory: Path):
         """Iterate over source files, respecting exclude patterns."""
         import fnmatch
@@ -1236,7 +1535,24 @@ class SymbolExtractor:
         symbols: List[ExtractedSymbol],
         links: List[ExtractedLink]
     ) -> List[str]:
-        """Upsert symbols and links to graph."""
+        """
+        Upsert symbols and links to graph with one bulk inject_many().
+
+        If the bulk write fails, falls back to per-item inject() so errors
+        are reported per symbol/link.
+        """
+        from runtime.inject import inject_many
+
+        items = [self._symbol_data(symbol) for symbol in symbols]
+        items += [self._link_data(link) for link in links]
+
+        # Use canonical inject (no context - bulk extraction operation)
+        try:
+            inject_many(self.graph_ops._adapter, items, with_context=False)
+            return []
+        except Exception as e:
+            logger.warning(f"Bulk upsert failed, retrying per item: {e}")
+
         errors = []
 
         # Upsert symbols
@@ -1259,6 +1575,20 @@ class SymbolExtractor:
         """Upsert a symbol node to the graph using unified inject()."""
         from runtime.inject import inject
 
+        # Use canonical inject (no context - bulk extraction operation)
+        adapter = self.graph_ops._adapter
+        inject(adapter, self._symbol_data(symbol), with_context=False)
+
+    def _upsert_link(self, link: ExtractedLink) -> None:
+        """Upsert a link to the graph using unified inject()."""
+        from runtime.inject import inject
+
+        # Use canonical inject (no context - bulk extraction operation)
+        adapter = self.graph_ops._adapter
+        inject(adapter, self._link_data(link), with_context=False)
+
+    def _symbol_data(self, symbol: ExtractedSymbol) -> Dict[str, Any]:
+        """Node data for inject() from a symbol."""
         # Build properties dict
         props = {
             'id': symbol.id,
@@ -1304,15 +1634,10 @@ class SymbolExtractor:
                 'value_type': symbol.value_type,
             })
 
-        # Use canonical inject (no context - bulk extraction operation)
-        adapter = self.graph_ops._adapter
-        inject(adapter, props, with_context=False)
-
-    def _upsert_link(self, link: ExtractedLink) -> None:
-        """Upsert a link to the graph using unified inject()."""
-        from runtime.inject import inject
+        return props
 
-        # Build link data for inject
+    def _link_data(self, link: ExtractedLink) -> Dict[str, Any]:
+        """Link data for inject() from an extracted link."""
         link_data = {
             'from': link.node_a,
             'to': link.node_b,
@@ -1328,9 +1653,7 @@ class SymbolExtractor:
         if link.import_type:
             link_data['import_type'] = link.import_type
 
-        # Use canonical inject (no context - bulk extraction operation)
-        adapter = self.graph_ops._adapter
-        inject(adapter, link_data, with_context=False)
+        return link_data
 
 
 # =============================================================================
@@ -1340,7 +1663,9 @@ class SymbolExtractor:
 def extract_symbols_command(
     directory: str = None,
     graph_name: str = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    workers: int = None,
+    incremental: bool = False
 ) -> ExtractionResult:
     """
     CLI command to extract symbols.
@@ -1349,6 +1674,8 @@ def extract_symbols_command(
         directory: Directory to scan
         graph_name: Graph name (defaults to repo name)
         dry_run: If True, extract but don't upsert
+        workers: Parsing processes (default: CPU count, 1 = in-process)
+        incremental: Only re-parse files changed since the last run
 
     Returns:
         ExtractionResult
@@ -1363,7 +1690,9 @@ def extract_symbols_command(
 
     result = extractor.extract_directory(
         directory=directory,
-        upsert=not dry_run
+        upsert=not dry_run,
+        workers=workers or os.cpu_count() or 1,
+        incremental=incremental
     )
 
     return result
@@ -1376,6 +1705,10 @@ if __name__ == "__main__":
     parser.add_argument("--dir", "-d", help="Directory to scan")
     parser.add_argument("--graph", "-g", help="Graph name")
     parser.add_argument("--dry-run", action="store_true", help="Extract without upsert")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Parsing processes (default: CPU count)")
+    parser.add_argument("--incremental", "-i", action="store_true",
+                        help="Only re-parse files changed since the last run")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -1388,11 +1721,15 @@ if __name__ == "__main__":
     result = extract_symbols_command(
         directory=args.dir,
         graph_name=args.graph,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        workers=args.workers,
+        incremental=args.incremental
     )
 
     print(f"\nExtraction complete:")
     print(f"  Files: {result.files}")
+    if result.files_unchanged:
+        print(f"  Unchanged: {result.files_unchanged}")
     print(f"  Symbols: {result.symbols}")
     print(f"  Links: {result.links}")
 
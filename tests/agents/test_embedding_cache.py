@@ -0,0 +1,58 @@
+"""
+Tests for runtime.agents.embedding_cache module.
+
+Candidates must be loaded once into a matrix, scored with one product,
+and reloaded after a mutation event.
+"""
+
+import pytest
+from runtime.agents.embedding_cache import EmbeddingMatrix
+
+
+class FakeLoader:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.rows
+
+
+def test_top_k_loads_once_and_ranks_by_cosine():
+    load = FakeLoader([
+        ["Ledger", [1.0, 0.0]],
+        ["Oath", "[0.0, 2.0]"],
+        ["Ledger", [0.0, 1.0]],   # duplicate name keeps the first row
+        ["Mill", [0.7, 0.7]],
+        ["Odd", [1.0, 0.0, 0.0]],  # wrong dimension
+    ])
+    matrix = EmbeddingMatrix(load)
+
+    hits = matrix.top_k([1.0, 0.1], 2)
+    assert [name for name, _ in hits] == ["Ledger", "Mill"]
+    assert hits[0][1] == pytest.approx(0.995, abs=1e-3)
+    assert matrix.top_k([0.0, 1.0], 1)[0][0] == "Oath"
+    assert matrix.top_k([1.0, 0.0, 0.0], 1) == []
+    assert load.calls == 1
+
+
+def test_similarities_restricted_to_keys():
+    matrix = EmbeddingMatrix(FakeLoader([["a", [1.0, 0.0]], ["b", [0.0, 1.0]]]))
+    keys, scores = matrix.similarities([0.0, 3.0], ["b", "missing"])
+    assert keys == ["b"]
+    assert scores.tolist() == pytest.approx([1.0])
+
+
+def test_mutation_events_mark_stale():
+    load = FakeLoader([["AGENT_Scout", [1.0, 0.0]]])
+    matrix = EmbeddingMatrix(load, node_types=("actor",))
+    matrix.top_k([1.0, 0.0], 1)
+
+    matrix.on_mutation({"type": "node_created", "data": {"type": "thing", "id": "x"}})
+    matrix.top_k([1.0, 0.0], 1)
+    assert load.calls == 1
+
+    matrix.on_mutation({"type": "node_updated", "data": {"type": "actor", "id": "AGENT_Scout"}})
+    matrix.top_k([1.0, 0.0], 1)
+    assert load.calls == 2
@@ -0,0 +1,178 @@
+"""
+Tests for bulk writes in runtime.infrastructure.database.
+
+Same-shape mutations must be coalesced into UNWIND statements and a
+FalkorDB batch must go out as one pipelined round-trip.
+"""
+
+import pytest
+from redis.exceptions import ResponseError
+from runtime.infrastructure.database import QueryError, coalesce_statements
+from runtime.infrastructure.database import falkordb_adapter
+from runtime.infrastructure.database.falkordb_adapter import params_header
+
+
+class FakeRedisConnection:
+    """Pooled connection: records packed round-trips, answers per command."""
+
+    def __init__(self, client):
+        self.client = client
+        self.pending = []
+
+    def pack_commands(self, commands):
+        return list(commands)
+
+    def send_packed_command(self, commands):
+        self.client.round_trips.append(commands)
+        self.pending = list(commands)
+
+    def read_response(self):
+        if self.client.drop_after is not None and self.client.responses >= self.client.drop_after:
+            self.client.drop_after = None
+            raise OSError("Connection reset by peer")
+        command = self.pending.pop(0)
+        self.client.responses += 1
+        self.client.executed.append(command[2])
+        if "FAIL" in command[2]:
+            raise ResponseError("bad")
+        return []
+
+    def disconnect(self):
+        self.pending = []
+
+
+class FakeConnection:
+    def __init__(self):
+        self.round_trips = []
+        self.executed = []
+        self.responses = 0
+        self.drop_after = None
+        self.connection_pool = self
+
+    def get_connection(self):
+        return FakeRedisConnection(self)
+
+    def release(self, conn):
+        pass
+
+
+class FakeGraph:
+    def __init__(self):
+        self.queries = []
+
+    def query(self, cypher, params=None):
+        self.queries.append((cypher, params))
+
+
+class FakeFalkorDB:
+    connection = None
+
+    def __init__(self, host=None, port=None):
+        # Shared across reconnects, like the server
+        FakeFalkorDB.connection = FakeFalkorDB.connection or FakeConnection()
+        self.connection = FakeFalkorDB.connection
+        self.graph = FakeGraph()
+
+    def select_graph(self, name):
+        return self.graph
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    monkeypatch.setattr(falkordb_adapter, "FalkorDB", FakeFalkorDB)
+    monkeypatch.setattr(FakeFalkorDB, "connection", None)
+    return falkordb_adapter.FalkorDBAdapter(graph_name="g")
+
+
+def test_coalesces_consecutive_same_shape_statements():
+    set_energy = "MATCH (n {id: $id}) SET n.energy = $energy"
+    out = coalesce_statements([
+        (set_energy, {"id": "a", "energy": 1}),
+        (set_energy, {"id": "b", "energy": 2}),
+        ("MATCH (n {id: $id}) DETACH DELETE n", {"id": "c"}),
+        (set_energy, {"id": "d", "energy": 3}),
+        ("MATCH (n) RETURN count(n)", None),
+    ])
+
+    assert out[0] == (
+        "UNWIND $rows AS row\nMATCH (n {id: row.id}) SET n.energy = row.energy",
+        {"rows": [{"id": "a", "energy": 1}, {"id": "b", "energy": 2}]},
+    )
+    assert out[1] == ("MATCH (n {id: $id}) DETACH DELETE n", {"id": "c"})
+    assert out[2] == (set_energy, {"id": "d", "energy": 3})
+    assert out[3][0] == "MATCH (n) RETURN count(n)"
+
+
+def test_statements_with_unused_or_missing_params_pass_through():
+    stmt = "MATCH (n {id: $id}) SET n.x = 1"
+    out = coalesce_statements([(stmt, {"id": "a", "extra": 1}), (stmt, {"id": "b", "extra": 2})])
+    assert [c for c, _ in out] == [stmt, stmt]
+
+
+def test_dollar_signs_inside_string_literals_are_not_rewritten():
+    stmt = "MATCH (n {id: $id}) SET n.note = 'costs $id', n.tag = \"a\\\"$id\", n.x = $x"
+    out = coalesce_statements([(stmt, {"id": "a", "x": 1}), (stmt, {"id": "b", "x": 2})])
+
+    assert out == [(
+        "UNWIND $rows AS row\n"
+        "MATCH (n {id: row.id}) SET n.note = 'costs $id', n.tag = \"a\\\"$id\", n.x = row.x",
+        {"rows": [{"id": "a", "x": 1}, {"id": "b", "x": 2}]},
+    )]
+
+
+def test_transaction_commits_in_one_pipelined_round_trip(adapter):
+    with adapter.transaction() as tx:
+        for i in range(300):
+            tx.execute("CREATE (n:Thing {id: $id})", {"id": f"t{i}"})
+        tx.execute("MATCH (n {id: $id}) DETACH DELETE n", {"id": "t0"})
+        tx.execute("MATCH (n {id: $id}) SET n.name = $name", {"id": "t1", "name": "x"})
+
+    conn = adapter._db.connection
+    assert len(conn.round_trips) == 1
+    assert [c[2].split(" ", 1)[0] for c in conn.round_trips[0]] == ["CYPHER"] * 3
+    assert "UNWIND $rows AS row" in conn.round_trips[0][0][2]
+
+
+def test_execute_many_chunks_rows_and_reports_failures(adapter):
+    adapter.execute_many("CREATE (:Thing {id: row.id})", [{"id": i} for i in range(25)], batch_size=10)
+    assert len(adapter._db.connection.round_trips) == 1
+    assert len(adapter._db.connection.round_trips[0]) == 3
+
+    with pytest.raises(QueryError):
+        adapter.execute_batch([("CREATE (:A)", None), ("FAIL", None)])
+
+
+def test_failed_statement_raises_after_its_chunk(adapter, monkeypatch):
+    monkeypatch.setattr(falkordb_adapter, "PIPELINE_CHUNK_SIZE", 2)
+    with pytest.raises(QueryError, match="FAIL"):
+        adapter.execute_batch([
+            ("CREATE (:A)", None), ("FAIL 1", None),   # chunk 1: both run
+            ("CREATE (:B)", None), ("CREATE (:C)", None),  # chunk 2: not sent
+        ])
+    assert adapter._db.connection.executed == ["CREATE (:A)", "FAIL 1"]
+
+
+def test_reconnect_resumes_at_first_unanswered_statement(adapter):
+    conn = adapter._db.connection
+    conn.drop_after = 2
+    adapter.execute_batch([(f"CREATE (:N{i})", None) for i in range(5)])
+
+    assert conn.executed == [f"CREATE (:N{i})" for i in range(5)]
+    assert [len(trip) for trip in conn.round_trips] == [5, 3]
+
+
+def test_params_header_quotes_values():
+    header = params_header({"s": 'a"b', "n": None, "rows": [{"id": 1, "ok": True}]})
+    assert header == 'CYPHER s="a\\"b" n=null rows=[{`id`:1,`ok`:true}] '
+
+
+def test_params_header_converts_numpy_and_rejects_non_finite_floats(adapter):
+    np = pytest.importorskip("numpy")
+    header = params_header({"v": np.array([0.5, 1.0], dtype=np.float32), "x": np.float64(0.25)})
+    assert header == "CYPHER v=[0.5,1.0] x=0.25 "
+
+    with pytest.raises(ValueError, match="nan"):
+        params_header({"x": float("nan")})
+    with pytest.raises(QueryError, match="cannot be encoded"):
+        adapter.execute_batch([(f"CREATE (:N{i} {{x: $x}})", {"x": float("inf")}) for i in range(2)])
+    assert adapter._db.connection.round_trips == []
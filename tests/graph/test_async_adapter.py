@@ -0,0 +1,128 @@
+"""
+Tests for runtime.infrastructure.database.async_adapter.
+
+Queries must overlap up to the pool size, respect per-query timeouts and
+be reflected in the pool metrics.
+"""
+
+import asyncio
+import pytest
+from runtime.infrastructure.database import (
+    AsyncDatabaseAdapter,
+    ConnectionError,
+    QueryTimeoutError,
+)
+
+
+class SleepyAdapter(AsyncDatabaseAdapter):
+    """Each query sleeps for params['sleep'] seconds."""
+
+    def __init__(self, **kwargs):
+        super().__init__("g", **kwargs)
+        self.batches = []
+
+    async def _run_query(self, cypher, params):
+        await asyncio.sleep(params.get("sleep", 0))
+        return [[cypher]]
+
+    async def _run_batch(self, commands):
+        self.batches.append(commands)
+
+    async def _close(self):
+        pass
+
+
+def test_queries_overlap_up_to_pool_size():
+    adapter = SleepyAdapter(pool_size=4)
+
+    async def main():
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(*(adapter.query("q", {"sleep": 0.05}) for _ in range(8)))
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = asyncio.run(main())
+    stats = adapter.stats()
+    assert 0.09 <= elapsed < 0.35  # two waves of four, not eight serial queries
+    assert stats.peak_in_use == 4 and stats.in_use == 0
+    assert stats.queries == 8 and stats.total_wait_s > 0
+
+
+def test_query_timeout_and_acquire_timeout():
+    adapter = SleepyAdapter(pool_size=1, acquire_timeout=0.02)
+
+    async def main():
+        with pytest.raises(QueryTimeoutError):
+            await adapter.query("slow", {"sleep": 1}, timeout=0.01)
+        hog = asyncio.ensure_future(adapter.query("hog", {"sleep": 0.1}))
+        await asyncio.sleep(0)
+        with pytest.raises(QueryTimeoutError):
+            await adapter.query("starved")
+        await hog
+
+    asyncio.run(main())
+    assert adapter.stats().timeouts == 2
+    assert adapter.stats().in_use == 0
+
+
+def test_batch_is_coalesced_and_adapter_is_loop_bound():
+    adapter = SleepyAdapter()
+    stmt = "MATCH (n {id: $id}) SET n.x = $x"
+    asyncio.run(adapter.execute_batch([(stmt, {"id": i, "x": i}) for i in range(3)]))
+    assert len(adapter.batches) == 1 and len(adapter.batches[0]) == 1
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(adapter.query("other loop"))
+
+
+def test_factory_uses_host_override_and_closes_replaced_adapter(monkeypatch):
+    from runtime.infrastructure.database import async_adapter, factory
+
+    class FakeFalkor(SleepyAdapter):
+        def __init__(self, graph_name, host, port, **kwargs):
+            super().__init__(**kwargs)
+            self.address = (host, port)
+            self.closed = False
+
+        async def _close(self):
+            self.closed = True
+
+    monkeypatch.setattr(async_adapter, "AsyncFalkorDBAdapter", FakeFalkor)
+    monkeypatch.setattr(factory, "_async_instances", {})
+    monkeypatch.setattr(factory, "load_database_config", lambda: {
+        "database": {"backend": "falkordb", "falkordb": {"host": "config-host", "port": 1}},
+    })
+
+    async def main():
+        first = factory.get_async_database_adapter("g", host="app-host", port=7000)
+        await first.query("q")
+        second = factory.get_async_database_adapter("g", force_new=True, host="app-host", port=7000)
+        await asyncio.sleep(0.01)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first.address == ("app-host", 7000)
+    assert first.closed and not second.closed
+
+
+def test_falkordb_batch_uses_the_shared_params_header():
+    from runtime.infrastructure.database.async_adapter import AsyncFalkorDBAdapter
+
+    class FakePipeline:
+        def __init__(self):
+            self.commands = []
+
+        def execute_command(self, *args):
+            self.commands.append(args)
+
+        async def execute(self, raise_on_error=True):
+            return [b"OK" for _ in self.commands]
+
+    pipe = FakePipeline()
+    adapter = AsyncFalkorDBAdapter("g")
+    adapter._graph = object()  # No private client API may be needed
+    adapter._db = type("DB", (), {"connection": type("Conn", (), {"pipeline": lambda self, transaction: pipe})()})()
+
+    asyncio.run(adapter._run_batch([("MATCH (n {id: $id}) SET n.x = 1", {"id": 'a"b'})]))
+    assert pipe.commands == [
+        ("GRAPH.QUERY", "g", 'CYPHER id="a\\"b" MATCH (n {id: $id}) SET n.x = 1', "--compact"),
+    ]
@@ -0,0 +1,160 @@
+"""
+Tests for runtime.physics.graph.graph_ops apply().
+
+apply(bulk=True) must produce the same ApplyResult as the serial path
+while embedding in batches and sending writes as grouped batches, and
+only buffer writes made by the applying thread.
+"""
+
+import copy
+import itertools
+import re
+import threading
+import pytest
+from runtime.physics.graph import graph_ops_apply
+from runtime.physics.graph.graph_ops import GraphOps
+
+
+class FakeAdapter:
+    """Stores MERGEd node embeddings per label; records every call."""
+
+    def __init__(self, existing):
+        self.nodes = {label: dict(rows) for label, rows in existing.items()}
+        self.queries = []
+        self.batches = []
+        self.many = []
+
+    def query(self, cypher, params=None):
+        self.queries.append(cypher)
+        return self._run(cypher, params)
+
+    def _run(self, cypher, params):
+        match = re.search(r"MERGE \(n:(\w+) \{id: \$id\}\)", cypher)
+        if match:
+            props = params['props']
+            self.nodes.setdefault(match.group(1), {})[params['id']] = (props.get('name'), props.get('embedding'))
+            return []
+        match = re.search(r"MATCH \(n:(\w+)\)", cypher)
+        if match:
+            # Vector index: keyset page load, IN $ids fetch (embeddings or names), count
+            rows = {i: v for i, v in self.nodes.get(match.group(1), {}).items() if v[1]}
+            if '$after' in cypher:
+                ids = sorted(i for i in rows if i > params['after'])[:params['limit']]
+            elif '$ids' in cypher:
+                ids = [i for i in params['ids'] if i in rows]
+            elif 'count(n)' in cypher:
+                return [[len(rows)]]
+            else:
+                ids = list(rows)
+            column = 0 if 'n.name' in cypher else 1
+            return [[i, rows[i][column]] for i in ids]
+        if 'RETURN n.id' in cypher and 'IN $ids' not in cypher:
+            return [[i] for rows in self.nodes.values() for i in rows]
+        return []
+
+    def execute_batch(self, statements):
+        statements = list(statements)
+        self.batches.append(statements)
+        for cypher, params in statements:
+            self._run(cypher, params)
+
+    def execute_many(self, cypher, rows):
+        self.many.append((cypher, rows))
+
+
+class FakeService:
+    VECTORS = {'Aldric': [1.0, 0.0, 0.0], 'Sword': [0.0, 1.0, 0.0], 'York': [0.0, 0.0, 1.0]}
+
+    def __init__(self):
+        self.single = 0
+        self.batches = 0
+
+    def embed(self, text):
+        self.single += 1
+        return self._vector(text)
+
+    def embed_batch(self, texts):
+        self.batches += 1
+        return [self._vector(t) for t in texts]
+
+    def _vector(self, text):
+        for key, vec in self.VECTORS.items():
+            if text.startswith(key):
+                return vec
+        return [0.5, 0.5, 0.7]
+
+
+PAYLOAD = {
+    'nodes': [
+        {'type': 'character', 'id': 'char_aldric', 'name': 'Aldric'},
+        {'type': 'character', 'id': 'char_edmund', 'name': 'Edmund'},
+        {'type': 'place', 'id': 'place_york', 'name': 'York'},
+        {'type': 'thing', 'id': 'thing_sword', 'name': 'Sword'},
+        {'type': 'thing', 'id': 'thing_sword_2', 'name': 'Sword of York'},
+        {'type': 'dragon', 'id': 'dragon_1', 'name': 'Smaug'},
+        {'name': 'no id'},
+    ],
+    'links': [
+        {'type': 'present', 'from': 'char_edmund', 'to': 'place_york'},
+        {'type': 'carries', 'from': 'char_edmund', 'to': 'thing_sword'},
+        {'type': 'present', 'from': 'char_ghost', 'to': 'place_york'},
+        {'type': 'haunts', 'from': 'char_edmund', 'to': 'place_york'},
+    ],
+}
+
+
+GRAPH_IDS = itertools.count()
+
+
+@pytest.fixture
+def make_ops(monkeypatch):
+    service = FakeService()
+    monkeypatch.setattr(graph_ops_apply, 'get_embedding_service', lambda: service)
+
+    def make():
+        ops = GraphOps.__new__(GraphOps)
+        ops.graph_name = f"test_ops_{next(GRAPH_IDS)}"  # own shared index per fake graph
+        ops._adapter = FakeAdapter({'Character': {'char_old': ('Aldric the Elder', [1.0, 0.0, 0.0])}})
+        return ops, service
+    return make
+
+
+def test_bulk_apply_matches_serial(make_ops):
+    serial_ops, _ = make_ops()
+    serial = serial_ops.apply(data=copy.deepcopy(PAYLOAD))
+    bulk_ops, service = make_ops()
+    bulk = bulk_ops.apply(data=copy.deepcopy(PAYLOAD), bulk=True)
+
+    assert bulk.persisted == serial.persisted
+    assert bulk.rejected == serial.rejected
+    assert bulk.errors == serial.errors
+    assert [d['similar_to'] for d in bulk.duplicates] == ['char_old', 'thing_sword']
+    assert bulk.duplicates == serial.duplicates
+
+
+def test_bulk_apply_batches_embeddings_and_writes(make_ops):
+    ops, service = make_ops()
+    ops.apply(data=copy.deepcopy(PAYLOAD), bulk=True)
+
+    assert service.single == 0
+    assert service.batches == 2  # nodes, link embeddings
+    assert len(ops._adapter.batches) == 2  # nodes, links
+    first = ops._adapter.batches[0]
+    assert all(re.match(r"\s*MERGE \(n:\w+ \{id: \$id\}\)", cypher) for cypher, _ in first[:3])
+    assert not any('MERGE' in q for q in ops._adapter.queries)
+    assert [len(rows) for _, rows in ops._adapter.many] == [1, 1]
+
+
+def test_buffered_writes_are_per_thread(make_ops):
+    ops, _ = make_ops()
+    other = []
+
+    with ops._buffered_writes() as buffer:
+        ops._query("MATCH (n {id: $id}) SET n.x = 1", {"id": "mine"})
+        worker = threading.Thread(target=lambda: other.append(ops._query("RETURN n.id")))
+        worker.start()
+        worker.join()
+
+    assert buffer == [("MATCH (n {id: $id}) SET n.x = 1", {"id": "mine"})]
+    assert other == [[["char_old"]]] and ops._adapter.queries == ["RETURN n.id"]
+    assert ops._write_buffer() is None
@@ -0,0 +1,109 @@
+"""
+Tests for runtime.infrastructure.database.schema.
+
+Every node label (known or found in the graph) must get an id index once
+per graph (retried by the factory while the database is down), and the
+audit must flag scan operators of both backends' plans.
+"""
+
+from runtime.infrastructure.database import schema
+from runtime.infrastructure.database.hot_queries import project_hot_queries
+from runtime.infrastructure.database.schema import (
+    NODE_LABELS,
+    HotQuery,
+    audit_queries,
+    ensure_id_indexes,
+    plan_scans,
+)
+
+
+class FakeAdapter:
+    def __init__(self, graph_name, labels=(), healthy=True, plans=None):
+        self.graph_name = graph_name
+        self.labels = labels
+        self.healthy = healthy
+        self.plans = plans or {}
+        self.indexes = []
+        self.explained = []
+
+    def health_check(self):
+        return self.healthy
+
+    def query(self, cypher, params=None):
+        assert cypher == "CALL db.labels()"
+        return [[label] for label in self.labels]
+
+    def create_index(self, label, property_name):
+        self.indexes.append((label, property_name))
+
+    def explain(self, cypher, params=None):
+        self.explained.append(cypher)
+        for marker, plan in self.plans.items():
+            if marker in cypher:
+                return plan
+        raise RuntimeError("unknown query")
+
+
+def test_id_indexes_cover_graph_labels_once(monkeypatch):
+    monkeypatch.setattr(schema, "_ensured", set())
+    adapter = FakeAdapter("g1", labels=["Actor", "Task", "bad label"])
+
+    assert ensure_id_indexes(adapter) == list(NODE_LABELS) + ["Task"]
+    assert ensure_id_indexes(adapter) == []  # already provisioned
+    assert set(adapter.indexes) == {(label, "id") for label in list(NODE_LABELS) + ["Task"]}
+
+    down = FakeAdapter("g2", healthy=False)
+    assert ensure_id_indexes(down) == [] and not down.indexes
+
+
+def test_factory_retries_indexes_once_the_database_is_up(monkeypatch):
+    from runtime.infrastructure.database import factory, falkordb_adapter
+
+    down = FakeAdapter("g", healthy=False)
+    monkeypatch.setattr(schema, "_ensured", set())
+    monkeypatch.setattr(factory, "_instances", {})
+    monkeypatch.setattr(factory, "load_database_config", lambda: {
+        "database": {"backend": "falkordb", "falkordb": {"graph_name": "g"}},
+    })
+    monkeypatch.setattr(falkordb_adapter, "FalkorDBAdapter", lambda **kwargs: down)
+
+    assert factory.get_database_adapter() is down and not down.indexes
+    down.healthy = True
+    assert factory.get_database_adapter() is down
+    assert {label for label, _ in down.indexes} == set(NODE_LABELS)
+
+
+def test_plan_scans_reads_falkordb_and_neo4j_operators():
+    falkordb = ["Results", "    Project", "        Node By Label Scan | (n:Actor)", "        All Node Scan | (m)"]
+    neo4j = ["ProduceResults@neo4j", "    Filter@neo4j", "        AllNodesScan@neo4j"]
+    indexed = ["Results", "    Node By Index Scan | (n:Actor)"]
+
+    assert plan_scans(falkordb) == ["Node By Label Scan | (n:Actor)", "All Node Scan | (m)"]
+    assert plan_scans(neo4j) == ["AllNodesScan@neo4j"]
+    assert plan_scans(indexed) == []
+
+
+def test_audit_flags_unexpected_scans():
+    adapter = FakeAdapter("g", plans={
+        "(n:Actor": ["Results", "    Node By Index Scan | (n:Actor)"],
+        "MATCH (n)": ["Results", "    All Node Scan | (n)"],
+        "row.id": ["Results", "    Unwind", "        All Node Scan | (n)"],
+    })
+    audits = audit_queries(adapter, [
+        HotQuery("indexed", "MATCH (n:Actor {id: $id}) RETURN n"),
+        HotQuery("unlabeled", "MATCH (n) RETURN n"),
+        HotQuery("batch", "MATCH (n) RETURN n", allow_scan=True),
+        HotQuery("rows", "MATCH (n {id: row.id}) SET n.x = 1"),
+        HotQuery("broken", "RETURN nothing"),
+    ])
+
+    assert [a.ok for a in audits] == [True, False, True, False, False]
+    assert audits[1].scans == ["All Node Scan | (n)"]
+    assert adapter.explained[3].startswith("UNWIND $rows AS row\n")
+    assert audits[4].error == "unknown query"
+
+
+def test_hot_query_registry_imports():
+    names = [hot.name for hot in project_hot_queries()]
+    assert len(names) == len(set(names))
+    assert "exploration.neighbourhood" in names
@@ -0,0 +1,163 @@
+"""
+Tests for runtime.physics.graph.graph_vector_index module.
+
+Engines must agree with an exact cosine scan, and GraphVectorIndex must
+follow graph writes (initial paged load, dirty ids, count reconciliation).
+Shared indexes are per database, not just per graph name.
+"""
+
+import numpy as np
+import pytest
+from runtime.physics.graph.graph_vector_index import (
+    BruteForceEngine,
+    GraphVectorIndex,
+    IVFEngine,
+    Int8Engine,
+    _normalize,
+    database_address,
+    get_vector_index,
+)
+from runtime.physics.graph import graph_vector_index
+
+
+class FakeGraph:
+    """Serves the three query shapes GraphVectorIndex issues."""
+
+    def __init__(self, nodes):
+        self.nodes = dict(nodes)  # id -> embedding
+        self.calls = []
+
+    def query(self, cypher, params=None):
+        self.calls.append(cypher)
+        params = params or {}
+        if '$after' in cypher:
+            ids = sorted(i for i in self.nodes if i > params['after'])
+            return [[i, self.nodes[i]] for i in ids[:params['limit']]]
+        if '$ids' in cypher:
+            return [[i, self.nodes[i]] for i in params['ids'] if i in self.nodes]
+        if 'count(n)' in cypher:
+            return [[len(self.nodes)]]
+        return [[i] for i in self.nodes]
+
+
+def _exact(vectors, ids, query, k):
+    scores = _normalize(vectors) @ _normalize(query)
+    order = np.argsort(-scores, kind='stable')[:k]
+    return [ids[i] for i in order]
+
+
+def _clustered(rng, n, dim=32, clusters=40):
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(0, clusters, n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+def test_brute_force_matches_exact_after_updates():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, 16))
+    ids = [f"n{i}" for i in range(200)]
+    engine = BruteForceEngine()
+    engine.upsert(ids, vectors)
+
+    engine.remove(ids[:50])
+    vectors[60] = rng.normal(size=16)
+    engine.upsert([ids[60]], vectors[60:61])
+
+    query = rng.normal(size=16)
+    hits = engine.search(_normalize(query), 10)
+    assert [i for i, _ in hits] == _exact(vectors[50:], ids[50:], query, 10)
+    assert len(engine) == 150
+
+
+def test_ivf_recall_against_brute_force():
+    rng = np.random.default_rng(2)
+    vectors = _clustered(rng, 5000)
+    ids = [f"n{i}" for i in range(5000)]
+    ivf = IVFEngine(min_train=1000)
+    ivf.upsert(ids, vectors)
+    assert ivf.trained
+
+    recalls = []
+    for _ in range(20):
+        query = vectors[rng.integers(0, 5000)] + 0.1 * rng.normal(size=32)
+        expected = set(_exact(vectors, ids, query, 10))
+        got = {i for i, _ in ivf.search(_normalize(query), 10)}
+        recalls.append(len(expected & got) / 10)
+    assert np.mean(recalls) >= 0.9
+
+
+def test_ivf_is_exact_below_min_train():
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(300, 8))
+    ids = [f"n{i}" for i in range(300)]
+    ivf = IVFEngine()
+    ivf.upsert(ids, vectors)
+    query = rng.normal(size=8)
+    assert not ivf.trained
+    assert [i for i, _ in ivf.search(_normalize(query), 5)] == _exact(vectors, ids, query, 5)
+
+
+def test_graph_index_loads_in_pages_and_follows_writes():
+    rng = np.random.default_rng(4)
+    graph = FakeGraph({f"n{i:03d}": list(rng.normal(size=8)) for i in range(25)})
+    index = GraphVectorIndex(graph.query, engine='brute', refresh_interval=0.0, page_size=10)
+
+    query = list(rng.normal(size=8))
+    index.search('Narrative', query, 3)
+    assert sum('$after' in c for c in graph.calls) == 3
+    assert len(index._engines['Narrative']) == 25
+
+    # Event-driven: a node written through apply() is fetched by id
+    graph.nodes['n999'] = query
+    index.on_mutation({'type': 'node_created', 'data': {'id': 'n999', 'type': 'narrative'}})
+    assert index.search('Narrative', query, 1)[0][0] == 'n999'
+
+    # Out-of-band writer: caught by the count reconciliation
+    del graph.nodes['n999']
+    graph.nodes['n998'] = query
+    graph.nodes['n997'] = [0.0] * 8
+    hits = dict(index.search('Narrative', query, 30))
+    assert 'n999' not in hits
+    assert hits['n998'] == pytest.approx(1.0)
+    assert hits['n997'] == 0.0
+
+
+def test_graph_index_ignores_mismatched_dimensions():
+    graph = FakeGraph({'a': [1.0, 0.0], 'b': [1.0, 0.0, 0.0]})
+    index = GraphVectorIndex(graph.query, engine='ivf')
+    assert index.search('Thing', [1.0, 0.0], 5) == [('a', pytest.approx(1.0))]
+    assert index.search('Thing', [1.0, 0.0, 0.0], 5) == []
+
+
+def test_int8_within_is_exact_after_rescoring():
+    rng = np.random.default_rng(5)
+    vectors = _clustered(rng, 600, dim=64, clusters=20)
+    ids = [f"n{i:03d}" for i in range(600)]
+    graph = FakeGraph(dict(zip(ids, vectors.tolist())))
+    index = GraphVectorIndex(graph.query, engine='int8')
+
+    queries = vectors[rng.integers(0, 600, 12)] + 0.2 * rng.normal(size=(12, 64))
+    results = index.within('Thing', queries.tolist() + [[1.0, 0.0]], 0.9)
+
+    exact = _normalize(queries) @ _normalize(vectors).T
+    for row, hits in zip(exact, results):
+        expected = {ids[i] for i in np.flatnonzero(row >= 0.9)}
+        assert {i for i, _ in hits} == expected
+        assert [s for _, s in hits] == sorted((s for _, s in hits), reverse=True)
+    assert results[-1] == []
+    assert isinstance(index._engines['Thing'], Int8Engine)
+    assert index._engines['Thing']._matrix.dtype == np.int8
+
+
+def test_shared_indexes_are_per_database(monkeypatch):
+    monkeypatch.setattr(graph_vector_index, '_indexes', {})
+    monkeypatch.setattr(graph_vector_index, 'add_mutation_listener', lambda listener: None)
+    local, remote = FakeGraph({'a': [1.0, 0.0]}), FakeGraph({'b': [0.0, 1.0]})
+    local_host, local_port = database_address(type('Adapter', (), {'_host': 'localhost', '_port': 6379})())
+
+    first = get_vector_index('g', local.query, engine='brute', host=local_host, port=local_port)
+    second = get_vector_index('g', remote.query, engine='brute', host='db2', port=6379)
+
+    assert first is not second
+    assert first is get_vector_index('g', remote.query, engine='brute', host='localhost', port=6379)
+    assert [i for i, _ in second.search('Narrative', [0.0, 1.0], 1)] == ['b']
+    assert database_address(type('Neo4j', (), {'_uri': 'bolt://x:7687'})()) == ('bolt://x:7687', None)
@@ -0,0 +1,150 @@
+"""
+Tests for runtime.ingest.files module.
+
+Re-running the file scan with incremental=True must only read and write
+files that changed since the manifest, and must delete vanished files.
+"""
+
+import os
+import pytest
+from runtime.ingest import files
+
+
+class FakeAdapter:
+    """Tracks Thing/Space ids written through execute_many."""
+
+    def __init__(self):
+        self.things = {}
+        self.spaces = set()
+        self.writes = []
+
+    def query(self, cypher, params=None):
+        if 'count(t)' in cypher:
+            return [[sum(1 for props in self.things.values() if props.get('path'))]]
+        if ':Space' in cypher:
+            return [[i] for i in params['ids'] if i in self.spaces]
+        return [[i] for i in params['ids'] if i in self.things]
+
+    def execute_many(self, cypher, rows):
+        self.writes.append((cypher, rows))
+        if cypher is files.SPACE_CREATE:
+            self.spaces.update(r['id'] for r in rows)
+        elif cypher is files.THING_UPSERT:
+            for r in rows:
+                self.things.setdefault(r['id'], {}).update(r['props'])
+        elif cypher is files.THING_DELETE:
+            for r in rows:
+                self.things.pop(r['id'], None)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    adapter = FakeAdapter()
+    monkeypatch.setattr('runtime.infrastructure.database.get_database_adapter', lambda graph_name=None: adapter)
+    (tmp_path / 'pkg' / 'sub').mkdir(parents=True)
+    (tmp_path / 'README.md').write_text('# Demo\n')
+    (tmp_path / 'pkg' / 'a.py').write_text('"""Module a."""\nfrom .b import x\n')
+    (tmp_path / 'pkg' / 'b.py').write_text('x = 1\n')
+    (tmp_path / 'pkg' / 'sub' / 'c.py').write_text('# c\n')
+    return tmp_path, adapter
+
+
+def ingest(root):
+    return files.scan_and_ingest_files(root, graph_name='g', incremental=True)
+
+
+def upserted(adapter):
+    return sorted(r['id'] for cypher, rows in adapter.writes if cypher is files.THING_UPSERT for r in rows)
+
+
+def test_first_run_ingests_everything_in_bulk(repo):
+    root, adapter = repo
+    stats = ingest(root)
+
+    assert stats['files_scanned'] == 4 and stats['things_created'] == 4
+    assert stats['spaces_created'] == 3  # root, area pkg, module pkg/sub
+    assert len([w for w in adapter.writes if w[0] is files.THING_UPSERT]) == 1
+    assert adapter.things['thing:pkg/a.py']['synthesis'] == 'Module a.'
+    assert files.default_manifest_path(root, 'g').exists()
+
+
+def test_rerun_only_touches_changed_and_deleted_files(repo):
+    root, adapter = repo
+    ingest(root)
+    adapter.writes.clear()
+
+    b = root / 'pkg' / 'b.py'
+    b.write_text('x = 2\n')
+    # Touched with identical content: hash says unchanged
+    c = root / 'pkg' / 'sub' / 'c.py'
+    os.utime(c, ns=(c.stat().st_atime_ns, c.stat().st_mtime_ns + 10**9))
+    (root / 'README.md').unlink()
+
+    stats = ingest(root)
+
+    assert upserted(adapter) == ['thing:pkg/b.py']
+    assert stats['files_unchanged'] == 2
+    assert stats['things_updated'] == 1 and stats['things_created'] == 0
+    assert stats['things_deleted'] == 1 and 'thing:README.md' not in adapter.things
+
+    adapter.writes.clear()
+    assert ingest(root)['files_unchanged'] == 3
+    assert adapter.writes == []
+
+
+def test_reset_graph_ignores_manifest(repo):
+    root, adapter = repo
+    ingest(root)
+    adapter.things.clear()
+    adapter.spaces.clear()
+
+    stats = ingest(root)
+    assert stats['things_created'] == 4 and stats['files_unchanged'] == 0
+
+
+def test_unreadable_file_is_kept_and_retried(repo, monkeypatch):
+    root, adapter = repo
+    ingest(root)
+    b = root / 'pkg' / 'b.py'
+    b.write_text('x = 2\n')
+    read_bytes = type(b).read_bytes
+
+    def deny_b(path):
+        if path.name == 'b.py':
+            raise PermissionError('denied')
+        return read_bytes(path)
+
+    monkeypatch.setattr(type(b), 'read_bytes', deny_b)
+    stats = ingest(root)
+
+    assert stats['things_deleted'] == 0 and 'thing:pkg/b.py' in adapter.things
+    assert any('denied' in e for e in stats['errors'])
+
+    # Readable again: the change is picked up
+    monkeypatch.setattr(type(b), 'read_bytes', read_bytes)
+    adapter.writes.clear()
+    ingest(root)
+    assert upserted(adapter) == ['thing:pkg/b.py']
+
+
+def test_embeddings_are_written_with_labeled_matches(monkeypatch):
+    from runtime.infrastructure import embeddings
+
+    class Adapter:
+        writes = []
+
+        def query(self, cypher):
+            return [['a', 'text a', 'Thing'], ['b', 'text b', 'Space'], ['c', 'text c', 'Thing']]
+
+        def execute_many(self, cypher, rows):
+            self.writes.append((cypher, [r['id'] for r in rows]))
+
+    service = type('Service', (), {'embed_batch': lambda self, texts: [[1.0]] * len(texts)})()
+    monkeypatch.setattr(embeddings, 'get_embedding_service', lambda: service)
+    adapter = Adapter()
+
+    assert files._embed_all_nodes(adapter) == 3
+    assert [(' '.join(c.split()), ids) for c, ids in adapter.writes] == [
+        ('MATCH (n:Thing {id: row.id}) SET n.embedding = row.embedding', ['a', 'c']),
+        ('MATCH (n:Space {id: row.id}) SET n.embedding = row.embedding', ['b']),
+    ]
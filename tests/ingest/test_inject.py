@@ -0,0 +1,170 @@
+"""
+Tests for runtime.inject inject_many().
+
+inject_many must leave the graph as per-item inject() would, with one
+read per label, one embedding batch and grouped UNWIND writes.
+"""
+
+import copy
+import re
+import time
+from collections import Counter
+import pytest
+from runtime import inject as inject_module
+from runtime.infrastructure.database.schema import NODE_LABELS
+from runtime.inject import inject, inject_many
+
+
+class FakeAdapter:
+    """In-memory nodes and links answering both the serial and bulk queries."""
+
+    def __init__(self, nodes=None):
+        self.nodes = copy.deepcopy(nodes or {})  # id -> (label, props)
+        self.links = {}  # (from, to) -> props
+        self.queries = 0
+        self.writes = 0
+
+    def query(self, cypher, params=None):
+        self.queries += 1
+        if cypher is inject_module.NODE_LABELS_BY_ID:
+            return [[i, self.nodes[i][0]] for i in params['ids']
+                    if i in self.nodes and self.nodes[i][0] in NODE_LABELS]
+        match = re.search(r"MATCH \(n:(\w+) \{id: \$id\}\) RETURN n.synthesis", cypher)
+        if match:
+            node = self.nodes.get(params['id'])
+            return [[node[1].get('synthesis'), None]] if node and node[0] == match.group(1) else []
+        match = re.search(r"UNWIND \$ids AS id MATCH \(n:(\w+)", cypher)
+        if match:
+            return [[i, self.nodes[i][1].get('synthesis')] for i in params['ids']
+                    if i in self.nodes and self.nodes[i][0] == match.group(1)]
+        return []  # task / space resolution
+
+    def execute(self, cypher, params):
+        self.writes += 1
+        match = re.search(r"MERGE \(n:(\w+) \{id: \$id\}\)", cypher)
+        if match:
+            self._node(match.group(1), params)
+        else:
+            rest = {k: v for k, v in params.items() if k not in ('from_id', 'to_id', 'now')}
+            self._link(params['from_id'], params['to_id'], rest)
+
+    def execute_many(self, cypher, rows):
+        self.writes += 1
+        match = re.search(r"MERGE \(n:(\w+) \{id: row.id\}\)", cypher)
+        endpoints = re.findall(r"MATCH \(\w(?::(\w+))? \{id: row\.\w+\}\)", cypher)  # '' = unlabeled
+        for row in rows:
+            if match:
+                self._node(match.group(1), row['props'])
+                continue
+            labels = [self.nodes.get(row[key], ('',))[0] for key in ('from_id', 'to_id')]
+            if all(want in ('', have) for want, have in zip(endpoints, labels)):
+                self._link(row['from_id'], row['to_id'], row.get('props') or {'verb': row['verb']})
+
+    def _node(self, label, props):
+        self.nodes.setdefault(props['id'], (label, {}))[1].update(props)
+
+    def _link(self, from_id, to_id, props):
+        if from_id in self.nodes and to_id in self.nodes:
+            self.links.setdefault((from_id, to_id), {}).update(props)
+
+
+class FakeService:
+    def __init__(self):
+        self.single = 0
+        self.batches = 0
+
+    def embed(self, text):
+        self.single += 1
+        return [float(len(text))]
+
+    def embed_batch(self, texts):
+        self.batches += 1
+        return [[float(len(t))] for t in texts]
+
+
+ITEMS = [
+    {'id': 'thing:a', 'label': 'Thing', 'name': 'a', 'synthesis': 'module a'},
+    {'id': 'thing:b', 'label': 'Thing', 'name': 'b', 'synthesis': 'module b v2'},
+    {'id': 'thing:c', 'label': 'Thing', 'name': 'c', 'synthesis': 'module c'},
+    {'id': 'thing:a', 'label': 'Thing', 'name': 'a', 'synthesis': 'module a'},
+    {'from': 'thing:a', 'to': 'thing:b', 'verb': 'imports', 'weight': 0.5, 'synthesis': 'a imports b'},
+    {'from': 'thing:b', 'to': 'thing:c', 'verb': 'calls', 'synthesis': 'b calls c'},
+]
+
+EXISTING = {
+    'thing:b': ('Thing', {'id': 'thing:b', 'synthesis': 'module b'}),
+    'thing:c': ('Thing', {'id': 'thing:c', 'synthesis': 'module c'}),
+    'actor:human': ('Actor', {'id': 'actor:human'}),
+}
+
+
+def strip(props):
+    return {k: v for k, v in props.items() if not k.endswith('_at_s')}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = FakeService()
+    monkeypatch.setattr(inject_module, '_embedding_service', service)
+    inject_module.clear_context()
+    yield service
+    inject_module.clear_context()
+
+
+def test_inject_many_matches_serial(service):
+    serial = FakeAdapter(EXISTING)
+    serial_results = [inject(serial, dict(item), with_context=False) for item in ITEMS]
+    bulk = FakeAdapter(EXISTING)
+    service.single = 0
+
+    results = inject_many(bulk, [dict(item) for item in ITEMS])
+
+    assert results == serial_results == ['created', 'updated', 'unchanged', 'unchanged', 'created', 'created']
+    assert {i: (l, strip(p)) for i, (l, p) in bulk.nodes.items()} == \
+        {i: (l, strip(p)) for i, (l, p) in serial.nodes.items()}
+    assert {k: strip(p) for k, p in bulk.links.items()} == {k: strip(p) for k, p in serial.links.items()}
+    assert service.single == 0 and service.batches == 1
+    assert bulk.queries == 1 and bulk.writes == 2
+
+
+def test_inject_many_applies_context_like_serial(service):
+    nodes = [item for item in ITEMS if 'id' in item]
+    serial = FakeAdapter(EXISTING)
+    for item in nodes:
+        inject(serial, dict(item))
+        time.sleep(0.002)  # serial moment ids are per millisecond
+    inject_module.clear_context()
+    bulk = FakeAdapter(EXISTING)
+
+    inject_many(bulk, [dict(item) for item in nodes], with_context=True)
+
+    def shape(adapter):
+        moments = sorted(p['name'] for l, p in adapter.nodes.values() if l == 'Moment')
+        verbs = Counter(p['verb'] for p in adapter.links.values())
+        return moments, verbs
+
+    assert shape(bulk) == shape(serial)
+    assert shape(bulk)[1] == Counter({'creates': 2, 'follows': 1, 'touches': 2, 'captures': 2})
+
+
+def test_links_to_existing_nodes_match_their_labels(service):
+    adapter = FakeAdapter(EXISTING)
+    adapter.nodes['AGENT_Witness'] = ('Actor', {'id': 'AGENT_Witness'})
+
+    inject_many(adapter, [
+        {'from': 'AGENT_Witness', 'to': 'thing:b', 'verb': 'reads'},
+        {'from': 'thing:c', 'to': 'thing:b', 'verb': 'calls'},
+        {'from': 'thing:c', 'to': 'thing:missing', 'verb': 'calls'},
+    ])
+
+    assert set(adapter.links) == {('AGENT_Witness', 'thing:b'), ('thing:c', 'thing:b')}
+    assert adapter.queries == 1  # one label lookup for every unknown endpoint
+
+
+def test_links_to_nodes_outside_schema_labels_match_unlabeled(service):
+    adapter = FakeAdapter(EXISTING)
+    adapter.nodes['func:parse'] = ('Function', {'id': 'func:parse'})
+
+    inject_many(adapter, [{'from': 'thing:c', 'to': 'func:parse', 'verb': 'calls'}])
+
+    assert set(adapter.links) == {('thing:c', 'func:parse')}
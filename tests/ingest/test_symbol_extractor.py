@@ -0,0 +1,152 @@
+"""
+Tests for runtime.symbol_extractor parallel extraction.
+
+Files parsed in a process pool must yield the same symbols and links, in
+the same file order, as in-process parsing; scan_tree must attribute nested
+calls to every enclosing function; incremental runs re-parse only changed
+files and delete the symbols that vanished, but never those of a file that
+failed to parse.
+"""
+
+import ast
+import os
+from types import SimpleNamespace
+
+from runtime.symbol_extractor import SymbolExtractor, scan_tree
+
+
+SOURCES = {
+    "pkg/__init__.py": "from .a import helper\n",
+    "pkg/a.py": (
+        "import os\n"
+        "from pathlib import Path\n\n"
+        "def helper(x):\n"
+        "    if x:\n"
+        "        return os.path.join(x, 'y')\n"
+        "    return Path(x)\n"
+    ),
+    "pkg/b.py": (
+        "from pkg.a import helper\n\n"
+        "class Thing:\n"
+        "    def run(self):\n"
+        "        for i in range(3):\n"
+        "            yield helper(i)\n"
+    ),
+    "pkg/broken.py": "def oops(:\n",
+}
+
+
+def write_tree(root):
+    for rel, text in SOURCES.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return sorted(root.glob("pkg/*.py"))
+
+
+def test_parallel_extraction_matches_serial(tmp_path):
+    files = write_tree(tmp_path)
+    extractor = SymbolExtractor(base_path=tmp_path)
+
+    serial = list(extractor._extract_files(files, workers=1))
+    parallel = list(extractor._extract_files(files, workers=2))
+
+    assert [r[0] for r in parallel] == files
+    assert parallel == serial
+    symbols, _, error = {path.name: rest for path, *rest in serial}["broken.py"]
+    assert symbols == [] and "invalid syntax" in error
+    assert any(symbols for _, symbols, _, _ in serial)
+
+
+def test_scan_tree_attributes_calls_to_enclosing_functions():
+    tree = ast.parse(
+        "def outer():\n"
+        "    def inner():\n"
+        "        yield leaf()\n"
+        "    if a and b:\n"
+        "        top()\n"
+    )
+    facts = scan_tree(tree)
+    outer, inner = facts.functions
+
+    assert facts.calls[id(outer)] == {"leaf": 1, "top": 1}
+    assert facts.calls[id(inner)] == {"leaf": 1}
+    assert id(inner) in facts.generators and id(outer) in facts.generators
+
+
+class FakeAdapter:
+    """Graph still holds the manifest's symbols; records bulk statements."""
+
+    def __init__(self):
+        self.many = []
+
+    def query(self, cypher, params=None):
+        return [[len(params["ids"])]]
+
+    def execute_many(self, cypher, rows):
+        self.many.append((cypher, rows))
+
+
+def make_extractor(root, monkeypatch):
+    extractor = SymbolExtractor(base_path=root)
+    extractor.graph_ops = SimpleNamespace(_adapter=FakeAdapter())
+    upserted = []
+    monkeypatch.setattr(
+        extractor, "_upsert_to_graph",
+        lambda symbols, links: upserted.append({s.id for s in symbols}) or [],
+    )
+    return extractor, upserted
+
+
+def test_incremental_reparses_only_changed_files(tmp_path, monkeypatch):
+    write_tree(tmp_path)
+    (tmp_path / "pkg/broken.py").unlink()  # Parse failures: see the next test
+    manifest = tmp_path / "symbols.json"
+    extractor, upserted = make_extractor(tmp_path, monkeypatch)
+
+    full = extractor.extract_directory("pkg", workers=1, manifest_path=manifest)
+    assert full.files == 3 and manifest.exists()
+    assert "thing_FUNC_pkg-a-py_helper" in upserted[0]
+
+    # Touched but identical content: nothing re-parsed
+    os.utime(tmp_path / "pkg/b.py")
+    quiet = extractor.extract_directory("pkg", workers=1, incremental=True, manifest_path=manifest)
+    assert (quiet.files, quiet.files_unchanged, quiet.symbols_deleted) == (0, 3, 0)
+    assert upserted[1] == set()
+
+    (tmp_path / "pkg/a.py").write_text("def renamed():\n    return 1\n")
+    (tmp_path / "pkg/b.py").unlink()
+    changed = extractor.extract_directory("pkg", workers=1, incremental=True, manifest_path=manifest)
+
+    assert (changed.files, changed.files_unchanged) == (1, 1)
+    assert upserted[2] == {"thing_FILE_pkg-a-py", "thing_FUNC_pkg-a-py_renamed"}
+    many = extractor.graph_ops._adapter.many
+    deleted = {row["id"] for cypher, rows in many if "DETACH DELETE" in cypher for row in rows}
+    assert deleted == {
+        "thing_FUNC_pkg-a-py_helper",
+        "thing_FILE_pkg-b-py", "thing_CLASS_pkg-b-py_thing", "thing_METHOD_pkg-b-py_thing_run",
+    }
+    assert changed.symbols_deleted == 4
+
+
+def test_incremental_keeps_symbols_of_unparseable_file(tmp_path, monkeypatch):
+    write_tree(tmp_path)
+    manifest = tmp_path / "symbols.json"
+    extractor, upserted = make_extractor(tmp_path, monkeypatch)
+    full = extractor.extract_directory("pkg", workers=1, manifest_path=manifest)
+    assert any("broken.py" in e for e in full.errors)
+
+    # Mid-edit syntax error in a file the graph already holds
+    (tmp_path / "pkg/a.py").write_text("def helper(x:\n")
+    edited = extractor.extract_directory("pkg", workers=1, incremental=True, manifest_path=manifest)
+
+    assert any("a.py" in e for e in edited.errors)
+    assert edited.symbols_deleted == 0
+    assert not any("DETACH DELETE" in cypher for cypher, _ in extractor.graph_ops._adapter.many)
+    assert "thing_FUNC_pkg-a-py_helper" not in upserted[1]
+
+    # Fixed (and extended): re-parsed, nothing lost
+    (tmp_path / "pkg/a.py").write_text(SOURCES["pkg/a.py"] + "\ndef extra():\n    pass\n")
+    fixed = extractor.extract_directory("pkg", workers=1, incremental=True, manifest_path=manifest)
+    assert "pkg/a.py" in fixed.extracted_files and fixed.symbols_deleted == 0
+    assert "thing_FUNC_pkg-a-py_helper" in upserted[2]
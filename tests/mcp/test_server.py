@@ -0,0 +1,219 @@
+"""
+Tests for mcp.server: the stdio loop and lazy startup.
+
+Requests must be answered as they finish (not in arrival order), reading
+must pause at the in-flight limit, and every line must get a response:
+parse errors, non-object requests and handler exceptions included. Startup
+steps run after their dependencies, and a tool call waits only for the
+subsystems it uses.
+"""
+
+import asyncio
+import io
+import json
+import threading
+
+from mcp import server as mcp_server
+from mcp.server import MindServer, StartupTracker, serve_stdio
+
+
+class CountingInput(io.StringIO):
+    """stdin that counts the lines handed out."""
+
+    def __init__(self, lines):
+        super().__init__("".join(line + "\n" for line in lines))
+        self.lines_read = 0
+
+    def readline(self, *args):
+        line = super().readline(*args)
+        if line:
+            self.lines_read += 1
+        return line
+
+
+def run(server, lines, workers=4):
+    stdin = lines if isinstance(lines, CountingInput) else CountingInput(lines)
+    stdout = io.StringIO()
+    asyncio.run(serve_stdio(server, workers=workers, stdin=stdin, stdout=stdout))
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def request(request_id, method="ping"):
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method})
+
+
+class EchoServer:
+    def __init__(self, handle=None):
+        self.handle = handle or (lambda req: None)
+
+    def handle_request(self, req):
+        self.handle(req)
+        return {"jsonrpc": "2.0", "id": req["id"], "result": req["method"]}
+
+
+def test_responses_are_written_as_requests_finish():
+    second_done = threading.Event()
+
+    def handle(req):
+        if req["id"] == 1:
+            assert second_done.wait(5)
+        else:
+            second_done.set()
+
+    responses = run(EchoServer(handle), [request(1), request(2)])
+    assert [r["id"] for r in responses] == [2, 1]
+
+
+def test_reading_pauses_at_the_in_flight_limit(monkeypatch):
+    monkeypatch.setattr(mcp_server, "MAX_PENDING_PER_WORKER", 2)
+    gate = threading.Event()
+    stdin = CountingInput([request(i) for i in range(10)])
+    read_while_blocked = []
+
+    def release():
+        read_while_blocked.append(stdin.lines_read)
+        gate.set()
+
+    threading.Timer(0.2, release).start()
+    responses = run(EchoServer(lambda req: gate.wait(5)), stdin, workers=1)
+
+    # Two in flight plus the one line waiting for a slot
+    assert read_while_blocked == [3]
+    assert sorted(r["id"] for r in responses) == list(range(10))
+
+
+def test_bad_lines_and_handler_errors_get_error_responses():
+    def handle(req):
+        if req["method"] == "boom":
+            raise RuntimeError("handler exploded")
+
+    responses = run(EchoServer(handle), [
+        "{not json",
+        "[1, 2]",
+        request(7, "boom"),
+        request(8),
+    ])
+    by_code = {r.get("error", {}).get("code"): r for r in responses}
+
+    assert len(responses) == 4
+    assert by_code[-32700]["id"] is None
+    assert by_code[-32600]["id"] is None
+    assert by_code[-32603]["id"] == 7 and "handler exploded" in by_code[-32603]["error"]["message"]
+    assert by_code[None]["result"] == "ping"
+
+
+def test_startup_steps_wait_for_dependencies():
+    upgraded = threading.Event()
+    order = []
+    tracker = StartupTracker()
+    tracker.add("upgrade", lambda: upgraded.wait(5) and order.append("upgrade"))
+    tracker.add("graph", lambda: order.append("graph"), depends_on=("upgrade",))
+    tracker.add("agents", lambda: "no agents", depends_on=("upgrade",))
+    tracker.add("broken", lambda: 1 / 0)
+    tracker.start()
+
+    assert tracker.wait(["graph", "broken"], timeout=0.05) == ["graph"]
+    upgraded.set()
+    assert tracker.wait(tracker.names(), timeout=5) == []
+
+    assert order == ["upgrade", "graph"]
+    states = {name: line.split()[1] for name, line in zip(tracker.names(), tracker.report().splitlines()[1:])}
+    assert states == {"upgrade": "ready", "graph": "ready", "agents": "degraded", "broken": "failed"}
+
+
+def lazy_server(monkeypatch, tracker):
+    monkeypatch.setattr(mcp_server, "STARTUP_WAIT_S", 0.05)
+    server = MindServer.__new__(MindServer)
+    server._startup = tracker
+    server._tool_graph_query = lambda arguments: {"content": [{"type": "text", "text": "rows"}]}
+    return server
+
+
+def test_tool_calls_wait_only_for_their_subsystems(monkeypatch):
+    agents_up = threading.Event()
+    tracker = StartupTracker()
+    tracker.add("graph", lambda: None)
+    tracker.add("agents", lambda: agents_up.wait(5) and None)
+    tracker.start()
+    server = lazy_server(monkeypatch, tracker)
+
+    listed = server.handle_request({"id": 1, "method": "tools/list"})
+    graph = server.handle_request({"id": 2, "method": "tools/call", "params": {"name": "graph_query"}})
+    agents = server.handle_request({"id": 3, "method": "tools/call", "params": {"name": "agent_status"}})
+    agents_up.set()
+
+    assert listed["result"]["tools"]
+    assert graph["result"]["content"][0]["text"] == "rows"
+    assert "still starting up (agents)" in agents["result"]["content"][0]["text"]
+
+
+def test_unprovisioned_agents_report_degraded(monkeypatch):
+    class OfflineAgentGraph:
+        def ensure_agents_exist(self):
+            return False
+
+    monkeypatch.setattr(mcp_server, "AgentGraph", OfflineAgentGraph)
+    server = MindServer.__new__(MindServer)
+
+    assert "not provisioned" in server._init_agents()
+    assert isinstance(server.agent_graph, OfflineAgentGraph)
+
+
+def test_ask_single_presents_found_narratives(monkeypatch):
+    from runtime import explore_cmd
+    from runtime.infrastructure import database
+    from runtime.infrastructure.embeddings import scheduler
+    from runtime.physics.exploration import ExplorationResult
+    from runtime.physics.subentity import SubEntityState
+
+    class Scheduler:
+        async def embed(self, text):
+            return [1.0, 0.0]
+
+    class AsyncDB:
+        async def execute(self, cypher, params=None):
+            pass
+
+        async def query(self, cypher, params=None):
+            if "narr_ids" not in (params or {}):
+                return []
+            fetched.append(params["narr_ids"])
+            return [["narr_1", "Ledger", "The ledger is in the vault", "Ledger in the vault", "narrative", 1.0, 0.9]]
+
+    class Runner:
+        def __init__(self, graph, config, logger=None, exploration_id=None):
+            pass
+
+        async def explore(self, **kwargs):
+            assert kwargs["intention"] == "find the ledger"
+            return ExplorationResult(
+                subentity_id="se", actor_id="actor_x", origin_moment=kwargs["origin_moment"],
+                state=SubEntityState.MERGING, found_narratives={"narr_1": 0.9},
+                crystallized=None, satisfaction=0.9, depth=1, duration_s=0.0,
+            )
+
+    class GraphQueries:
+        graph_name = "g"
+
+        def _create_query_moment(self, query, embed_fn, initial_energy):
+            # Sync graph writes stay off the shared event loop
+            assert threading.current_thread() is not threading.main_thread()
+            assert embed_fn(query) == [1.0, 0.0]
+            return "moment_query_1"
+
+    async def graph_interface(graph_name=None):
+        return None
+
+    fetched = []
+
+    monkeypatch.setattr(scheduler, "get_embedding_scheduler", Scheduler)
+    monkeypatch.setattr(database, "get_async_database_adapter", lambda graph_name=None: AsyncDB())
+    monkeypatch.setattr(explore_cmd, "get_embedding_async", Scheduler().embed)
+    monkeypatch.setattr(explore_cmd, "get_graph_interface", graph_interface)
+    monkeypatch.setattr(explore_cmd, "ExplorationRunner", Runner)
+    server = MindServer.__new__(MindServer)
+    server.graph_queries = GraphQueries()
+
+    output = asyncio.run(server._ask_single("q", "actor_x", "find the ledger", 5.0, False, []))
+
+    assert output.startswith('**Query:** "q"') and fetched == [["narr_1"]]
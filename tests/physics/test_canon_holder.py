@@ -0,0 +1,90 @@
+"""
+Tests for runtime.infrastructure.canon.canon_holder batch validation.
+
+A batch of moments must be validated with one neighbourhood query and
+resolved with one write, applying the same rules as the per-moment checks.
+"""
+
+from runtime.infrastructure.canon.canon_holder import (
+    BATCH_NEIGHBOURHOOD_QUERY,
+    BATCH_TRANSITION_QUERY,
+    CanonHolder,
+)
+
+
+def neighbourhood(mid, speakers=(), contradicting=(), can_become=(), sequence=()):
+    return {
+        "id": mid,
+        "speakers": list(speakers),
+        "about_actors": [],
+        "contradicting": list(contradicting),
+        "can_become": list(can_become),
+        "sequence": list(sequence),
+    }
+
+
+class FakeQueries:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def query(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        if cypher is BATCH_NEIGHBOURHOOD_QUERY:
+            return [r for r in self.rows if r["id"] in params["ids"]]
+        if cypher is BATCH_TRANSITION_QUERY:
+            return [{"moved": [{"id": r["id"]} for r in params["rows"]], "returned": 0.5}]
+        raise AssertionError(f"unexpected query: {cypher}")
+
+
+ROWS = [
+    neighbourhood("m_ok", speakers=[{"id": "char_a", "alive": True, "rel": "EXPRESSES"}]),
+    neighbourhood("m_dead", speakers=[{"id": "char_b", "alive": False, "rel": "CAN_SPEAK"}]),
+    # Contradicts m_ok, which is only possible until the batch activates it
+    neighbourhood("m_clash", contradicting=[{"id": "m_ok", "status": "possible"}]),
+    # Required predecessor m_ok becomes active earlier in the batch
+    neighbourhood("m_next", can_become=[{"id": "m_ok", "status": "possible", "required": True}]),
+    neighbourhood("m_seq", sequence=[{"id": "m_old", "status": "active"}]),
+]
+
+
+def test_validate_batch_is_one_query_and_sequential():
+    queries = FakeQueries(ROWS)
+    holder = CanonHolder(queries, None)
+
+    results = holder.validate_batch(["m_ok", "m_dead", "m_clash", "m_next", "m_seq", "m_missing"])
+
+    assert len(queries.calls) == 1
+    assert {mid for mid, r in results.items() if r.valid} == {"m_ok", "m_next"}
+    assert results["m_dead"].unavailable_actors == ["char_b"]
+    assert results["m_clash"].contradicting_moments == ["m_ok"]
+    assert results["m_seq"].broken_chain and "m_missing" not in results
+
+    independent = holder.validate_batch(["m_ok", "m_clash", "m_next"], sequential=False)
+    assert independent["m_clash"].valid and not independent["m_next"].valid
+
+
+def test_resolve_batch_writes_once():
+    queries = FakeQueries(ROWS)
+    holder = CanonHolder(queries, None)
+
+    resolved = holder.resolve_batch(["m_ok", "m_dead", "m_clash"], current_tick=7)
+
+    assert len(queries.calls) == 2
+    _, params = queries.calls[1]
+    assert params["tick"] == 7 and params["return_to"] == "char_player"
+    assert params["rows"] == [
+        {"id": "m_ok", "status": "active"},
+        {"id": "m_dead", "status": "failed"},
+        {"id": "m_clash", "status": "failed"},
+    ]
+    assert set(resolved) == {"m_ok", "m_dead", "m_clash"}
+
+
+def test_validate_for_activation_uses_batch():
+    queries = FakeQueries(ROWS)
+    holder = CanonHolder(queries, None)
+
+    assert not holder.validate_for_activation("m_dead").valid
+    assert holder.validate_for_activation("m_unknown").valid
+    assert len(queries.calls) == 2
@@ -0,0 +1,127 @@
+"""
+Tests for the per-exploration embedding cache in runtime.physics.exploration.
+
+Path embeddings must come from the cache (seeded by outgoing-link fetches)
+instead of one graph read per path link per step.
+"""
+
+import asyncio
+from runtime.physics.exploration import (
+    EmbeddingCache,
+    ExplorationConfig,
+    ExplorationRunner,
+    GraphInterface,
+)
+from runtime.physics.subentity import create_subentity
+
+
+class ChainGraph:
+    """n0 → n1 → ... → n{length}, every link and node embedded."""
+
+    def __init__(self, length=8, dim=4):
+        self.length = length
+        self.dim = dim
+        self.calls = {'link_embedding': 0, 'link_embeddings': 0, 'outgoing': 0}
+
+    def _emb(self, i):
+        return [1.0 if j == i % self.dim else 0.1 for j in range(self.dim)]
+
+    async def get_outgoing_links(self, node_id):
+        self.calls['outgoing'] += 1
+        i = int(node_id[1:])
+        if i >= self.length:
+            return []
+        return [{'id': f"l{i}", 'node_a': node_id, 'node_b': f"n{i + 1}",
+                 'weight': 0.0, 'polarity': [1.0, 1.0], 'embedding': self._emb(i)}]
+
+    async def get_link_embedding(self, link_id):
+        self.calls['link_embedding'] += 1
+        return self._emb(int(link_id[1:]))
+
+    async def get_link_embeddings(self, link_ids):
+        self.calls['link_embeddings'] += 1
+        return {link_id: self._emb(int(link_id[1:])) for link_id in link_ids}
+
+    async def get_node(self, node_id):
+        return {'id': node_id, 'name': node_id, 'weight': 1.0, 'energy': 0.0,
+                'embedding': self._emb(int(node_id[1:]))}
+
+    async def get_node_embedding(self, node_id):
+        return self._emb(int(node_id[1:]))
+
+    async def is_false(self, node_id):
+        return False
+
+    def interface(self, bulk=True):
+        return GraphInterface(
+            get_node=self.get_node,
+            get_node_embedding=self.get_node_embedding,
+            get_outgoing_links=self.get_outgoing_links,
+            get_link_embedding=self.get_link_embedding,
+            get_link_embeddings=self.get_link_embeddings if bulk else None,
+            is_narrative=self.is_false,
+            is_moment=self.is_false,
+        )
+
+
+def _subentity(runner, position='n0', path=()):
+    se = create_subentity(
+        actor_id='n0', origin_moment='', query='q', query_embedding=[1.0, 0.0, 0.0, 0.0],
+        intention='q', intention_embedding=[1.0, 0.0, 0.0, 0.0],
+        start_position=position, context=runner._context,
+    )
+    se.path = list(path)
+    return se
+
+
+def test_cache_is_bounded_lru():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put('link', 'a', [1.0])
+    cache.put('link', 'b', [2.0])
+    assert cache.get('link', 'a') == [1.0]
+    cache.put('link', 'c', [3.0])
+    assert cache.get('link', 'b', None) is None
+    assert len(cache) == 2
+
+
+def test_seeking_reads_path_embeddings_from_cache():
+    graph = ChainGraph(length=8)
+    runner = ExplorationRunner(graph.interface(), ExplorationConfig(max_depth=8, min_link_score=-1.0))
+    se = _subentity(runner)
+
+    async def walk():
+        for _ in range(8):
+            await runner._step_seeking(se)
+
+    asyncio.run(walk())
+    assert se.depth == 8
+    assert graph.calls['link_embedding'] == 0
+    assert graph.calls['link_embeddings'] == 0
+
+
+def test_misses_go_out_in_one_bulk_call_and_updates_invalidate():
+    graph = ChainGraph(length=8)
+    runner = ExplorationRunner(graph.interface())
+    se = _subentity(runner, 'n5', [(f"l{i}", f"n{i + 1}") for i in range(5)])
+
+    first = asyncio.run(runner._path_embeddings(se))
+    again = asyncio.run(runner._path_embeddings(se))
+    assert first == again and len(first) == 5
+    assert graph.calls['link_embeddings'] == 1
+
+    async def update(link_id, link):
+        pass
+    runner.graph.update_link = update
+    asyncio.run(runner._update_link({'id': 'l2'}))
+    asyncio.run(runner._path_embeddings(se))
+    assert graph.calls['link_embeddings'] == 2
+
+
+def test_falls_back_to_single_link_reads_once_each():
+    graph = ChainGraph(length=8)
+    runner = ExplorationRunner(graph.interface(bulk=False))
+    se = _subentity(runner, 'n3', [('l0', 'n1'), ('l1', 'n2'), ('l0', 'n1')])
+
+    assert len(asyncio.run(runner._path_embeddings(se))) == 3
+    asyncio.run(runner._path_embeddings(se))
+    assert graph.calls['link_embedding'] == 2
@@ -0,0 +1,126 @@
+"""
+Tests for runtime.physics.exploration_graph.
+
+Lookups must be labeled and parameterized; one neighbourhood query per
+step must serve later node and link reads from the per-exploration cache;
+concurrent lookups of one node must share a query.
+"""
+
+import asyncio
+
+from runtime.physics.exploration_graph import (
+    LINK_QUERY,
+    NEIGHBOURHOOD_QUERY,
+    NODE_QUERY,
+    ExplorationGraph,
+)
+
+
+NODES = {
+    'char_a': ({'id': 'char_a', 'node_type': 'actor', 'energy': 0.1, 'embedding': '[1.0, 0.0]'}, 'Actor'),
+    'moment_1': ({'id': 'moment_1', 'node_type': 'moment', 'energy': 0.0}, 'Moment'),
+    'narr_1': ({'id': 'narr_1', 'node_type': 'narrative', 'energy': 0.0}, 'Narrative'),
+}
+
+# (rel props, type, from, to)
+LINKS = [
+    ({'id': 'l1', 'polarity': [0.9, 0.2], 'embedding': [0.0, 1.0]}, 'link', 'char_a', 'moment_1'),
+    ({'id': 'l2', 'polarity': [0.7, 0.3]}, 'link', 'narr_1', 'char_a'),
+]
+
+
+class FakeAsyncAdapter:
+    def __init__(self):
+        self.calls = []
+        self.executed = []
+
+    async def query(self, cypher, params=None):
+        self.calls.append(cypher)
+        await asyncio.sleep(0)  # let concurrent callers interleave
+        node_id = (params or {}).get('id')
+        if cypher is NODE_QUERY:
+            return [list(NODES[node_id])] if node_id in NODES else []
+        if cypher is NEIGHBOURHOOD_QUERY:
+            rows = []
+            for rel, rel_type, a, b in LINKS:
+                if node_id in (a, b):
+                    other = b if a == node_id else a
+                    rows.append([rel, rel_type, a == node_id, *NODES[other]])
+            return rows
+        if cypher is LINK_QUERY:
+            return [[rel, t, a, b] for rel, t, a, b in LINKS if rel['id'] == node_id]
+        raise AssertionError(f"unexpected query: {cypher}")
+
+    async def execute(self, cypher, params=None):
+        self.executed.append((cypher, params))
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_queries_are_labeled_and_parameterized():
+    for cypher in (NODE_QUERY, NEIGHBOURHOOD_QUERY):
+        assert '$id' in cypher and '(n {' not in cypher
+        assert cypher.count('UNION ALL') == 4
+
+
+def test_neighbourhood_seeds_node_and_link_reads():
+    adapter = FakeAsyncAdapter()
+    graph = ExplorationGraph(adapter).interface()
+
+    async def step():
+        links = await graph.get_outgoing_links('char_a')
+        return links, await asyncio.gather(
+            graph.is_moment('moment_1'),
+            graph.is_narrative('narr_1'),
+            graph.get_link('l2'),
+            graph.get_link_embeddings(['l1', 'l2']),
+        )
+
+    links, (is_moment, is_narrative, stored, embeddings) = run(step())
+
+    assert adapter.calls == [NEIGHBOURHOOD_QUERY]
+    assert is_moment and is_narrative
+    out, back = links
+    assert (out['node_a'], out['node_b'], out['to_type']) == ('char_a', 'moment_1', 'moment')
+    # Incoming link is traversed in reverse with swapped polarity...
+    assert (back['node_a'], back['node_b']) == ('char_a', 'narr_1')
+    assert (back['polarity_ab'], back['polarity_ba']) == (0.3, 0.7)
+    # ...but cached in its stored direction
+    assert (stored['node_a'], stored['polarity_ab']) == ('narr_1', 0.7)
+    assert embeddings == {'l1': [0.0, 1.0], 'l2': None}
+
+
+def test_concurrent_lookups_share_one_query_and_return_copies():
+    adapter = FakeAsyncAdapter()
+    graph = ExplorationGraph(adapter).interface()
+
+    async def lookups():
+        return await asyncio.gather(*(graph.get_node('char_a') for _ in range(5)))
+
+    nodes = run(lookups())
+    assert adapter.calls == [NODE_QUERY]
+    assert nodes[0]['embedding'] == [1.0, 0.0]
+
+    nodes[0]['energy'] = 99.0  # in-place edits stay with the caller
+    assert run(graph.get_node('char_a'))['energy'] == 0.1
+    assert run(graph.get_node('nobody')) is None
+    assert run(graph.get_node('nobody')) is None
+    assert adapter.calls.count(NODE_QUERY) == 2
+
+
+def test_update_node_writes_by_label_and_refreshes_cache():
+    adapter = FakeAsyncAdapter()
+    graph = ExplorationGraph(adapter).interface()
+
+    async def update():
+        await graph.update_node('char_a', {'energy': 0.5, 'tags': ['x']})
+        return await graph.get_node('char_a')
+
+    node = run(update())
+    (cypher, params), = adapter.executed
+    assert 'MATCH (n:Actor {id: $id})' in cypher
+    assert params == {'id': 'char_a', 'props': {'energy': 0.5}}
+    assert node['energy'] == 0.5
+    assert adapter.calls == [NODE_QUERY]
@@ -0,0 +1,89 @@
+"""
+Tests for runtime.physics.link_scoring batch scoring.
+
+score_links_batch must reproduce the per-link formula, including the
+neutral/degenerate cases (no intention, empty or mismatched embeddings).
+"""
+
+import random
+import pytest
+from runtime.physics.link_scoring import (
+    calculate_permanence,
+    cosine_similarity,
+    get_polarity,
+    score_links_batch,
+    score_outgoing_links,
+)
+
+
+def _reference_max(embedding, embedding_set):
+    best = 0.0
+    for other in embedding_set:
+        if other:
+            best = max(best, cosine_similarity(embedding, other))
+    return best
+
+
+def _reference_score(link, from_id, intention, path, siblings):
+    emb = link.get('embedding')
+    semantic = cosine_similarity(emb, intention) if emb and intention else 0.5
+    novelty = 1.0 - _reference_max(emb, path) if emb and path else 1.0
+    divergence = 1.0 - _reference_max(emb, siblings) if emb and siblings else 1.0
+    permanence = calculate_permanence(link.get('weight', 1.0))
+    return semantic * get_polarity(link, from_id) * (1.0 - permanence) * novelty * divergence
+
+
+def _vec(rng, dim=12):
+    return [rng.uniform(-1, 1) for _ in range(dim)]
+
+
+def _links(rng, n=60):
+    links = []
+    for i in range(n):
+        link = {'node_a': 'hub', 'node_b': f"n{i}", 'weight': rng.choice([None, 0.0, 0.5, 3.0, -1.0])}
+        kind = i % 6
+        if kind == 1:
+            link['embedding'] = []
+        elif kind == 2:
+            link['embedding'] = [0.0] * 12
+        elif kind == 3:
+            link['embedding'] = _vec(rng, dim=5)
+        elif kind != 4:
+            link['embedding'] = _vec(rng)
+        if i % 4 == 0:
+            link['polarity'] = [rng.uniform(-1, 1), rng.uniform(-1, 1)]
+        links.append(link)
+    return links
+
+
+@pytest.mark.parametrize('has_intention', [True, False])
+def test_batch_matches_per_link_formula(has_intention):
+    rng = random.Random(7)
+    links = _links(rng)
+    intention = _vec(rng) if has_intention else []
+    path = [_vec(rng), [], _vec(rng, dim=5)]
+    siblings = [_vec(rng) for _ in range(3)]
+
+    batch = score_links_batch(links, 'hub', intention, path, siblings)
+    for link, (score, components) in zip(links, batch):
+        assert score == pytest.approx(_reference_score(link, 'hub', intention, path, siblings), abs=1e-9)
+        assert set(components) == {
+            'semantic', 'polarity', 'permanence', 'permanence_factor',
+            'self_novelty', 'sibling_divergence',
+        }
+
+
+def test_outgoing_ranking_and_filtering():
+    rng = random.Random(11)
+    links = _links(rng) + [{'node_a': 'x', 'node_b': 'y', 'embedding': _vec(rng)}]
+    intention = _vec(rng)
+    path = [_vec(rng)]
+
+    scored = score_outgoing_links(links, 'hub', intention, path, [], min_score=0.0)
+    expected = sorted(
+        (_reference_score(l, 'hub', intention, path, []) for l in links[:-1]),
+        reverse=True,
+    )
+    expected = [s for s in expected if s >= 0.0]
+    assert [s for _, s, _ in scored] == pytest.approx(expected, abs=1e-9)
+    assert all(l['node_a'] == 'hub' for l, _, _ in scored)
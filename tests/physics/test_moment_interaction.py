@@ -0,0 +1,109 @@
+"""
+Tests for runtime.physics.phases.moment_interaction module.
+
+Checks the batched Phase 4 against the original pairwise loop.
+"""
+
+import math
+import random
+import pytest
+from runtime.physics.constants import (
+    SUPPORT_THRESHOLD, CONTRADICT_THRESHOLD, INTERACTION_RATE,
+    PLUTCHIK_AXES, plutchik_proximity
+)
+from runtime.physics.phases.moment_interaction import phase_moment_interaction
+
+
+class FakeQueries:
+    """TickQueries stand-in with fixed axes and ABOUT incidence."""
+
+    def __init__(self, axes, about):
+        self.axes = axes
+        self.about = about
+        self.energy = {}
+        self.batch_calls = 0
+
+    def get_moment_axes(self, moment_id):
+        return self.axes[moment_id]
+
+    def get_moment_axes_batch(self, moment_ids):
+        self.batch_calls += 1
+        return {mid: self.axes[mid] for mid in moment_ids}
+
+    def get_about_incidence(self, moment_ids):
+        return [(m, n) for m in moment_ids for n in self.about.get(m, [])]
+
+    def get_shared_narratives(self, m1_id, m2_id):
+        return sorted(set(self.about.get(m1_id, [])) & set(self.about.get(m2_id, [])))
+
+    def set_energy(self, label, node_id, energy):
+        self.energy[node_id] = energy
+
+
+def reference_interaction(active_moments, queries):
+    """The original O(N²) pairwise Phase 4."""
+    total = 0.0
+    axes = {m['id']: queries.get_moment_axes(m['id']) for m in active_moments}
+    for i, m1 in enumerate(active_moments):
+        m1_energy = m1.get('energy', 0.0) or 0.0
+        if m1_energy <= 0.01:
+            continue
+        for m2 in active_moments[i + 1:]:
+            m2_energy = m2.get('energy', 0.0) or 0.0
+            if not queries.get_shared_narratives(m1['id'], m2['id']):
+                continue
+            proximity = plutchik_proximity(axes[m1['id']], axes[m2['id']])
+            if proximity > SUPPORT_THRESHOLD:
+                support = m1_energy * INTERACTION_RATE * proximity
+                m2_energy += support * math.sqrt(m2.get('weight', 1.0) or 1.0)
+                total += support
+                queries.set_energy('Moment', m2['id'], m2_energy)
+            elif proximity < CONTRADICT_THRESHOLD:
+                suppress = m1_energy * INTERACTION_RATE * (1 - proximity)
+                m2_energy = max(0, m2_energy - suppress)
+                total += suppress
+                queries.set_energy('Moment', m2['id'], m2_energy)
+    return total
+
+
+def _random_case(seed, n=40, narratives=6):
+    rng = random.Random(seed)
+    moments, axes, about = [], {}, {}
+    for i in range(n):
+        mid = f"m{i}"
+        moments.append({'id': mid, 'energy': rng.choice([0.0, 0.005, rng.random()]),
+                        'weight': rng.choice([None, rng.random() * 2])})
+        # Clustered axes so both support and contradiction occur
+        base = rng.choice([-1.0, 1.0])
+        axes[mid] = {a: max(-1.0, min(1.0, base + rng.gauss(0, 0.3))) for a in PLUTCHIK_AXES}
+        about[mid] = rng.sample([f"n{k}" for k in range(narratives)], rng.randint(0, 2))
+    return moments, axes, about
+
+
+class TestBatchedInteraction:
+    """Batched Phase 4 matches the pairwise loop."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_pairwise_loop(self, seed):
+        moments, axes, about = _random_case(seed)
+        expected_q = FakeQueries(axes, about)
+        expected = reference_interaction(moments, expected_q)
+
+        batched_q = FakeQueries(axes, about)
+        total = phase_moment_interaction(moments, batched_q)
+
+        assert total == pytest.approx(expected)
+        assert set(batched_q.energy) == set(expected_q.energy)
+        for mid, value in expected_q.energy.items():
+            assert batched_q.energy[mid] == pytest.approx(value)
+        assert batched_q.batch_calls == 1
+
+    def test_no_shared_narratives(self):
+        axes = {m: {a: 0.0 for a in PLUTCHIK_AXES} for m in ('a', 'b')}
+        queries = FakeQueries(axes, {'a': ['n1'], 'b': ['n2']})
+        moments = [{'id': 'a', 'energy': 1.0}, {'id': 'b', 'energy': 1.0}]
+        assert phase_moment_interaction(moments, queries) == 0.0
+        assert queries.energy == {}
+
+    def test_single_moment(self):
+        assert phase_moment_interaction([{'id': 'a'}], FakeQueries({}, {})) == 0.0
@@ -0,0 +1,166 @@
+"""
+Tests for runtime.physics.proximity_index module.
+
+The incrementally repaired tree must match a from-scratch Dijkstra after
+any sequence of link changes.
+"""
+
+import random
+import pytest
+from runtime.physics.constants import BLOCKED_PATH_RESISTANCE
+from runtime.physics.graph.graph_query_utils import dijkstra_single_source
+from runtime.physics.proximity_index import ProximityIndex, link_resistance
+
+
+class FakeRead:
+    """Serves link rows to ProximityIndex.build / refresh_nodes."""
+
+    def __init__(self, links):
+        self.links = links
+        self.calls = 0
+
+    def query(self, cypher, params=None):
+        self.calls += 1
+        if 'id(r) > $after' in cypher:
+            rows = [dict(l, rid=i) for i, l in enumerate(self.links) if i > params['after']]
+            return rows[:params['limit']]
+        ids = set(params['ids'])
+        return [l for l in self.links if l['node_a'] in ids or l['node_b'] in ids]
+
+
+def _link(a, b, weight, link_type='RELATES'):
+    return {'node_a': a, 'node_b': b, 'type': link_type, 'weight': weight}
+
+
+def _reference(links, root):
+    edges = [
+        {'node_a': l['node_a'], 'node_b': l['node_b'], 'weight': l['weight'],
+         'emotion_factor': 0.5}
+        for l in links
+    ]
+    return dijkstra_single_source(edges, root, max_hops=10 ** 6)
+
+
+def _random_links(rng, nodes=30, edges=80):
+    links = {}
+    for _ in range(edges):
+        a, b = rng.sample(range(nodes), 2)
+        key = (f"n{a}", f"n{b}", 'RELATES')
+        links[key] = _link(*key[:2], weight=rng.uniform(0.1, 3.0))
+    return links
+
+
+class TestProximityIndex:
+    """Full builds and incremental repairs."""
+
+    def test_build_matches_dijkstra(self):
+        rng = random.Random(1)
+        links = list(_random_links(rng).values())
+        index = ProximityIndex(max_hops=10 ** 6)
+        index.build(FakeRead(links), 'n0')
+
+        expected = _reference(links, 'n0')
+        assert index.distances() == pytest.approx(expected)
+
+    def test_build_pages_without_cap(self, monkeypatch):
+        monkeypatch.setattr('runtime.physics.proximity_index.PROXIMITY_PAGE_SIZE', 7)
+        links = [_link(f"n{i}", f"n{i + 1}", 1.0) for i in range(50)]
+        read = FakeRead(links)
+        index = ProximityIndex(max_hops=10 ** 6)
+        index.build(read, 'n0')
+
+        assert index.edge_count == 50
+        assert read.calls == 8
+        assert index.resistance('n50') == pytest.approx(50 * link_resistance(links[0]))
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_incremental_matches_rebuild(self, seed):
+        rng = random.Random(seed)
+        links = _random_links(rng)
+        index = ProximityIndex(max_hops=10 ** 6)
+        index.build(FakeRead(list(links.values())), 'n0')
+
+        for _ in range(15):
+            changed = []
+            for _ in range(rng.randint(1, 6)):
+                op = rng.random()
+                if op < 0.2 and links:
+                    key = rng.choice(list(links))
+                    del links[key]
+                    changed.append((key, None))
+                else:
+                    key = rng.choice(list(links)) if op < 0.7 else \
+                        tuple(f"n{x}" for x in rng.sample(range(35), 2)) + ('RELATES',)
+                    links[key] = _link(*key[:2], weight=rng.uniform(0.05, 3.0))
+                    changed.append((key, link_resistance(links[key])))
+            index.apply_changes(changed)
+
+            expected = _reference(list(links.values()), 'n0')
+            assert index.distances() == pytest.approx(expected)
+            for node, parent in index.parent.items():
+                if parent is not None:
+                    assert index.depth[node] == index.depth[parent] + 1
+
+    def test_hop_limit_blocks_deep_nodes(self):
+        links = [_link(f"n{i}", f"n{i + 1}", 1.0) for i in range(6)]
+        index = ProximityIndex(max_hops=5)
+        index.build(FakeRead(links), 'n0')
+
+        assert index.resistance('n5') < BLOCKED_PATH_RESISTANCE
+        assert index.resistance('n6') == BLOCKED_PATH_RESISTANCE
+        assert index.resistance('missing') == BLOCKED_PATH_RESISTANCE
+
+    def test_mutation_events_refresh_touched_nodes(self):
+        links = [_link('player', 'a', 1.0)]
+        read = FakeRead(links)
+        index = ProximityIndex()
+        index.sync(read, 'player')
+        assert index.resistance('b') == BLOCKED_PATH_RESISTANCE
+
+        links.append(_link('a', 'b', 1.0))
+        index.on_mutation({'type': 'link_created', 'data': {'from': 'a', 'to': 'b'}})
+        index.sync(read, 'player')
+        assert index.resistance('b') == pytest.approx(2 * link_resistance(links[0]))
+
+        links.pop(0)
+        index.on_mutation({'type': 'link_updated', 'data': {'from': 'player'}})
+        index.sync(read, 'player')
+        assert index.resistance('b') == BLOCKED_PATH_RESISTANCE
+
+    def test_update_links_from_tick(self):
+        links = [_link('player', 'a', 1.0), _link('a', 'b', 1.0), _link('player', 'b', 0.1)]
+        index = ProximityIndex()
+        index.build(FakeRead(links), 'player')
+        via_a = 2 * link_resistance(links[0])
+        assert index.resistance('b') == pytest.approx(via_a)
+
+        changed = index.update_links([_link('player', 'b', 5.0)])
+        assert changed == 1
+        assert index.resistance('b') == pytest.approx(link_resistance(_link('x', 'y', 5.0)))
+
+
+class TestTickLifecycle:
+    """The tick's index is resynced periodically and unhooked when the tick ends."""
+
+    def test_tick_runner_removes_mutation_listener(self, monkeypatch):
+        from unittest.mock import Mock
+        from runtime.physics import tick_runner, tick_v1_2
+        from runtime.physics.constants import PROXIMITY_RESYNC_TICKS
+        from runtime.physics.graph.graph_ops_events import _mutation_listeners
+
+        ticks = []
+
+        def failing_run(self, *args, **kwargs):
+            ticks.append(self)
+            raise RuntimeError("graph down")
+
+        monkeypatch.setattr(tick_v1_2, 'GraphQueries', Mock)
+        monkeypatch.setattr(tick_v1_2, 'GraphOps', Mock)
+        monkeypatch.setattr(tick_v1_2.GraphTickV1_2, 'run', failing_run)
+        before = list(_mutation_listeners)
+
+        with pytest.raises(RuntimeError):
+            tick_runner.run_until_next_moment(max_ticks=3)
+
+        assert _mutation_listeners == before
+        assert ticks[0].proximity.resync_every == PROXIMITY_RESYNC_TICKS
@@ -0,0 +1,82 @@
+"""
+Tests for runtime.infrastructure.tempo.tempo_controller module.
+
+Ticks must run off the event loop, and ticks slower than the interval
+must be handled by the overrun policy instead of stacking up.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from runtime.infrastructure.tempo import TempoController
+
+
+class FakeTick:
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.threads = []
+
+    def run(self):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.duration)
+        return {"ok": True}
+
+
+class FakeCanon:
+    def __init__(self):
+        self.recorded = []
+
+    def record_to_canon(self, result):
+        self.recorded.append(result)
+
+
+def run_for(controller, seconds, probe=None):
+    async def main():
+        task = asyncio.create_task(controller.run())
+        beats = 0
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            await asyncio.sleep(0.005)
+            beats += 1
+        controller.stop()
+        await task
+        return beats
+    return asyncio.run(main())
+
+
+def test_ticks_run_on_worker_thread_without_blocking_loop():
+    tick = FakeTick(duration=0.05)
+    canon = FakeCanon()
+    controller = TempoController(tick, canon)
+    controller.set_speed("3x")
+
+    beats = run_for(controller, 0.3)
+
+    assert tick.threads and all(name.startswith("tempo-tick") for name in tick.threads)
+    assert len(canon.recorded) == len(tick.threads)
+    # The loop kept ticking its own coroutines while physics ran
+    assert beats > 20
+
+
+@pytest.mark.parametrize("policy", ["skip", "coalesce", "catch_up"])
+def test_overrun_policies(policy):
+    controller = TempoController(FakeTick(duration=0.05), overrun_policy=policy, max_catch_up=1)
+    controller.set_speed("3x")
+
+    run_for(controller, 0.3)
+    metrics = controller.metrics()
+
+    assert metrics.overruns > 0
+    assert metrics.ticks_run <= 7
+    if policy == "skip":
+        assert metrics.ticks_skipped > 0 and controller.tick_count == metrics.ticks_run
+    elif policy == "coalesce":
+        assert controller.tick_count == metrics.ticks_run + metrics.ticks_coalesced
+    else:
+        assert metrics.ticks_caught_up > 0 and metrics.ticks_skipped > 0
+
+
+def test_invalid_overrun_policy():
+    with pytest.raises(ValueError):
+        TempoController(FakeTick(), overrun_policy="stack")
@@ -0,0 +1,224 @@
+"""
+Tests for runtime.physics.tick_v1_2_snapshot module.
+
+Tests the in-memory snapshot backend for the v1.2 tick: row-shaped reads,
+recorded writes, the batched diff flush, and canon activation mirrored
+into the tables.
+"""
+
+import pytest
+from unittest.mock import Mock
+from runtime.infrastructure.canon.canon_holder import ValidationResult
+from runtime.physics.constants import REJECTION_RETURN_RATE
+from runtime.physics.phases.completion import phase_activation
+from runtime.physics.tick_v1_2 import GraphTickV1_2
+from runtime.physics.tick_v1_2_queries import TickQueries
+from runtime.physics.tick_v1_2_snapshot import TickSnapshot, SnapshotTickQueries
+
+
+def _node(node_id, label, **props):
+    return {'id': node_id, 'labels': [label], **props}
+
+
+def _link(rid, link_type, src, src_label, dst, dst_label, **props):
+    return {
+        'rid': rid, 'type': link_type,
+        'src': src, 'src_labels': [src_label],
+        'dst': dst, 'dst_labels': [dst_label],
+        **props
+    }
+
+
+class RecordingWrite:
+    """Minimal GraphOps stand-in that records every statement."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _query(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        return []
+
+
+@pytest.fixture
+def snapshot():
+    nodes = [
+        _node('player', 'Actor', energy=1.0, weight=1.0, alive=True),
+        _node('char_a', 'Actor', energy=2.0, weight=0.5),
+        _node('char_dead', 'Actor', energy=2.0, weight=3.0, alive=False),
+        _node('m1', 'Moment', energy=0.5, weight=1.0, status='active', duration=1.0),
+        _node('m2', 'Moment', energy=0.9, weight=1.0, status='active', duration=1.0),
+        _node('m3', 'Moment', energy=0.4, weight=1.0, status='failed'),
+        _node('n1', 'Narrative', energy=0.5, joy_sadness=0.2),
+    ]
+    targets = [_node('place_1', 'Space', energy=0.0, weight=4.0)]
+    links = [
+        _link(1, 'EXPRESSES', 'player', 'Actor', 'm1', 'Moment', weight=1.0, energy=0.1),
+        _link(2, 'SAID', 'char_a', 'Actor', 'm1', 'Moment', weight=1.0, energy=0.5),
+        _link(3, 'ABOUT', 'm1', 'Moment', 'n1', 'Narrative', weight=1.0, joy_sadness=0.5),
+        _link(4, 'ABOUT', 'm2', 'Moment', 'n1', 'Narrative', weight=1.0),
+        _link(5, 'AT', 'm1', 'Moment', 'place_1', 'Space', weight=2.0),
+        _link(6, 'BELIEVES', 'char_a', 'Actor', 'n1', 'Narrative', weight=1.0, energy=0.005),
+        _link(7, 'EXPRESSES', 'char_a', 'Actor', 'm2', 'Moment', weight=1.0),
+    ]
+    return TickSnapshot.from_rows(nodes, targets, links)
+
+
+class TestSnapshotReads:
+    """Reads return rows shaped like the Cypher results."""
+
+    def test_moments_by_status(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        active = queries.get_moments_by_status('active')
+        assert [m['id'] for m in active] == ['m1', 'm2']
+        assert set(active[0]) == {'id', 'energy', 'weight', 'duration'}
+
+    def test_hot_links_to_moment_sorted_by_heat(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        links = queries.get_hot_links_to_moment('m1')
+        assert [l['actor_id'] for l in links] == ['char_a', 'player']
+        assert queries.get_hot_links_to_moment('m1', n=1)[0]['actor_id'] == 'char_a'
+
+    def test_hot_links_from_moment_skip_actors(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        targets = {l['target_id']: l for l in queries.get_hot_links_from_moment('m1')}
+        assert set(targets) == {'n1', 'place_1'}
+        assert targets['place_1']['target_type'] == 'Space'
+        assert targets['place_1']['target_weight'] == 4.0
+
+    def test_moment_axes_missing_values_fall_back(self, snapshot):
+        """A NULL axis on any link makes the weighted average fail, as in Cypher."""
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        assert queries.get_moment_axes('m1')['joy_sadness'] == 0.0
+
+    def test_shared_narratives(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        assert queries.get_shared_narratives('m1', 'm2') == ['n1']
+        assert queries.get_shared_narratives('m1', 'm3') == []
+
+    def test_generating_actors_excludes_dead(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        actors = queries.get_generating_actors()
+        assert [a['id'] for a in actors] == ['player', 'char_a']
+
+    def test_count_hot_cold(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        assert queries.count_hot_cold_links() == (2, 1)
+
+
+class TestSnapshotWrites:
+    """Writes update the tables and flush as grouped UNWIND statements."""
+
+    def test_set_energy_visible_to_reads(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        queries.set_energy('Actor', 'char_a', 7.0)
+        assert queries.get_actor_energy('char_a') == 7.0
+        links = queries.get_hot_links_to_moment('m1')
+        assert links[0]['actor_energy'] == 7.0
+
+    def test_set_energy_respects_label(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        queries.set_energy('Moment', 'char_a', 7.0)
+        assert queries.get_actor_energy('char_a') == 2.0
+
+    def test_cool_links_uses_pre_update_energy(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        cooled, total = queries.cool_links(0.02, 0.6, 0.1)
+        assert cooled == 2
+        assert total == pytest.approx(0.6)
+        j = snapshot.link_rid.index(2)
+        assert snapshot.link_energy[j] == pytest.approx(0.3)
+        assert snapshot.link_weight[j] == pytest.approx(1.05)
+
+    def test_flush_groups_statements(self, snapshot):
+        write = RecordingWrite()
+        queries = SnapshotTickQueries(snapshot, write)
+        queries.set_energy('Actor', 'player', 1.5)
+        queries.set_energy('Actor', 'char_a', 1.5)
+        queries.set_energy(None, 'place_1', 0.2)
+        queries.complete_moment('m2', 3)
+        queries.cool_links(0.02, 0.6, 0.1)
+        queries.create_relates_link('player', 'char_a', 0.2, [], 'm2')
+
+        statements = queries.flush()
+
+        assert statements == len(write.calls) == 5
+        actor_rows = [p['rows'] for c, p in write.calls if 'MATCH (n:Actor' in c][0]
+        assert {r['id'] for r in actor_rows} == {'player', 'char_a'}
+        assert queries.flush() == 0
+
+    def test_relates_link_visible_after_create(self, snapshot):
+        queries = SnapshotTickQueries(snapshot, RecordingWrite())
+        assert not queries.actors_related('player', 'char_a')
+        queries.create_relates_link('player', 'char_a', 0.2, [], 'm1')
+        assert queries.actors_related('char_a', 'player')
+
+
+class TestSnapshotActivation:
+    """Possible moments at the threshold are resolved in one canon batch."""
+
+    def test_activation_resolves_once_and_mirrors_transitions(self):
+        snapshot = TickSnapshot.from_rows([
+            _node('player', 'Actor', energy=1.0, weight=1.0),
+            _node('m_ok', 'Moment', energy=0.9, weight=1.0, status='possible'),
+            _node('m_bad', 'Moment', energy=0.85, weight=1.0, status='possible'),
+            _node('m_cold', 'Moment', energy=0.1, weight=1.0, status='possible'),
+        ], [], [])
+        write = RecordingWrite()
+        queries = SnapshotTickQueries(snapshot, write)
+        queries.set_energy('Actor', 'player', 2.0)
+
+        class Canon:
+            calls = []
+
+            def resolve_batch(self, moment_ids, current_tick, return_energy_to=None):
+                # The pending diff reached the graph before the canon query
+                assert len(write.calls) == 1
+                self.calls.append((moment_ids, current_tick, return_energy_to))
+                return {'m_ok': ValidationResult(valid=True), 'm_bad': ValidationResult(valid=False)}
+
+        possible = queries.get_moments_by_status('possible')
+        activated = phase_activation(
+            queries, possible, 4,
+            lambda ids, tick: queries.resolve_moments(Canon(), ids, tick, 'player'),
+        )
+
+        assert activated == ['m_ok']
+        assert Canon.calls == [(['m_ok', 'm_bad'], 4, 'player')]
+        assert queries.get_moment_state('m_ok')['status'] == 'active'
+        assert queries.get_moment_state('m_bad')['energy'] == 0
+        assert queries.get_failed_moments() == []
+        assert queries.get_actor_energy('player') == pytest.approx(2.0 + 0.85 * REJECTION_RETURN_RATE)
+
+
+class TestSnapshotTick:
+    """GraphTickV1_2 runs every phase against the snapshot in snapshot mode."""
+
+    def test_tick_reads_graph_only_for_load(self, snapshot, monkeypatch):
+        read = Mock()
+        read.query.return_value = []
+        write = RecordingWrite()
+        monkeypatch.setattr(
+            SnapshotTickQueries, 'load',
+            classmethod(lambda cls, r, w: cls(snapshot, w))
+        )
+
+        tick = GraphTickV1_2(read=read, write=write, snapshot=True)
+        result = tick.run(current_tick=1)
+
+        # Only the proximity edge scan reaches the graph
+        assert read.query.call_count == 1
+        assert result.moments_active == 2
+        assert result.moments_rejected == 1
+        assert result.energy_generated > 0
+        assert all('UNWIND $rows' in cypher for cypher, _ in write.calls)
+
+    def test_snapshot_by_default_and_env_opt_out(self, monkeypatch):
+        monkeypatch.delenv('MIND_TICK_SNAPSHOT', raising=False)
+        assert GraphTickV1_2(read=Mock(), write=RecordingWrite()).snapshot
+
+        monkeypatch.setenv('MIND_TICK_SNAPSHOT', '0')
+        tick = GraphTickV1_2(read=Mock(), write=RecordingWrite())
+        assert not tick.snapshot
+        assert isinstance(tick._open_tick_queries(), TickQueries)
+        assert GraphTickV1_2(read=Mock(), write=RecordingWrite(), snapshot=True).snapshot
@@ -0,0 +1,95 @@
+"""
+Tests for the TraversalLogger background writer and deferred step analysis.
+"""
+
+import json
+import threading
+import time
+from runtime.physics.traversal_logger import LogWriter, TraversalLogger
+from runtime.physics.health.exploration_log_checker import parse_log_file
+
+
+def _log_steps(logger, exploration_id, count):
+    for i in range(count):
+        logger.log_step(
+            exploration_id=exploration_id, subentity_id="se_1", actor_id="actor_a",
+            tick=0, step_number=i + 1, state_before="SEEKING", state_after="SEEKING",
+            transition_reason=None, position_node_id="n_same", position_node_type="",
+            position_node_name="", depth=9, satisfaction=0.1, criticality=0.0,
+            decision=None, movement=None, found_narratives={}, new_this_step=None,
+            alignment_this_step=None, parent_id=None, sibling_ids=[], children_ids=[],
+            active_siblings=0, emotions={},
+        )
+
+
+def test_steps_are_written_and_analysis_deferred_to_end(tmp_path):
+    logger = TraversalLogger(log_dir=tmp_path)
+    logger.exploration_start("exp_1", "actor_a", "m_0", "find things")
+    _log_steps(logger, "exp_1", 3)
+    logger.exploration_end("exp_1", found_narratives={})
+    assert logger.flush(timeout=5)
+
+    path = tmp_path / "traversal_exp_1.jsonl"
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    steps = [r for r in records if r.get("header", {}).get("level") == "STEP"]
+    assert len(steps) == 3 and all("anomalies" not in s for s in steps)
+
+    analysis = next(r for r in records if r.get("event") == "STEP_ANALYSIS")
+    assert [e["step_number"] for e in analysis["steps"]] == [1, 2, 3]
+    assert "DEEP_EXPLORATION" in (tmp_path / "traversal_exp_1.txt").read_text()
+
+    # The health checker sees the deferred anomalies on their steps
+    parsed = parse_log_file(path)
+    assert all(any(a["type"] == "DEEP_EXPLORATION" for a in s.anomalies) for s in parsed)
+    logger.close()
+
+
+def test_inline_analysis_matches_deferred(tmp_path):
+    logger = TraversalLogger(log_dir=tmp_path, defer_analysis=False)
+    logger.exploration_start("exp_2", "actor_a", "m_0", "find things")
+    _log_steps(logger, "exp_2", 2)
+    logger.exploration_end("exp_2", found_narratives={})
+    logger.close()
+
+    records = [json.loads(line) for line in (tmp_path / "traversal_exp_2.jsonl").read_text().splitlines()]
+    steps = [r for r in records if r.get("header", {}).get("level") == "STEP"]
+    assert all(s["anomalies"] for s in steps)
+    assert not any(r.get("event") == "STEP_ANALYSIS" for r in records)
+
+
+def test_drop_policy_counts_instead_of_blocking(tmp_path):
+    gate = threading.Event()
+    writer = LogWriter(max_queue=2, policy="drop")
+    path = tmp_path / "out.txt"
+
+    def slow():
+        gate.wait(5)
+        return "first"
+
+    assert writer.write(path, slow)
+    # Wait until the writer thread has taken the slow record off the queue
+    while not writer._queue.empty():
+        time.sleep(0.001)
+    results = [writer.write(path, f"line{i}") for i in range(5)]
+    gate.set()
+    writer.close()
+
+    assert results == [True, True, False, False, False]
+    assert writer.dropped == 3
+    assert path.read_text().splitlines() == ["first", "line0", "line1"]
+
+
+def test_close_stops_thread_and_drops_atexit_hook(tmp_path, monkeypatch):
+    import atexit
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+
+    writer = LogWriter()
+    writer.write(tmp_path / "out.txt", "line")
+    thread = writer._thread
+    writer.close()
+
+    assert not thread.is_alive()
+    assert registered == []
+    assert (tmp_path / "out.txt").read_text() == "line\n"
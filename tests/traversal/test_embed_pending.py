@@ -0,0 +1,90 @@
+"""
+Tests for runtime.infrastructure.embeddings.embed_pending module.
+
+The paged pipeline must embed every pending element with bulk writes and
+resume from its checkpoint after a crash instead of starting over.
+"""
+
+import pytest
+from runtime.infrastructure.embeddings import embed_pending
+
+
+class FakeGraphQueries:
+    """In-memory graph answering the pipeline's page and UNWIND write queries."""
+
+    nodes = {}
+    links = {}
+    fail_after_writes = None
+    writes = []
+
+    def __init__(self, graph_name=None):
+        pass
+
+    def _query(self, cypher, params=None):
+        cls = FakeGraphQueries
+        if 'UNWIND' in cypher:
+            if cls.fail_after_writes is not None and len(cls.writes) >= cls.fail_after_writes:
+                raise RuntimeError("connection lost")
+            cls.writes.append(len(params['rows']))
+            for row in params['rows']:
+                if 'nid' in row:
+                    cls.nodes[row['nid']]['embedding'] = row['emb']
+                else:
+                    cls.links[row['rid']]['embedding'] = row['emb']
+            return []
+        if 'id(n) > $after' in cypher:
+            ids = sorted(i for i, n in cls.nodes.items()
+                         if n.get('embedding') is None and i > params['after'])
+            return [[i, cls.nodes[i]['name'], 'thing', None] for i in ids[:params['limit']]]
+        ids = sorted(i for i, l in cls.links.items()
+                     if l.get('embedding') is None and i > params['after'])
+        return [[i, 0, 'rel', 'a', None, 'b', None] for i in ids[:params['limit']]]
+
+
+class FakeService:
+    def __init__(self):
+        self.batches = 0
+
+    def embed_batch(self, texts):
+        self.batches += 1
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.fixture
+def fake_graph(monkeypatch):
+    FakeGraphQueries.nodes = {i: {'name': f"node{i}"} for i in range(25)}
+    FakeGraphQueries.links = {i: {} for i in range(7)}
+    FakeGraphQueries.writes = []
+    FakeGraphQueries.fail_after_writes = None
+    service = FakeService()
+    monkeypatch.setattr('runtime.physics.graph.graph_queries.GraphQueries', FakeGraphQueries)
+    monkeypatch.setattr(embed_pending, 'get_embedding_service', lambda: service)
+    return service
+
+
+def test_embeds_everything_in_pages(fake_graph, tmp_path):
+    checkpoint = tmp_path / "ckpt.json"
+    stats = embed_pending.embed_all_pending('g', page_size=10, workers=2, checkpoint_path=checkpoint)
+
+    assert stats == {'nodes': 25, 'links': 7}
+    assert all(n['embedding'] for n in FakeGraphQueries.nodes.values())
+    assert FakeGraphQueries.writes == [10, 10, 5, 7]
+    assert fake_graph.batches == 4
+    assert not checkpoint.exists()
+
+
+def test_resumes_from_checkpoint_after_crash(fake_graph, tmp_path):
+    checkpoint = tmp_path / "ckpt.json"
+    FakeGraphQueries.fail_after_writes = 2
+    with pytest.raises(RuntimeError):
+        embed_pending.embed_all_pending('g', page_size=5, workers=1, checkpoint_path=checkpoint)
+    assert checkpoint.exists()
+
+    FakeGraphQueries.fail_after_writes = None
+    # Un-embed an already-checkpointed node: a resumed run must not rescan it
+    FakeGraphQueries.nodes[0]['embedding'] = None
+    stats = embed_pending.embed_all_pending('g', page_size=5, workers=1, checkpoint_path=checkpoint)
+
+    assert stats == {'nodes': 15, 'links': 7}
+    assert FakeGraphQueries.nodes[0]['embedding'] is None
+    assert all(n['embedding'] for i, n in FakeGraphQueries.nodes.items() if i)
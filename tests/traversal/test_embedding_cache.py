@@ -0,0 +1,82 @@
+"""
+Tests for runtime.infrastructure.embeddings.cache and its use by EmbeddingService.
+"""
+
+import numpy as np
+from unittest.mock import Mock
+from runtime.infrastructure.embeddings.cache import EmbeddingCache, RECORDS_FILE
+from runtime.traversal.embedding import EmbeddingService
+
+
+def _fake_model(dim=8):
+    model = Mock()
+
+    def encode(texts, normalize_embeddings=True):
+        single = isinstance(texts, str)
+        rows = [[float(len(t) + i) for i in range(dim)] for t in ([texts] if single else texts)]
+        return np.array(rows[0] if single else rows, dtype=np.float32)
+
+    model.encode.side_effect = encode
+    return model
+
+
+class TestEmbeddingCache:
+
+    def test_memory_lru_is_bounded(self):
+        cache = EmbeddingCache("m", max_memory_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")
+        cache.put("c", [3.0])
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+
+    def test_disk_tier_survives_restart_and_is_keyed_by_model(self, tmp_path):
+        first = EmbeddingCache("model-a", cache_dir=tmp_path)
+        first.put_many(["joy", "fear"], [[0.5, 1.5], [2.5, 3.5]])
+
+        again = EmbeddingCache("model-a", cache_dir=tmp_path)
+        assert again.get("fear") == [2.5, 3.5]
+        assert again.get("anger") is None
+        assert EmbeddingCache("model-b", cache_dir=tmp_path).get("fear") is None
+
+    def test_sees_rows_appended_by_another_writer(self, tmp_path):
+        reader = EmbeddingCache("m", cache_dir=tmp_path, dimension=2)
+        EmbeddingCache("m", cache_dir=tmp_path).put("late", [1.0, 2.0])
+        assert reader.get("late") == [1.0, 2.0]
+
+    def test_torn_tail_is_ignored_and_repaired(self, tmp_path):
+        EmbeddingCache("m", cache_dir=tmp_path).put("ok", [1.0, 2.0])
+        records = tmp_path / "m" / RECORDS_FILE
+        with open(records, "ab") as f:
+            f.write(b"\x00" * 5)
+
+        cache = EmbeddingCache("m", cache_dir=tmp_path)
+        assert cache.get("ok") == [1.0, 2.0]
+        cache.put("next", [3.0, 4.0])
+        assert EmbeddingCache("m", cache_dir=tmp_path).get("next") == [3.0, 4.0]
+
+
+class TestServiceCaching:
+
+    def test_repeated_text_encodes_once(self, tmp_path):
+        service = EmbeddingService(cache_dir=tmp_path)
+        service.model = _fake_model()
+
+        first = service.embed("joy")
+        assert service.embed("joy") == first
+        assert service.model.encode.call_count == 1
+
+        restarted = EmbeddingService(cache_dir=tmp_path)
+        restarted.model = _fake_model()
+        assert restarted.embed("joy") == first
+        restarted.model.encode.assert_not_called()
+
+    def test_batch_encodes_only_distinct_misses(self):
+        service = EmbeddingService()
+        service.model = _fake_model()
+        service.embed("joy")
+
+        result = service.embed_batch(["joy", "fear", "fear", ""])
+        assert len(result) == 4 and result[1] == result[2]
+        assert service.model.encode.call_args[0][0] == ["fear", " "]
@@ -0,0 +1,84 @@
+"""
+Tests for runtime.infrastructure.embeddings.scheduler module.
+
+Concurrent single-text requests must be coalesced into batched encodes
+and every caller must get its own text's vector back.
+"""
+
+import asyncio
+import threading
+import pytest
+from runtime.infrastructure.embeddings.scheduler import EmbeddingScheduler
+
+
+class FakeService:
+    def __init__(self, fail=False, block=None):
+        self.batches = []
+        self.fail = fail
+        self.block = block
+
+    def embed(self, text):
+        return [0.0, 0.0]
+
+    def embed_batch(self, texts):
+        if self.block is not None:
+            self.block.wait(5)
+        if self.fail:
+            raise RuntimeError("model down")
+        self.batches.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def test_concurrent_requests_share_one_batch():
+    service = FakeService()
+    scheduler = EmbeddingScheduler(service, max_delay_s=0.01)
+
+    async def main():
+        return await asyncio.gather(*(scheduler.embed("x" * i) for i in range(1, 11)))
+
+    vectors = asyncio.run(main())
+    assert vectors == [[float(i), 1.0] for i in range(1, 11)]
+    assert len(service.batches) == 1
+
+
+def test_batches_are_capped_and_blank_texts_get_zero_vectors():
+    service = FakeService()
+    scheduler = EmbeddingScheduler(service, max_batch_size=4, max_delay_s=0.01)
+
+    async def main():
+        return await scheduler.embed_many(["a", "", "bb", "  ", "ccc", "d", "ee", "f", "g"])
+
+    vectors = asyncio.run(main())
+    assert vectors[1] == [0.0, 0.0] and vectors[3] == [0.0, 0.0]
+    assert vectors[4] == [3.0, 1.0]
+    assert all(len(b) <= 4 for b in service.batches)
+    assert sum(len(b) for b in service.batches) == 7
+
+
+def test_requests_during_an_encode_go_out_together_next():
+    release = threading.Event()
+    service = FakeService(block=release)
+    scheduler = EmbeddingScheduler(service, max_delay_s=0.0)
+
+    async def main():
+        first = asyncio.ensure_future(scheduler.embed("first"))
+        await asyncio.sleep(0.02)  # first batch is now encoding
+        later = [asyncio.ensure_future(scheduler.embed(t)) for t in ("a", "b", "c")]
+        await asyncio.sleep(0.02)
+        release.set()
+        return await asyncio.gather(first, *later)
+
+    asyncio.run(main())
+    assert service.batches == [["first"], ["a", "b", "c"]]
+
+
+def test_errors_reach_every_caller_and_scheduler_survives_new_loop():
+    scheduler = EmbeddingScheduler(FakeService(fail=True))
+
+    async def main():
+        return await asyncio.gather(scheduler.embed("a"), scheduler.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(main()))
+
+    scheduler._service = FakeService()
+    assert asyncio.run(scheduler.embed("abc")) == [3.0, 1.0]